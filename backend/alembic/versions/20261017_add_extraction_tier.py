@@ -0,0 +1,23 @@
+"""add extraction_tier field
+
+Revision ID: 20261017_add_extraction_tier
+Revises: 20260123_add_rbac
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261017_add_extraction_tier'
+down_revision = '20260123_add_rbac'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('resumes', sa.Column('extraction_tier', sa.String(30), nullable=True))
+
+
+def downgrade():
+    op.drop_column('resumes', 'extraction_tier')
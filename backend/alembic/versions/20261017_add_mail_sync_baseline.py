@@ -0,0 +1,24 @@
+"""add mail_sync_states.baseline_uid
+
+Revision ID: 20261017_add_mail_sync_baseline
+Revises: 20261017_add_review_reason
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261017_add_mail_sync_baseline'
+down_revision = '20261017_add_review_reason'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 建立基线时的最大UID；不为空时还在处理基线之前的未读邮件（已有的记录都已完成基线）
+    op.add_column('mail_sync_states', sa.Column('baseline_uid', sa.BigInteger(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('mail_sync_states', 'baseline_uid')
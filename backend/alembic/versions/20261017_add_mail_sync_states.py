@@ -0,0 +1,36 @@
+"""add mail_sync_states table
+
+Revision ID: 20261017_add_mail_sync_states
+Revises: 20261017_add_parse_versions
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261017_add_mail_sync_states'
+down_revision = '20261017_add_parse_versions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 邮箱文件夹的增量同步进度（UIDVALIDITY + 已处理到的最大UID）
+    op.create_table(
+        'mail_sync_states',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('email_address', sa.String(200), nullable=False),
+        sa.Column('folder', sa.String(200), nullable=False),
+        sa.Column('uid_validity', sa.BigInteger(), nullable=False),
+        sa.Column('last_seen_uid', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('last_synced_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('email_address', 'folder', name='uq_mail_sync_state_folder')
+    )
+
+
+def downgrade():
+    op.drop_table('mail_sync_states')
@@ -0,0 +1,30 @@
+"""add parser_version / extractor_versions to resumes
+
+Revision ID: 20261017_add_parse_versions
+Revises: 20261017_add_extraction_tier
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_add_parse_versions'
+down_revision = '20261017_add_extraction_tier'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 解析版本标记（已有简历为空，增量重新解析时视为全部过期）
+    op.add_column('resumes', sa.Column('parser_version', sa.String(20), nullable=True))
+    op.add_column('resumes', sa.Column('extractor_versions', postgresql.JSONB(), nullable=True))
+    op.create_index('ix_resumes_parser_version', 'resumes', ['parser_version'])
+
+
+def downgrade():
+    op.drop_index('ix_resumes_parser_version', table_name='resumes')
+    op.drop_column('resumes', 'extractor_versions')
+    op.drop_column('resumes', 'parser_version')
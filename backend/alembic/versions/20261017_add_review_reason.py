@@ -0,0 +1,31 @@
+"""add review_reason field
+
+Revision ID: 20261017_add_review_reason
+Revises: 20261017_add_mail_sync_states
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261017_add_review_reason'
+down_revision = '20261017_add_mail_sync_states'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 需要人工审核的原因代码（PDF提取超时/超内存/子进程崩溃、扫描件等）
+    op.add_column('resumes', sa.Column('review_reason', sa.String(50), nullable=True))
+    op.create_index('ix_resumes_review_reason', 'resumes', ['review_reason'])
+    # 已识别为扫描件的简历补上原因，进入人工审核队列
+    op.execute(
+        "UPDATE resumes SET review_reason = 'pdf_image_only' "
+        "WHERE extraction_tier = 'image_only' AND review_reason IS NULL"
+    )
+
+
+def downgrade():
+    op.drop_index('ix_resumes_review_reason', table_name='resumes')
+    op.drop_column('resumes', 'review_reason')
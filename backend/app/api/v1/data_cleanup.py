@@ -153,11 +153,10 @@ async def fix_year_value_anomalies(db: Session = Depends(get_db)) -> Dict[str, A
                 })
                 continue
 
-            # 重新解析工作经历
-            work_experience = parser._extract_work_experience(resume.raw_text)
-
-            # 计算工作年限
-            work_years = parser._calculate_work_years(work_experience)
+            # 重新解析工作经历并计算工作年限（只提取工作经历，不做完整解析）
+            parsed = parser._parse_text(resume.raw_text, lazy=True)
+            work_experience = parsed['work_experience']
+            work_years = parsed['work_years']
 
             # 更新数据库
             old_value = resume.work_years
@@ -243,11 +242,10 @@ def recalculate_all_work_years_impl(db: Session) -> Dict[str, Any]:
                 })
                 continue
 
-            # 重新解析工作经历
-            work_experience = parser._extract_work_experience(resume.raw_text)
-
-            # 计算工作年限
-            work_years = parser._calculate_work_years(work_experience)
+            # 重新解析工作经历并计算工作年限（只提取工作经历，不做完整解析）
+            parsed = parser._parse_text(resume.raw_text, lazy=True)
+            work_experience = parsed['work_experience']
+            work_years = parsed['work_years']
 
             # 更新数据库
             resume.work_years = work_years
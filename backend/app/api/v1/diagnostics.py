@@ -5,11 +5,15 @@
 - 所有统��仅基于外部Agent结果
 """
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import func
 from app.core.database import SessionLocal
 from app.models.resume import Resume
 from app.models.screening_result import ScreeningResult
 from app.models.job import Job
+from app.services.parse_cache import get_parse_cache
+from app.services.parse_metrics import get_parse_metrics
+from app.services.resume_patterns import list_patterns, reset_pattern_stats
 import logging
 
 logger = logging.getLogger(__name__)
@@ -156,3 +160,72 @@ async def get_resume_matches(resume_id: str):
         raise HTTPException(status_code=500, detail=f"获取失败: {str(e)}")
     finally:
         db.close()
+
+
+@router.get("/parser-patterns")
+async def get_parser_patterns(sort_by: str = None):
+    """获取简历解析正则的调用/命中统计
+
+    计数为当前进程内的累计值（Celery worker 中的解析不计入API进程）。
+    calls > 0 但 hits == 0 的规则即为从未命中的候选清理项。
+
+    Args:
+        sort_by: 排序字段（hits / calls），不传则按登记顺序
+
+    Returns:
+        正则总数、从未命中的规则名称和每条规则的统计
+    """
+    patterns = list_patterns(sort_by=sort_by)
+    return {
+        'total': len(patterns),
+        'never_hit': [p['name'] for p in patterns if p['calls'] and not p['hits']],
+        'patterns': patterns
+    }
+
+
+@router.post("/parser-patterns/reset")
+async def reset_parser_patterns():
+    """清零简历解析正则的调用/命中统计"""
+    reset_pattern_stats()
+    return {'message': '正则统计已清零'}
+
+
+@router.get("/parse-cache")
+async def get_parse_cache_stats():
+    """获取简历解析缓存的命中/未命中统计
+
+    Returns:
+        缓存后端（redis/disk）、当前进程计数，以及所有进程的汇总计数（Redis可用时）
+    """
+    return get_parse_cache().stats()
+
+
+@router.get("/parse-metrics", response_class=PlainTextResponse)
+async def get_parse_metrics_histograms():
+    """获取简历解析各阶段耗时/输入大小直方图（Prometheus文本格式，可直接配置为抓取目标）
+
+    只统计被采样的解析（PARSE_METRICS_SAMPLE_RATE）；Redis可用时为所有进程的汇总。
+    """
+    return get_parse_metrics().render_prometheus()
+
+
+@router.get("/parse-metrics/slowest")
+async def get_slowest_parses():
+    """获取耗时最长的N次解析
+
+    Returns:
+        每条记录的耗时、文件SHA-256、文件名、邮件主题、提取层级，以及被采样时的各阶段耗时；
+        用 python -m benchmarks.replay_slow 按文件哈希找到原文件重放
+    """
+    slowest = get_parse_metrics().slowest()
+    return {
+        'total': len(slowest),
+        'parses': slowest
+    }
+
+
+@router.post("/parse-metrics/reset")
+async def reset_parse_metrics():
+    """清空简历解析耗时统计"""
+    get_parse_metrics().reset()
+    return {'message': '解析耗时统计已清空'}
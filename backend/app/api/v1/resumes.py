@@ -15,15 +15,16 @@ from app.models.resume import Resume
 from app.models.screening_result import ScreeningResult
 from app.models.job import Job
 from app.models.user import User
+from app.services.parse_versions import stamp as stamp_parse_versions, stampable
 from app.services.resume_parser import ResumeParser
-from app.services.city_extractor import CityExtractor
+from app.services.subject_parser import parse_subject
+from app.services.university_classifier import resolve_education_level
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 # 初始化服务
 resume_parser = ResumeParser()
-city_extractor = CityExtractor()
 
 # 文件保存目录
 UPLOAD_DIR = "/app/resume_files"
@@ -42,6 +43,7 @@ def list_resumes(
     min_score: Optional[int] = Query(None, description="最低Agent评分"),
     exclude_needs_review: bool = Query(True, description="排除需要人工审核的简历(raw_text少于100字符)"),
     needs_review_only: bool = Query(False, description="只返回需要人工审核的简历"),
+    review_reason: Optional[str] = Query(None, description="人工审核原因: pdf_timeout/pdf_memory_limit/pdf_worker_crashed/pdf_image_only"),
     time_range: Optional[str] = Query(None, description="时间范围: today/this_week/this_month"),
     search: Optional[str] = Query(None, description="搜索候选人姓名"),
     current_user: User = Depends(get_current_user),
@@ -79,6 +81,10 @@ def list_resumes(
     if file_type:
         query = query.filter(Resume.file_type == file_type)
 
+    # 人工审核原因筛选
+    if review_reason:
+        query = query.filter(Resume.review_reason == review_reason)
+
     # 只返回既有PDF/DOCX又有正文的简历
     if has_pdf_and_content:
         query = query.filter(
@@ -160,13 +166,14 @@ def list_resumes(
             "phone": resume.phone,
             "email": resume.email,
             "education": resume.education,
-            "education_level": resume.education_level,
+            "education_level": resume.education_level or None,
             "work_years": resume.work_years,
             "skills": resume.skills or [],
             "skills_by_level": resume.skills_by_level,
             "status": resume.status,
             "file_type": resume.file_type,
             "raw_text_length": len(resume.raw_text) if resume.raw_text else 0,
+            "review_reason": resume.review_reason,
             "created_at": resume.created_at.isoformat() if resume.created_at else None,
             "updated_at": resume.updated_at.isoformat() if resume.updated_at else None,
             # Agent相关字段
@@ -203,7 +210,7 @@ def get_resume(resume_id: UUID, db: Session = Depends(get_db)):
         "phone": resume.phone,
         "email": resume.email,
         "education": resume.education,
-        "education_level": resume.education_level,
+        "education_level": resume.education_level or None,
         "work_years": resume.work_years,
         "skills": resume.skills or [],
         "skills_by_level": resume.skills_by_level,
@@ -213,6 +220,9 @@ def get_resume(resume_id: UUID, db: Session = Depends(get_db)):
         "raw_text": resume.raw_text,
         "file_path": resume.file_path,
         "file_type": resume.file_type,
+        "extraction_tier": resume.extraction_tier,
+        "review_reason": resume.review_reason,
+        "parser_version": resume.parser_version,
         "source_email_id": resume.source_email_id,
         "source_email_subject": resume.source_email_subject,
         "source_sender": resume.source_sender,
@@ -299,7 +309,7 @@ async def upload_resume(
 
         # 2. 解析简历
         logger.info(f"开始解析简历: {file_path}")
-        resume_data = resume_parser.parse_resume(file_path)
+        resume_data = resume_parser.parse_resume_bytes(content, file_path)
 
         # 如果仍然没有提取到姓名，尝试从原始文件名提取
         if not resume_data.get('candidate_name'):
@@ -314,16 +324,22 @@ async def upload_resume(
             phone=resume_data.get('phone'),
             email=resume_data.get('email'),
             education=resume_data.get('education'),
+            education_level=resolve_education_level(resume_data.get('education_level'), resume_data.get('raw_text')),
             work_years=resume_data.get('work_years', 0),
             skills=resume_data.get('skills', []),
+            skills_by_level=resume_data.get('skills_by_level', {}),
             work_experience=resume_data.get('work_experience', []),
             project_experience=resume_data.get('project_experience', []),
             education_history=resume_data.get('education_history', []),
             raw_text=resume_data.get('raw_text'),
             file_path=file_path,
             file_type=file_ext,
+            extraction_tier=resume_data.get('extraction_tier'),
+            review_reason=resume_data.get('review_reason'),
             status='parsed'
         )
+        if stampable(resume_data):
+            stamp_parse_versions(resume)
 
         db.add(resume)
         db.commit()
@@ -400,21 +416,16 @@ def reparse_resume(
         resume.education_history = parsed_data.get('education_history', [])
         # 更新学历和学历等级
         resume.education = parsed_data.get('education')
-        resume.education_level = parsed_data.get('education_level')
+        resume.education_level = resolve_education_level(parsed_data.get('education_level'), resume.raw_text)
         # 确保work_years不为None，设为0
         work_years = parsed_data.get('work_years', 0)
         resume.work_years = work_years if work_years is not None else 0
         resume.skills = parsed_data.get('skills', [])
         resume.skills_by_level = parsed_data.get('skills_by_level', {})
 
-        # 重新提取城市信息（只从邮件主题提取）
-        city_result = city_extractor.extract_city(
-            email_subject=resume.source_email_subject or '',
-            email_body='',  # 不再从正文提取
-            resume_text=''  # 不再从简历文本提取
-        )
-        resume.city = city_result.confirmed_city
-        resume.candidate_cities = city_result.candidate_cities
+        # 重新提取城市信息（只从邮件主题提取，不收集候选城市）
+        resume.city = parse_subject(resume.source_email_subject).city
+        resume.candidate_cities = []
 
         resume.updated_at = datetime.now()
 
@@ -453,19 +464,12 @@ def reextract_all_cities(
 
         for resume in all_resumes:
             try:
-                # 重新提取城市信息（只从邮件主题提取）
-                city_result = city_extractor.extract_city(
-                    email_subject=resume.source_email_subject or '',
-                    email_body='',  # 不再从正文提取
-                    resume_text=''  # 不再从简历文本提取
-                )
-
-                # 更新城市字段
+                # 重新提取城市信息（只从邮件主题提取，同一主题的解析结果有缓存）
                 old_city = resume.city
                 old_candidates = resume.candidate_cities
 
-                resume.city = city_result.confirmed_city
-                resume.candidate_cities = city_result.candidate_cities
+                resume.city = parse_subject(resume.source_email_subject).city
+                resume.candidate_cities = []
 
                 # 记录有变化的简历
                 if old_city != resume.city or old_candidates != resume.candidate_cities:
@@ -514,9 +518,7 @@ def reextract_all_names(
         for resume in all_resumes:
             try:
                 # 从邮件主题提取姓名
-                name = resume_parser._extract_name_from_email_subject(
-                    resume.source_email_subject or ''
-                )
+                name = parse_subject(resume.source_email_subject).candidate_name
 
                 if name:
                     old_name = resume.candidate_name
@@ -6,7 +6,7 @@
 - GET /results只返回有agent_score的简历
 """
 from fastapi import APIRouter, HTTPException, Query, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 from uuid import UUID
 from typing import List, Optional
 from datetime import datetime, timedelta
@@ -17,7 +17,7 @@ from app.models.screening_result import ScreeningResult
 from app.models.resume import Resume
 from app.models.job import Job
 from app.models.user import User
-from app.services.university_classifier import classify_education_level
+from app.tasks.education_tasks import queue_education_levels
 
 router = APIRouter()
 
@@ -129,7 +129,8 @@ async def list_screening_results(
     if resume_id:
         valid_resumes_query = valid_resumes_query.filter(Resume.id == resume_id)
 
-    valid_resumes = valid_resumes_query.all()
+    # 列表不使用简历正文，不加载 raw_text
+    valid_resumes = valid_resumes_query.options(defer(Resume.raw_text)).all()
 
     if not valid_resumes:
         return {"total": 0, "results": []}
@@ -243,10 +244,7 @@ async def list_screening_results(
         if resume_id not in resume_ids_with_screenings:
             resume = resume_dict[resume_id]
 
-            # 🔴 新增：从简历文本中实时分类学历等级
-            education_level = resume.education_level
-            if not education_level and resume.raw_text:
-                education_level = classify_education_level(resume.raw_text)
+            education_level = resume.education_level or None
 
             # 获取技能标签（取前3个）
             skills_list = resume.skills or []
@@ -295,10 +293,7 @@ async def list_screening_results(
         # 获取岗位信息（从数据库）
         job = db.query(Job).filter(Job.id == screening.job_id).first()
 
-        # 🔴 新增：从简历文本中实时分类学历等级（如果数据库中没有）
-        education_level = resume.education_level
-        if not education_level and resume.raw_text:
-            education_level = classify_education_level(resume.raw_text)
+        education_level = resume.education_level or None
 
         # 获取技能标签（取前3个）
         skills_list = resume.skills or []
@@ -332,6 +327,11 @@ async def list_screening_results(
             "city": resume.city,  # 新增：城市
         })
 
+    # 尚未分类学历等级的简历排队后台分类（本次返回空，分类完成后刷新列表即可看到）
+    queue_education_levels(
+        resume.id for resume in resume_dict.values() if resume.education_level is None
+    )
+
     # 10. 合并已评估和未评估的结果（简历已按创建时间筛选，无需再次筛选）
     all_results = evaluated_results_formatted + pending_results
 
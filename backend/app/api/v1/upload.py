@@ -10,7 +10,7 @@ from datetime import datetime
 
 from app.core.database import get_db
 from app.models.resume import Resume
-from app.tasks.email_tasks import parse_resume
+from app.tasks.email_tasks import parse_resume_batch
 from app.services.url_download_service import URLDownloadService
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,31 @@ UPLOAD_DIR = "/app/resume_files"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 
+def _dispatch_parse_batches(items: List[dict]) -> int:
+    """按 PARSE_BATCH_CHUNK_SIZE 分组触发批量解析任务
+
+    分组之间由 Celery worker 并行执行，每个任务内默认串行解析（PARSE_BATCH_TASK_WORKERS）。
+
+    Args:
+        items: [{'file_path': ..., 'email_info': {...}}, ...]
+
+    Returns:
+        已触发解析的文件数
+    """
+    from app.core.config import settings
+
+    chunk_size = max(settings.PARSE_BATCH_CHUNK_SIZE, 1)
+    dispatched = 0
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start:start + chunk_size]
+        try:
+            parse_resume_batch.delay(chunk)
+            dispatched += len(chunk)
+        except Exception as e:
+            logger.error(f"触发批量解析任务失败: {len(chunk)} 个文件, 错误: {e}")
+    return dispatched
+
+
 @router.post("/batch-upload")
 async def batch_upload_resumes(
     files: List[UploadFile] = File(..., description="简历文件列表(PDF/DOCX)"),
@@ -49,6 +74,7 @@ async def batch_upload_resumes(
         "errors": [],
         "file_names": []
     }
+    parse_items = []
 
     for file in files:
         try:
@@ -71,10 +97,10 @@ async def batch_upload_resumes(
                 content = await file.read()
                 f.write(content)
 
-            # 触发解析任务
-            parse_resume.delay(file_path, {"subject": file.filename, "source": "batch_upload"})
-
-            results["success"] += 1
+            parse_items.append({
+                "file_path": file_path,
+                "email_info": {"subject": file.filename, "source": "batch_upload"}
+            })
             results["file_names"].append(file.filename)
             logger.info(f"批量上传文件成功: {file.filename}")
 
@@ -86,6 +112,11 @@ async def batch_upload_resumes(
             })
             logger.error(f"批量上传文件失败: {file.filename}, 错误: {e}")
 
+    # 触发批量解析任务（按批分组，每批在一个任务内并行解析）
+    dispatched = _dispatch_parse_batches(parse_items)
+    results["success"] = dispatched
+    results["failed"] += len(parse_items) - dispatched
+
     return {
         "message": f"批量上传完成: {results['success']}个成功, {results['failed']}个失败",
         "results": results
@@ -200,14 +231,17 @@ async def multi_source_upload_resumes(
             }
         }
 
-    # 5. 触发解析任务
-    for file_path in all_file_paths:
-        try:
-            parse_resume.delay(file_path, {"subject": os.path.basename(file_path), "source": "multi_source_upload"})
-            all_results["overall"]["success"] += 1
-        except Exception as e:
-            logger.error(f"触发解析任务失败: {file_path}, 错误: {e}")
-            all_results["overall"]["failed"] += 1
+    # 5. 触发批量解析任务（按批分组，每批在一个任务内并行解析）
+    parse_items = [
+        {
+            "file_path": file_path,
+            "email_info": {"subject": os.path.basename(file_path), "source": "multi_source_upload"}
+        }
+        for file_path in all_file_paths
+    ]
+    dispatched = _dispatch_parse_batches(parse_items)
+    all_results["overall"]["success"] += dispatched
+    all_results["overall"]["failed"] += len(parse_items) - dispatched
 
     all_results["overall"]["total"] = total_files
 
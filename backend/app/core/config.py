@@ -1,5 +1,5 @@
 """应用配置管理"""
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -24,6 +24,100 @@ class Settings(BaseSettings):
         description="Redis连接URL"
     )
 
+    # 简历解析缓存配置
+    PARSE_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="是否启用简历解析缓存（按文件内容SHA-256 + 解析器版本）"
+    )
+    PARSE_CACHE_TTL: int = Field(
+        default=30 * 24 * 3600,
+        description="解析缓存过期时间（秒），按最近一次访问计算"
+    )
+    PARSE_CACHE_DIR: str = Field(
+        default="/app/cache/parse_cache",
+        description="Redis不可用时的磁盘缓存目录"
+    )
+    PARSE_CACHE_MAX_ENTRIES: int = Field(
+        default=20000,
+        description="磁盘缓存最大条目数，超出后按访问时间淘汰"
+    )
+
+    # PDF提取隔离配置（pymupdf4llm在子进程中运行）
+    PDF_EXTRACT_ISOLATED: bool = Field(
+        default=True,
+        description="是否在受限子进程中运行pymupdf4llm提取"
+    )
+    PDF_EXTRACT_WORKERS: int = Field(
+        default=1,
+        description="每个进程的PDF提取子进程数"
+    )
+    PDF_EXTRACT_TIMEOUT: int = Field(
+        default=60,
+        description="单个PDF提取超时时间（秒）"
+    )
+    PDF_EXTRACT_MEMORY_MB: int = Field(
+        default=1536,
+        description="PDF提取子进程地址空间上限（MB），0表示不限制"
+    )
+    PDF_EXTRACT_MAX_PAGES: int = Field(
+        default=30,
+        description="单个PDF最多提取的页数，超出部分忽略"
+    )
+    PDF_EXTRACT_MAX_TASKS_PER_WORKER: int = Field(
+        default=50,
+        description="提取子进程处理多少个文件后回收重建"
+    )
+    PDF_EXTRACT_STRATEGY: str = Field(
+        default="adaptive",
+        description="PDF提取策略：adaptive=先读fitz文本层，版式复杂时才用pymupdf4llm；layout=始终先用pymupdf4llm"
+    )
+
+    # 批量解析配置（ResumeParser.parse_many）
+    # 进程数上限（每个解析子进程内不再启动PDF提取子进程，地址空间限制为 PDF_EXTRACT_MEMORY_MB）：
+    # - 命令行批量任务（reparse_*）：1 + PARSE_BATCH_WORKERS 个进程；串行时 1 + 1（PDF提取子进程）
+    # - Celery（parse_resume_batch）：每个 worker 进程 1 + max(PARSE_BATCH_TASK_WORKERS, 1) 个，
+    #   共 Celery并发数 × 该值；默认串行时8核机器最多 8 × 2 = 16 个
+    PARSE_BATCH_WORKERS: Optional[int] = Field(
+        default=None,
+        description="命令行批量解析的子进程数，0表示在当前进程内串行解析；不设置时按CPU核数（最多8个，单核时串行）"
+    )
+    PARSE_BATCH_TASK_WORKERS: int = Field(
+        default=0,
+        description="Celery批量解析任务中每个任务的解析子进程数，默认0在任务进程内串行（各分组已由Celery worker并行执行）"
+    )
+    PARSE_BATCH_TIMEOUT: int = Field(
+        default=180,
+        description="批量解析中单个文件的超时时间（秒），超时后终止对应子进程"
+    )
+    PARSE_BATCH_CHUNK_SIZE: int = Field(
+        default=100,
+        description="批量上传时每个批量解析任务包含的文件数"
+    )
+
+    # 技能词库（见 app/services/skill_lexicon.py）
+    SKILLS_LEXICON_PATH: str = Field(
+        default="",
+        description="技能词库JSON文件路径，为空时使用内置词库 app/data/skills_database.py"
+    )
+    SKILLS_LEXICON_CHECK_INTERVAL: int = Field(
+        default=30,
+        description="检查Redis中已发布词库版本的间隔（秒），新版本在此时间内生效"
+    )
+
+    # 简历解析耗时统计
+    PARSE_METRICS_SAMPLE_RATE: float = Field(
+        default=0.1,
+        description="记录各阶段耗时的解析采样比例（0~1），0表示不采样"
+    )
+    PARSE_METRICS_SLOWEST: int = Field(
+        default=20,
+        description="保留耗时最长的解析记录条数（含文件SHA-256，便于重放），0表示不保留"
+    )
+    PARSE_METRICS_ATTACH: bool = Field(
+        default=False,
+        description="是否在被采样的解析结果中附带各阶段耗时（parse_profile字段）"
+    )
+
     # JWT配置
     SECRET_KEY: str = Field(
         default="your-secret-key-change-in-production",
@@ -92,6 +186,30 @@ class Settings(BaseSettings):
         default="",
         description="邮箱授权码"
     )
+    EMAIL_SYNC_MAX_PER_RUN: int = Field(
+        default=500,
+        description="每次增量同步每个文件夹最多获取的新邮件数，其余的下次同步时继续"
+    )
+    EMAIL_FETCH_BATCH_SIZE: int = Field(
+        default=100,
+        description="每条 UID FETCH 命令获取的邮件数（先批量获取邮件结构，再只获取正文和简历附件）"
+    )
+    EMAIL_FETCH_MAX_BYTES: int = Field(
+        default=20 * 1024 * 1024,
+        description="按部分获取邮件时单条 UID FETCH 命令的最大数据量（字节，按邮件结构中的大小估算）"
+    )
+    EMAIL_SCAN_CONCURRENCY: int = Field(
+        default=4,
+        description="抓取历史邮件时并行扫描的文件夹数（同时打开的IMAP连接数，不要超过邮箱服务商对同一账号的连接数限制）"
+    )
+    EMAIL_IDLE_TIMEOUT: int = Field(
+        default=540,
+        description="新邮件监听每次 IDLE 的最长时间（秒），到时重新 IDLE；应小于服务器和网络设备断开空闲连接的时间（RFC 2177 要求小于29分钟）"
+    )
+    EMAIL_IDLE_MAX_BACKOFF: int = Field(
+        default=300,
+        description="新邮件监听断线重连的最长等待时间（秒），从5秒开始每次失败加倍"
+    )
 
     class Config:
         env_file = ".env"
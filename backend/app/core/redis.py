@@ -0,0 +1,80 @@
+"""Redis连接 - 解析缓存、解析耗时统计、技能词库、学历等级排队共用
+
+这些功能中Redis都是可选的：连接不上时 get_redis() 返回None，调用方退回本地实现
+（磁盘缓存、进程内统计、本地词库、不去重）。失败后 RETRY_INTERVAL 秒内不再重连，
+避免每次调用都等待连接超时；操作失败时调用 redis_failed()，下次按同样的间隔重连。
+
+同一URL的客户端在进程内共用（redis-py 的客户端线程安全，fork 后连接池会自动重建）。
+
+使用方法:
+    client = get_redis()
+    if client is not None:
+        try:
+            client.get(key)
+        except Exception as e:
+            logger.warning(f"...Redis操作失败: {e}")
+            redis_failed()
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Redis连接失败后，多久再尝试重连（秒）
+RETRY_INTERVAL = 60
+
+_clients: Dict[str, object] = {}
+_failed_at: Dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def _resolve(url: Optional[str]) -> str:
+    if url:
+        return url
+    from app.core.config import settings
+    return settings.REDIS_URL
+
+
+def get_redis(url: Optional[str] = None):
+    """获取Redis客户端，不可用时返回None（RETRY_INTERVAL 秒后重试）
+
+    Args:
+        url: Redis连接URL，默认 REDIS_URL
+    """
+    url = _resolve(url)
+    client = _clients.get(url)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(url)
+        if client is not None:
+            return client
+        failed_at = _failed_at.get(url)
+        if failed_at and time.time() - failed_at < RETRY_INTERVAL:
+            return None
+        try:
+            import redis
+            client = redis.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+            client.ping()
+        except Exception as e:
+            logger.warning(f"无法连接Redis，{RETRY_INTERVAL}秒后重试: {e}")
+            _failed_at[url] = time.time()
+            return None
+        _clients[url] = client
+        _failed_at.pop(url, None)
+        return client
+
+
+def current_redis(url: Optional[str] = None):
+    """已连接的Redis客户端，没有连接时返回None（不尝试连接）"""
+    return _clients.get(_resolve(url))
+
+
+def redis_failed(url: Optional[str] = None) -> None:
+    """Redis操作失败：丢弃客户端，RETRY_INTERVAL 秒后再重连"""
+    url = _resolve(url)
+    with _lock:
+        _clients.pop(url, None)
+        _failed_at[url] = time.time()
@@ -6,9 +6,11 @@
 - 所有评分由外部Agent完成
 """
 
-from typing import Dict, List, Pattern
+from typing import Dict, List, Pattern, Set, Tuple
 import re
 
+from app.utils.regex_trie import build_trie_pattern
+
 
 # 7个大类的职位名称列表（用于精确匹配）
 JOB_TITLES: Dict[str, List[str]] = {
@@ -155,6 +157,75 @@ def get_compiled_patterns(job_name: str) -> List[Pattern]:
     return _COMPILED_PATTERNS.get(job_name, {}).get("fuzzy_compiled", [])
 
 
+def _compile_automaton() -> Tuple[Pattern, Dict[str, Tuple[str, ...]]]:
+    """把所有职位的全部名称编译成一个前缀树正则（不区分大小写，一次扫描匹配所有职位）
+
+    前瞻在每个起点取最长的名称；同一起点上更短的名称（最长名称的前缀）必然也出现，
+    因此每个名称附带其所有前缀名称所属的职位，例如"产品运营经理"同时命中 产品经理 和 市场运营（"产品运营"）。
+
+    名称按 casefold() 存储。
+
+    Returns:
+        (正则, {casefold名称: 命中的职位})
+    """
+    jobs_by_name: Dict[str, List[str]] = {}
+    for job_name, patterns in JOB_TITLES.items():
+        for pattern in patterns:
+            jobs = jobs_by_name.setdefault(pattern.casefold(), [])
+            if job_name not in jobs:
+                jobs.append(job_name)
+
+    hits: Dict[str, Tuple[str, ...]] = {}
+    for name in jobs_by_name:
+        matched: Set[str] = set()
+        for end in range(1, len(name) + 1):
+            matched.update(jobs_by_name.get(name[:end], ()))
+        hits[name] = tuple(matched)
+
+    pattern = re.compile('(?=(' + build_trie_pattern(jobs_by_name) + '))', re.IGNORECASE)
+    return pattern, hits
+
+
+# 所有职位名称的组合正则（模块加载时编译）
+_JOB_AUTOMATON, _JOBS_BY_NAME = _compile_automaton()
+_JOB_PRIORITY = {job_name: get_job_config(job_name).get('priority', 50) for job_name in JOB_TITLES}
+
+
+def _jobs_for_match(matched: str) -> Tuple[str, ...]:
+    """组合正则匹配到的原文对应的职位
+
+    re.IGNORECASE 按单个字符的大小写等价匹配，个别字符（如 "İ" 匹配 "i"）casefold() 后与名称不同，
+    这时在等长名称中逐个比较找出匹配的那个。
+    """
+    jobs = _JOBS_BY_NAME.get(matched.casefold())
+    if jobs is not None:
+        return jobs
+    for name, jobs in _JOBS_BY_NAME.items():
+        if len(name) == len(matched) and re.fullmatch(re.escape(name), matched, re.IGNORECASE):
+            return jobs
+    return ()
+
+
+def match_job_titles(text: str) -> List[Tuple[str, int]]:
+    """一次扫描找出文本中出现的所有职位（等价于逐个职位、逐个模式 search）
+
+    Args:
+        text: 待匹配的文本
+
+    Returns:
+        [(职位名称, 优先级)]，按 JOB_TITLES 中的顺序
+    """
+    if not text:
+        return []
+
+    found: Set[str] = set()
+    for match in _JOB_AUTOMATON.finditer(text):
+        found.update(_jobs_for_match(match.group(1)))
+        if len(found) == len(JOB_TITLES):
+            break
+    return [(job_name, _JOB_PRIORITY[job_name]) for job_name in JOB_TITLES if job_name in found]
+
+
 def is_valid_job(job_name: str) -> bool:
     """检查职位是否在定义列表中
 
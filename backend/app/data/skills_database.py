@@ -4,6 +4,9 @@
 - 本地不进行技能评分
 - 所有技能评估通过外部Agent完成
 - 此文件仅用于提取技能关键词（不用于评分）
+
+这是内置词库；配置 SKILLS_LEXICON_PATH 后改为从JSON词库文件加载，
+发布新版本不需要重新部署（见 app/services/skill_lexicon.py）。
 """
 
 # 通用技能列表（仅用于关键词提取，不用于评分）
@@ -55,3 +58,14 @@ SKILL_SYNONYMS = {
     "k8s": "Kubernetes",
     "nginx": "Nginx"
 }
+
+# 技能排序优先级（编程语言 > 框架 > 工具），未列出的为0
+SKILL_PRIORITY = {
+    'Python': 10, 'Java': 10, 'JavaScript': 10, 'TypeScript': 10, 'Go': 10, 'C++': 10,
+    'React': 9, 'Vue': 9, 'Angular': 9, 'Django': 9, 'Flask': 9, 'FastAPI': 9, 'Node.js': 9,
+    'MySQL': 8, 'PostgreSQL': 8, 'MongoDB': 8, 'Redis': 8, 'Oracle': 8,
+    'Docker': 8, 'Kubernetes': 8, 'Linux': 8, 'Git': 8, 'Jenkins': 8,
+    'Excel': 7, 'SAP': 7, 'Word': 7, 'PowerPoint': 7,
+    '财务': 6, '会计': 6, '审计': 6, '税务': 6,
+    '招聘': 5, '培训': 5, '绩效管理': 5, '项目管理': 5,
+}
@@ -6,7 +6,16 @@
 - 985工程大学名单（39所）
 - 211工程大学名单（115所，含39所985）
 - QS世界大学排名前200（含中国和外国大学）
+
+名单在模块加载时编译为只读索引：UNIVERSITY_LEVELS（标准名称 -> 等级，classify_university 一次哈希查找），
+以及覆盖全部校名和别名的前缀树正则（find_universities 一次扫描找出文本中提到的所有已知学校）。
 """
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping
+
+from app.utils.regex_trie import build_trie_pattern
 
 # ============== 中国大学数据 ==============
 
@@ -396,6 +405,7 @@ for school_list in [
         SCHOOL_NAME_MAP[school.lower()] = school
 
 # 添加中文别名校（如 台大、港大等）
+# 内地高校的别名指向中文校名（名单中只有中文校名）
 SCHOOL_ALIASES = {
     "台大": "National Taiwan University",
     "台清交": "National Taiwan University",
@@ -404,15 +414,15 @@ SCHOOL_ALIASES = {
     "港科": "Hong Kong University of Science and Technology",
     "港城": "City University of Hong Kong",
     "港理工": "Hong Kong Polytechnic University",
-    "清华": "Tsinghua University",
-    "北大": "Peking University",
-    "复旦": "Fudan University",
-    "交大": "Shanghai Jiao Tong University",
-    "浙大": "Zhejiang University",
-    "南大": "Nanjing University",
-    "中科大": "University of Science and Technology of China",
-    "哈工大": "Harbin Institute of Technology",
-    "同济": "Tongji University",
+    "清华": "清华大学",
+    "北大": "北京大学",
+    "复旦": "复旦大学",
+    "交大": "上海交通大学",
+    "浙大": "浙江大学",
+    "南大": "南京大学",
+    "中科大": "中国科学技术大学",
+    "哈工大": "哈尔滨工业大学",
+    "同济": "同济大学",
     "mit": "Massachusetts Institute of Technology",
     "stanford": "Stanford University",
     "harvard": "Harvard University",
@@ -424,6 +434,48 @@ for alias, full_name in SCHOOL_ALIASES.items():
     SCHOOL_NAME_MAP[alias.lower()] = full_name
 
 
+# ============== 索引 ==============
+
+# 校名清理：括号及其内容（如 "(211)"、"（华东）"），末尾的标签（如 东北农业大学211）
+_BRACKETED = re.compile(r'[()（）][^()（）]*')
+_TRAILING_TAGS = re.compile(r'(985|211|双一流|一流大学|一流学科)$')
+
+_985 = frozenset(UNIVERSITIES_985)
+
+
+def _level_of(school: str) -> str:
+    """名单中学校的等级（优先级：QS前50 > QS前100 > QS前200 > 985 > 211）"""
+    if school in ALL_QS_TOP_50:
+        return "QS前50"
+    if school in ALL_QS_51_100:
+        return "QS前100"
+    if school in ALL_QS_101_200:
+        return "QS前200"
+    if school in _985:
+        return "985"
+    if school in ALL_211:
+        return "211"
+    return "双非"
+
+
+def _build_level_index() -> Mapping[str, str]:
+    """标准名称 -> 等级
+
+    带括号的校名（如 "中国石油大学(华东)"）另外登记去掉括号的写法，
+    classify_university 清理括号后仍能查到（同一学校各校区等级相同）。
+    """
+    schools = ALL_211 | ALL_QS_TOP_50 | ALL_QS_51_100 | ALL_QS_101_200
+    levels = {school: _level_of(school) for school in schools}
+    for school in sorted(schools):
+        stripped = _BRACKETED.sub('', school).strip()
+        if stripped != school:
+            levels.setdefault(stripped, levels[school])
+    return MappingProxyType(levels)
+
+
+UNIVERSITY_LEVELS: Mapping[str, str] = _build_level_index()
+
+
 def classify_university(school_name: str) -> str:
     """分类大学等级
 
@@ -438,44 +490,115 @@ def classify_university(school_name: str) -> str:
     if not school_name:
         return "双非"
 
-    import re
+    # 标准化学校名称：移除括号及其内容、末尾的常见标签
+    school_clean = _BRACKETED.sub('', school_name.strip()).strip()
+    school_clean = _TRAILING_TAGS.sub('', school_clean).strip()
 
-    # 标准化学校名称
-    school_clean = school_name.strip()
+    # 先通过别名映射获取正式名称
+    school_clean = SCHOOL_NAME_MAP.get(school_clean.lower(), school_clean)
 
-    # 移除括号及其内容（如 "(211)"、"（211）"、"985"等标签）
-    # 使用正则同时处理中文和英文括号
-    school_clean = re.sub(r'[()（）][^()（）]*', '', school_clean).strip()
+    return UNIVERSITY_LEVELS.get(school_clean, "双非")
 
-    # 移除末尾的常见标签（可能没有括号的）
-    # 例如：东北农业大学211、清华大学985
-    school_clean = re.sub(r'(985|211|双一流|一流大学|一流学科)$', '', school_clean).strip()
 
-    school_lower = school_clean.lower()
+# ============== 文本扫描 ==============
 
-    # 先通过别名映射获取正式名称
-    if school_lower in SCHOOL_NAME_MAP:
-        school_clean = SCHOOL_NAME_MAP[school_lower]
+@dataclass(frozen=True)
+class UniversityMention:
+    """文本中提到的已知学校
 
-    # 优先级1：QS前50
-    if school_clean in ALL_QS_TOP_50:
-        return "QS前50"
+    Attributes:
+        name: 标准名称
+        level: 等级
+        start: 在文本中的起始位置
+        end: 结束位置（不含）
+    """
+    name: str
+    level: str
+    start: int
+    end: int
 
-    # 优先级2：QS前100
-    if school_clean in ALL_QS_51_100:
-        return "QS前100"
 
-    # 优先级3：QS前200
-    if school_clean in ALL_QS_101_200:
-        return "QS前200"
+# 中文别名（如 "南大"）很短，前后都不能紧接汉字（避免 "河南大学" 命中 "南大"）
+_CJK_ALIASES = frozenset(alias for alias in SCHOOL_ALIASES if not alias.isascii())
+# 是其他已知校名结尾的中文校名（如 "交通大学"、"清华大学"），前面紧接汉字时只接受常见的引导词：
+# 毕业于/就读于/考入、学历学位（硕士清华大学）、栏目名（学校名称清华大学），避免 "华东交通大学" 命中 "交通大学"
+_LEAD_IN_TOKENS = (
+    '于', '在', '校', '读', '入', '毕业',
+    '硕士', '博士', '学士', '本科', '研究生', '大专', '专科', '学历', '学位',
+    '名称', '背景', '经历',
+)
 
-    # 优先级4：985
-    if school_clean in UNIVERSITIES_985:
-        return "985"
 
-    # 优先级5：211
-    if school_clean in ALL_211:
-        return "211"
+# 扫描时只把ASCII字母转成小写（长度不变，命中位置与原文一致）
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
 
-    # 默认：双非
-    return "双非"
+
+def _is_cjk(char: str) -> bool:
+    return '\u4e00' <= char <= '\u9fff'
+
+
+def _is_ascii_alnum(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def _build_scanner():
+    """校名写法（ASCII小写）-> 标准名称，以及覆盖全部写法的前缀树正则"""
+    names: Dict[str, str] = {}
+    for school in UNIVERSITY_LEVELS:
+        names.setdefault(school.translate(_ASCII_LOWER), SCHOOL_NAME_MAP.get(school.lower(), school))
+    for alias in SCHOOL_ALIASES:
+        names[alias.translate(_ASCII_LOWER)] = SCHOOL_NAME_MAP[alias.lower()]
+
+    suffixes = frozenset(
+        name for name in names
+        if _is_cjk(name[0]) and any(other != name and other.endswith(name) for other in names)
+    )
+    # 在小写后的文本上匹配（不用 IGNORECASE，正则可以按首字符快速跳过）
+    return re.compile(build_trie_pattern(names)), MappingProxyType(names), suffixes
+
+
+_SCANNER, _SCANNER_NAMES, _SUFFIX_NAMES = _build_scanner()
+
+
+def _is_standalone(text: str, start: int, end: int, name: str) -> bool:
+    """命中的前后文是否允许把它当作学校名称"""
+    before = text[start - 1] if start > 0 else ''
+    after = text[end] if end < len(text) else ''
+    # 英文校名/缩写：前后不能是字母数字（避免 "submit" 命中 "mit"）
+    if _is_ascii_alnum(name[0]) and before and _is_ascii_alnum(before):
+        return False
+    if _is_ascii_alnum(name[-1]) and after and _is_ascii_alnum(after):
+        return False
+    if name in _CJK_ALIASES and ((before and _is_cjk(before)) or (after and _is_cjk(after))):
+        return False
+    if name in _SUFFIX_NAMES and before and _is_cjk(before) and not text.endswith(_LEAD_IN_TOKENS, 0, start):
+        return False
+    return True
+
+
+def find_universities(text: str) -> List[UniversityMention]:
+    """一次扫描找出文本中提到的所有已知学校（按出现顺序，不重叠，同一位置取最长的写法）
+
+    Args:
+        text: 文本
+
+    Returns:
+        UniversityMention 列表
+    """
+    if not text:
+        return []
+
+    lowered = text.translate(_ASCII_LOWER)
+    mentions: List[UniversityMention] = []
+    match = _SCANNER.search(lowered)
+    while match:
+        start, end = match.span()
+        matched = match.group()
+        if _is_standalone(lowered, start, end, matched):
+            name = _SCANNER_NAMES[matched]
+            mentions.append(UniversityMention(name, UNIVERSITY_LEVELS[name], start, end))
+            match = _SCANNER.search(lowered, end)
+        else:
+            # 边界不满足时从下一个字符继续（可能是另一个校名的开头）
+            match = _SCANNER.search(lowered, start + 1)
+    return mentions
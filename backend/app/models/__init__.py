@@ -1,6 +1,7 @@
 """数据库模型导入"""
 from app.models.user import User
 from app.models.email_config import EmailConfig
+from app.models.mail_sync_state import MailSyncState
 from app.models.job import Job
 from app.models.resume import Resume
 from app.models.screening_result import ScreeningResult
@@ -8,6 +9,7 @@ from app.models.screening_result import ScreeningResult
 __all__ = [
     "User",
     "EmailConfig",
+    "MailSyncState",
     "Job",
     "Resume",
     "ScreeningResult",
@@ -0,0 +1,30 @@
+"""邮箱同步状态模型"""
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, BigInteger, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+
+class MailSyncState(Base):
+    """邮箱文件夹的增量同步进度（UID高水位）
+
+    UIDVALIDITY 不变时，文件夹中 UID 大于 last_seen_uid 的邮件都是新邮件；
+    UIDVALIDITY 变化（文件夹重建、服务器迁移）后旧的 UID 失效，需要重新建立基线：
+    基线（baseline_uid）之前的邮件只处理未读的，last_seen_uid 记录处理到的位置。
+    """
+    __tablename__ = "mail_sync_states"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    email_address = Column(String(200), nullable=False)
+    folder = Column(String(200), nullable=False)  # IMAP文件夹名（modified UTF-7编码，与SELECT使用的名称一致）
+    uid_validity = Column(BigInteger, nullable=False)
+    last_seen_uid = Column(BigInteger, nullable=False, default=0)  # 已处理到的最大UID
+    baseline_uid = Column(BigInteger)  # 建立基线时的最大UID；不为空时还在处理基线之前的未读邮件，处理完后清空
+    last_synced_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('email_address', 'folder', name='uq_mail_sync_state_folder'),
+    )
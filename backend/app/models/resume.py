@@ -31,6 +31,12 @@ class Resume(Base):
     raw_text = Column(Text)  # 简历原文
     file_path = Column(String(500))  # 原始文件路径
     file_type = Column(String(20))  # pdf/docx
+    extraction_tier = Column(String(30))  # PDF正文提取层级：text_layer/layout/text_layer_fallback/pdfplumber/image_only
+    review_reason = Column(String(50), index=True)  # 需要人工审核的原因代码：pdf_timeout/pdf_memory_limit/pdf_worker_crashed/pdf_image_only 等
+
+    # 解析版本（增量重新解析用，见 app/services/parse_versions.py）
+    parser_version = Column(String(20), index=True)  # 解析器版本 resume_parser.PARSER_VERSION
+    extractor_versions = Column(JSONB, default=None)  # 各提取器版本 {"skills": 1, "education": 1, ...}
 
     # 来源信息
     source_email_id = Column(String(200))  # 来源邮件ID
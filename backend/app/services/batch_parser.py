@@ -0,0 +1,385 @@
+"""批量简历解析 - 子进程池并行解析，按完成顺序流式返回结果
+
+批量入口（多来源上传最多1500个文件、ZIP导入、reparse_all_resumes）原先逐个解析：
+每个文件一个Celery任务，或者一个串行循环。这里把解析分发到常驻的解析子进程：
+
+- 每个子进程启动时预热一次（PyMuPDF导入、正则、技能词库、Unicode字符表、学校库），之后复用
+- 结果按完成顺序 yield，单个文件失败（异常/超时/子进程崩溃）只影响这一项，给出错误原因
+- 输入是惰性消费的：同时在途的文件数不超过 max_in_flight，字节输入不会一次性全部读进内存
+- 单个文件超过 PARSE_BATCH_TIMEOUT 时终止对应子进程并重新拉起
+
+和PDF提取隔离一样，Celery prefork 的子进程是 daemon 进程，不能用 multiprocessing，
+因此子进程用 subprocess 启动 `python -m app.services.batch_parser`，协议与 pdf_extractor 相同。
+workers=0 时在当前进程内串行解析（小批量、调试，以及 Celery 任务中：多个分组已由 Celery 并行执行）。
+
+解析子进程内不再启动 PDF提取子进程（PDF_EXTRACT_ISOLATED 在子进程中关闭）：解析子进程本身有
+PARSE_BATCH_TIMEOUT 超时并可被终止，地址空间同样限制为 PDF_EXTRACT_MEMORY_MB，每个解析子进程只有一个Python进程。
+
+用法:
+    parser = ResumeParser()
+    for outcome in parser.parse_many(['/app/resume_files/a.pdf', '/app/resume_files/b.docx'], workers=4):
+        if outcome.ok:
+            save(outcome.result)
+        else:
+            logger.error(f"{outcome.source}: {outcome.error}")
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from app.services.pdf_extractor import SubprocessWorker, WorkerCrashed, WorkerTimeout, reply_channel
+
+logger = logging.getLogger(__name__)
+
+# 失败原因代码
+REASON_TIMEOUT = 'parse_timeout'
+REASON_CRASHED = 'parse_worker_crashed'
+REASON_ERROR = 'parse_error'
+REASON_MEMORY = 'parse_memory_limit'
+
+_WORKER_MODULE = 'app.services.batch_parser'
+# 解析子进程处理多少个文件后回收重建
+_MAX_TASKS_PER_WORKER = 500
+# 未配置子进程数时的上限
+_MAX_DEFAULT_WORKERS = 8
+
+
+@dataclass
+class BatchItem:
+    """批量解析的一项输入
+
+    path / data / text 三选一：
+    - path: 文件路径（由解析子进程自己读取，不经过管道）
+    - data + filename: 内存中的文件内容（上传/附件）
+    - text: 已提取的简历正文（重新解析数据库中的 raw_text），clean=True 时先经过 TextCleaner
+
+    Attributes:
+        email_subject: 邮件标题（用于提取姓名、工作年限）
+        fields: 只计算这些字段（仅 text 输入，按需解析，见 ParsedResume）；None 表示完整解析
+        key: 调用方自定义的标识，原样带回到结果中
+    """
+    path: Optional[str] = None
+    data: Optional[bytes] = None
+    filename: Optional[str] = None
+    text: Optional[str] = None
+    clean: bool = False
+    email_subject: Optional[str] = None
+    fields: Optional[Tuple[str, ...]] = None
+    key: Any = None
+
+    @property
+    def source(self) -> str:
+        """日志和结果中显示的来源"""
+        return self.path or self.filename or '<text>'
+
+
+@dataclass
+class BatchOutcome:
+    """一项的解析结果
+
+    Attributes:
+        index: 在输入中的序号
+        item: 输入项
+        ok: 是否解析成功（解析器返回空结果也算成功，由调用方按 raw_text 判断是否需要人工审核）
+        result: 解析结果
+        reason: 失败原因代码（REASON_*）
+        error: 失败详情
+        elapsed: 耗时（秒）
+    """
+    index: int
+    item: BatchItem
+    ok: bool
+    result: Optional[Dict] = None
+    reason: Optional[str] = None
+    error: str = ''
+    elapsed: float = 0.0
+
+    @property
+    def source(self) -> str:
+        return self.item.source
+
+    @property
+    def key(self) -> Any:
+        return self.item.key
+
+
+BatchInput = Union[str, Path, Tuple[bytes, str], BatchItem]
+
+
+def _to_item(value: BatchInput) -> BatchItem:
+    if isinstance(value, BatchItem):
+        return value
+    if isinstance(value, (str, Path)):
+        return BatchItem(path=str(value))
+    if isinstance(value, tuple):
+        data, filename = value
+        return BatchItem(data=data, filename=filename)
+    raise TypeError(f"不支持的批量解析输入: {type(value).__name__}")
+
+
+def _parse_item(parser, item: BatchItem) -> Dict:
+    """在当前进程中解析一项（子进程和 workers=0 时共用）"""
+    if item.text is not None:
+        text = item.text
+        if item.clean:
+            text = parser._clean_text(text)
+        filename = item.filename or item.path
+        if item.fields is not None:
+            parsed = parser._parse_text(text, email_subject=item.email_subject, filename=filename, lazy=True)
+            # education_level 没有识别出学校等级时不存在，与完整解析结果中缺少该键一致
+            return {field: parsed[field] for field in item.fields if field in parsed}
+        return parser._parse_text(text, email_subject=item.email_subject, filename=filename)
+    if item.data is not None:
+        return parser.parse_resume_bytes(item.data, item.filename or '', email_subject=item.email_subject)
+    return parser.parse_resume(item.path, email_subject=item.email_subject)
+
+
+class _WorkerSet:
+    """解析子进程（每个调度线程取一个空闲子进程使用）"""
+
+    def __init__(self, memory_mb: int):
+        self.memory_mb = memory_mb
+        self._idle: List[SubprocessWorker] = []
+        self._lock = threading.Lock()
+
+    def take(self) -> SubprocessWorker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive():
+                    return worker
+                worker.kill()
+        return SubprocessWorker(_WORKER_MODULE, ['--memory-mb', str(self.memory_mb)])
+
+    def give_back(self, worker: SubprocessWorker) -> None:
+        if not worker.alive() or worker.tasks_done >= _MAX_TASKS_PER_WORKER:
+            worker.kill()
+            return
+        with self._lock:
+            self._idle.append(worker)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.kill()
+
+
+def _run_in_worker(workers: _WorkerSet, index: int, item: BatchItem, timeout: float) -> BatchOutcome:
+    start = time.monotonic()
+    payload = {
+        'path': item.path,
+        'filename': item.filename,
+        'text': item.text,
+        'clean': item.clean,
+        'email_subject': item.email_subject,
+        'fields': item.fields,
+        'has_data': item.data is not None,
+    }
+    try:
+        worker = workers.take()
+    except OSError as e:
+        return BatchOutcome(index, item, ok=False, reason=REASON_CRASHED, error=f"无法启动解析子进程: {e}")
+
+    try:
+        reply = worker.request(payload, item.data or b'', timeout)
+    except WorkerTimeout:
+        worker.kill()
+        logger.warning(f"批量解析超时（{timeout}秒），已终止子进程: {item.source}")
+        return BatchOutcome(index, item, ok=False, reason=REASON_TIMEOUT,
+                            error=f"超过{timeout}秒", elapsed=time.monotonic() - start)
+    except WorkerCrashed as e:
+        worker.kill()
+        logger.warning(f"批量解析子进程异常退出: {item.source}, {e}")
+        return BatchOutcome(index, item, ok=False, reason=REASON_CRASHED,
+                            error=str(e), elapsed=time.monotonic() - start)
+
+    workers.give_back(worker)
+    return BatchOutcome(
+        index, item,
+        ok=reply.get('ok', False),
+        result=reply.get('result'),
+        reason=reply.get('reason'),
+        error=reply.get('error', ''),
+        elapsed=time.monotonic() - start,
+    )
+
+
+def default_workers() -> int:
+    """按CPU核数决定子进程数（单核机器上子进程只会增加开销，直接串行）"""
+    cpus = os.cpu_count() or 1
+    return 0 if cpus <= 1 else min(cpus, _MAX_DEFAULT_WORKERS)
+
+
+def parse_many(
+    items: Iterable[BatchInput],
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    timeout: Optional[float] = None,
+    parser=None,
+) -> Iterator[BatchOutcome]:
+    """批量解析，按完成顺序逐项返回结果
+
+    Args:
+        items: 文件路径、(字节, 文件名)、或 BatchItem；惰性消费，可以是生成器
+        workers: 解析子进程数，默认 PARSE_BATCH_WORKERS（未设置时按CPU核数）；0 表示在当前进程中串行解析
+        max_in_flight: 同时在途（已读取/已分发未返回）的最大项数，默认 workers 的2倍
+        timeout: 单项超时（秒），默认 PARSE_BATCH_TIMEOUT
+        parser: workers=0 时使用的 ResumeParser（默认新建一个）
+
+    Yields:
+        BatchOutcome（单项失败不会中断整批）
+    """
+    from app.core.config import settings
+
+    if workers is None:
+        workers = settings.PARSE_BATCH_WORKERS
+    if workers is None:
+        workers = default_workers()
+    timeout = settings.PARSE_BATCH_TIMEOUT if timeout is None else timeout
+
+    if workers <= 0:
+        yield from _parse_serial(items, parser)
+        return
+
+    max_in_flight = max(max_in_flight or workers * 2, workers)
+    worker_set = _WorkerSet(settings.PDF_EXTRACT_MEMORY_MB)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='batch-parse')
+    pending: Set[Future] = set()
+    source = enumerate(items)
+    exhausted = False
+    try:
+        while True:
+            # 补充在途项（输入惰性读取，在途数有上限）
+            while not exhausted and len(pending) < max_in_flight:
+                try:
+                    index, value = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                try:
+                    item = _to_item(value)
+                except TypeError as e:
+                    yield BatchOutcome(index, BatchItem(key=value), ok=False, reason=REASON_ERROR, error=str(e))
+                    continue
+                pending.add(executor.submit(_run_in_worker, worker_set, index, item, timeout))
+
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # 调用方提前停止迭代时，丢弃还没开始的项
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        worker_set.shutdown()
+
+
+def _parse_serial(items: Iterable[BatchInput], parser=None) -> Iterator[BatchOutcome]:
+    if parser is None:
+        from app.services.resume_parser import ResumeParser
+        parser = ResumeParser()
+
+    for index, value in enumerate(items):
+        start = time.monotonic()
+        try:
+            item = _to_item(value)
+        except TypeError as e:
+            yield BatchOutcome(index, BatchItem(key=value), ok=False, reason=REASON_ERROR, error=str(e))
+            continue
+        try:
+            result = _parse_item(parser, item)
+        except Exception as e:
+            logger.error(f"批量解析失败: {item.source}, {e}")
+            yield BatchOutcome(index, item, ok=False, reason=REASON_ERROR, error=str(e),
+                               elapsed=time.monotonic() - start)
+            continue
+        yield BatchOutcome(index, item, ok=True, result=result, elapsed=time.monotonic() - start)
+
+
+# ==================== 子进程端 ====================
+
+def _warm_up():
+    """子进程启动时加载一次性资源，之后每个文件直接复用"""
+    from app.services.resume_parser import ResumeParser
+    from app.services.skill_matcher import get_skill_matcher
+    from app.utils.text_cleaner import _deleted_chars
+
+    try:
+        import fitz  # noqa
+    except ImportError:
+        pass
+    get_skill_matcher()
+    _deleted_chars()
+    import app.data.university_database  # noqa
+    return ResumeParser()
+
+
+def _worker_main(memory_mb: int) -> None:
+    """子进程入口：逐行读取请求，逐行写回JSON结果"""
+    from app.core.config import settings
+
+    if memory_mb:
+        import resource
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    # 本进程已有超时和内存限制，pymupdf4llm 直接在进程内运行，不再为每个解析子进程再启动一个PDF提取子进程
+    settings.PDF_EXTRACT_ISOLATED = False
+
+    channel = reply_channel()
+    logging.basicConfig(level=logging.WARNING)
+    parser = _warm_up()
+
+    stdin = sys.stdin.buffer
+    while True:
+        line = stdin.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        data = stdin.read(request.get('size', 0))
+        item = BatchItem(
+            path=request.get('path'),
+            data=data if request.get('has_data') else None,
+            filename=request.get('filename'),
+            text=request.get('text'),
+            clean=request.get('clean', False),
+            email_subject=request.get('email_subject'),
+            fields=tuple(request['fields']) if request.get('fields') is not None else None,
+        )
+        exit_after_reply = False
+        try:
+            reply = {'ok': True, 'result': _parse_item(parser, item)}
+        except MemoryError as e:
+            reply = {'ok': False, 'reason': REASON_MEMORY, 'error': str(e) or 'MemoryError'}
+            exit_after_reply = True
+        except Exception as e:
+            reply = {'ok': False, 'reason': REASON_ERROR, 'error': str(e)}
+
+        try:
+            encoded = json.dumps(reply, ensure_ascii=False, default=str)
+        except (TypeError, ValueError) as e:
+            encoded = json.dumps({'ok': False, 'reason': REASON_ERROR, 'error': f"解析结果无法序列化: {e}"})
+        channel.write(encoded.encode('utf-8') + b'\n')
+        channel.flush()
+        if exit_after_reply:
+            # 内存耗尽后进程状态不可信，回复后退出，由父进程重新拉起
+            break
+
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description='批量解析子进程')
+    arg_parser.add_argument('--memory-mb', type=int, default=0)
+    _worker_main(arg_parser.parse_args().memory_mb)
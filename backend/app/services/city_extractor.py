@@ -1,9 +1,16 @@
-"""城市提取服务 - 从邮件主题、正文、简历中提取城市信息"""
+"""城市提取服务 - 从邮件主题、正文、简历中提取城市信息
+
+全部城市和别名编译成一个前缀树正则（公共前缀只比较一次，优先匹配最长的名称），
+邮件主题的七种格式和正文/简历的关键词规则在初始化时一次性预编译。
+城市数据是静态的，进程内共享一个实例即可（get_city_extractor）。
+"""
 import re
 import logging
-from typing import Optional, List
+from collections import Counter
+from typing import Optional, List, Pattern, Tuple
 from dataclasses import dataclass, field
 from app.data.cities import ALL_CITIES, CITY_ALIASES, get_standard_city_name
+from app.utils.regex_trie import build_trie_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -24,22 +31,64 @@ class CityExtractor:
     """城市提取器"""
 
     def __init__(self):
-        """初始化城市提取器"""
-        # 构建城市正则表达式模式（按长度降序，避免短词匹配长词的一部分）
-        sorted_cities = sorted(ALL_CITIES, key=len, reverse=True)
-        city_pattern = '|'.join(re.escape(city) for city in sorted_cities)
-
-        # 构建别名正则表达式模式
-        alias_pattern = '|'.join(re.escape(alias) for alias in CITY_ALIASES.keys())
-
-        # 组合模式：优先匹配完整城市名，再匹配别名
-        self.city_pattern = f'({city_pattern}|{alias_pattern})'
+        """初始化城市提取器（编译全部正则）"""
+        # 城市名和别名构建为前缀树（贪婪优先匹配最长的名称，避免短词匹配长词的一部分）
+        city_trie = build_trie_pattern(list(ALL_CITIES) + list(CITY_ALIASES.keys()))
+        self.city_pattern = f'({city_trie})'
+        self._city_regex = re.compile(city_trie)
 
         # 应聘关键词模式（用于从邮件主题提取）
         self.application_keywords = ['应聘', '申请', '期望', '求职意向', '投递', '岗位地点', '工作地点']
 
+        # 邮件主题格式（按优先级），第1个捕获组为城市：(规则, 命中时的日志描述)
+        city = self.city_pattern
+        subject_formats = [
+            # 格式1: BOSS直聘 【职位_城市_薪资】
+            (rf'【[^_]+_{city}_[^】]+】', 'BOSS格式'),
+            # 格式2: BOSS直聘 【职位（城市）_城市_薪资】
+            (rf'【[^（（]+\({city}\)[^】]+】', 'BOSS格式（括号内）'),
+            # 格式3: 括号城市标记 【城市】或[城市]
+            (rf'[【\[]{city}[】\]]', '括号格式'),
+        ]
+        # 格式4: 应聘/期望关键词格式
+        for keyword in self.application_keywords:
+            subject_formats.append((rf'{keyword}[:：\s\-]*{city}', None))
+            subject_formats.append((rf'{city}[:：\s\-]*{keyword}', None))
+        subject_formats.extend([
+            # 格式5: 城市开头 城市-岗位
+            (rf'^{city}[\s\-|]+', None),
+            # 格式6: 城市结尾 岗位-城市
+            (rf'[\s\-|/]+{city}$', None),
+            # 格式7: BOSS直聘格式 城市薪资【BOSS直聘】 或 城市数字-数字【...
+            # 例如: "上海8-13K【BOSS直聘】" 或 "北京15-25K【..."
+            (rf'{city}\d+[\d\-Kk]+【[^】]+】', 'BOSS格式(城市薪资)'),
+        ])
+        self._subject_patterns: List[Tuple[Pattern, Optional[str]]] = [
+            (re.compile(pattern), label) for pattern, label in subject_formats
+        ]
+
+        # 邮件正文：期望工作地点等关键词、应聘/期望关键词后的城市
+        self._body_location_patterns = self._compile_keywords(
+            ['期望工作地点', '可工作城市', '工作地点', '期望城市', '求职地点'], r'[:：\s]*')
+        self._body_keyword_patterns = self._compile_keywords(self.application_keywords, r'[^。]*?')
+
+        # 简历文本：期望工作地点、现居住地等关键词
+        self._resume_location_patterns = self._compile_keywords(
+            ['期望工作地点', '期望城市', '求职地点', '意向城市', '期望工作地'], r'[:：\s]*')
+        self._resume_residence_patterns = self._compile_keywords(
+            ['现居住地', '居住地', '所在地', '目前所在地'], r'[:：\s]*')
+
+        # 工作经历中的公司名前缀
+        self._work_patterns = [
+            re.compile(rf'{city}[^。]*?{suffix}') for suffix in ('公司', '科技', '有限')
+        ]
+
         logger.info(f"城市提取器初始化完成，支持 {len(ALL_CITIES)} 个城市，{len(CITY_ALIASES)}个别名")
 
+    def _compile_keywords(self, keywords: List[str], separator: str) -> List[Pattern]:
+        """编译"关键词 + 分隔 + 城市"规则（第1个捕获组为城市）"""
+        return [re.compile(rf'{keyword}{separator}{self.city_pattern}') for keyword in keywords]
+
     def extract_city(self, email_subject: str = '', email_body: str = '',
                      resume_text: str = '') -> CityExtractionResult:
         """按优先级提取城市，返回确认城市和候选城市
@@ -99,95 +148,17 @@ class CityExtractor:
         subject = subject.strip()
 
         # ========== 确认城市提取 ==========
-
-        # 格式1: BOSS直聘 【职位_城市_薪资】
-        boss_pattern1 = r'【[^_]+_({0})_[^】]+】'.format(self.city_pattern)
-        match = re.search(boss_pattern1, subject)
-        if match:
-            city_name = match.group(1)
-            standard_name = get_standard_city_name(city_name)
-            if standard_name:
-                result.confirmed_city = standard_name
-                logger.info(f"从BOSS格式提取到城市: {standard_name}")
-                # 同时收集候选城市
-                result.candidate_cities = []  # 只保留确认城市，不收集候选城市
-                return result
-
-        # 格式2: BOSS直聘 【职位（城市）_城市_薪资】
-        boss_pattern2 = r'【[^（（]+\((({0}))\)[^】]+】'.format(self.city_pattern)
-        match = re.search(boss_pattern2, subject)
-        if match:
-            city_name = match.group(1)
-            standard_name = get_standard_city_name(city_name)
-            if standard_name:
-                result.confirmed_city = standard_name
-                logger.info(f"从BOSS格式（括号内）提取到城市: {standard_name}")
-                result.candidate_cities = []  # 只保留确认城市，不收集候选城市
-                return result
-
-        # 格式3: 括号城市标记 【城市】或[城市]
-        bracket_city_pattern = r'[【\[]({0})[】\]]'.format(self.city_pattern)
-        match = re.search(bracket_city_pattern, subject)
-        if match:
-            city_name = match.group(1)
-            standard_name = get_standard_city_name(city_name)
-            if standard_name:
-                result.confirmed_city = standard_name
-                logger.info(f"从括号格式提取到城市: {standard_name}")
-                result.candidate_cities = []  # 只保留确认城市，不收集候选城市
-                return result
-
-        # 格式4: 应聘/期望关键词格式
-        for keyword in self.application_keywords:
-            patterns = [
-                rf'{keyword}[:：\s\-]*({self.city_pattern})',
-                rf'({self.city_pattern})[:：\s\-]*{keyword}',
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, subject)
-                if match:
-                    # get_standard_city_name 现在可以处理 tuple（来自嵌套捕获组）
-                    city_name = match.group(1)
-                    standard_name = get_standard_city_name(city_name)
-                    if standard_name:
-                        result.confirmed_city = standard_name
-                        result.candidate_cities = []  # 只保留确认城市，不收集候选城市
-                        return result
-
-        # 格式5: 城市开头 城市-岗位
-        pattern = rf'^({self.city_pattern})[\s\-|]+'
-        match = re.search(pattern, subject)
-        if match:
-            city_name = match.group(1)
-            standard_name = get_standard_city_name(city_name)
-            if standard_name:
-                result.confirmed_city = standard_name
-                result.candidate_cities = []  # 只保留确认城市，不收集候选城市
-                return result
-
-        # 格式6: 城市结尾 岗位-城市
-        pattern = rf'[\s\-|/]+({self.city_pattern})$'
-        match = re.search(pattern, subject)
-        if match:
-            city_name = match.group(1)
-            standard_name = get_standard_city_name(city_name)
-            if standard_name:
-                result.confirmed_city = standard_name
-                result.candidate_cities = []  # 只保留确认城市，不收集候选城市
-                return result
-
-        # 格式7: BOSS直聘格式 城市薪资【BOSS直聘】 或 城市数字-数字【...
-        # 例如: "上海8-13K【BOSS直聘】" 或 "北京15-25K【..."
-        boss_pattern3 = rf'({self.city_pattern})\d+[\d\-Kk]+【[^】]+】'
-        match = re.search(boss_pattern3, subject)
-        if match:
-            city_name = match.group(1)
-            standard_name = get_standard_city_name(city_name)
-            if standard_name:
-                result.confirmed_city = standard_name
-                logger.info(f"从BOSS格式(城市薪资)提取到城市: {standard_name}")
-                result.candidate_cities = []  # 只保留确认城市，不收集候选城市
-                return result
+        for pattern, label in self._subject_patterns:
+            match = pattern.search(subject)
+            if match:
+                city_name = match.group(1)
+                standard_name = get_standard_city_name(city_name)
+                if standard_name:
+                    result.confirmed_city = standard_name
+                    if label:
+                        logger.info(f"从{label}提取到城市: {standard_name}")
+                    result.candidate_cities = []  # 只保留确认城市，不收集候选城市
+                    return result
 
         # ========== 未找到确认城市，不收集候选城市 ==========
         result.candidate_cities = []
@@ -212,30 +183,10 @@ class CityExtractor:
 
         # ========== 确认城市提取 ==========
 
-        # 期望工作地点等关键词
-        location_keywords = [
-            r'期望工作地点[:：\s]*({self.city_pattern})',
-            r'可工作城市[:：\s]*({self.city_pattern})',
-            r'工作地点[:：\s]*({self.city_pattern})',
-            r'期望城市[:：\s]*({self.city_pattern})',
-            r'求职地点[:：\s]*({self.city_pattern})',
-        ]
-
-        for pattern in location_keywords:
-            match = re.search(pattern, body)
-            if match:
-                city_name = match.group(1)
-                standard_name = get_standard_city_name(city_name)
-                if standard_name:
-                    result.confirmed_city = standard_name
-                    return result
-
-        # 应聘/期望关键词后的城市
-        for keyword in self.application_keywords:
-            pattern = rf'{keyword}[^。]*?({self.city_pattern})'
-            match = re.search(pattern, body)
+        # 期望工作地点等关键词、应聘/期望关键词后的城市
+        for pattern in self._body_location_patterns + self._body_keyword_patterns:
+            match = pattern.search(body)
             if match:
-                # get_standard_city_name 现在可以处理 tuple（来自嵌套捕获组）
                 city_name = match.group(1)
                 standard_name = get_standard_city_name(city_name)
                 if standard_name:
@@ -266,34 +217,9 @@ class CityExtractor:
 
         # ========== 确认城市提取 ==========
 
-        # 期望工作地点等关键词
-        location_patterns = [
-            r'期望工作地点[:：\s]*({self.city_pattern})',
-            r'期望城市[:：\s]*({self.city_pattern})',
-            r'求职地点[:：\s]*({self.city_pattern})',
-            r'意向城市[:：\s]*({self.city_pattern})',
-            r'期望工作地[:：\s]*({self.city_pattern})',
-        ]
-
-        for pattern in location_patterns:
-            match = re.search(pattern, text)
-            if match:
-                city_name = match.group(1)
-                standard_name = get_standard_city_name(city_name)
-                if standard_name:
-                    result.confirmed_city = standard_name
-                    return result
-
-        # 现居住地等关键词
-        residence_patterns = [
-            r'现居住地[:：\s]*({self.city_pattern})',
-            r'居住地[:：\s]*({self.city_pattern})',
-            r'所在地[:：\s]*({self.city_pattern})',
-            r'目前所在地[:：\s]*({self.city_pattern})',
-        ]
-
-        for pattern in residence_patterns:
-            match = re.search(pattern, text)
+        # 期望工作地点等关键词，其次现居住地等关键词
+        for pattern in self._resume_location_patterns + self._resume_residence_patterns:
+            match = pattern.search(text)
             if match:
                 city_name = match.group(1)
                 standard_name = get_standard_city_name(city_name)
@@ -322,10 +248,7 @@ class CityExtractor:
         if not text:
             return []
 
-        # 使用 finditer 获取完整匹配（避免捕获组问题）
-        cities = []
-        for match in re.finditer(self.city_pattern, text):
-            cities.append(match.group(0))  # 获取完整匹配
+        cities = [match.group(0) for match in self._city_regex.finditer(text)]
 
         if not cities:
             return []
@@ -343,7 +266,6 @@ class CityExtractor:
             return []
 
         # 统计出现次数
-        from collections import Counter
         city_counter = Counter(standard_cities)
 
         # 返回满足最小出现次数的城市，去重
@@ -370,15 +292,8 @@ class CityExtractor:
         text = text[:8000]
 
         # 从工作经历中的公司名前缀提取
-        work_patterns = [
-            rf'({self.city_pattern})[^。]*?公司',
-            rf'({self.city_pattern})[^。]*?科技',
-            rf'({self.city_pattern})[^。]*?有限',
-        ]
-
-        for pattern in work_patterns:
-            # 使用 finditer 避免 re.findall 返回 tuple 的���题
-            for match in re.finditer(pattern, text):
+        for pattern in self._work_patterns:
+            for match in pattern.finditer(text):
                 city_name = match.group(1)  # 获取城市捕获组
                 standard_name = get_standard_city_name(city_name)
                 if standard_name and standard_name not in candidates:
@@ -388,3 +303,14 @@ class CityExtractor:
         candidates.extend(self._extract_all_cities_from_text(text, min_count=3))
 
         return list(dict.fromkeys(candidates))  # 去重
+
+
+_city_extractor: Optional[CityExtractor] = None
+
+
+def get_city_extractor() -> CityExtractor:
+    """获取进程内共享的城市提取器（正则只编译一次）"""
+    global _city_extractor
+    if _city_extractor is None:
+        _city_extractor = CityExtractor()
+    return _city_extractor
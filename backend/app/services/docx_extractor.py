@@ -0,0 +1,208 @@
+"""DOCX正文流式提取 - 直接读取 word/document.xml
+
+python-docx 先把整个文档构建成对象模型，而 doc.paragraphs 只包含正文段落：
+表格里的文字（中文简历模板里很常见，教育背景、个人信息经常写在表格中）会整体丢失。
+
+这里打开 zip 后用 iterparse 流式读取主文档部件，不构建对象模型，按文档顺序输出：
+- 正文段落：每段一行（空段落保留为空行，与原先 python-docx 的拼接结果一致）
+- 表格：每行一行，非空单元格用 CELL_SEPARATOR 连接；单元格内多个段落用空格连接；
+  嵌套表格的行并入外层单元格
+- 文本框（w:txbxContent）：其中的段落在所在段落之前输出；mc:AlternateContent 只读 mc:Choice，
+  mc:Fallback 是同一内容的旧版副本，跳过
+- w:tab 输出为制表符，w:br（换行符）/w:cr 输出为换行；修订删除的文字（w:delText）和域代码（w:instrText）不输出
+
+页眉页脚、脚注不在主文档部件中，与 python-docx 一样不提取。
+"""
+import io
+import logging
+import zipfile
+from typing import BinaryIO, List, Optional, Union
+from xml.etree.ElementTree import ParseError, iterparse
+
+logger = logging.getLogger(__name__)
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+_CT = '{http://schemas.openxmlformats.org/package/2006/content-types}'
+
+_P = _W + 'p'
+_R = _W + 'r'
+_T = _W + 't'
+_TAB = _W + 'tab'
+_PTAB = _W + 'ptab'
+_BR = _W + 'br'
+_CR = _W + 'cr'
+_NO_BREAK_HYPHEN = _W + 'noBreakHyphen'
+_TBL = _W + 'tbl'
+_TR = _W + 'tr'
+_TC = _W + 'tc'
+_BODY = _W + 'body'
+_FALLBACK = _MC + 'Fallback'
+
+# 行内元素对应的字符（与 python-docx 的 Run.text 一致）
+_RUN_CHARS = {_TAB: '\t', _PTAB: '\t', _BR: '\n', _CR: '\n', _NO_BREAK_HYPHEN: '-'}
+
+# 表格同一行的单元格之间的分隔符（教育背景解析能识别 "学校 | 学历 | 专业" 这样的行）
+CELL_SEPARATOR = ' | '
+
+# 主文档部件解压后的大小上限（防止zip炸弹），正常简历远小于这个值
+MAX_DOCUMENT_BYTES = 64 * 1024 * 1024
+
+_DEFAULT_DOCUMENT_PART = 'word/document.xml'
+# [Content_Types].xml 中主文档部件的内容类型（.docx / .docm / 模板）
+_MAIN_CONTENT_TYPES = (
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml',
+    'application/vnd.ms-word.document.macroEnabled.main+xml',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.template.main+xml',
+    'application/vnd.ms-word.template.macroEnabledTemplate.main+xml',
+)
+
+
+class DocxExtractError(Exception):
+    """DOCX无法流式提取（不是zip、缺少主文档部件、XML损坏或超过大小上限）"""
+
+
+def _find_document_part(archive: zipfile.ZipFile) -> str:
+    """主文档部件名（几乎总是 word/document.xml，否则按 [Content_Types].xml 查找）"""
+    names = set(archive.namelist())
+    if _DEFAULT_DOCUMENT_PART in names:
+        return _DEFAULT_DOCUMENT_PART
+    if '[Content_Types].xml' in names:
+        with archive.open('[Content_Types].xml') as fp:
+            for _, elem in iterparse(fp):
+                if elem.tag == _CT + 'Override' and elem.get('ContentType') in _MAIN_CONTENT_TYPES:
+                    part = elem.get('PartName', '').lstrip('/')
+                    if part in names:
+                        return part
+    raise DocxExtractError("缺少主文档部件 word/document.xml")
+
+
+class _Paragraph:
+    """正在读取的段落"""
+    __slots__ = ('parts', 'runs')
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.runs = 0
+
+
+def _stream_lines(fp: BinaryIO) -> List[str]:
+    """按文档顺序流式读取段落和表格行"""
+    lines: List[str] = []
+    # 当前输出位置：正文是 lines，表格单元格内是该单元格的段落列表
+    containers: List[List[str]] = [lines]
+    rows: List[List[str]] = []
+    paragraphs: List[_Paragraph] = []
+    skip = 0
+    depth = 0
+    body = None
+
+    for event, elem in iterparse(fp, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            depth += 1
+            if tag == _FALLBACK:
+                skip += 1
+            elif skip:
+                continue
+            elif tag == _P:
+                paragraphs.append(_Paragraph())
+            elif tag == _R:
+                if paragraphs:
+                    paragraphs[-1].runs += 1
+            elif tag == _TR:
+                rows.append([])
+            elif tag == _TC:
+                containers.append([])
+            elif tag == _BODY:
+                body = elem
+            continue
+
+        depth -= 1
+        if tag == _FALLBACK:
+            skip -= 1
+        elif skip:
+            pass
+        elif tag == _T:
+            if paragraphs and elem.text:
+                paragraphs[-1].parts.append(elem.text)
+        elif tag in _RUN_CHARS:
+            # 段落属性里的制表位定义（w:pPr/w:tabs/w:tab）不在 w:r 内，不输出
+            if paragraphs and paragraphs[-1].runs:
+                # 分页符/分栏符不是换行
+                if tag != _BR or elem.get(_W + 'type', 'textWrapping') == 'textWrapping':
+                    paragraphs[-1].parts.append(_RUN_CHARS[tag])
+        elif tag == _R:
+            if paragraphs:
+                paragraphs[-1].runs -= 1
+        elif tag == _P:
+            text = ''.join(paragraphs.pop().parts)
+            if text.strip() or len(containers) == 1:
+                containers[-1].append(text)
+        elif tag == _TC:
+            cell = ' '.join(part.strip() for part in containers.pop() if part.strip())
+            if rows:
+                rows[-1].append(cell)
+        elif tag == _TR:
+            cells = [cell for cell in rows.pop() if cell]
+            if cells:
+                containers[-1].append(CELL_SEPARATOR.join(cells))
+
+        # 正文下的段落/表格处理完后释放，内存占用与文档大小无关
+        if depth == 2 and body is not None:
+            body.clear()
+        elif depth > 2:
+            elem.clear()
+
+    return lines
+
+
+def extract_docx_text(source: Union[bytes, BinaryIO]) -> str:
+    """提取DOCX正文（段落和表格按文档顺序，每段/每个表格行一行）
+
+    Args:
+        source: DOCX文件内容或可 seek 的文件对象
+
+    Returns:
+        正文文本，每行以换行结尾
+
+    Raises:
+        DocxExtractError: 无法流式提取
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    try:
+        with zipfile.ZipFile(source) as archive:
+            part = _find_document_part(archive)
+            size = archive.getinfo(part).file_size
+            if size > MAX_DOCUMENT_BYTES:
+                raise DocxExtractError(f"主文档部件过大: {size} 字节")
+            with archive.open(part) as fp:
+                lines = _stream_lines(fp)
+    except (zipfile.BadZipFile, zipfile.LargeZipFile) as e:
+        raise DocxExtractError(f"不是有效的DOCX文件: {e}") from e
+    except ParseError as e:
+        raise DocxExtractError(f"document.xml 解析失败: {e}") from e
+    except (OSError, EOFError, RuntimeError, NotImplementedError) as e:
+        # 损坏的压缩数据、加密条目、不支持的压缩方式
+        raise DocxExtractError(f"读取DOCX失败: {e}") from e
+
+    return ''.join(line + '\n' for line in lines)
+
+
+def extract_docx_text_python_docx(data: bytes) -> Optional[str]:
+    """用 python-docx 提取正文段落（不含表格）
+
+    原先的实现，保留作为流式提取失败时的后备和基准测试的参照。
+
+    Returns:
+        正文文本；python-docx 未安装时返回 None
+    """
+    try:
+        from docx import Document
+    except ImportError:
+        logger.error("python-docx未安装，无法解析DOCX")
+        return None
+
+    doc = Document(io.BytesIO(data))
+    return ''.join(para.text + '\n' for para in doc.paragraphs)
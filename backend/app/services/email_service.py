@@ -4,12 +4,42 @@ from email import message
 from email import message_from_bytes
 from email.header import decode_header
 import os
-from typing import List, Dict, Optional, Tuple
+import re
+import select
+import socket
+import ssl
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 import logging
 
+from app.services.imap_structure import HEADER_FIELDS, BodyPart, body_parts, decode_part, find_item, parse_fetch_response
+
 logger = logging.getLogger(__name__)
 
+# IDLE 期间表示有新邮件的未标记响应（* <n> EXISTS / * <n> RECENT）
+_NEW_MAIL_RESPONSE = re.compile(rb'^\* \d+ (EXISTS|RECENT)\b', re.IGNORECASE)
+
+# IDLE 期间读取一行响应的最长等待时间（秒），防止连接半开时永远阻塞
+_IDLE_READ_TIMEOUT = 60
+
+
+@dataclass(frozen=True)
+class FolderStatus:
+    """选择文件夹时服务器返回的状态
+
+    Attributes:
+        folder: 文件夹名（IMAP编码）
+        uid_validity: UIDVALIDITY，变化时文件夹中原有的UID全部失效
+        exists: 邮件数
+        uid_next: 下一封新邮件的UID（服务器未返回时为 None）
+    """
+    folder: str
+    uid_validity: int
+    exists: int
+    uid_next: Optional[int] = None
+
 
 class EmailService:
     """邮箱服务类"""
@@ -37,6 +67,7 @@ class EmailService:
         self.imap_port = imap_port
         self.folder = folder
         self.client = None
+        self.selected_folder: Optional[str] = None
 
     def connect(self) -> bool:
         """连接到IMAP服务器
@@ -53,6 +84,7 @@ class EmailService:
 
             # 选择文件夹
             self.client.select(self.folder)
+            self.selected_folder = self.folder
 
             logger.info(f"成功连接到邮箱: {self.email_address}")
             return True
@@ -71,160 +103,405 @@ class EmailService:
             except Exception as e:
                 logger.error(f"断开连接时出错: {e}")
 
-    def fetch_unread_emails(
-        self,
-        save_path: Optional[str] = None
-    ) -> List[Dict]:
-        """获取未读邮件（只要有简历附件就处理）
+    # ==================== 按UID访问 ====================
+
+    def _untagged_int(self, name: str) -> Optional[int]:
+        _, data = self.client.response(name)
+        try:
+            return int(data[-1]) if data and data[-1] is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def select_folder(self, folder: str, readonly: bool = True) -> Optional[FolderStatus]:
+        """选择文件夹并读取 UIDVALIDITY / EXISTS / UIDNEXT
 
         Args:
-            save_path: 附件保存路径
+            folder: 文件夹名（IMAP编码）
+            readonly: 只读选择（EXAMINE），获取邮件不会把它们标记为已读
 
         Returns:
-            邮件列表
+            文件夹状态，无法选择时返回 None
         """
         if not self.client:
             if not self.connect():
-                return []
-
-        emails = []
-
-        # 统计附件信息
-        attachment_count = 0
-        attachment_types = {}
-
-        try:
-            # 搜索未读邮件
-            status, messages = self.client.search(None, 'UNSEEN')
+                return None
 
+        for name in (folder, '"{}"'.format(folder)):
+            try:
+                status, data = self.client.select(name, readonly=readonly)
+            except Exception as e:
+                logger.warning(f"选择文件夹失败 {name}: {e}")
+                continue
             if status != 'OK':
-                logger.warning("搜索邮件失败")
-                return []
+                continue
+            uid_validity = self._untagged_int('UIDVALIDITY')
+            if uid_validity is None:
+                logger.warning(f"文件夹 {folder} 没有返回UIDVALIDITY")
+                return None
+            self.selected_folder = folder
+            return FolderStatus(
+                folder=folder,
+                uid_validity=uid_validity,
+                exists=int(data[0]) if data and data[0] else 0,
+                uid_next=self._untagged_int('UIDNEXT'),
+            )
+        return None
 
-            # 获取邮件ID列表
-            email_ids = messages[0].split()
+    def search_uids(self, *criteria: str) -> List[int]:
+        """在当前文件夹中 UID SEARCH
 
-            logger.info(f"找到 {len(email_ids)} 封未读邮件")
+        Args:
+            criteria: 搜索条件，例如 'UNSEEN'、'UID', '101:*'
 
-            for idx, email_id in enumerate(email_ids):
-                try:
-                    if idx % 50 == 0:
-                        logger.info(f"正在处理第 {idx+1}/{len(email_ids)} 封邮件...")
+        Returns:
+            升序的UID列表
 
-                    # 获取邮件
-                    status, msg_data = self.client.fetch(email_id, '(RFC822)')
+        Raises:
+            imaplib.IMAP4.error: 搜索失败
+        """
+        status, data = self.client.uid('SEARCH', *criteria)
+        if status != 'OK':
+            raise imaplib.IMAP4.error(f"UID SEARCH {' '.join(criteria)} 失败: {data}")
+        return sorted(int(uid) for uid in data[0].split()) if data and data[0] else []
 
-                    if status != 'OK':
-                        continue
+    def fetch_by_uids(
+        self,
+        uids: Iterable[int],
+        save_path: Optional[str] = None
+    ) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """按UID分批获取并解析当前文件夹中的邮件（只下载正文和简历附件，见 _fetch_messages）
 
-                    # 解析邮件
-                    raw_email = msg_data[0][1]
-                    msg = message_from_bytes(raw_email)
+        邮件信息的 id 为UID，另有 uid、folder。连接错误直接抛出，调用方据此停止（不跳过后面的邮件）。
 
-                    # 提取邮件信息
-                    email_info = self._parse_email(msg, email_id.decode(), save_path)
+        Args:
+            uids: UID列表（按给定顺序返回）
+            save_path: 附件保存路径
 
-                    # 统计附件
-                    if email_info['attachments']:
-                        attachment_count += len(email_info['attachments'])
-                        for att in email_info['attachments']:
-                            ext = att['filename'].split('.')[-1].lower()
-                            attachment_types[ext] = attachment_types.get(ext, 0) + 1
+        Yields:
+            (UID, 邮件信息)；邮件已被删除或无法解析时邮件信息为 None
+        """
+        from app.core.config import settings
+
+        uids = list(uids)
+        batch_size = max(1, settings.EMAIL_FETCH_BATCH_SIZE)
+        for start in range(0, len(uids), batch_size):
+            batch = uids[start:start + batch_size]
+            messages = self._fetch_messages(batch, save_path)
+            for uid in batch:
+                email_info = messages.get(uid)
+                if email_info is None:
+                    logger.warning(f"邮件 UID {uid} 不存在或获取失败")
+                else:
+                    email_info['uid'] = uid
+                    email_info['folder'] = self.selected_folder
+                yield uid, email_info
 
-                    # 添加到结果列表（不再过滤）
-                    emails.append(email_info)
+    # ==================== IDLE ====================
 
-                except Exception as e:
-                    logger.error(f"解析邮件 {email_id} 失败: {e}")
-                    continue
+    def supports_idle(self) -> bool:
+        """服务器是否支持 IDLE（RFC 2177）"""
+        return bool(self.client) and 'IDLE' in getattr(self.client, 'capabilities', ())
 
-        except Exception as e:
-            logger.error(f"获取邮件失败: {e}")
+    def idle(self, timeout: float, stop: Optional[Callable[[], bool]] = None) -> bool:
+        """在当前文件夹上 IDLE，等待服务器推送新邮件
 
-        # 输出统计信息
-        logger.info(f"附件统计: 总计{attachment_count}个附件, 类型分布: {dict(attachment_types)}")
+        imaplib 不支持 IDLE，这里直接收发命令：发送 IDLE 后等待未标记响应，
+        收到 EXISTS/RECENT、超时或 stop() 为真时发送 DONE 结束。
+        服务器会断开长时间 IDLE 的连接（RFC 2177 要求至少每29分钟重新 IDLE），timeout 应小于该时间。
 
-        return emails
+        Args:
+            timeout: 最长等待时间（秒）
+            stop: 每秒检查一次，返回真时提前结束
 
-    def fetch_read_emails(
-        self,
-        limit: int = 500,
-        save_path: Optional[str] = None
-    ) -> List[Dict]:
-        """获取已读邮件（最新的N封）
+        Returns:
+            是否收到了新邮件通知
 
-        Args:
-            limit: 获取邮件数量限制
-            save_path: 附件保存路径
+        Raises:
+            imaplib.IMAP4.error: 服务器拒绝 IDLE
+            OSError: 连接断开或超时
+        """
+        client = self.client
+        sock = client.socket()
+        previous_timeout = sock.gettimeout()
+        # 等待期间用 select 检查可读；读取一行响应最多等待 _IDLE_READ_TIMEOUT 秒
+        sock.settimeout(_IDLE_READ_TIMEOUT)
+        try:
+            tag = client._new_tag()
+            client.send(tag + b' IDLE\r\n')
+            line = client.readline()
+            while line.startswith(b'* '):
+                line = client.readline()
+            if not line.startswith(b'+'):
+                raise imaplib.IMAP4.error(f"IDLE 失败: {line.strip()!r}")
+
+            new_mail = False
+            deadline = time.monotonic() + timeout
+            while not new_mail and (stop is None or not stop()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if not self._idle_buffered(sock):
+                    readable, _, _ = select.select([sock], [], [], min(remaining, 1.0))
+                    if not readable:
+                        continue
+                line = client.readline()
+                if not line:
+                    raise OSError("IDLE 期间连接被服务器关闭")
+                new_mail = bool(_NEW_MAIL_RESPONSE.match(line))
+
+            client.send(b'DONE\r\n')
+            # 读到 IDLE 命令的结束响应为止（其间可能还有未标记响应）
+            while True:
+                line = client.readline()
+                if not line:
+                    raise OSError("IDLE 期间连接被服务器关闭")
+                if line.startswith(tag):
+                    if not line[len(tag):].strip().upper().startswith(b'OK'):
+                        raise imaplib.IMAP4.error(f"IDLE 失败: {line.strip()!r}")
+                    return new_mail
+                new_mail = new_mail or bool(_NEW_MAIL_RESPONSE.match(line))
+        finally:
+            sock.settimeout(previous_timeout)
+
+    def _idle_buffered(self, sock) -> bool:
+        """不等待网络，检查是否已有收到但还没读取的响应
+
+        imaplib 通过带缓冲的 sock.makefile('rb') 按行读取：服务器一次发送的多行响应
+        （如 "* 2 EXPUNGE\r\n* 3 EXISTS\r\n"）读出第一行后其余都在缓冲区里，
+        SSL连接中已解密、尚未读取的数据也一样，select 都检查不到。
+        这里把 socket 临时设为非阻塞后 peek：缓冲区有数据时直接返回，缓冲区为空时只做一次非阻塞读取。
+        """
+        sock.settimeout(0)
+        try:
+            return bool(self.client.file.peek())
+        except (BlockingIOError, ssl.SSLWantReadError, socket.timeout):
+            return False
+        finally:
+            sock.settimeout(_IDLE_READ_TIMEOUT)
+
+    # ==================== 按部分获取 ====================
+
+    def _fetch(self, message_set: str, items: str, by_uid: bool = True) -> List[Tuple[int, Dict]]:
+        """FETCH / UID FETCH 并解析响应"""
+        if by_uid:
+            status, data = self.client.uid('FETCH', message_set, items)
+        else:
+            status, data = self.client.fetch(message_set, items)
+        if status != 'OK':
+            raise imaplib.IMAP4.error(f"FETCH {message_set} {items} 失败: {data}")
+        return parse_fetch_response(data)
+
+    def _wanted_parts(self, parts: List[BodyPart]) -> List[BodyPart]:
+        """需要下载的部分：正文（没有 Content-Disposition 的 text/plain、text/html）和简历附件"""
+        return [
+            part for part in parts
+            if (part.content_type in ('text/plain', 'text/html') and not part.disposition)
+            or (part.disposition and part.filename and self._is_resume_file(part.filename))
+        ]
+
+    def _fetch_messages(self, uids: List[int], save_path: Optional[str]) -> Dict[int, Optional[Dict]]:
+        """获取一批邮件
+
+        1. 一条 UID FETCH 取回这批邮件的 BODYSTRUCTURE 和 Subject/From/Date 头
+        2. 按结构找出正文和简历附件所在的部分；需要的部分相同的邮件合并为一条 UID FETCH BODY.PEEK[...]
+           （同一招聘平台的邮件结构基本相同），单条命令的数据量不超过 EMAIL_FETCH_MAX_BYTES
+        3. 结构无法识别的邮件单独获取整封邮件
+
+        BODY.PEEK 不会改变邮件的已读状态。
 
         Returns:
-            邮件列表
+            {UID: 邮件信息}，已不存在的邮件不在其中，无法解析的为 None
         """
-        if not self.client:
-            if not self.connect():
-                return []
+        from app.core.config import settings
 
-        emails = []
+        structures = {
+            items['UID']: items
+            for _, items in self._fetch(','.join(map(str, uids)), f'(UID BODYSTRUCTURE {HEADER_FIELDS})')
+            if 'UID' in items
+        }
 
-        try:
-            # 搜索所有邮件（包括已读）
-            status, messages = self.client.search(None, 'SEEN')
+        plans: Dict[int, Tuple[message.Message, List[BodyPart]]] = {}
+        full_fetch = []
+        for uid in uids:
+            items = structures.get(uid)
+            if items is None:
+                continue
+            try:
+                parts = self._wanted_parts(body_parts(items.get('BODYSTRUCTURE')))
+            except ValueError as e:
+                logger.warning(f"邮件 UID {uid} 的结构无法识别，获取整封邮件: {e}")
+                full_fetch.append(uid)
+                continue
+            plans[uid] = (message_from_bytes(find_item(items, 'BODY[HEADER') or b''), parts)
+
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for uid, (_, parts) in plans.items():
+            if parts:
+                groups.setdefault(tuple(part.section for part in parts), []).append(uid)
+
+        contents: Dict[int, Dict] = {}
+        for sections, group in groups.items():
+            items_spec = '(UID ' + ' '.join(f'BODY.PEEK[{section}]' for section in sections) + ')'
+            chunk, chunk_bytes = [], 0
+            for uid in group:
+                size = sum(part.size for part in plans[uid][1])
+                if chunk and chunk_bytes + size > settings.EMAIL_FETCH_MAX_BYTES:
+                    contents.update(self._fetch_parts(chunk, items_spec))
+                    chunk, chunk_bytes = [], 0
+                chunk.append(uid)
+                chunk_bytes += size
+            contents.update(self._fetch_parts(chunk, items_spec))
+
+        messages: Dict[int, Optional[Dict]] = {}
+        for uid, (header, parts) in plans.items():
+            items = contents.get(uid, {})
+            try:
+                messages[uid] = self._build_email(
+                    header, parts, {part.section: items.get(f'BODY[{part.section}]') for part in parts},
+                    str(uid), save_path
+                )
+            except Exception as e:
+                logger.error(f"解析邮件 UID {uid} 失败: {e}")
+                messages[uid] = None
+        for uid in full_fetch:
+            messages[uid] = self._fetch_full_message(uid, save_path)
+        return messages
 
-            if status != 'OK':
-                logger.warning("搜索邮件失败")
-                return []
+    def _fetch_parts(self, uids: List[int], items_spec: str) -> Dict[int, Dict]:
+        return {
+            items['UID']: items
+            for _, items in self._fetch(','.join(map(str, uids)), items_spec)
+            if 'UID' in items
+        }
 
-            # 获取邮件ID列表
-            email_ids = messages[0].split()
+    def _fetch_full_message(self, uid: int, save_path: Optional[str]) -> Optional[Dict]:
+        try:
+            for _, items in self._fetch(str(uid), '(UID BODY.PEEK[])'):
+                raw_email = items.get('BODY[]')
+                if raw_email:
+                    return self._parse_email(message_from_bytes(raw_email), str(uid), save_path)
+        except imaplib.IMAP4.error as e:
+            logger.error(f"获取邮件 UID {uid} 失败: {e}")
+        return None
+
+    def _build_email(
+        self,
+        header: message.Message,
+        parts: List[BodyPart],
+        contents: Dict[str, Optional[bytes]],
+        email_id: str,
+        save_path: Optional[str]
+    ) -> Dict:
+        """由头部和按部分获取的内容组装邮件信息（与 _parse_email 的结果相同）"""
+        email_body = ""
+        attachments = []
+        for part in parts:
+            data = contents.get(part.section)
+            if data is None:
+                continue
+            payload = decode_part(data, part.encoding)
+            if part.disposition:
+                attachments.append(self._attachment_info(part.filename, part.content_type, payload, save_path))
+            elif payload:
+                email_body += self._decode_body(payload)
 
-            # 只取最新的limit封邮件
-            email_ids = email_ids[-limit:] if len(email_ids) > limit else email_ids
+        return {
+            'id': email_id,
+            'subject': self._decode_header_value(header["Subject"]),
+            'sender': self._decode_header_value(header["From"]),
+            'date': header["Date"],
+            'body': email_body,
+            'attachments': attachments
+        }
 
-            logger.info(f"找到 {len(email_ids)} 封已读邮件（限制: {limit}封）")
+    # ==================== 按条件获取 ====================
 
-            # 统计附件信息
-            attachment_count = 0
-            attachment_types = {}
+    def _fetch_emails(self, uids: List[int], save_path: Optional[str], label: str = '') -> List[Dict]:
+        """按UID获取邮件列表（跳过获取失败的邮件），并输出附件统计"""
+        emails = []
+        try:
+            for idx, (uid, email_info) in enumerate(self.fetch_by_uids(uids, save_path)):
+                if idx % 50 == 0:
+                    logger.info(f"正在处理第 {idx+1}/{len(uids)} 封{label}邮件...")
+                if email_info is not None:
+                    emails.append(email_info)
+        except Exception as e:
+            logger.error(f"获取邮件失败: {e}")
 
-            for idx, email_id in enumerate(email_ids):
-                try:
-                    if idx % 50 == 0:
-                        logger.info(f"正在处理第 {idx+1}/{len(email_ids)} 封已读邮件...")
+        self._log_attachment_stats(emails)
+        return emails
 
-                    # 获取邮件
-                    status, msg_data = self.client.fetch(email_id, '(RFC822)')
+    def _log_attachment_stats(self, emails: List[Dict]) -> None:
+        attachment_count = 0
+        attachment_types = {}
+        for email_info in emails:
+            attachment_count += len(email_info['attachments'])
+            for att in email_info['attachments']:
+                ext = att['filename'].split('.')[-1].lower()
+                attachment_types[ext] = attachment_types.get(ext, 0) + 1
+        logger.info(f"附件统计: 总计{attachment_count}个附件, 类型分布: {dict(attachment_types)}")
 
-                    if status != 'OK':
-                        continue
+    def _search(self, *criteria: str) -> Optional[List[int]]:
+        if not self.client:
+            if not self.connect():
+                return None
+        try:
+            return self.search_uids(*criteria)
+        except Exception as e:
+            logger.warning(f"搜索邮件失败: {e}")
+            return None
 
-                    # 解析邮件
-                    raw_email = msg_data[0][1]
-                    msg = message_from_bytes(raw_email)
+    def fetch_unread_emails(
+        self,
+        save_path: Optional[str] = None
+    ) -> List[Dict]:
+        """获取未读邮件（只要有简历附件就处理），获取后标记为已读
 
-                    # 提取邮件信息
-                    email_info = self._parse_email(msg, email_id.decode(), save_path)
+        Args:
+            save_path: 附件保存路径
 
-                    # 统计附件
-                    if email_info['attachments']:
-                        attachment_count += len(email_info['attachments'])
-                        for att in email_info['attachments']:
-                            ext = att['filename'].split('.')[-1].lower()
-                            attachment_types[ext] = attachment_types.get(ext, 0) + 1
+        Returns:
+            邮件列表
+        """
+        uids = self._search('UNSEEN')
+        if uids is None:
+            return []
 
-                    # 添加到结果列表（不再过滤）
-                    emails.append(email_info)
+        logger.info(f"找到 {len(uids)} 封未读邮件")
+        emails = self._fetch_emails(uids, save_path)
 
-                except Exception as e:
-                    logger.error(f"解析邮件 {email_id} 失败: {e}")
-                    continue
+        # 按部分获取（BODY.PEEK）不会改变已读状态，和原来获取整封邮件时一样标记为已读
+        batch_size = 500
+        for start in range(0, len(uids), batch_size):
+            try:
+                self.client.uid('STORE', ','.join(map(str, uids[start:start + batch_size])), '+FLAGS', '(\\Seen)')
+            except Exception as e:
+                logger.warning(f"标记已读失败: {e}")
+                break
+        return emails
 
-        except Exception as e:
-            logger.error(f"获取邮件失败: {e}")
+    def fetch_read_emails(
+        self,
+        limit: int = 500,
+        save_path: Optional[str] = None
+    ) -> List[Dict]:
+        """获取已读邮件（最新的N封）
 
-        # 输出统计信息
-        logger.info(f"附件统计: 总计{attachment_count}个附件, 类型分布: {dict(attachment_types)}")
+        Args:
+            limit: 获取邮件数量限制
+            save_path: 附件保存路径
 
-        return emails
+        Returns:
+            邮件列表
+        """
+        uids = self._search('SEEN')
+        if uids is None:
+            return []
+
+        # 只取最新的limit封邮件
+        uids = uids[-limit:] if len(uids) > limit else uids
+        logger.info(f"找到 {len(uids)} 封已读邮件（限制: {limit}封）")
+        return self._fetch_emails(uids, save_path, label='已读')
 
     def fetch_emails_by_date(
         self,
@@ -240,86 +517,38 @@ class EmailService:
         Returns:
             邮件列表
         """
-        from datetime import datetime
-
-        if not self.client:
-            if not self.connect():
-                return []
+        from datetime import datetime, timedelta
 
         # 转换日期格式为 IMAP 要求的格式 (DD-Jan-YYYY)
         try:
             # 尝试解析 2025-01-21 格式
-            if '-' in date_str and len(date_str.split('-')) == 3:
+            if '-' in date_str and len(date_str.split('-')) == 3 and date_str[:4].isdigit():
                 dt = datetime.strptime(date_str, '%Y-%m-%d')
                 date_imap = dt.strftime('%d-%b-%Y')
             else:
                 # 已经是 IMAP 格式
                 date_imap = date_str
+            # SINCE 包含当天，所以用 SINCE 21-Jan AND BEFORE 22-Jan 来获取21号的
+            next_day = datetime.strptime(date_imap, '%d-%b-%Y') + timedelta(days=1)
+            next_day_imap = next_day.strftime('%d-%b-%Y')
             logger.info(f"搜索日期: {date_imap}")
         except Exception as e:
             logger.error(f"日期格式解析失败: {e}")
             return []
 
-        emails = []
-        attachment_count = 0
-        attachment_types = {}
-
-        try:
-            # 搜索指定日期的邮件（使用 SINCE 和 BEFORE 组合）
-            # SINCE 包含当天，所以用 SINCE 21-Jan AND BEFORE 22-Jan 来获取21号的
-            next_day = datetime.strptime(date_imap, '%d-%b-%Y')
-            from datetime import timedelta
-            next_day = next_day + timedelta(days=1)
-            next_day_imap = next_day.strftime('%d-%b-%Y')
-
-            status, messages = self.client.search(None, 'SINCE', date_imap, 'BEFORE', next_day_imap)
-
-            if status != 'OK':
-                logger.warning("搜索邮件失败")
-                return []
-
-            email_ids = messages[0].split()
-            logger.info(f"找到 {len(email_ids)} 封邮件在 {date_imap}")
-
-            for idx, email_id in enumerate(email_ids):
-                try:
-                    if idx % 50 == 0:
-                        logger.info(f"正在处理第 {idx+1}/{len(email_ids)} 封邮件...")
-
-                    status, msg_data = self.client.fetch(email_id, '(RFC822)')
-                    if status != 'OK':
-                        continue
-
-                    raw_email = msg_data[0][1]
-                    msg = message_from_bytes(raw_email)
-
-                    email_info = self._parse_email(msg, email_id.decode(), save_path)
-
-                    if email_info['attachments']:
-                        attachment_count += len(email_info['attachments'])
-                        for att in email_info['attachments']:
-                            ext = att['filename'].split('.')[-1].lower()
-                            attachment_types[ext] = attachment_types.get(ext, 0) + 1
-
-                    emails.append(email_info)
-
-                except Exception as e:
-                    logger.error(f"解析邮件 {email_id} 失败: {e}")
-                    continue
-
-        except Exception as e:
-            logger.error(f"获取邮件失败: {e}")
-
-        logger.info(f"附件统计: 总计{attachment_count}个附件, 类型分布: {dict(attachment_types)}")
+        uids = self._search('SINCE', date_imap, 'BEFORE', next_day_imap)
+        if uids is None:
+            return []
 
-        return emails
+        logger.info(f"找到 {len(uids)} 封邮件在 {date_imap}")
+        return self._fetch_emails(uids, save_path)
 
     def fetch_recent_emails(
         self,
         limit: int = 20,
         save_path: Optional[str] = None
     ) -> List[Dict]:
-        """获���最近的N封邮件（包括已读和未读，按时间从近到远）
+        """获取最近的N封邮件（包括已读和未读，按时间从近到远）
 
         Args:
             limit: 获取邮件数量限制（默认20封）
@@ -328,79 +557,23 @@ class EmailService:
         Returns:
             邮件列表（按时间从近到远排序）
         """
-        if not self.client:
-            if not self.connect():
-                return []
-
-        emails = []
-
-        try:
-            # 搜索所有邮件（已读+未读）
-            status, messages = self.client.search(None, 'ALL')
-
-            if status != 'OK':
-                logger.warning("搜索邮件失败")
-                return []
-
-            # 获取邮件ID列表
-            email_ids = messages[0].split()
-
-            # 只取最近的limit封邮件（从近到远）
-            email_ids = email_ids[-limit:] if len(email_ids) > limit else email_ids
-            # 反转列表，使其从最近的开始
-            email_ids = list(reversed(email_ids))
-
-            logger.info(f"找到 {len(email_ids)} 封最近的邮件（从近到远，限制: {limit}封）")
-
-            # 统计附件信息
-            attachment_count = 0
-            attachment_types = {}
-
-            for idx, email_id in enumerate(email_ids):
-                try:
-                    logger.info(f"正在处理第 {idx+1}/{len(email_ids)} 封邮件...")
-
-                    # 获取邮件
-                    status, msg_data = self.client.fetch(email_id, '(RFC822)')
-
-                    if status != 'OK':
-                        logger.warning(f"获取邮件 {email_id} 失败，状态码: {status}")
-                        continue
-
-                    # 解析邮件
-                    raw_email = msg_data[0][1]
-                    msg = message_from_bytes(raw_email)
-
-                    # 提取邮件信息
-                    email_info = self._parse_email(msg, email_id.decode(), save_path)
-
-                    # 记录邮件基本信息
-                    logger.info(
-                        f"邮件 {idx+1}: 主题='{email_info['subject'][:50]}', "
-                        f"发件人='{email_info['sender'][:30]}', "
-                        f"附件数={len(email_info['attachments'])}"
-                    )
-
-                    # 统计附件
-                    if email_info['attachments']:
-                        attachment_count += len(email_info['attachments'])
-                        for att in email_info['attachments']:
-                            ext = att['filename'].split('.')[-1].lower()
-                            attachment_types[ext] = attachment_types.get(ext, 0) + 1
-
-                    # 添加到结果列表（不再过滤）
-                    emails.append(email_info)
-
-                except Exception as e:
-                    logger.error(f"解析邮件 {email_id} 失败: {e}")
-                    continue
-
-        except Exception as e:
-            logger.error(f"获取邮件失败: {e}")
-
-        # 输出统计信息
-        logger.info(f"附件统计: 总计{attachment_count}个附件, 类型分布: {dict(attachment_types)}")
+        uids = self._search('ALL')
+        if uids is None:
+            return []
 
+        # 只取最近的limit封邮件，从近到远
+        uids = uids[-limit:] if len(uids) > limit else uids
+        uids = list(reversed(uids))
+        logger.info(f"找到 {len(uids)} 封最近的邮件（从近到远，限制: {limit}封）")
+
+        emails = self._fetch_emails(uids, save_path)
+        for idx, email_info in enumerate(emails):
+            # 记录邮件基本信息
+            logger.info(
+                f"邮件 {idx+1}: 主题='{email_info['subject'][:50]}', "
+                f"发件人='{email_info['sender'][:30]}', "
+                f"附件数={len(email_info['attachments'])}"
+            )
         return emails
 
     def _decode_filename(self, filename: str) -> str:
@@ -456,6 +629,59 @@ class EmailService:
         resume_extensions = ('.pdf', '.PDF', '.docx', '.DOCX', '.doc', '.DOC')
         return decoded_name.endswith(resume_extensions)
 
+    def _decode_header_value(self, value) -> str:
+        """解码MIME编码的头部（主题、发件人）"""
+        decoded = ""
+        if value:
+            for part, encoding in decode_header(value):
+                if isinstance(part, bytes):
+                    decoded += part.decode(encoding if encoding else 'utf-8', errors='ignore')
+                else:
+                    decoded += part
+        return decoded
+
+    def _decode_body(self, payload: bytes) -> str:
+        """解码正文（尝试多种编码）"""
+        for encoding in ['utf-8', 'gb18030', 'gbk', 'gb2312', 'iso-8859-1']:
+            try:
+                return payload.decode(encoding)
+            except:
+                continue
+        # 如果所有编码都失败，使用errors='ignore'
+        return payload.decode('utf-8', errors='ignore')
+
+    def _attachment_info(
+        self,
+        file_name: str,
+        content_type: str,
+        attachment_data: Optional[bytes],
+        save_path: Optional[str]
+    ) -> Dict:
+        """简历附件信息（提供了保存路径时直接保存文件）"""
+        # 解码文件名
+        decoded_filename = self._decode_filename(file_name)
+        saved_path = None
+
+        # 如果提供了保存路径，直接保存文件
+        if save_path and attachment_data:
+            try:
+                Path(save_path).mkdir(parents=True, exist_ok=True)
+                # 清理文件名中的特殊字符（避免路径错误）
+                safe_filename = decoded_filename.replace('/', '-').replace('\\', '-').replace(':', '_')
+                saved_path = os.path.join(save_path, safe_filename)
+                with open(saved_path, 'wb') as f:
+                    f.write(attachment_data)
+                logger.info(f"附件已保存: {saved_path}")
+            except Exception as e:
+                logger.error(f"保存附件失败: {e}")
+
+        return {
+            'filename': decoded_filename,
+            'content_type': content_type,
+            'size': len(attachment_data) if attachment_data else 0,
+            'saved_path': saved_path  # 新增：已保存的文件路径
+        }
+
     def _parse_email(self, msg: message.Message, email_id: str, save_path: str = None) -> Dict:
         """解析邮件
 
@@ -467,28 +693,6 @@ class EmailService:
         Returns:
             邮件信息字典
         """
-        # 解码主题
-        subject = ""
-        if msg["Subject"]:
-            subject_parts = decode_header(msg["Subject"])
-            subject = ""
-            for part, encoding in subject_parts:
-                if isinstance(part, bytes):
-                    subject += part.decode(encoding if encoding else 'utf-8', errors='ignore')
-                else:
-                    subject += part
-
-        # 解码发件人
-        sender = ""
-        if msg["From"]:
-            sender_parts = decode_header(msg["From"])
-            sender = ""
-            for part, encoding in sender_parts:
-                if isinstance(part, bytes):
-                    sender += part.decode(encoding if encoding else 'utf-8', errors='ignore')
-                else:
-                    sender += part
-
         # 提取附件
         attachments = []
         email_body = ""
@@ -502,57 +706,22 @@ class EmailService:
                 try:
                     payload = part.get_payload(decode=True)
                     if payload:
-                        # 尝试多种编码
-                        for encoding in ['utf-8', 'gb18030', 'gbk', 'gb2312', 'iso-8859-1']:
-                            try:
-                                email_body += payload.decode(encoding)
-                                break
-                            except:
-                                continue
-                        else:
-                            # 如果所有编码都失败，使用errors='ignore'
-                            email_body += payload.decode('utf-8', errors='ignore')
+                        email_body += self._decode_body(payload)
                 except:
                     pass
 
-            # 提取附件
+            # 提取附件（只处理简历文件）
             if content_disposition:
                 file_name = part.get_filename()
                 if file_name and self._is_resume_file(file_name):
-                    # 解码文件名
-                    decoded_filename = self._decode_filename(file_name)
-
-                    # 获取附件内容
-                    attachment_data = part.get_payload(decode=True)
-                    saved_path = None
-
-                    # 如果提供了保存路径，直接保存文件
-                    if save_path and attachment_data:
-                        try:
-                            import os
-                            from pathlib import Path
-                            Path(save_path).mkdir(parents=True, exist_ok=True)
-                            # 清理文件名中的特殊字符（避免路径错误）
-                            safe_filename = decoded_filename.replace('/', '-').replace('\\', '-').replace(':', '_')
-                            saved_path = os.path.join(save_path, safe_filename)
-                            with open(saved_path, 'wb') as f:
-                                f.write(attachment_data)
-                            logger.info(f"附件已保存: {saved_path}")
-                        except Exception as e:
-                            logger.error(f"保存附件失败: {e}")
-
-                    # 只处理简历文件
-                    attachments.append({
-                        'filename': decoded_filename,
-                        'content_type': part.get_content_type(),
-                        'size': len(attachment_data) if attachment_data else 0,
-                        'saved_path': saved_path  # 新增：已保存的文件路径
-                    })
+                    attachments.append(
+                        self._attachment_info(file_name, content_type, part.get_payload(decode=True), save_path)
+                    )
 
         return {
             'id': email_id,
-            'subject': subject,
-            'sender': sender,
+            'subject': self._decode_header_value(msg["Subject"]),
+            'sender': self._decode_header_value(msg["From"]),
             'date': msg["Date"],
             'body': email_body,
             'attachments': attachments
@@ -636,58 +805,49 @@ class EmailService:
         self,
         email_id: str,
         file_name: str,
-        save_path: str
+        save_path: str,
+        by_uid: bool = False
     ) -> Optional[str]:
         """下载附件
 
         Args:
-            email_id: 邮件ID
+            email_id: 邮件ID（当前文件夹中的序号，by_uid 时为UID）
             file_name: 文件名（已解码）
             save_path: 保存路径
+            by_uid: email_id 是UID
 
         Returns:
             保存的文件路径，失败返回None
         """
         try:
-            # 获取邮件
-            status, msg_data = self.client.fetch(email_id, '(RFC822)')
-
-            if status != 'OK':
+            # 按邮件结构找到目标附件所在的部分，只下载这一部分
+            target = None
+            for _, items in self._fetch(email_id, '(BODYSTRUCTURE)', by_uid):
+                for part in body_parts(items.get('BODYSTRUCTURE')):
+                    # 找到目标附件（比较解码后的文件名）
+                    if part.disposition and part.filename and self._decode_filename(part.filename) == file_name:
+                        target = part
+                        break
+            if target is None:
                 return None
 
-            # 解析邮件
-            raw_email = msg_data[0][1]
-            msg = message_from_bytes(raw_email)
-
-            # 查找并下载附件
-            for part in msg.walk():
-                if part.get_content_maintype() == 'multipart':
-                    continue
-                if part.get('Content-Disposition') is None:
-                    continue
-
-                attachment_file_name = part.get_filename()
-
-                if attachment_file_name:
-                    # 解码文件名
-                    decoded_filename = self._decode_filename(attachment_file_name)
-
-                    # 找到目标附件（比较解码后的文件名）
-                    if decoded_filename == file_name:
-                        # 保存文件（清理文件名中的特殊字符）
-                        safe_filename = file_name.replace('/', '-').replace('\\', '-').replace(':', '_')
-                        file_path = os.path.join(save_path, safe_filename)
-                        Path(save_path).mkdir(parents=True, exist_ok=True)
+            attachment_data = None
+            for _, items in self._fetch(email_id, f'(BODY.PEEK[{target.section}])', by_uid):
+                attachment_data = items.get(f'BODY[{target.section}]')
+            if attachment_data is None:
+                return None
 
-                        with open(file_path, 'wb') as f:
-                            f.write(part.get_payload(decode=True))
+            # 保存文件（清理文件名中的特殊字符）
+            safe_filename = file_name.replace('/', '-').replace('\\', '-').replace(':', '_')
+            file_path = os.path.join(save_path, safe_filename)
+            Path(save_path).mkdir(parents=True, exist_ok=True)
 
-                        logger.info(f"附件已保存: {file_path}")
-                        return file_path
+            with open(file_path, 'wb') as f:
+                f.write(decode_part(attachment_data, target.encoding))
 
-            return None
+            logger.info(f"附件已保存: {file_path}")
+            return file_path
 
         except Exception as e:
             logger.error(f"下载附件失败: {e}")
             return None
-
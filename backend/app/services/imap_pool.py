@@ -0,0 +1,90 @@
+"""IMAP连接池 - 多个线程并行访问同一邮箱
+
+IMAP连接一次只能选择一个文件夹，多个文件夹并行扫描时每个线程需要各自的连接。
+连接池最多同时打开 size 个已登录的连接（邮箱服务商限制了同一账号的并发连接数），
+用完归还后给其他线程复用，避免每个文件夹都重新登录；使用中出错的连接直接断开，下次按需重建。
+
+使用方法：
+    pool = IMAPConnectionPool(lambda: EmailService(...), size=4)
+    try:
+        with pool.connection() as service:
+            status = service.select_folder(folder)
+            ...
+    finally:
+        pool.close()
+"""
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+
+from app.services.email_service import EmailService
+
+logger = logging.getLogger(__name__)
+
+
+class IMAPConnectionPool:
+    """已登录的IMAP连接池（线程安全）"""
+
+    def __init__(self, factory: Callable[[], EmailService], size: int):
+        """初始化连接池（连接在第一次使用时才建立）
+
+        Args:
+            factory: 创建（未连接的）邮箱服务
+            size: 最多同时打开的连接数
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._idle: List[EmailService] = []
+        self._closed = False
+
+    @contextmanager
+    def connection(self) -> Iterator[EmailService]:
+        """借用一个已登录的连接（没有空闲连接时新建，已达上限时等待归还）
+
+        Raises:
+            ConnectionError: 无法连接邮箱
+        """
+        self._slots.acquire()
+        try:
+            service = self._take()
+        except Exception:
+            self._slots.release()
+            raise
+
+        try:
+            yield service
+        except Exception:
+            # 出错的连接可能已处于不确定的状态（读取到一半的响应等），不再复用
+            service.disconnect()
+            self._slots.release()
+            raise
+        self._give_back(service)
+        self._slots.release()
+
+    def _take(self) -> EmailService:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        service = self.factory()
+        if not service.connect():
+            raise ConnectionError(f"无法连接邮箱 {service.email_address}")
+        return service
+
+    def _give_back(self, service: EmailService) -> None:
+        with self._lock:
+            if not self._closed:
+                self._idle.append(service)
+                return
+        service.disconnect()
+
+    def close(self) -> None:
+        """断开全部空闲连接（使用中的连接在归还时断开）"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for service in idle:
+            service.disconnect()
+        logger.info(f"IMAP连接池已关闭（断开 {len(idle)} 个连接）")
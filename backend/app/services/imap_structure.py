@@ -0,0 +1,251 @@
+"""IMAP FETCH 响应解析 - BODYSTRUCTURE 与按部分获取
+
+EmailService 先对一批UID获取 (UID BODYSTRUCTURE BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE)])，
+按邮件结构找出简历附件（PDF/DOC/DOCX）和正文所在的部分，再只获取这些部分（BODY.PEEK[<部分>]），
+图片等其他附件不再下载。
+
+部分编号按 RFC 3501：多部分邮件的子部分为 1、2、1.2…；单部分邮件的正文为 1；
+message/rfc822 部分（转发的邮件）N 中的子部分为 N.1、N.2…
+"""
+import base64
+import binascii
+import quopri
+import re
+from dataclasses import dataclass
+from email import message_from_bytes
+from email.message import Message
+from typing import Dict, Iterator, List, Optional, Tuple
+
+HEADER_FIELDS = 'BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE)]'
+
+_LITERAL = re.compile(rb'\{(\d+)\}$')
+
+
+@dataclass(frozen=True)
+class BodyPart:
+    """BODYSTRUCTURE 中的一个非多部分的部分
+
+    Attributes:
+        section: 部分编号（BODY[<section>]）
+        content_type: 小写的 type/subtype
+        encoding: 小写的 Content-Transfer-Encoding
+        size: 编码后的字节数
+        disposition: Content-Disposition 类型（没有该头时为 None）
+        filename: 与 Message.get_filename() 相同（MIME encoded-word 未解码）
+    """
+    section: str
+    content_type: str
+    encoding: str
+    size: int
+    disposition: Optional[str]
+    filename: Optional[str]
+
+
+# ==================== 响应解析 ====================
+
+def _tokens(text: bytes) -> Iterator[Tuple[str, Optional[bytes]]]:
+    i, n = 0, len(text)
+    while i < n:
+        c = text[i:i + 1]
+        if c in (b' ', b'\r', b'\n'):
+            i += 1
+        elif c in (b'(', b')'):
+            yield c.decode(), None
+            i += 1
+        elif c == b'"':
+            i += 1
+            value = bytearray()
+            while i < n and text[i:i + 1] != b'"':
+                if text[i:i + 1] == b'\\':
+                    i += 1
+                value += text[i:i + 1]
+                i += 1
+            yield 'string', bytes(value)
+            i += 1
+        else:
+            start = i
+            while i < n and text[i:i + 1] not in (b' ', b'(', b')', b'"', b'\r', b'\n'):
+                if text[i:i + 1] == b'[':
+                    # BODY[HEADER.FIELDS (SUBJECT FROM DATE)]：方括号中的空格和括号属于同一个词
+                    i = text.find(b']', i)
+                    if i < 0:
+                        i = n
+                i += 1
+            yield 'atom', text[start:i]
+
+
+def _response_tokens(data) -> Iterator[Tuple[str, Optional[bytes]]]:
+    for item in data:
+        if isinstance(item, tuple):
+            text, literal = item
+            match = _LITERAL.search(text)
+            yield from _tokens(text[:match.start()] if match else text)
+            yield 'string', literal
+        elif isinstance(item, bytes):
+            yield from _tokens(item)
+
+
+def _build(tokens: Iterator[Tuple[str, Optional[bytes]]]) -> List:
+    """把词序列组装为嵌套列表（NIL 为 None，其余为 bytes）"""
+    stack: List[List] = [[]]
+    for kind, value in tokens:
+        if kind == '(':
+            stack.append([])
+        elif kind == ')':
+            if len(stack) > 1:
+                done = stack.pop()
+                stack[-1].append(done)
+        elif kind == 'atom' and value.upper() == b'NIL':
+            stack[-1].append(None)
+        else:
+            stack[-1].append(value)
+    while len(stack) > 1:
+        done = stack.pop()
+        stack[-1].append(done)
+    return stack[0]
+
+
+def parse_fetch_response(data) -> List[Tuple[int, Dict[str, object]]]:
+    """解析 imaplib 的 FETCH / UID FETCH 返回数据
+
+    Args:
+        data: imaplib 返回的数据（bytes 与 (前缀, 字面量) 元组的列表）
+
+    Returns:
+        [(序号, {数据项名称: 值})]；名称为大写（如 'UID'、'BODYSTRUCTURE'、'BODY[2]'），UID 转为整数
+    """
+    messages = []
+    elements = _build(_response_tokens(data))
+    seq = None
+    for element in elements:
+        if not isinstance(element, list):
+            seq = element
+            continue
+        items: Dict[str, object] = {}
+        for i in range(0, len(element) - 1, 2):
+            name = element[i]
+            if isinstance(name, bytes):
+                items[name.decode('ascii', 'replace').upper()] = element[i + 1]
+        if 'UID' in items:
+            try:
+                items['UID'] = int(items['UID'])
+            except (TypeError, ValueError):
+                del items['UID']
+        try:
+            messages.append((int(seq), items))
+        except (TypeError, ValueError):
+            continue
+    return messages
+
+
+def find_item(items: Dict[str, object], prefix: str) -> Optional[bytes]:
+    """按名称前缀查找数据项（服务器返回的 HEADER.FIELDS 名称写法不一定与请求相同）"""
+    for name, value in items.items():
+        if name.startswith(prefix):
+            return value
+    return None
+
+
+# ==================== BODYSTRUCTURE ====================
+
+def _text(value) -> str:
+    if value is None:
+        return ''
+    for encoding in ('utf-8', 'gb18030'):
+        try:
+            return value.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return value.decode('latin-1')
+
+
+def _header_value(value: str, params) -> str:
+    header = value
+    if isinstance(params, list):
+        for i in range(0, len(params) - 1, 2):
+            param_value = _text(params[i + 1]).replace('\\', '\\\\').replace('"', '\\"')
+            header += f'; {_text(params[i])}="{param_value}"'
+    return header
+
+
+def _filename(content_type: str, params, disposition) -> Optional[str]:
+    # 用原头部重建一个空的部分，文件名（RFC 2231 编码、续行等）按 get_filename 的规则解析
+    part = Message()
+    part['Content-Type'] = _header_value(content_type, params)
+    if disposition:
+        part['Content-Disposition'] = _header_value(_text(disposition[0]), disposition[1] if len(disposition) > 1 else None)
+    return part.get_filename()
+
+
+def _leaves(body: List, prefix: str) -> Iterator[BodyPart]:
+    if body and isinstance(body[0], list):
+        # 多部分：子部分在前，之后是 subtype 和扩展字段
+        for index, child in enumerate(body, 1):
+            if not isinstance(child, list):
+                break
+            yield from _leaves(child, f'{prefix}.{index}' if prefix else str(index))
+        return
+
+    section = prefix or '1'
+    main_type = _text(body[0]).lower()
+    sub_type = _text(body[1]).lower()
+    content_type = f'{main_type}/{sub_type}'
+    # 扩展字段（md5 disposition language location）的起始位置
+    if main_type == 'text':
+        extension = 8
+    elif content_type == 'message/rfc822':
+        extension = 10
+    else:
+        extension = 7
+    disposition = body[extension + 1] if len(body) > extension + 1 else None
+    if not isinstance(disposition, list) or not disposition:
+        disposition = None
+    try:
+        size = int(body[6])
+    except (TypeError, ValueError, IndexError):
+        size = 0
+
+    yield BodyPart(
+        section=section,
+        content_type=content_type,
+        encoding=_text(body[5]).lower() if len(body) > 5 else '7bit',
+        size=size,
+        disposition=_text(disposition[0]).lower() if disposition else None,
+        filename=_filename(content_type, body[2], disposition),
+    )
+
+    if content_type == 'message/rfc822' and len(body) > 8 and isinstance(body[8], list):
+        inner = body[8]
+        yield from _leaves(inner, section if inner and isinstance(inner[0], list) else f'{section}.1')
+
+
+def body_parts(structure: List) -> List[BodyPart]:
+    """按邮件中的顺序列出 BODYSTRUCTURE 中的全部非多部分的部分
+
+    Raises:
+        ValueError: 结构无法识别
+    """
+    if not isinstance(structure, list) or not structure:
+        raise ValueError(f"无法识别的BODYSTRUCTURE: {structure!r}")
+    try:
+        return list(_leaves(structure, ''))
+    except (IndexError, TypeError, AttributeError) as e:
+        raise ValueError(f"无法识别的BODYSTRUCTURE: {e}")
+
+
+# ==================== 部分内容 ====================
+
+def decode_part(data: bytes, encoding: str) -> bytes:
+    """按 Content-Transfer-Encoding 解码部分内容（与 Message.get_payload(decode=True) 一致）"""
+    if encoding in ('7bit', '8bit', 'binary', ''):
+        return data
+    if encoding == 'base64':
+        try:
+            return base64.b64decode(data)
+        except (binascii.Error, ValueError):
+            pass
+    elif encoding == 'quoted-printable':
+        return quopri.decodestring(data)
+    # 其他编码（x-uuencode 等）和不规范的 base64 交给 email 包处理
+    part = message_from_bytes(b'Content-Transfer-Encoding: ' + encoding.encode('ascii', 'replace') + b'\r\n\r\n' + data)
+    return part.get_payload(decode=True) or b''
@@ -7,18 +7,22 @@
 """
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional
 
-from app.data.job_titles_minimal import (
-    JOB_TITLES,
-    get_job_config,
-    get_all_job_names,
-    get_compiled_patterns,
-    is_valid_job
-)
+from app.data.job_titles_minimal import get_all_job_names, match_job_titles
 
 logger = logging.getLogger(__name__)
 
+# 邮件主题解析结果的缓存条数（招聘平台的主题模板高度重复）
+SUBJECT_CACHE_SIZE = 4096
+
+# 职位后缀："职位-XXX"（开头）、"XXX-职位"（结尾）格式
+_TITLE_SUFFIX = (r'[^\-|/]{2,20}?开发|[^\-|/]{2,20}?工程|[^\-|/]{2,20}?经理|[^\-|/]{2,20}?总监'
+                 r'|[^\-|/]{2,20}?专员|[^\-|/]{2,20}?顾问|[^\-|/]{2,20}?师')
+_LEADING_TITLE = re.compile(rf'^({_TITLE_SUFFIX})[\-|/]')
+_TRAILING_TITLE = re.compile(rf'[\-|/]({_TITLE_SUFFIX})$')
+
 
 class JobTitleClassifier:
     """职位分类器 - 仅使用字符串匹配，不进行评分判断"""
@@ -32,6 +36,13 @@ class JobTitleClassifier:
     def __init__(self):
         """初始化职位分类器"""
         self.job_names = get_all_job_names()
+        # 匹配 "关键词：职位" 或 "关键词职位" 或 "关键词-职位"（应聘:Java开发 或 应聘Java开发）
+        self._keyword_patterns = [
+            re.compile(rf'{keyword}[:：\s\-]*(.+?)(?:[\-|/]|$)', re.IGNORECASE)
+            for keyword in self.JOB_KEYWORDS
+        ]
+        # 主题解析结果按去掉首尾空白后的主题缓存
+        self._classify_subject = lru_cache(maxsize=SUBJECT_CACHE_SIZE)(self._classify_subject_uncached)
         logger.info(f"职位分类器初始化完成，支持 {len(self.job_names)} 个职位")
 
     def classify_job_title(
@@ -97,65 +108,34 @@ class JobTitleClassifier:
         if not subject:
             return None
 
-        subject = subject.strip()
+        return self._classify_subject(subject.strip())
 
+    def _classify_subject_uncached(self, subject: str) -> Optional[str]:
+        """从（已去掉首尾空白的）邮件主题提取职位，结果由 _classify_subject 缓存"""
         # 策略1: 匹配"应聘/申请/期望"后面的职位
-        for keyword in self.JOB_KEYWORDS:
-            # 匹配 "关键词：职位" 或 "关键词职位" 或 "关键词-职位"
-            patterns = [
-                rf'{keyword}[:：\s\-]*(.+?)(?:[\-|/]|$)',  # 应聘:Java开发 或 应聘Java开发
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, subject, re.IGNORECASE)
-                if match:
-                    candidate = match.group(1).strip()
-                    # 尝试精确+模糊匹配
-                    job_title = self._match_job_title(candidate)
-                    if job_title:
-                        return job_title
+        for pattern in self._keyword_patterns:
+            match = pattern.search(subject)
+            if match:
+                candidate = match.group(1).strip()
+                # 尝试精确+模糊匹配
+                job_title = self._match_job_title(candidate)
+                if job_title:
+                    return job_title
 
         # 策略2: 匹配"职位-XXX"格式（开头）
         # 例如: "Java开发-张三", "前端开发工程师-简历"
-        pattern = r'^([^\-|/]{2,20}?开发|[^\-|/]{2,20}?工程|[^\-|/]{2,20}?经理|[^\-|/]{2,20}?总监|[^\-|/]{2,20}?专员|[^\-|/]{2,20}?顾问|[^\-|/]{2,20}?师)[\-|/]'
-        match = re.search(pattern, subject)
-        if match:
-            candidate = match.group(1).strip()
-            job_title = self._match_job_title(candidate)
-            if job_title:
-                return job_title
-
         # 策略3: 匹配"XXX-职位"格式（结尾）
         # 例如: "张三-Java开发", "简历-产品经理"
-        pattern = r'[\-|/]([^\-|/]{2,20}?开发|[^\-|/]{2,20}?工程|[^\-|/]{2,20}?经理|[^\-|/]{2,20}?总监|[^\-|/]{2,20}?专员|[^\-|/]{2,20}?顾问|[^\-|/]{2,20}?师)$'
-        match = re.search(pattern, subject)
-        if match:
-            candidate = match.group(1).strip()
-            job_title = self._match_job_title(candidate)
-            if job_title:
-                return job_title
-
-        # 策略4: 全局搜索（如果主题中只包含一个职位）
-        matched_jobs = []
-        for job_name in self.job_names:
-            job_config = get_job_config(job_name)
-            compiled_patterns = get_compiled_patterns(job_name)
-
-            # 使用预编译的模式进行匹配
-            for compiled_pattern in compiled_patterns:
-                if compiled_pattern.search(subject):
-                    matched_jobs.append((job_name, job_config.get('priority', 50), 100))
-                    break
-
-        if len(matched_jobs) == 1:
-            return matched_jobs[0][0]
-
-        # 如果匹配多个，选择优先级最高的
-        if len(matched_jobs) > 1:
-            matched_jobs.sort(key=lambda x: (x[1], x[2]), reverse=True)
-            return matched_jobs[0][0]
+        for pattern in (_LEADING_TITLE, _TRAILING_TITLE):
+            match = pattern.search(subject)
+            if match:
+                candidate = match.group(1).strip()
+                job_title = self._match_job_title(candidate)
+                if job_title:
+                    return job_title
 
-        return None
+        # 策略4: 全局搜索（匹配多个时选择优先级最高的）
+        return self._match_job_title(subject)
 
     def _extract_from_resume(self, text: str) -> Optional[str]:
         """从简历文本提取职位
@@ -246,21 +226,22 @@ class JobTitleClassifier:
         if not candidate:
             return None
 
-        # 收集所有匹配的职位
-        matched_jobs = []
-
-        for job_name in self.job_names:
-            compiled_patterns = get_compiled_patterns(job_name)
-
-            # 使用预编译模式进行匹配
-            for compiled_pattern in compiled_patterns:
-                if compiled_pattern.search(candidate):
-                    matched_jobs.append((job_name, get_job_config(job_name).get('priority', 50), 100))
-                    break
-
+        # 一次扫描收集所有匹配的职位
+        matched_jobs = match_job_titles(candidate)
         if not matched_jobs:
             return None
 
-        # 按优先级和分数排序
-        matched_jobs.sort(key=lambda x: (x[1], x[2]), reverse=True)
+        # 按优先级排序（稳定排序，同优先级取 JOB_TITLES 中靠前的职位）
+        matched_jobs.sort(key=lambda x: x[1], reverse=True)
         return matched_jobs[0][0]
+
+
+_job_title_classifier: Optional[JobTitleClassifier] = None
+
+
+def get_job_title_classifier() -> JobTitleClassifier:
+    """获取进程内共享的职位分类器（主题解析缓存在进程内共享）"""
+    global _job_title_classifier
+    if _job_title_classifier is None:
+        _job_title_classifier = JobTitleClassifier()
+    return _job_title_classifier
@@ -0,0 +1,224 @@
+"""邮箱增量同步 - 按UID高水位只获取新邮件
+
+每个文件夹在 mail_sync_states 中记录 (UIDVALIDITY, last_seen_uid, baseline_uid)。每次同步：
+
+- 只读选择文件夹（EXAMINE），获取邮件不会改变它们的已读状态
+- UIDVALIDITY 与记录一致：UID SEARCH UID <last_seen_uid+1>:*，只获取新邮件
+- 没有记录或 UIDVALIDITY 变化（文件夹重建、服务器迁移）：建立基线，记录当前最大UID为 baseline_uid。
+  基线之前只处理未读邮件（与原来按 SEARCH UNSEEN 抓取一致），基线之后的邮件全部处理；
+  超过单次上限时下次继续处理 UID ≤ baseline_uid 的未读邮件，处理完后高水位跳到基线，之后只按UID增量同步
+- 按UID升序处理，单次最多 EMAIL_SYNC_MAX_PER_RUN 封，其余的下次继续；
+  获取中途连接出错时保存已处理的进度，下次从断点继续
+- 同步期间锁定该文件夹的同步状态行，同时进行的同步依次执行；第一次同步时先插入占位行
+  （INSERT ... ON CONFLICT DO NOTHING）再加锁，同时进行的第一次同步不会因唯一约束冲突而失败
+
+搜索和获取的开销只与新邮件数有关，与文件夹大小无关；在邮件客户端中打开过的新邮件也不会漏掉。
+"""
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.mail_sync_state import MailSyncState
+from app.services.email_service import EmailService, FolderStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FolderSyncResult:
+    """一个文件夹的同步结果
+
+    Attributes:
+        folder: 文件夹名（IMAP编码）
+        uid_validity: 文件夹的 UIDVALIDITY（无法选择文件夹时为 None）
+        fetched: 获取并交给处理函数的邮件数
+        skipped: 已被删除或无法解析、跳过的邮件数
+        remaining: 超过单次上限、留到下次的新邮件数
+        last_seen_uid: 同步后的高水位
+        baseline: 本次处理的是基线之前的未读邮件（建立或因UIDVALIDITY变化重建了基线，还没处理完）
+        error: 同步中断的原因
+    """
+    folder: str
+    uid_validity: Optional[int] = None
+    fetched: int = 0
+    skipped: int = 0
+    remaining: int = 0
+    last_seen_uid: int = 0
+    baseline: bool = False
+    error: Optional[str] = None
+
+
+# 占位行的 UIDVALIDITY（服务器返回的 UIDVALIDITY 不为0），与任何文件夹都不一致，按没有记录处理
+_NO_UID_VALIDITY = 0
+
+
+def _lock_state(db, email_address: str, folder: str) -> MailSyncState:
+    """锁定文件夹的同步状态行直到提交/回滚，没有记录时先插入占位行
+
+    行不存在时 SELECT ... FOR UPDATE 锁不住任何东西，两个同时进行的第一次同步都会插入新行，
+    后提交的违反唯一约束 uq_mail_sync_state_folder。先 INSERT ... ON CONFLICT DO NOTHING：
+    后插入的等待先插入的事务结束，再读取并锁定同一行。
+    """
+    now = datetime.utcnow()
+    db.execute(
+        insert(MailSyncState).values(
+            id=uuid.uuid4(),
+            email_address=email_address,
+            folder=folder,
+            uid_validity=_NO_UID_VALIDITY,
+            last_seen_uid=0,
+            created_at=now,
+            updated_at=now,
+        ).on_conflict_do_nothing(constraint='uq_mail_sync_state_folder')
+    )
+    return db.query(MailSyncState).filter(
+        MailSyncState.email_address == email_address,
+        MailSyncState.folder == folder
+    ).with_for_update().one()
+
+
+def _save_state(db, state: MailSyncState, status: FolderStatus, last_seen_uid: int) -> None:
+    state.uid_validity = status.uid_validity
+    state.last_seen_uid = last_seen_uid
+    state.last_synced_at = datetime.utcnow()
+    db.commit()
+
+
+def _max_uid(service: EmailService, status: FolderStatus) -> int:
+    """文件夹中当前最大的UID（空文件夹为0）"""
+    if not status.exists:
+        return 0
+    if status.uid_next:
+        return status.uid_next - 1
+    # 服务器没有返回UIDNEXT：取最后一封邮件的UID
+    uids = service.search_uids(str(status.exists))
+    return uids[-1] if uids else 0
+
+
+def sync_folder(
+    service: EmailService,
+    db,
+    folder: str,
+    handle: Callable[[Dict], None],
+    save_path: Optional[str] = None,
+    max_messages: Optional[int] = None
+) -> FolderSyncResult:
+    """增量同步一个文件夹：获取上次同步之后的新邮件，逐封交给 handle，再保存高水位
+
+    Args:
+        service: 已登录的邮箱服务
+        db: 数据库会话
+        folder: 文件夹名（IMAP编码）
+        handle: 处理一封邮件（例如排队解析任务）；抛出异常时停止同步，该邮件下次重新处理
+        save_path: 附件保存路径
+        max_messages: 本次最多获取的邮件数，默认 EMAIL_SYNC_MAX_PER_RUN
+
+    Returns:
+        FolderSyncResult
+    """
+    if max_messages is None:
+        from app.core.config import settings
+        max_messages = settings.EMAIL_SYNC_MAX_PER_RUN
+
+    result = FolderSyncResult(folder=folder)
+    status = service.select_folder(folder)
+    if status is None:
+        result.error = "无法选择文件夹"
+        return result
+    result.uid_validity = status.uid_validity
+
+    # 锁定同步状态直到保存（提交）：定时检查与新邮件监听（mail_listener）同时同步同一文件夹时，
+    # 后开始的等待前一个完成，再从更新后的高水位继续，同一封邮件不会被处理两次
+    state = _lock_state(db, service.email_address, folder)
+    if state.uid_validity != status.uid_validity:
+        if state.uid_validity != _NO_UID_VALIDITY:
+            logger.warning(
+                f"文件夹 {folder} 的UIDVALIDITY已变化（{state.uid_validity} -> {status.uid_validity}），重新建立同步基线"
+            )
+        state.uid_validity = status.uid_validity
+        state.last_seen_uid = 0
+        state.baseline_uid = _max_uid(service, status)
+
+    last_seen = state.last_seen_uid
+    baseline_uid = state.baseline_uid
+    result.baseline = baseline_uid is not None
+    if baseline_uid is None:
+        # UID n+1:* 在没有新邮件时也会返回最后一封（* 取最大UID），过滤掉
+        drain = []
+        uids = [uid for uid in service.search_uids('UID', f'{last_seen + 1}:*') if uid > last_seen]
+    else:
+        # 基线之前只处理未读邮件（从上次处理到的位置继续），基线之后的新邮件全部处理
+        drain = []
+        if last_seen < baseline_uid:
+            drain = [
+                uid for uid in service.search_uids('UNSEEN', 'UID', f'{last_seen + 1}:{baseline_uid}')
+                if last_seen < uid <= baseline_uid
+            ]
+        start_uid = max(last_seen, baseline_uid)
+        uids = drain + [uid for uid in service.search_uids('UID', f'{start_uid + 1}:*') if uid > start_uid]
+
+    pending = uids[:max_messages] if max_messages else uids
+    result.remaining = len(uids) - len(pending)
+    logger.info(
+        f"同步文件夹 {folder}: {len(uids)} 封新邮件"
+        f"{f'（基线 UID {baseline_uid} 之前的未读邮件 {len(drain)} 封）' if result.baseline else f'（UID > {last_seen}）'}"
+        f"{f'，本次处理 {len(pending)} 封' if result.remaining else ''}"
+    )
+
+    try:
+        for uid, email_info in service.fetch_by_uids(pending, save_path):
+            if email_info is None:
+                result.skipped += 1
+            else:
+                handle(email_info)
+                result.fetched += 1
+            last_seen = uid
+    except Exception as e:
+        result.error = str(e)
+        logger.error(f"同步文件夹 {folder} 中断（已处理到 UID {last_seen}）: {e}")
+
+    if baseline_uid is not None and (not drain or last_seen >= drain[-1]):
+        # 基线之前的未读邮件已全部处理：高水位跳到基线（之前的已读邮件不再处理），之后只按UID增量同步
+        last_seen = max(last_seen, baseline_uid)
+        state.baseline_uid = None
+    # 基线保存在同步状态中，中断或超过上限时下次从 last_seen 继续处理基线之前的未读邮件
+    _save_state(db, state, status, last_seen)
+    result.last_seen_uid = last_seen
+    return result
+
+
+def recent_uids(service: EmailService, status: FolderStatus, limit: int) -> List[int]:
+    """文件夹中最近的 limit 封邮件的UID（从近到远）
+
+    按序号范围搜索（<EXISTS-limit+1>:*），不列出整个文件夹。
+    """
+    if not status.exists or limit <= 0:
+        return []
+    start = max(1, status.exists - limit + 1)
+    return list(reversed(service.search_uids(f'{start}:*')))
+
+
+def mark_scanned(db, service: EmailService, status: FolderStatus, uids: List[int]) -> bool:
+    """记录已处理完文件夹中最近的这些邮件（recent_uids 的结果）
+
+    只有它们覆盖了高水位之后的全部邮件时才推进高水位，否则增量同步会漏掉中间的邮件。
+
+    Returns:
+        是否推进了高水位
+    """
+    if not uids:
+        return False
+    state = _lock_state(db, service.email_address, status.folder)
+    last_seen = state.last_seen_uid if state.uid_validity == status.uid_validity else None
+    covers_all = len(uids) >= status.exists or (last_seen is not None and min(uids) <= last_seen + 1)
+    if not covers_all or (last_seen is not None and max(uids) <= last_seen):
+        db.rollback()
+        return False
+    # 最近的邮件（不论是否已读）已全部处理，基线之前剩下的未读邮件也包含在内
+    state.baseline_uid = None
+    _save_state(db, state, status, max(uids))
+    return True
@@ -0,0 +1,293 @@
+"""简历解析缓存 - 按附件内容（SHA-256）+ 解析器版本寻址
+
+同一份PDF经常重复到达（转发邮件、多渠道投递同一候选人、fetch_recent_resumes
+重扫已处理过的文件夹），每次都要重新跑 pymupdf4llm → TextCleaner → _parse_text。
+缓存命中后整条链路都可以跳过。
+
+缓存两类内容：
+- text: 清理后的简历正文及其提取层级（extraction_tier），只取决于文件内容
+- result: 结构化解析结果，还取决于邮件主题和文件名（姓名、工作年限会从中提取），
+  因此key中额外带上这两者的摘要
+
+存储：
+- 优先Redis：每个key设置TTL，超出内存后由Redis的maxmemory-policy（allkeys-lru）淘汰
+- Redis不可用时落到本地磁盘：TTL按最近一次访问计算，条目数超上限时按访问时间LRU淘汰
+
+解析器逻辑变化时修改 resume_parser.PARSER_VERSION，旧缓存自然失效。
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.core.redis import current_redis, get_redis, redis_failed
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = 'resume_parse'
+_STATS_KEY = f'{_KEY_PREFIX}:stats'
+# 磁盘缓存每写入多少次做一次淘汰扫描
+_DISK_PRUNE_EVERY = 100
+
+
+def file_sha256(file_path: str) -> str:
+    """计算文件内容的SHA-256"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bytes_sha256(data: bytes) -> str:
+    """计算内存中文件内容的SHA-256"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def context_digest(email_subject: Optional[str], filename: Optional[str], lexicon_version: str = '') -> str:
+    """解析上下文（邮件主题 + 文件名 + 技能词库版本）的摘要，用于结构化结果的key
+
+    技能词库热更新后结构化结果失效，正文缓存仍然有效（只重新解析字段）。
+    """
+    name = Path(filename).name if filename else ''
+    raw = f"{email_subject or ''}\x00{name}\x00{lexicon_version}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+class _DiskStore:
+    """本地磁盘缓存（Redis不可用时的后备）"""
+
+    def __init__(self, directory: str, ttl: int, max_entries: int):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.directory / name[:2] / f"{name}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink()
+                return None
+            value = path.read_text(encoding='utf-8')
+            # 更新访问时间（LRU + 滑动TTL）
+            os.utime(path, None)
+            return value
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp_path.write_text(value, encoding='utf-8')
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._writes += 1
+            should_prune = self._writes % _DISK_PRUNE_EVERY == 0
+        if should_prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """删除过期条目，并在超出上限时按访问时间淘汰最旧的条目
+
+        Returns:
+            删除的条目数
+        """
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self.directory.glob('*/*.json'):
+            try:
+                mtime = path.stat().st_mtime
+                if now - mtime > self.ttl:
+                    path.unlink()
+                    removed += 1
+                else:
+                    entries.append((mtime, path))
+            except FileNotFoundError:
+                continue
+
+        overflow = len(entries) - self.max_entries
+        if overflow > 0:
+            entries.sort()
+            for _, path in entries[:overflow]:
+                try:
+                    path.unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    continue
+
+        if removed:
+            logger.info(f"解析缓存磁盘淘汰 {removed} 条")
+        return removed
+
+
+class ParseCache:
+    """简历解析缓存（Redis优先，磁盘后备）"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        directory: Optional[str] = None,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        from app.core.config import settings
+
+        self.enabled = settings.PARSE_CACHE_ENABLED if enabled is None else enabled
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.ttl = ttl or settings.PARSE_CACHE_TTL
+        self.disk = _DiskStore(
+            directory or settings.PARSE_CACHE_DIR,
+            self.ttl,
+            max_entries or settings.PARSE_CACHE_MAX_ENTRIES,
+        )
+        self._stats: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    # ==================== 后端选择 ====================
+
+    def _redis_error(self, e: Exception) -> None:
+        logger.warning(f"解析缓存Redis操作失败，切换到磁盘缓存: {e}")
+        redis_failed(self.redis_url)
+
+    def _get(self, key: str) -> Optional[str]:
+        client = get_redis(self.redis_url)
+        if client is not None:
+            try:
+                value = client.get(key)
+                if value is not None:
+                    client.expire(key, self.ttl)
+                    return value.decode('utf-8')
+                return None
+            except Exception as e:
+                self._redis_error(e)
+        return self.disk.get(key)
+
+    def _set(self, key: str, value: str) -> None:
+        client = get_redis(self.redis_url)
+        if client is not None:
+            try:
+                client.set(key, value, ex=self.ttl)
+                return
+            except Exception as e:
+                self._redis_error(e)
+        self.disk.set(key, value)
+
+    # ==================== 计数 ====================
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] = self._stats.get(name, 0) + 1
+        # 解析主要发生在Celery worker中，计数同时写入Redis，供API进程汇总查看
+        client = current_redis(self.redis_url)
+        if client is not None:
+            try:
+                client.hincrby(_STATS_KEY, name, 1)
+            except Exception:
+                pass
+
+    def stats(self) -> Dict:
+        """命中/未命中计数
+
+        Returns:
+            {'local': 当前进程计数, 'shared': 所有进程汇总（Redis可用时）}
+        """
+        with self._lock:
+            local = dict(self._stats)
+        shared = None
+        client = get_redis(self.redis_url)
+        if client is not None:
+            try:
+                shared = {k.decode('utf-8'): int(v) for k, v in client.hgetall(_STATS_KEY).items()}
+            except Exception as e:
+                self._redis_error(e)
+        return {
+            'enabled': self.enabled,
+            'backend': 'redis' if current_redis(self.redis_url) is not None else 'disk',
+            'local': local,
+            'shared': shared,
+        }
+
+    # ==================== 读写 ====================
+
+    @staticmethod
+    def _text_key(version: str, content_hash: str) -> str:
+        return f"{_KEY_PREFIX}:{version}:text:{content_hash}"
+
+    @staticmethod
+    def _result_key(version: str, content_hash: str, context: str) -> str:
+        return f"{_KEY_PREFIX}:{version}:result:{content_hash}:{context}"
+
+    def get_extraction(self, version: str, content_hash: str) -> Optional[Dict]:
+        """读取缓存的简历正文
+
+        Returns:
+            {'raw_text': 正文, 'extraction_tier': 提取层级}，未命中时返回None
+        """
+        if not self.enabled:
+            return None
+        try:
+            value = self._get(self._text_key(version, content_hash))
+        except Exception as e:
+            logger.warning(f"读取解析缓存失败: {e}")
+            value = None
+        self._count('text_hits' if value is not None else 'text_misses')
+        return json.loads(value) if value is not None else None
+
+    def get_result(self, version: str, content_hash: str, context: str) -> Optional[Dict]:
+        """读取缓存的结构化解析结果"""
+        if not self.enabled:
+            return None
+        try:
+            value = self._get(self._result_key(version, content_hash, context))
+        except Exception as e:
+            logger.warning(f"读取解析缓存失败: {e}")
+            value = None
+        if value is None:
+            self._count('result_misses')
+            return None
+        self._count('result_hits')
+        return json.loads(value)
+
+    def set(self, version: str, content_hash: str, context: str, result: Dict) -> None:
+        """写入正文和结构化解析结果"""
+        if not self.enabled or not result:
+            return
+        try:
+            payload = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"解析结果无法序列化，跳过缓存: {e}")
+            return
+        try:
+            extraction = {
+                'raw_text': result.get('raw_text') or '',
+                'extraction_tier': result.get('extraction_tier'),
+            }
+            self._set(self._text_key(version, content_hash), json.dumps(extraction, ensure_ascii=False))
+            self._set(self._result_key(version, content_hash, context), payload)
+        except Exception as e:
+            logger.warning(f"写入解析缓存失败: {e}")
+
+
+_parse_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> ParseCache:
+    """获取进程内共享的解析缓存"""
+    global _parse_cache
+    if _parse_cache is None:
+        _parse_cache = ParseCache()
+    return _parse_cache
@@ -0,0 +1,449 @@
+"""简历解析耗时统计 - 各阶段耗时/输入大小直方图 + 最慢解析记录
+
+一份简历解析慢（比如8秒）时，需要知道慢在哪一步：PDF提取、文本清理、
+_extract_education、_extract_work_experience 还是技能匹配。
+
+用法（ResumeParser 内部）:
+    with stage('education', len(text)):
+        ...
+
+- 按 PARSE_METRICS_SAMPLE_RATE 采样：未采样的解析 stage() 直接返回空上下文，几乎没有开销
+- 采样到的解析记录每个阶段的耗时和输入大小（PDF/DOCX提取为字节数，其余为字符数），
+  写入 Prometheus 风格的直方图：
+    resume_parse_stage_seconds{stage}      各阶段耗时
+    resume_parse_stage_input_size{stage}   各阶段输入大小
+    resume_parse_seconds{format,tier}      整次解析耗时
+- 每次解析（不论是否采样）都参与"最慢N次"排名，保留文件SHA-256、文件名和邮件主题，
+  可以找到原文件用 benchmarks.replay_slow 重放；采样到的记录同时带各阶段耗时。
+  进程内缓存Redis排名中第N名的耗时，没有超过它的解析不写Redis
+- PARSE_METRICS_ATTACH 打开时，采样到的解析结果附带 parse_profile 字段
+
+解析主要发生在Celery worker中，和解析缓存一样，统计同时写入Redis，供API进程汇总查看。
+"""
+import bisect
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.core.redis import get_redis, redis_failed
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = 'resume_parse_metrics'
+_HIST_KEY = f'{_KEY_PREFIX}:hist'
+_SLOWEST_KEY = f'{_KEY_PREFIX}:slowest'
+# 缓存的Redis最慢排名门槛多久后失效（秒），其他进程 reset() 清空排名后在此时间内恢复写入
+_SHARED_FLOOR_TTL = 60
+
+# 耗时分桶（秒）
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 输入大小分桶（字符数/字节数）
+SIZE_BUCKETS = (500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000, 5000000, 20000000)
+
+STAGE_SECONDS = 'resume_parse_stage_seconds'
+STAGE_INPUT_SIZE = 'resume_parse_stage_input_size'
+PARSE_SECONDS = 'resume_parse_seconds'
+
+_METRICS = {
+    STAGE_SECONDS: ('简历解析各阶段耗时（秒）', SECONDS_BUCKETS, ('stage',)),
+    STAGE_INPUT_SIZE: ('简历解析各阶段输入大小（提取阶段为字节数，其余为字符数）', SIZE_BUCKETS, ('stage',)),
+    PARSE_SECONDS: ('简历解析总耗时（秒）', SECONDS_BUCKETS, ('format', 'tier')),
+}
+
+# 当前正在采样的解析（每个线程/协程独立）
+_current_trace: ContextVar[Optional['ParseTrace']] = ContextVar('resume_parse_trace', default=None)
+_NOOP = nullcontext()
+
+
+class ParseTrace:
+    """一次解析的各阶段耗时记录"""
+
+    def __init__(self, sampled: bool):
+        self.sampled = sampled
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+        # stage -> {'seconds': 累计耗时, 'size': 输入大小, 'calls': 调用次数}
+        self.stages: Dict[str, Dict] = {}
+        self.notes: Dict[str, str] = {}
+        self._token = None
+
+    def add(self, name: str, seconds: float, size: Optional[int]) -> None:
+        entry = self.stages.get(name)
+        if entry is None:
+            entry = self.stages[name] = {'seconds': 0.0, 'size': 0, 'calls': 0}
+        entry['seconds'] += seconds
+        entry['calls'] += 1
+        if size is not None:
+            entry['size'] = max(entry['size'], size)
+
+    def profile(self) -> Dict:
+        """可附加到解析结果/写入日志的摘要（毫秒）"""
+        return {
+            'total_ms': round(self.seconds * 1000, 3),
+            'stages': {
+                name: {'ms': round(entry['seconds'] * 1000, 3), 'size': entry['size'], 'calls': entry['calls']}
+                for name, entry in self.stages.items()
+            },
+        }
+
+
+class _StageTimer:
+    __slots__ = ('trace', 'name', 'size', 'start')
+
+    def __init__(self, trace: ParseTrace, name: str, size: Optional[int]):
+        self.trace = trace
+        self.name = name
+        self.size = size
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.trace.add(self.name, time.perf_counter() - self.start, self.size)
+        return False
+
+
+def stage(name: str, size: Optional[int] = None):
+    """为当前解析的一个阶段计时，当前解析未被采样时不做任何事
+
+    Args:
+        name: 阶段名称（如 education、clean）
+        size: 阶段输入大小（字符数或字节数）
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return _NOOP
+    return _StageTimer(trace, name, size)
+
+
+def note(key: str, value: str) -> None:
+    """给当前采样中的解析附加标记（如缓存命中类型）"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.notes[key] = value
+
+
+class Histogram:
+    """Prometheus 风格直方图（分桶计数 + 总和 + 次数），按标签值分组
+
+    内部存放的是各桶自身的计数（不累计），输出时再转成 Prometheus 的累计 le 桶，
+    这样本地和Redis中的计数都可以直接相加。
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # labels -> [各桶计数..., +Inf桶计数], 总和, 次数
+        self.series: Dict[Tuple[str, ...], Dict] = {}
+
+    def bucket_index(self, value: float) -> int:
+        return bisect.bisect_left(self.buckets, value)
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> int:
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = {'buckets': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+        index = self.bucket_index(value)
+        series['buckets'][index] += 1
+        series['sum'] += value
+        series['count'] += 1
+        return index
+
+
+class ParseMetrics:
+    """进程内的解析耗时统计（Redis可用时同时写入Redis汇总）"""
+
+    def __init__(
+        self,
+        sample_rate: Optional[float] = None,
+        slowest: Optional[int] = None,
+        attach: Optional[bool] = None,
+        redis_url: Optional[str] = None,
+    ):
+        from app.core.config import settings
+
+        self.sample_rate = settings.PARSE_METRICS_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.slowest_limit = settings.PARSE_METRICS_SLOWEST if slowest is None else slowest
+        self.attach = settings.PARSE_METRICS_ATTACH if attach is None else attach
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.histograms = {name: Histogram(buckets) for name, (_, buckets, _) in _METRICS.items()}
+        # 最小堆：(耗时, 序号, 记录)
+        self._slowest: List[Tuple[float, int, Dict]] = []
+        self._seq = itertools.count()
+        # Redis最慢排名已满时第N名的耗时（每次写入后更新），不超过它的解析不写Redis
+        self._shared_floor = 0.0
+        self._shared_floor_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or self.slowest_limit > 0
+
+    # ==================== Redis ====================
+
+    def _redis_error(self, e: Exception) -> None:
+        logger.warning(f"解析耗时统计Redis操作失败: {e}")
+        redis_failed(self.redis_url)
+
+    # ==================== 记录 ====================
+
+    def begin(self, force: bool = False) -> Optional[ParseTrace]:
+        """开始一次解析的计时
+
+        Args:
+            force: 强制采样（重放慢解析时使用）
+
+        Returns:
+            ParseTrace，统计关闭时返回None
+        """
+        if not force and not self.enabled:
+            return None
+        sampled = force or (self.sample_rate > 0 and random.random() < self.sample_rate)
+        trace = ParseTrace(sampled)
+        # 嵌套调用（解析过程中再次解析）只计外层
+        if sampled and _current_trace.get() is None:
+            trace._token = _current_trace.set(trace)
+        return trace
+
+    def end(self, trace: ParseTrace) -> None:
+        """结束计时（在 finally 中调用）"""
+        trace.seconds = time.perf_counter() - trace.started
+        if trace._token is not None:
+            _current_trace.reset(trace._token)
+            trace._token = None
+
+    def record(
+        self,
+        trace: ParseTrace,
+        result: Dict,
+        data: bytes,
+        filename: str,
+        email_subject: Optional[str],
+        parser_version: str,
+    ) -> Dict:
+        """写入直方图和最慢记录
+
+        Returns:
+            解析结果（PARSE_METRICS_ATTACH 打开且本次被采样时附带 parse_profile）
+        """
+        file_format = Path(filename).suffix.lower().lstrip('.') or 'unknown'
+        if trace.notes.get('cache') == 'result':
+            tier = 'cache'
+        else:
+            tier = (result or {}).get('extraction_tier') or ('docx' if file_format in ('docx', 'doc') else 'none')
+
+        try:
+            if trace.sampled:
+                self._observe(trace, file_format, tier)
+            self._offer_slowest(trace, data, filename, email_subject, file_format, tier, parser_version)
+        except Exception as e:
+            # 统计失败不能影响解析结果
+            logger.warning(f"记录解析耗时失败: {e}")
+
+        if trace.sampled and self.attach and result:
+            result['parse_profile'] = trace.profile()
+        return result
+
+    def _observe(self, trace: ParseTrace, file_format: str, tier: str) -> None:
+        observations = [(PARSE_SECONDS, (file_format, tier), trace.seconds)]
+        for name, entry in trace.stages.items():
+            observations.append((STAGE_SECONDS, (name,), entry['seconds']))
+            if entry['size']:
+                observations.append((STAGE_INPUT_SIZE, (name,), entry['size']))
+
+        indexed = []
+        with self._lock:
+            for metric, labels, value in observations:
+                indexed.append((metric, labels, value, self.histograms[metric].observe(labels, value)))
+
+        client = get_redis(self.redis_url)
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for metric, labels, value, index in indexed:
+                field = _field(metric, labels)
+                pipe.hincrby(_HIST_KEY, f'{field}\x1f{index}', 1)
+                pipe.hincrbyfloat(_HIST_KEY, f'{field}\x1fsum', value)
+                pipe.hincrby(_HIST_KEY, f'{field}\x1fcount', 1)
+            pipe.execute()
+        except Exception as e:
+            self._redis_error(e)
+
+    def _offer_slowest(
+        self,
+        trace: ParseTrace,
+        data: bytes,
+        filename: str,
+        email_subject: Optional[str],
+        file_format: str,
+        tier: str,
+        parser_version: str,
+    ) -> None:
+        if self.slowest_limit <= 0:
+            return
+        with self._lock:
+            if len(self._slowest) >= self.slowest_limit and trace.seconds <= self._slowest[0][0]:
+                return
+
+        # 只有进入排名时才计算哈希
+        entry = {
+            'seconds': round(trace.seconds, 4),
+            'file_hash': hashlib.sha256(data).hexdigest(),
+            'filename': Path(filename).name,
+            'email_subject': email_subject,
+            'format': file_format,
+            'tier': tier,
+            'size_bytes': len(data),
+            'parser_version': parser_version,
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+            'stages': trace.profile()['stages'] if trace.sampled else None,
+        }
+        with self._lock:
+            item = (trace.seconds, next(self._seq), entry)
+            if len(self._slowest) < self.slowest_limit:
+                heapq.heappush(self._slowest, item)
+            else:
+                heapq.heappushpop(self._slowest, item)
+
+        # 其他进程写入后第N名只会变大，缓存的值偏小时最多多写一次，写入后即更新
+        if trace.seconds <= self._shared_floor and time.time() - self._shared_floor_at < _SHARED_FLOOR_TTL:
+            return
+        client = get_redis(self.redis_url)
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.zadd(_SLOWEST_KEY, {json.dumps(entry, ensure_ascii=False): trace.seconds})
+            pipe.zremrangebyrank(_SLOWEST_KEY, 0, -(self.slowest_limit + 1))
+            # 排名不足N条时取不到第N名，门槛保持为0
+            pipe.zrange(_SLOWEST_KEY, -self.slowest_limit, -self.slowest_limit, withscores=True)
+            floor = pipe.execute()[-1]
+            self._shared_floor = float(floor[0][1]) if floor else 0.0
+            self._shared_floor_at = time.time()
+        except Exception as e:
+            self._redis_error(e)
+
+    # ==================== 查看 ====================
+
+    def _shared_series(self) -> Optional[Dict[str, Dict[Tuple[str, ...], Dict]]]:
+        """从Redis读取所有进程汇总的直方图，不可用时返回None"""
+        client = get_redis(self.redis_url)
+        if client is None:
+            return None
+        try:
+            raw = client.hgetall(_HIST_KEY)
+        except Exception as e:
+            self._redis_error(e)
+            return None
+
+        shared: Dict[str, Dict[Tuple[str, ...], Dict]] = {name: {} for name in _METRICS}
+        for key, value in raw.items():
+            metric, label_text, slot = key.decode('utf-8').split('\x1f')
+            if metric not in shared:
+                continue
+            labels = tuple(label_text.split('\x1e'))
+            series = shared[metric].get(labels)
+            if series is None:
+                buckets = _METRICS[metric][1]
+                series = shared[metric][labels] = {'buckets': [0] * (len(buckets) + 1), 'sum': 0.0, 'count': 0}
+            if slot == 'sum':
+                series['sum'] = float(value)
+            elif slot == 'count':
+                series['count'] = int(value)
+            else:
+                index = int(slot)
+                if index < len(series['buckets']):
+                    series['buckets'][index] = int(value)
+        return shared
+
+    def render_prometheus(self, shared: bool = True) -> str:
+        """Prometheus 文本格式输出
+
+        Args:
+            shared: Redis可用时输出所有进程的汇总，否则只输出当前进程
+        """
+        series_by_metric = self._shared_series() if shared else None
+        if series_by_metric is None:
+            with self._lock:
+                series_by_metric = {
+                    name: {labels: {'buckets': list(s['buckets']), 'sum': s['sum'], 'count': s['count']}
+                           for labels, s in histogram.series.items()}
+                    for name, histogram in self.histograms.items()
+                }
+
+        lines = []
+        for name, (help_text, buckets, label_names) in _METRICS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for labels, series in sorted(series_by_metric.get(name, {}).items()):
+                label_text = ','.join(f'{key}="{_escape(value)}"' for key, value in zip(label_names, labels))
+                cumulative = 0
+                for bound, count in zip(list(buckets) + ['+Inf'], series['buckets']):
+                    cumulative += count
+                    le = bound if bound == '+Inf' else _format_bound(bound)
+                    lines.append(f'{name}_bucket{{{label_text},le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{{label_text}}} {series["sum"]}')
+                lines.append(f'{name}_count{{{label_text}}} {series["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def slowest(self, shared: bool = True) -> List[Dict]:
+        """最慢的N次解析（按耗时从高到低）"""
+        if shared:
+            client = get_redis(self.redis_url)
+            if client is not None:
+                try:
+                    members = client.zrevrange(_SLOWEST_KEY, 0, self.slowest_limit - 1)
+                    return [json.loads(member) for member in members]
+                except Exception as e:
+                    self._redis_error(e)
+        with self._lock:
+            return [entry for _, _, entry in sorted(self._slowest, key=lambda item: -item[0])]
+
+    def reset(self) -> None:
+        """清空当前进程和Redis中的统计"""
+        with self._lock:
+            for histogram in self.histograms.values():
+                histogram.series.clear()
+            self._slowest.clear()
+        self._shared_floor = 0.0
+        client = get_redis(self.redis_url)
+        if client is not None:
+            try:
+                client.delete(_HIST_KEY, _SLOWEST_KEY)
+            except Exception as e:
+                self._redis_error(e)
+
+
+def _field(metric: str, labels: Tuple[str, ...]) -> str:
+    """Redis哈希字段前缀：指标名 + 标签值（用不可见分隔符连接）"""
+    return metric + '\x1f' + '\x1e'.join(labels)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound)) if isinstance(bound, float) else str(bound)
+
+
+_parse_metrics: Optional[ParseMetrics] = None
+
+
+def get_parse_metrics() -> ParseMetrics:
+    """获取进程内共享的解析耗时统计"""
+    global _parse_metrics
+    if _parse_metrics is None:
+        _parse_metrics = ParseMetrics()
+    return _parse_metrics
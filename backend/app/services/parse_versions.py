@@ -0,0 +1,133 @@
+"""解析版本标记 - 记录每份简历由哪个版本的解析器/各提取器解析
+
+Resume.parser_version 记录整体解析版本（resume_parser.PARSER_VERSION + 技能词库版本），
+Resume.extractor_versions 记录各提取器的版本，例如 {"docx_text": 1, "skills": "1+3f2a9c1d", ...}。
+
+修改某个提取器的逻辑时，把 EXTRACTORS 中对应的 version 加1，同时修改 PARSER_VERSION（解析缓存按它隔离）。
+增量重新解析（app.tasks.reparse_stale_resumes）只选出 parser_version 不是当前版本的简历，
+再按 extractor_versions 找出过期的提取器，只重跑这些提取器、只更新它们产出的字段：
+调整技能词库后只会重新匹配技能，不会在全部简历上重跑教育、工作经历提取。
+
+依赖关系：education 由 education_history 汇总得出，work_years 由 work_experience 计算，
+被依赖的提取器过期时依赖它的也一起重跑；正文提取（pdf_text/docx_text）过期时需要从原文件重新提取，全部字段重跑。
+
+技能词库可以不重新部署直接发布新版本（见 skill_lexicon），因此 skills 的版本和 parser_version
+都带上词库版本（如 "2026.10.3+3f2a9c1d"）：发布新词库后只有技能字段过期。
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from app.services.pdf_layout import TIER_IMAGE_ONLY
+from app.services.resume_parser import PARSER_VERSION
+
+
+@dataclass(frozen=True)
+class Extractor:
+    """一个提取器
+
+    Attributes:
+        version: 版本号，逻辑变化时加1
+        fields: 产出的 Resume 字段（与解析结果的键相同）
+        depends: 依赖的提取器
+        file_types: 只适用于这些文件类型（正文提取器）；None 表示适用于全部简历
+        lexicon: 结果取决于技能词库（版本号附加词库版本）
+    """
+    version: int
+    fields: Tuple[str, ...]
+    depends: Tuple[str, ...] = ()
+    file_types: Optional[Tuple[str, ...]] = None
+    lexicon: bool = False
+
+
+EXTRACTORS: Dict[str, Extractor] = {
+    # 正文提取（PDF分层提取 + TextCleaner / DOCX流式提取）
+    'pdf_text': Extractor(1, ('raw_text', 'extraction_tier', 'review_reason'), file_types=('pdf',)),
+    'docx_text': Extractor(1, ('raw_text', 'review_reason'), file_types=('docx', 'doc')),
+    # 基于正文的字段提取（对应 ParsedResume 的各个 _resolve_*）
+    'contact': Extractor(1, ('phone', 'email')),
+    'name': Extractor(1, ('candidate_name',)),
+    'education_history': Extractor(1, ('education_history',)),
+    'education': Extractor(3, ('education', 'education_level'), depends=('education_history',)),
+    'work_experience': Extractor(1, ('work_experience',)),
+    'work_years': Extractor(1, ('work_years',), depends=('work_experience',)),
+    'project_experience': Extractor(1, ('project_experience',)),
+    'skills': Extractor(1, ('skills', 'skills_by_level'), lexicon=True),
+}
+
+TEXT_EXTRACTORS = tuple(name for name, extractor in EXTRACTORS.items() if extractor.file_types)
+
+
+def _lexicon_version() -> str:
+    from app.services.skill_matcher import get_skill_matcher
+    return get_skill_matcher().version
+
+
+def current_parser_version() -> str:
+    """当前的解析版本（PARSER_VERSION + 技能词库版本），与 Resume.parser_version 比较"""
+    return f"{PARSER_VERSION}+{_lexicon_version()}"
+
+
+def current_versions(file_type: Optional[str]) -> Dict[str, Union[int, str]]:
+    """适用于该文件类型的各提取器的当前版本"""
+    file_type = (file_type or '').lower()
+    lexicon = _lexicon_version()
+    return {
+        name: f"{extractor.version}+{lexicon}" if extractor.lexicon else extractor.version
+        for name, extractor in EXTRACTORS.items()
+        if extractor.file_types is None or file_type in extractor.file_types
+    }
+
+
+def stale_extractors(file_type: Optional[str], stamped: Optional[Dict]) -> List[str]:
+    """需要重跑的提取器（按 EXTRACTORS 顺序，已包含依赖它们的提取器）
+
+    Args:
+        file_type: Resume.file_type
+        stamped: Resume.extractor_versions（未标记过为 None，视为全部过期）
+    """
+    stamped = stamped or {}
+    current = current_versions(file_type)
+    stale = {name for name, version in current.items() if stamped.get(name) != version}
+    if stale & set(TEXT_EXTRACTORS):
+        return list(current)
+
+    # 依赖传递（EXTRACTORS 中被依赖的提取器排在前面）
+    for name, extractor in EXTRACTORS.items():
+        if name in current and any(dep in stale for dep in extractor.depends):
+            stale.add(name)
+    return [name for name in current if name in stale]
+
+
+def fields_of(extractors: Iterable[str]) -> Tuple[str, ...]:
+    """这些提取器产出的字段"""
+    fields: List[str] = []
+    for name in extractors:
+        fields.extend(field for field in EXTRACTORS[name].fields if field not in fields)
+    return tuple(fields)
+
+
+def stampable(result: Dict) -> bool:
+    """解析结果是否可以记录版本：有正文，或已确认是扫描件（当前版本重新提取也不会得到正文）
+
+    提取超时、子进程崩溃等得到的空正文不记录版本，增量重新解析时再试。
+    """
+    return bool(result.get('raw_text')) or result.get('extraction_tier') == TIER_IMAGE_ONLY
+
+
+def stamp(resume, extractors: Optional[Iterable[str]] = None) -> None:
+    """在简历上记录解析版本
+
+    Args:
+        resume: Resume 对象
+        extractors: 本次重跑的提取器；None 表示完整解析
+    """
+    current = current_versions(resume.file_type)
+    if extractors is None:
+        versions = dict(current)
+    else:
+        # 赋值新字典（原地修改JSONB字典不会被SQLAlchemy检测到）
+        versions = dict(resume.extractor_versions or {})
+        versions.update({name: current[name] for name in extractors if name in current})
+    resume.extractor_versions = versions
+    if all(versions.get(name) == version for name, version in current.items()):
+        resume.parser_version = current_parser_version()
@@ -0,0 +1,174 @@
+"""按需解析的简历结果
+
+ResumeParser._parse_text(text, lazy=True) 返回 ParsedResume：各字段在第一次访问时才提取并缓存，
+只需要一两个字段的批量维护任务（重算工作年限、回填技能等）不必跑完整的解析。
+
+    parsed = parser._parse_text(resume.raw_text, lazy=True)
+    parsed['work_years']        # 只提取工作经历（邮件主题没有年限时）
+    parsed['skills_by_level']   # 只做技能匹配
+
+字段之间的依赖自动解析：work_years 需要时会先提取 work_experience，
+education / education_level 需要时会先提取 education_history。各提取器共用同一次 segment_resume 切分。
+
+ParsedResume 是只读的 Mapping；to_dict() 按完整解析的顺序计算全部字段，
+结果与 _parse_text(text) 返回的字典完全相同（_parse_text 本身就是这样实现的）。
+"""
+import logging
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional
+
+from app.services.parse_metrics import stage
+from app.services.resume_sections import ResumeSections, segment_resume
+from app.services.subject_parser import parse_subject
+
+logger = logging.getLogger(__name__)
+
+# 字段 -> 计算它的方法（一个方法可以同时产出多个字段）
+_RESOLVERS = {
+    'candidate_name': '_resolve_name',
+    'phone': '_resolve_contact',
+    'email': '_resolve_contact',
+    'education': '_resolve_education',
+    'education_level': '_resolve_education',
+    'education_history': '_resolve_education_history',
+    'work_years': '_resolve_work_years',
+    'skills': '_resolve_skills',
+    'skills_by_level': '_resolve_skills',
+    'work_experience': '_resolve_work_experience',
+    'project_experience': '_resolve_project_experience',
+}
+
+# 完整解析时各字段的计算顺序（与原先逐项解析的顺序一致）
+_EAGER_ORDER = (
+    'phone', 'candidate_name', 'education', 'work_years',
+    'work_experience', 'project_experience', 'skills',
+)
+
+# 完整结果的字段顺序；education_level 只在识别出学校等级时出现
+_RESULT_KEYS = (
+    'candidate_name', 'phone', 'email', 'education', 'work_years', 'skills',
+    'work_experience', 'project_experience', 'education_history', 'raw_text',
+    'education_level', 'skills_by_level',
+)
+
+
+class ParsedResume(Mapping):
+    """按需解析的简历结果（字段第一次访问时提取，之后直接返回缓存值）"""
+
+    def __init__(self, parser, text: str, email_subject: Optional[str] = None, filename: Optional[str] = None):
+        self._parser = parser
+        self._text = text
+        self._email_subject = email_subject
+        self._filename = filename
+        self._sections: Optional[ResumeSections] = None
+        self._values: Dict = {'raw_text': text}
+
+    @property
+    def sections(self) -> ResumeSections:
+        """正文切分结果（各提取器共用）"""
+        if self._sections is None:
+            with stage('segment', len(self._text)):
+                self._sections = segment_resume(self._text)
+        return self._sections
+
+    # ==================== Mapping ====================
+
+    def __getitem__(self, key: str):
+        if key not in self._values:
+            resolver = _RESOLVERS.get(key)
+            if resolver is None:
+                raise KeyError(key)
+            getattr(self, resolver)()
+        # education_level 在没有识别出学校等级时不存在
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def is_resolved(self, key: str) -> bool:
+        """字段是否已经计算过"""
+        return key in self._values
+
+    def to_dict(self) -> Dict:
+        """计算全部字段，返回与完整解析相同的字典"""
+        for key in _EAGER_ORDER:
+            self[key]
+        return {key: self._values[key] for key in _RESULT_KEYS if key in self._values}
+
+    # ==================== 各字段的计算 ====================
+
+    def _resolve_contact(self) -> None:
+        with stage('contact', len(self._text)):
+            self._values['phone'] = self._parser._extract_phone(self._text)
+            self._values['email'] = self._parser._extract_email(self._text)
+
+    def _resolve_name(self) -> None:
+        parser = self._parser
+        name = None
+        with stage('name', len(self._text)):
+            # 优先级1: 从邮件标题提取姓名
+            if self._email_subject:
+                name = parse_subject(self._email_subject).candidate_name
+                if name:
+                    logger.info(f"从邮件主题提取姓名: {name}")
+
+            # 优先级2: 从文件名提取姓名
+            if not name and self._filename:
+                name = parser._extract_name_from_filename(self._filename)
+                if name:
+                    logger.info(f"从文件名提取姓名: {name}")
+
+            # 优先级3: 从简历正文提取姓名
+            if not name:
+                name = parser._extract_name(self._text, sections=self.sections)
+                if name:
+                    logger.info(f"从简历正文提取姓名: {name}")
+        self._values['candidate_name'] = name
+
+    def _resolve_education_history(self) -> None:
+        with stage('education', len(self._text)):
+            self._values['education_history'] = self._parser._extract_education(self._text, sections=self.sections)
+
+    def _resolve_education(self) -> None:
+        self._values.update(self._parser._summarize_education(self['education_history'], self.sections))
+
+    def _resolve_work_experience(self) -> None:
+        with stage('work_experience', len(self._text)):
+            self._values['work_experience'] = self._parser._extract_work_experience(self._text, sections=self.sections)
+
+    def _resolve_work_years(self) -> None:
+        work_years = None
+
+        # 优先级1: 从邮件主题提取工作年限
+        if self._email_subject:
+            work_years = parse_subject(self._email_subject).work_years
+            if work_years is not None:
+                logger.info(f"从邮件主题提取工作年限: {work_years}年")
+
+        # 优先级2: 邮件主题没有工作年限时，才从工作经历计算
+        if work_years is None and self['work_experience']:
+            work_years = self._parser._calculate_work_years(self['work_experience'])
+
+        # 仍未确定时设为0
+        self._values['work_years'] = 0 if work_years is None else work_years
+
+    def _resolve_project_experience(self) -> None:
+        with stage('project_experience', len(self._text)):
+            self._values['project_experience'] = self._parser._extract_project_experience(
+                self._text, sections=self.sections
+            )
+
+    def _resolve_skills(self) -> None:
+        # 提取技能关键词（带熟练度检测）
+        with stage('skills', len(self._text)):
+            skills_with_levels = self._parser._extract_skills_with_proficiency(self._text)
+        self._values['skills'] = (
+            skills_with_levels['expert'] +
+            skills_with_levels['proficient'] +
+            skills_with_levels['familiar'] +
+            skills_with_levels['mentioned']
+        )
+        self._values['skills_by_level'] = skills_with_levels
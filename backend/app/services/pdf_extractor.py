@@ -0,0 +1,340 @@
+"""隔离的PDF提取 - 在受监管的子进程池中运行 pymupdf4llm
+
+pymupdf4llm.to_markdown 直接跑在 Celery worker 进程里时没有任何超时，
+一份异常PDF（上千页、超大内嵌图片、损坏的xref）就能把worker卡住几分钟或撑爆内存。
+
+这里把提取放到常驻子进程中执行：
+- 墙钟超时：父进程等待结果超时后直接 kill 子进程，下次使用时重新拉起
+- 内存上限：子进程启动时设置 RLIMIT_AS，超限时 MemoryError / 分配失败
+- 页数上限：超过上限的PDF只提取前N页
+- 每个子进程处理一定数量的文件后自动回收，避免内存碎片累积
+
+Celery prefork 的子进程是 daemon 进程，不能再用 multiprocessing 创建子进程，
+因此这里用 subprocess 启动 `python -m app.services.pdf_extractor`：
+请求是一行JSON头（含PDF字节数）后接PDF原始字节，响应是一行JSON。
+父进程已经读入内存的PDF直接通过管道传给子进程，不需要再落盘或重新读文件。
+"""
+import atexit
+import json
+import logging
+import os
+import select
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 失败原因代码（写入解析结果的 review_reason）
+REASON_TIMEOUT = 'pdf_timeout'
+REASON_MEMORY = 'pdf_memory_limit'
+REASON_CRASHED = 'pdf_worker_crashed'
+REASON_ERROR = 'pdf_extract_error'
+REASON_UNAVAILABLE = 'pdf_extractor_unavailable'
+
+# 触发资源限制的原因（需要退回到更轻量的提取方式）
+LIMIT_REASONS = frozenset({REASON_TIMEOUT, REASON_MEMORY, REASON_CRASHED})
+
+_BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class PdfExtraction:
+    """一次PDF提取的结果
+
+    Attributes:
+        ok: 是否成功
+        text: 提取出的Markdown文本
+        reason: 失败原因代码（REASON_*）
+        error: 失败详情
+        page_count: PDF总页数
+        truncated: 是否因页数上限只提取了前N页
+        elapsed: 耗时（秒）
+    """
+    ok: bool
+    text: str = ''
+    reason: Optional[str] = None
+    error: str = ''
+    page_count: int = 0
+    truncated: bool = False
+    elapsed: float = 0.0
+
+
+class WorkerTimeout(Exception):
+    pass
+
+
+class WorkerCrashed(Exception):
+    pass
+
+
+class SubprocessWorker:
+    """一个常驻子进程（`python -m <module>`），按"JSON头 + 原始字节"请求、单行JSON响应通信
+
+    批量解析（batch_parser）的工作进程也使用这套协议。
+    """
+
+    def __init__(self, module: str = 'app.services.pdf_extractor', args: Sequence[str] = ()):
+        self.tasks_done = 0
+        self.proc = subprocess.Popen(
+            [sys.executable, '-m', module, *args],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=str(_BACKEND_ROOT),
+        )
+        self._buffer = b''
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, payload: Dict, data: bytes, timeout: float) -> Dict:
+        """发送一个请求（JSON头 + 文件字节）并等待一行JSON响应"""
+        header = dict(payload, size=len(data))
+        try:
+            self.proc.stdin.write(json.dumps(header).encode('utf-8') + b'\n')
+            self.proc.stdin.write(data)
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise WorkerCrashed(str(e))
+
+        deadline = time.monotonic() + timeout
+        fd = self.proc.stdout.fileno()
+        while b'\n' not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WorkerTimeout()
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                raise WorkerTimeout()
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise WorkerCrashed(f"子进程退出，返回码: {self.proc.wait()}")
+            self._buffer += chunk
+
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        self.tasks_done += 1
+        return json.loads(line)
+
+    def kill(self) -> None:
+        if self.alive():
+            self.proc.kill()
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        for stream in (self.proc.stdin, self.proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class PdfExtractorPool:
+    """PDF提取子进程池"""
+
+    def __init__(
+        self,
+        size: int = 1,
+        timeout: float = 60,
+        memory_mb: int = 1024,
+        max_pages: int = 30,
+        max_tasks_per_worker: int = 50,
+    ):
+        """
+        Args:
+            size: 子进程数量（同时处理的PDF数上限，超出的调用会排队等待）
+            timeout: 单个文件的墙钟超时（秒）
+            memory_mb: 子进程地址空间上限（MB），0表示不限制
+            max_pages: 单个文件最多提取的页数
+            max_tasks_per_worker: 子进程处理多少个文件后回收重建
+        """
+        self.size = size
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.max_pages = max_pages
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._idle: List[SubprocessWorker] = []
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(size)
+        self._pid = os.getpid()
+
+    def _take_worker(self) -> SubprocessWorker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive():
+                    return worker
+                worker.kill()
+        return SubprocessWorker(args=['--memory-mb', str(self.memory_mb)])
+
+    def _return_worker(self, worker: SubprocessWorker) -> None:
+        if not worker.alive() or worker.tasks_done >= self.max_tasks_per_worker:
+            worker.kill()
+            return
+        with self._lock:
+            self._idle.append(worker)
+
+    def extract(self, data: bytes, label: str = '') -> PdfExtraction:
+        """在子进程中提取PDF为Markdown
+
+        Args:
+            data: PDF文件内容
+            label: 日志中显示的文件名
+
+        Returns:
+            PdfExtraction（不抛异常，失败时 ok=False 并给出原因代码）
+        """
+        start = time.monotonic()
+        payload = {'max_pages': self.max_pages}
+
+        with self._slots:
+            try:
+                worker = self._take_worker()
+            except OSError as e:
+                return PdfExtraction(ok=False, reason=REASON_UNAVAILABLE, error=str(e))
+
+            try:
+                reply = worker.request(payload, data, self.timeout)
+            except WorkerTimeout:
+                worker.kill()
+                elapsed = time.monotonic() - start
+                logger.warning(f"PDF提取超时（{self.timeout}秒），已终止子进程: {label}")
+                return PdfExtraction(ok=False, reason=REASON_TIMEOUT,
+                                     error=f"超过{self.timeout}秒", elapsed=elapsed)
+            except WorkerCrashed as e:
+                worker.kill()
+                elapsed = time.monotonic() - start
+                logger.warning(f"PDF提取子进程异常退出: {label}, {e}")
+                return PdfExtraction(ok=False, reason=REASON_CRASHED, error=str(e), elapsed=elapsed)
+
+            if reply.get('reason') == REASON_MEMORY:
+                # 子进程内存耗尽后会自行退出，不再放回池中
+                worker.kill()
+            else:
+                self._return_worker(worker)
+
+        return PdfExtraction(
+            ok=reply.get('ok', False),
+            text=reply.get('text', ''),
+            reason=reply.get('reason'),
+            error=reply.get('error', ''),
+            page_count=reply.get('page_count', 0),
+            truncated=reply.get('truncated', False),
+            elapsed=time.monotonic() - start,
+        )
+
+    def shutdown(self) -> None:
+        """终止所有空闲子进程"""
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.kill()
+
+
+_pool: Optional[PdfExtractorPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pdf_extractor_pool() -> PdfExtractorPool:
+    """获取进程内共享的提取子进程池（fork出的子进程会重新创建）"""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._pid != os.getpid():
+            from app.core.config import settings
+            _pool = PdfExtractorPool(
+                size=settings.PDF_EXTRACT_WORKERS,
+                timeout=settings.PDF_EXTRACT_TIMEOUT,
+                memory_mb=settings.PDF_EXTRACT_MEMORY_MB,
+                max_pages=settings.PDF_EXTRACT_MAX_PAGES,
+                max_tasks_per_worker=settings.PDF_EXTRACT_MAX_TASKS_PER_WORKER,
+            )
+        return _pool
+
+
+@atexit.register
+def _shutdown_pool() -> None:
+    if _pool is not None and _pool._pid == os.getpid():
+        _pool.shutdown()
+
+
+# ==================== 子进程端 ====================
+
+def _extract_in_worker(request: Dict, data: bytes) -> Dict:
+    import pymupdf4llm
+    import fitz
+
+    max_pages = request.get('max_pages') or 0
+    with fitz.open(stream=data, filetype='pdf') as doc:
+        page_count = doc.page_count
+        pages = None
+        if max_pages and page_count > max_pages:
+            pages = list(range(max_pages))
+        text = pymupdf4llm.to_markdown(doc, pages=pages)
+
+    return {
+        'ok': True,
+        'text': text,
+        'page_count': page_count,
+        'truncated': pages is not None,
+    }
+
+
+def reply_channel() -> BinaryIO:
+    """子进程的响应通道
+
+    第三方库可能直接print到stdout，把协议通道单独保留，stdout重定向到stderr
+    """
+    channel = os.fdopen(os.dup(1), 'wb')
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return channel
+
+
+def _worker_main(memory_mb: int) -> None:
+    """子进程入口：逐行读取请求，逐行写回JSON结果"""
+    if memory_mb:
+        import resource
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    channel = reply_channel()
+    stdin = sys.stdin.buffer
+    while True:
+        line = stdin.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        data = stdin.read(request.get('size', 0))
+        exit_after_reply = False
+        try:
+            reply = _extract_in_worker(request, data)
+        except ImportError as e:
+            reply = {'ok': False, 'reason': REASON_UNAVAILABLE, 'error': str(e)}
+        except MemoryError as e:
+            reply = {'ok': False, 'reason': REASON_MEMORY, 'error': str(e) or 'MemoryError'}
+            exit_after_reply = True
+        except Exception as e:
+            reason = REASON_MEMORY if 'malloc' in str(e) or 'memory' in str(e).lower() else REASON_ERROR
+            reply = {'ok': False, 'reason': reason, 'error': str(e)}
+
+        channel.write(json.dumps(reply, ensure_ascii=False).encode('utf-8') + b'\n')
+        channel.flush()
+        if exit_after_reply:
+            # 内存耗尽后进程状态不可信，回复后退出，由父进程重新拉起
+            break
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='PDF提取子进程')
+    parser.add_argument('--memory-mb', type=int, default=0)
+    args = parser.parse_args()
+    _worker_main(args.memory_mb)
@@ -0,0 +1,217 @@
+"""PDF文本层探测 - 判断是否值得做布局分析
+
+大多数简历是单栏文本PDF，fitz 直接读取文本层就够用，
+pymupdf4llm 的布局分析要慢好几倍，只在版式复杂时才有收益。
+
+每页一次 page.get_text("dict") 同时得到文本（与 get_text("text") 输出一致）和每一行的坐标，
+据此计算几个廉价指标：
+- 并排行比例：与其他文本行左右并排（垂直方向重叠、水平方向不相交）的行占比 → 多栏
+- 表格行比例：同一水平线上有3段及以上并排文本的行占比 → 表格
+- 单字行比例：只有一个字符的行占比 → 文字被逐字拆行（竖排/字距异常）
+
+MuPDF 会把同一基线上左右两栏的文字归进同一个文本块，所以指标按行而不是按块计算。
+
+在此之前先用 check_image_only 检查前几页是否为扫描件（几乎没有文本、页面被图片覆盖），
+扫描件直接进入人工审核，不再依次尝试各个文本提取器。
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+# 提取层级（记录到解析结果和 Resume.extraction_tier）
+TIER_TEXT_LAYER = 'text_layer'  # 只用了fitz文本层
+TIER_LAYOUT = 'layout'  # pymupdf4llm布局分析
+TIER_TEXT_LAYER_FALLBACK = 'text_layer_fallback'  # 需要布局分析但pymupdf4llm失败，退回文本层
+TIER_PDFPLUMBER = 'pdfplumber'
+TIER_IMAGE_ONLY = 'image_only'  # 扫描件，未做文本提取
+
+# 扫描件的人工审核原因代码
+REASON_IMAGE_ONLY = 'pdf_image_only'
+
+# 判定阈值
+MULTI_COLUMN_RATIO = 0.4
+TABLE_ROW_RATIO = 0.25
+SHORT_LINE_RATIO = 0.3
+# 垂直方向重叠占较矮块高度的比例，超过视为同一行
+_ROW_OVERLAP = 0.5
+
+# 扫描件判定：检查前N页，平均每页文本字符数低于下限且图片平均覆盖率达到阈值
+IMAGE_ONLY_PAGES = 3
+IMAGE_ONLY_MAX_CHARS = 20
+IMAGE_ONLY_MIN_COVERAGE = 0.5
+
+
+@dataclass
+class TextLayerProbe:
+    """文本层探测结果
+
+    Attributes:
+        text: 文本层内容（与逐页 get_text("text") 拼接结果一致）
+        page_count: PDF总页数
+        pages_read: 实际读取的页数
+        text_lines: 文本行数量
+        multi_column_ratio: 并排行比例
+        table_row_ratio: 表格行比例
+        short_line_ratio: 单字行比例
+        reasons: 需要布局分析的原因（为空表示文本层足够）
+    """
+    text: str
+    page_count: int
+    pages_read: int
+    text_lines: int = 0
+    multi_column_ratio: float = 0.0
+    table_row_ratio: float = 0.0
+    short_line_ratio: float = 0.0
+    reasons: List[str] = field(default_factory=list)
+
+    @property
+    def needs_layout(self) -> bool:
+        return bool(self.reasons)
+
+
+@dataclass
+class ImageOnlyCheck:
+    """扫描件检查结果
+
+    Attributes:
+        image_only: 是否判定为扫描件
+        pages_checked: 检查的页数
+        text_spans: 非空文本span数量
+        text_chars: 文本字符数（去掉空白）
+        image_coverage: 图片对页面的平均覆盖率（文本充足时不计算，为0）
+    """
+    image_only: bool
+    pages_checked: int
+    text_spans: int = 0
+    text_chars: int = 0
+    image_coverage: float = 0.0
+
+
+def check_image_only(doc, max_pages: int = IMAGE_ONLY_PAGES) -> ImageOnlyCheck:
+    """检查PDF前几页是否为没有文本层的扫描件
+
+    文本字符足够时直接返回，只有文本稀少的文件才计算图片覆盖率。
+
+    Args:
+        doc: 已打开的 fitz.Document
+        max_pages: 检查的页数
+
+    Returns:
+        ImageOnlyCheck
+    """
+    pages_checked = min(doc.page_count, max_pages)
+    check = ImageOnlyCheck(image_only=False, pages_checked=pages_checked)
+    if not pages_checked:
+        return check
+
+    max_chars = pages_checked * IMAGE_ONLY_MAX_CHARS
+    for page_no in range(pages_checked):
+        for block in doc[page_no].get_text("dict")["blocks"]:
+            if block.get("type") != 0:
+                continue
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    chars = len(''.join(span["text"].split()))
+                    if chars:
+                        check.text_spans += 1
+                        check.text_chars += chars
+        if check.text_chars >= max_chars:
+            return check
+
+    coverage = 0.0
+    for page_no in range(pages_checked):
+        page = doc[page_no]
+        page_rect = page.rect
+        page_area = page_rect.width * page_rect.height
+        if page_area <= 0:
+            continue
+        covered = 0.0
+        for info in page.get_image_info():
+            rect = page_rect & info["bbox"]
+            if not rect.is_empty:
+                covered += rect.width * rect.height
+        coverage += min(covered / page_area, 1.0)
+
+    check.image_coverage = coverage / pages_checked
+    check.image_only = check.image_coverage >= IMAGE_ONLY_MIN_COVERAGE
+    return check
+
+
+def _count_side_by_side(boxes: List[tuple]) -> List[int]:
+    """统计每个文本行左右并排的行数量"""
+    order = sorted(range(len(boxes)), key=lambda k: boxes[k][1])
+    partners = [0] * len(boxes)
+    for pos, i in enumerate(order):
+        x0, y0, x1, y1 = boxes[i]
+        for j in order[pos + 1:]:
+            bx0, by0, bx1, by1 = boxes[j]
+            if by0 >= y1:
+                break
+            overlap = min(y1, by1) - max(y0, by0)
+            min_height = min(y1 - y0, by1 - by0)
+            if min_height <= 0 or overlap < min_height * _ROW_OVERLAP:
+                continue
+            if bx0 >= x1 or x0 >= bx1:
+                partners[i] += 1
+                partners[j] += 1
+    return partners
+
+
+def probe_text_layer(doc, max_pages: int = 0) -> TextLayerProbe:
+    """读取文本层并评估版式复杂度
+
+    Args:
+        doc: 已打开的 fitz.Document
+        max_pages: 最多读取的页数，0表示不限制
+
+    Returns:
+        TextLayerProbe
+    """
+    page_count = doc.page_count
+    pages_read = min(page_count, max_pages) if max_pages else page_count
+
+    texts = []
+    lines = []
+    side_by_side = 0
+    table_like = 0
+    for page_no in range(pages_read):
+        page_dict = doc[page_no].get_text("dict")
+        boxes = []
+        for block in page_dict["blocks"]:
+            if block.get("type") != 0:
+                continue
+            for line in block["lines"]:
+                line_text = ''.join(span["text"] for span in line["spans"])
+                texts.append(line_text + "\n")
+                if line_text.strip():
+                    lines.append(line_text.strip())
+                    boxes.append(tuple(line["bbox"]))
+        texts.append("\n")
+        partners = _count_side_by_side(boxes)
+        side_by_side += sum(1 for n in partners if n >= 1)
+        table_like += sum(1 for n in partners if n >= 2)
+
+    text = ''.join(texts)
+    total_lines = len(lines)
+    short_lines = sum(1 for line in lines if len(line) == 1)
+
+    probe = TextLayerProbe(
+        text=text,
+        page_count=page_count,
+        pages_read=pages_read,
+        text_lines=total_lines,
+        multi_column_ratio=side_by_side / total_lines if total_lines else 0.0,
+        table_row_ratio=table_like / total_lines if total_lines else 0.0,
+        short_line_ratio=short_lines / total_lines if total_lines else 0.0,
+    )
+
+    if probe.table_row_ratio >= TABLE_ROW_RATIO:
+        probe.reasons.append('table')
+    elif probe.multi_column_ratio >= MULTI_COLUMN_RATIO:
+        probe.reasons.append('multi_column')
+    if probe.short_line_ratio >= SHORT_LINE_RATIO:
+        probe.reasons.append('short_lines')
+
+    return probe
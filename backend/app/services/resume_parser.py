@@ -1,12 +1,24 @@
 """简历解析服务 - 支持PDF和DOCX格式"""
+import io
 import re
 import jieba
 from typing import Dict, List, Optional
 from pathlib import Path
 import logging
 
+from app.services import resume_patterns as rp
+from app.services.docx_extractor import DocxExtractError, extract_docx_text, extract_docx_text_python_docx
+from app.services.parse_cache import bytes_sha256, context_digest, get_parse_cache
+from app.services.parse_metrics import get_parse_metrics, note, stage
+from app.services.parsed_resume import ParsedResume
+from app.services.resume_sections import SECTION_KEYWORDS, ResumeSections, segment_resume
+from app.services.skill_matcher import get_skill_matcher
+
 logger = logging.getLogger(__name__)
 
+# 解析器版本：提取或解析逻辑变化时递增，解析缓存按此版本隔离
+PARSER_VERSION = '2026.10.5'
+
 
 class ResumeParser:
     """简历解析器"""
@@ -17,7 +29,7 @@ class ResumeParser:
         jieba.setLogLevel(jieba.logging.INFO)
 
     def parse_resume(self, file_path: str, email_subject: Optional[str] = None) -> Dict:
-        """解���简历文件
+        """解析简历文件
 
         Args:
             file_path: 简历文件路径
@@ -26,167 +38,376 @@ class ResumeParser:
             解析后的简历信息
         """
         file_ext = Path(file_path).suffix.lower()
+        if file_ext not in ['.pdf', '.docx', '.doc']:
+            logger.error(f"不支持的文件格式: {file_ext}")
+            return {}
 
         try:
-            if file_ext == '.pdf':
-                return self._parse_pdf(file_path, email_subject=email_subject)
-            elif file_ext in ['.docx', '.doc']:
-                return self._parse_docx(file_path, email_subject=email_subject)
-            else:
+            data = Path(file_path).read_bytes()
+        except OSError as e:
+            logger.error(f"读取简历文件失败: {e}")
+            return {}
+
+        return self.parse_resume_bytes(data, file_path, email_subject=email_subject)
+
+    def parse_resume_bytes(self, data: bytes, filename: str, email_subject: Optional[str] = None) -> Dict:
+        """解析内存中的简历文件（附件/上传内容无需先写入磁盘）
+
+        文件只读取一次，缓存哈希、文本层探测、pymupdf4llm和各fallback共用这份字节。
+
+        Args:
+            data: 文件内容
+            filename: 文件名（用于判断格式和从文件名提取姓名）
+            email_subject: 邮件标题（可选）
+
+        Returns:
+            解析后的简历信息
+        """
+        metrics = get_parse_metrics()
+        trace = metrics.begin()
+        if trace is None:
+            return self._parse_resume_bytes(data, filename, email_subject)
+        try:
+            result = self._parse_resume_bytes(data, filename, email_subject)
+        finally:
+            metrics.end(trace)
+        return metrics.record(trace, result, data, filename, email_subject, PARSER_VERSION)
+
+    def _parse_resume_bytes(self, data: bytes, filename: str, email_subject: Optional[str]) -> Dict:
+        """parse_resume_bytes 的实际解析（先查缓存，再按格式提取和解析）"""
+        file_ext = Path(filename).suffix.lower()
+
+        try:
+            if file_ext not in ['.pdf', '.docx', '.doc']:
                 logger.error(f"不支持的文件格式: {file_ext}")
                 return {}
 
+            # 先查缓存（同一份附件重复到达时跳过PDF/DOCX提取和文本解析）
+            cache = get_parse_cache()
+            content_hash = None
+            context = context_digest(email_subject, filename, get_skill_matcher().version)
+            if cache.enabled:
+                with stage('cache_lookup', len(data)):
+                    content_hash = bytes_sha256(data)
+                    cached = cache.get_result(PARSER_VERSION, content_hash, context)
+                    extraction = cache.get_extraction(PARSER_VERSION, content_hash) if cached is None else None
+                if cached is not None:
+                    logger.info(f"解析缓存命中: {filename}")
+                    note('cache', 'result')
+                    return cached
+                if extraction is not None:
+                    note('cache', 'text')
+                    logger.info(f"解析缓存命中正文，重新解析字段: {filename}")
+                    result = self._parse_text(extraction['raw_text'], email_subject=email_subject, filename=filename)
+                    if extraction.get('extraction_tier'):
+                        result['extraction_tier'] = extraction['extraction_tier']
+                    cache.set(PARSER_VERSION, content_hash, context, result)
+                    return result
+
+            if file_ext == '.pdf':
+                result = self._parse_pdf(data, filename, email_subject=email_subject)
+            else:
+                result = self._parse_docx(data, filename, email_subject=email_subject)
+
+            # 没有正文的结果（提取失败/触发资源限制）不缓存，下次重新尝试
+            if content_hash and result.get('raw_text'):
+                cache.set(PARSER_VERSION, content_hash, context, result)
+            return result
+
         except Exception as e:
             logger.error(f"解析简历失败: {e}")
             return {}
 
-    def _parse_pdf(self, file_path: str, email_subject: Optional[str] = None) -> Dict:
-        """解析PDF简历 - 使用pymupdf-layout布局感知解析
+    def parse_many(
+        self,
+        items,
+        workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """批量解析，按完成顺序逐项返回 BatchOutcome（见 batch_parser.parse_many）
+
+        Args:
+            items: 文件路径、(字节, 文件名)、或 BatchItem 的可迭代对象
+            workers: 解析子进程数，默认 PARSE_BATCH_WORKERS（未设置时按CPU核数）；0 表示用当前解析器串行解析
+            max_in_flight: 同时在途的最大项数
+            timeout: 单项超时（秒）
+        """
+        from app.services.batch_parser import parse_many
+
+        return parse_many(items, workers=workers, max_in_flight=max_in_flight, timeout=timeout, parser=self)
+
+    def _parse_pdf(self, data: bytes, filename: str, email_subject: Optional[str] = None) -> Dict:
+        """解析PDF简历 - 文本层优先，版式复杂时才做布局分析
+
+        扫描件（前几页几乎没有文本、被图片覆盖）直接返回空正文，review_reason 为 pdf_image_only。
 
         策略优先级：
-        1. pymupdf4llm (布局感知，主要) - 更好地处理复杂布局、表格、分栏等
+        0. fitz文本层 (adaptive模式) - 读取文本层并评估版式，单栏文本PDF直接使用
+        1. pymupdf4llm (布局感知) - 多栏/表格/逐字拆行时使用，在受限子进程中运行（超时/内存/页数上限）
         2. 原生PyMuPDF (fallback) - 基础文本提取
         3. pdfplumber (最后备选) - 兼容性方案
+
+        PDF只用fitz打开一次，这个Document在策略0/1(进程内)/2之间共用；
+        隔离子进程和pdfplumber直接使用内存中的字节，不会重新读取文件。
+
+        实际使用的层级记录在结果的 extraction_tier 中。
+        pymupdf4llm 触发资源限制时只复用策略0已读取的文本层，不在当前进程内重新提取
+        （进程内提取没有超时和内存限制）；得不到正文时，结果中的 review_reason 给出原因代码，
+        由调用方保存并标记为需要人工审核。
         """
-        from app.utils.text_cleaner import TextCleaner
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            logger.warning("PyMuPDF未安装，pymupdf4llm和原生PyMuPDF均不可用")
+            return self._parse_pdf_with_pdfplumber(data, filename, email_subject)
 
-        # 策略1: pymupdf4llm (布局感知，主要)
         try:
-            import pymupdf4llm
+            with stage('pdf_open', len(data)):
+                doc = fitz.open(stream=data, filetype='pdf')
+        except Exception as e:
+            logger.warning(f"PyMuPDF无法打开PDF: {e}，尝试pdfplumber")
+            return self._parse_pdf_with_pdfplumber(data, filename, email_subject)
+
+        with doc:
+            return self._parse_pdf_document(doc, data, filename, email_subject)
+
+    def _parse_pdf_document(self, doc, data: bytes, filename: str, email_subject: Optional[str]) -> Dict:
+        """按策略0~3解析已打开的PDF（见 _parse_pdf）"""
+        from app.core.config import settings
+        from app.services.pdf_layout import (
+            REASON_IMAGE_ONLY, TIER_IMAGE_ONLY, TIER_LAYOUT, TIER_TEXT_LAYER, TIER_TEXT_LAYER_FALLBACK,
+            check_image_only, probe_text_layer
+        )
 
-            logger.info(f"使用pymupdf4llm解析PDF: {file_path}")
+        max_pages = settings.PDF_EXTRACT_MAX_PAGES
+        review_reason = None
+        probe = None
 
-            # 转换为Markdown（保留格式，有助于理解文档结构）
-            # pymupdf4llm 会自动使用布局功能（如果 pymupdf 版本支持）
-            md_text = pymupdf4llm.to_markdown(file_path)
+        # 扫描件（没有文本层）直接进入人工审核，跳过所有文本提取器
+        try:
+            with stage('image_check', len(data)):
+                image_check = check_image_only(doc)
+        except Exception as e:
+            logger.warning(f"扫描件检查失败: {e}，继续文本提取")
+        else:
+            if image_check.image_only:
+                logger.warning(
+                    f"PDF为扫描件，跳过文本提取: {filename} "
+                    f"[前{image_check.pages_checked}页文本{image_check.text_chars}字 "
+                    f"图片覆盖率{image_check.image_coverage:.2f}]"
+                )
+                return self._parse_extracted_text('', TIER_IMAGE_ONLY, email_subject, filename, REASON_IMAGE_ONLY)
+
+        # 策略0: fitz文本层（adaptive模式）
+        if settings.PDF_EXTRACT_STRATEGY == 'adaptive':
+            try:
+                with stage('text_layer', len(data)):
+                    probe = probe_text_layer(doc, max_pages)
+
+                if not probe.needs_layout:
+                    text = self._clean_text(probe.text)
+                    logger.info(f"fitz文本层解析完成（单栏文本），文本长度: {len(text)} 字符: {filename}")
+                    return self._parse_extracted_text(text, TIER_TEXT_LAYER, email_subject, filename)
+
+                logger.info(
+                    f"版式复杂({','.join(probe.reasons)})，使用pymupdf4llm布局分析: {filename} "
+                    f"[并排行{probe.multi_column_ratio:.2f} 表格行{probe.table_row_ratio:.2f} "
+                    f"单字行{probe.short_line_ratio:.2f}]"
+                )
+            except Exception as e:
+                logger.warning(f"fitz文本层读取失败: {e}，尝试pymupdf4llm")
+                probe = None
+
+        # 策略1: pymupdf4llm (布局感知)
+        if settings.PDF_EXTRACT_ISOLATED:
+            from app.services.pdf_extractor import LIMIT_REASONS, REASON_UNAVAILABLE, get_pdf_extractor_pool
+
+            logger.info(f"使用pymupdf4llm解析PDF（隔离子进程）: {filename}")
+            with stage('layout', len(data)):
+                extraction = get_pdf_extractor_pool().extract(data, label=filename)
+            if extraction.ok:
+                if extraction.truncated:
+                    logger.warning(f"PDF共{extraction.page_count}页，只提取前{max_pages}页: {filename}")
+                text = self._clean_text(extraction.text)
+                logger.info(f"pymupdf4llm解析完成，文本长度: {len(text)} 字符，耗时 {extraction.elapsed:.2f}秒")
+                return self._parse_extracted_text(text, TIER_LAYOUT, email_subject, filename)
+
+            if extraction.reason in LIMIT_REASONS:
+                review_reason = extraction.reason
+                logger.warning(f"pymupdf4llm触发资源限制({extraction.reason})，不再进程内重新提取: {filename}")
+            elif extraction.reason == REASON_UNAVAILABLE:
+                logger.warning(f"pymupdf4llm不可用: {extraction.error}，使用原生PyMuPDF作为fallback")
+            else:
+                logger.warning(f"pymupdf4llm解析失败: {extraction.error}，尝试fallback方案")
+        else:
+            try:
+                import pymupdf4llm
 
-            # 清理文本
-            text = TextCleaner.clean_text(md_text)
-            logger.info(f"pymupdf4llm解析完成，文本长度: {len(text)} 字符")
+                logger.info(f"使用pymupdf4llm解析PDF: {filename}")
 
-            return self._parse_text(text, email_subject=email_subject, filename=file_path)
+                # 转换为Markdown（保留格式，有助于理解文档结构）
+                # pymupdf4llm 会自动使用布局功能（如果 pymupdf 版本支持）
+                pages = list(range(max_pages)) if doc.page_count > max_pages else None
+                with stage('layout', len(data)):
+                    md_text = pymupdf4llm.to_markdown(doc, pages=pages)
 
-        except ImportError:
-            logger.warning("pymupdf4llm未安装，使用原生PyMuPDF作为fallback")
-        except Exception as e:
-            logger.warning(f"pymupdf4llm解析失败: {e}，尝试fallback方案")
+                # 清理文本
+                text = self._clean_text(md_text)
+                logger.info(f"pymupdf4llm解析完成，文本长度: {len(text)} 字符")
+
+                return self._parse_extracted_text(text, TIER_LAYOUT, email_subject, filename)
+
+            except ImportError:
+                logger.warning("pymupdf4llm未安装，使用原生PyMuPDF作为fallback")
+            except Exception as e:
+                logger.warning(f"pymupdf4llm解析失败: {e}，尝试fallback方案")
+
+        # 策略2: 原生PyMuPDF (fallback) - 已读取过文本层时直接复用
+        if probe is not None:
+            text = self._clean_text(probe.text)
+            logger.info(f"使用已读取的fitz文本层，文本长度: {len(text)} 字符")
+            return self._parse_extracted_text(text, TIER_TEXT_LAYER_FALLBACK, email_subject, filename, review_reason)
+
+        if review_reason:
+            # 隔离子进程触发了超时/内存/崩溃限制：不在当前进程内用没有限制的PyMuPDF/pdfplumber重试同一个文件
+            logger.warning(f"PDF提取触发资源限制，跳过进程内提取，转人工审核: {filename}")
+            return self._with_review_reason({}, review_reason)
 
-        # 策略2: 原生PyMuPDF (fallback)
         try:
-            import fitz  # PyMuPDF
-            logger.info(f"使用原生PyMuPDF解析PDF: {file_path}")
+            logger.info(f"使用原生PyMuPDF解析PDF: {filename}")
 
             text = ""
-            with fitz.open(file_path) as doc:
-                for page in doc:
+            with stage('fitz_text', len(data)):
+                for page_no, page in enumerate(doc):
+                    if page_no >= max_pages:
+                        break
                     # 提取文本（使用"text"模式，适合文本型PDF）
                     page_text = page.get_text("text")
                     text += page_text + "\n"
 
             # 清理文本
-            text = TextCleaner.clean_text(text)
+            text = self._clean_text(text)
             logger.info(f"原生PyMuPDF解析完成，文本长度: {len(text)} 字符")
 
-            return self._parse_text(text, email_subject=email_subject, filename=file_path)
+            return self._parse_extracted_text(text, TIER_TEXT_LAYER_FALLBACK, email_subject, filename, review_reason)
 
-        except ImportError:
-            logger.warning("PyMuPDF未安装，尝试pdfplumber作为最后备选")
+        except Exception as e:
+            logger.warning(f"原生PyMuPDF解析失败: {e}，尝试pdfplumber作为最后备选")
+
+        return self._parse_pdf_with_pdfplumber(data, filename, email_subject, review_reason)
+
+    def _parse_pdf_with_pdfplumber(
+        self,
+        data: bytes,
+        filename: str,
+        email_subject: Optional[str],
+        review_reason: Optional[str] = None
+    ) -> Dict:
+        """策略3: pdfplumber (最后备选)"""
+        from app.core.config import settings
+        from app.services.pdf_layout import TIER_PDFPLUMBER
 
-        # 策略3: pdfplumber (最后备选)
         try:
             import pdfplumber
-            logger.info(f"使用pdfplumber解析PDF: {file_path}")
+            logger.info(f"使用pdfplumber解析PDF: {filename}")
 
-            with pdfplumber.open(file_path) as pdf:
+            with stage('pdfplumber', len(data)), pdfplumber.open(io.BytesIO(data)) as pdf:
                 # 提取所有文本
                 text = ""
-                for page in pdf.pages:
+                for page in pdf.pages[:settings.PDF_EXTRACT_MAX_PAGES]:
                     text += page.extract_text() or ""
 
             # 清理文本
-            text = TextCleaner.clean_text(text)
+            text = self._clean_text(text)
             logger.info(f"pdfplumber解析完成，文本长度: {len(text)} 字符")
 
-            return self._parse_text(text, email_subject=email_subject, filename=file_path)
+            return self._parse_extracted_text(text, TIER_PDFPLUMBER, email_subject, filename, review_reason)
 
         except ImportError:
             logger.error("PDF解析库未安装（pymupdf4llm、PyMuPDF和pdfplumber都不可用）")
-            return {}
+            return self._with_review_reason({}, review_reason)
         except Exception as e:
             logger.error(f"PDF解析失败: {e}")
-            return {}
+            return self._with_review_reason({}, review_reason)
+
+    def _parse_extracted_text(
+        self,
+        text: str,
+        tier: str,
+        email_subject: Optional[str],
+        filename: str,
+        review_reason: Optional[str] = None
+    ) -> Dict:
+        """解析提取出的正文，并记录提取层级和人工审核原因"""
+        result = self._parse_text(text, email_subject=email_subject, filename=filename)
+        result['extraction_tier'] = tier
+        return self._with_review_reason(result, review_reason)
+
+    @staticmethod
+    def _with_review_reason(result: Dict, review_reason: Optional[str]) -> Dict:
+        """没有提取到正文时，附上需要人工审核的原因代码"""
+        if review_reason and not result.get('raw_text'):
+            result['review_reason'] = review_reason
+        return result
 
-    def _parse_docx(self, file_path: str, email_subject: Optional[str] = None) -> Dict:
-        """解析DOCX简历"""
-        try:
-            from docx import Document
+    @staticmethod
+    def _clean_text(text: str) -> str:
+        """TextCleaner.clean_text（计入 clean 阶段耗时）"""
+        from app.utils.text_cleaner import TextCleaner
 
-            doc = Document(file_path)
+        with stage('clean', len(text)):
+            return TextCleaner.clean_text(text)
 
-            # 提取所有文本
-            text = ""
-            for para in doc.paragraphs:
-                text += para.text + "\n"
+    def _parse_docx(self, data: bytes, filename: str, email_subject: Optional[str] = None) -> Dict:
+        """解析DOCX简历（流式读取 word/document.xml，包含表格中的文字）"""
+        try:
+            with stage('docx', len(data)):
+                try:
+                    text = extract_docx_text(data)
+                except DocxExtractError as e:
+                    logger.warning(f"DOCX流式提取失败，改用python-docx: {filename}, {e}")
+                    note('docx_fallback', str(e))
+                    text = extract_docx_text_python_docx(data)
+                    if text is None:
+                        return {}
 
             # 解析文本
-            return self._parse_text(text, email_subject=email_subject, filename=file_path)
+            return self._parse_text(text, email_subject=email_subject, filename=filename)
 
-        except ImportError:
-            logger.error("python-docx未安装，无法解析DOCX")
-            return {}
         except Exception as e:
             logger.error(f"解析DOCX失败: {e}")
             return {}
 
-    def _parse_text(self, text: str, email_subject: Optional[str] = None, filename: Optional[str] = None) -> Dict:
+    def _parse_text(
+        self,
+        text: str,
+        email_subject: Optional[str] = None,
+        filename: Optional[str] = None,
+        lazy: bool = False
+    ):
         """解析简历文本
 
         Args:
             text: 简历文本
             email_subject: 邮件标题（可选，用于优先提取姓名）
             filename: 文件名（可选，用于从文件名提取姓名）
+            lazy: 为True时返回 ParsedResume，各字段在第一次访问时才提取（只需要部分字段的批量任务使用）
 
         Returns:
-            解析后的简历信息
+            解析后的简历信息（dict；lazy=True 时为 ParsedResume）
         """
-        result = {
-            'candidate_name': None,
-            'phone': None,
-            'email': None,
-            'education': None,
-            'work_years': None,
-            'skills': [],
-            'work_experience': [],
-            'project_experience': [],
-            'education_history': [],
-            'raw_text': text
-        }
+        parsed = ParsedResume(self, text, email_subject=email_subject, filename=filename)
+        return parsed if lazy else parsed.to_dict()
+
+    def _summarize_education(self, education_history: List[Dict], sections: ResumeSections) -> Dict:
+        """从教育经历中取最高学历和学校等级
 
-        # 提取基本信息
-        result['phone'] = self._extract_phone(text)
-        result['email'] = self._extract_email(text)
-
-        # 优先级1: 从邮件标题提取姓名
-        if email_subject:
-            result['candidate_name'] = self._extract_name_from_email_subject(email_subject)
-            if result['candidate_name']:
-                logger.info(f"从邮件主题提取姓名: {result['candidate_name']}")
-
-        # 优先级2: 从文件名提取姓名
-        if not result['candidate_name'] and filename:
-            result['candidate_name'] = self._extract_name_from_filename(filename)
-            if result['candidate_name']:
-                logger.info(f"从文件名提取姓名: {result['candidate_name']}")
-
-        # 优先级3: 从简历正文提取姓名
-        if not result['candidate_name']:
-            result['candidate_name'] = self._extract_name(text)
-            if result['candidate_name']:
-                logger.info(f"从简历正文提取姓名: {result['candidate_name']}")
-
-        # 提取教育背景
-        result['education_history'] = self._extract_education(text)
-        if result['education_history']:
+        Returns:
+            {'education': 最高学历}，识别出学校等级时另有 'education_level'
+        """
+        result = {'education': None}
+        if education_history:
             # 标准化学历映射（学士→本科等，包含英文）
             degree_mapping = {
                 '博士研究生': '博士', '博士': '博士',
@@ -205,7 +426,7 @@ class ResumeParser:
             education_order = ['博士', '硕士', '本科', '大专', '高中']
             highest_edu_record = None
             for edu in education_order:
-                for edu_history in result['education_history']:
+                for edu_history in education_history:
                     degree = edu_history.get('degree', '')
                     # 标准化学历名称
                     normalized_degree = degree_mapping.get(degree, degree)
@@ -218,7 +439,7 @@ class ResumeParser:
 
             # 如果还没找到，直接检查原始学历
             if not result['education']:
-                for edu_history in result['education_history']:
+                for edu_history in education_history:
                     degree = edu_history.get('degree', '')
                     if degree:
                         result['education'] = degree_mapping.get(degree, degree)
@@ -229,26 +450,24 @@ class ResumeParser:
             if highest_edu_record and highest_edu_record.get('school'):
                 from app.data.university_database import classify_university
                 school_name = highest_edu_record.get('school', '')
-                result['education_level'] = classify_university(school_name)
+                with stage('university', len(school_name)):
+                    result['education_level'] = classify_university(school_name)
                 logger.info(f"学历：{result['education']}，学校：{school_name}，等级：{result['education_level']}")
 
         # 备用方案：从基本信息部分提取学历（处理"学 历:本科(211)"格式）
-        if not result['education'] or not result['education_level']:
-            lines = text.split('\n')
-            basic_info_section = False
-            for i, line in enumerate(lines):
-                line_stripped = line.strip()
+        basic_info_start = sections.first_mention['basic_info']
+        if (not result['education'] or not result.get('education_level')) and basic_info_start is not None:
+            for line_stripped in sections.stripped[basic_info_start + 1:]:
                 # 检测基本信息段落
                 if '基本信息' in line_stripped:
-                    basic_info_section = True
                     continue
                 # 如果离开基本信息段落，停止
-                if basic_info_section and any(kw in line_stripped for kw in ['工作经历', '项目经验', '教育经历', '技能']):
+                if any(kw in line_stripped for kw in ['工作经历', '项目经验', '教育经历', '技能']):
                     break
                 # 在基本信息段落内查找学历
-                if basic_info_section and ('学 历:' in line_stripped or '学历:' in line_stripped):
+                if '学 历:' in line_stripped or '学历:' in line_stripped:
                     # 提取学历（支持"本科(211)"格式）
-                    degree_match = re.search(r'[:：]\s*([本科大专高中中专博士硕士学士]+)(?:\(([211985双非QS前\d]+)\))?', line_stripped)
+                    degree_match = rp.BASIC_INFO_DEGREE.search(line_stripped)
                     if degree_match:
                         degree = degree_match.group(1)
                         # 标准化学历名称
@@ -262,36 +481,6 @@ class ResumeParser:
                         logger.info(f"从基本信息提取学历：{result['education']}")
                     break
 
-        # 优先级1: 从邮件主题提取工作年限（第一优先级）
-        if email_subject and result['work_years'] is None:
-            work_years_from_subject = self._extract_work_years_from_subject(email_subject)
-            if work_years_from_subject is not None:
-                result['work_years'] = work_years_from_subject
-                logger.info(f"从邮件主题提取工作年限: {result['work_years']}年")
-
-        # 提取工作经历
-        result['work_experience'] = self._extract_work_experience(text)
-
-        # 优先级2: 只有当邮件主题没有提取到工作年限时，才从工作经历计算
-        if result['work_years'] is None and result['work_experience']:
-            result['work_years'] = self._calculate_work_years(result['work_experience'])
-
-        # 提取项目经历
-        result['project_experience'] = self._extract_project_experience(text)
-
-        # 提取技能关键词（带熟练度检测）
-        skills_with_levels = self._extract_skills_with_proficiency(text)
-        result['skills'] = (
-            skills_with_levels['expert'] +
-            skills_with_levels['proficient'] +
-            skills_with_levels['familiar'] +
-            skills_with_levels['mentioned']
-        )
-        result['skills_by_level'] = skills_with_levels  # 存储供后续使用
-
-        # 如果工作年限仍未确定，设为0
-        if result['work_years'] is None:
-            result['work_years'] = 0
 
         return result
 
@@ -309,20 +498,20 @@ class ResumeParser:
         text_no_spaces = text.replace(' ', '').replace('　', '')
 
         # 先尝试直接匹配11位手机号
-        match = re.search(r'1[3-9]\d{9}', text_no_spaces)
+        match = rp.MOBILE.search(text_no_spaces)
         if match:
             return match.group()
 
         # 尝试匹配带国家代码的格式：(+86) 139-1234-5678 或 （+86）139-1234-5678
-        match = re.search(r'[\(（]\+86[\)）]\s*-?\s*1[3-9]\d{9}', text_no_spaces)
+        match = rp.MOBILE_WITH_COUNTRY_CODE.search(text_no_spaces)
         if match:
             # 提取纯手机号
-            phone_match = re.search(r'1[3-9]\d{9}', match.group())
+            phone_match = rp.MOBILE.search(match.group())
             if phone_match:
                 return phone_match.group()
 
         # 尝试匹配带横杠的手机号
-        match = re.search(r'1[3-9]\d[-\s]?\d{4}[-\s]?\d{4}', text_no_spaces)
+        match = rp.MOBILE_SEPARATED.search(text_no_spaces)
         if match:
             # 清理横杠和空格
             phone = match.group()
@@ -331,7 +520,7 @@ class ResumeParser:
                 return phone
 
         # 匹配座机号（从原文）
-        match = re.search(r'\d{3,4}-\d{7,8}', text)
+        match = rp.LANDLINE.search(text)
         if match:
             return match.group()
 
@@ -340,79 +529,21 @@ class ResumeParser:
     def _extract_email(self, text: str) -> Optional[str]:
         """提取邮箱"""
         # 匹配邮箱格式
-        pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        match = re.search(pattern, text)
+        match = rp.EMAIL.search(text)
 
         if match:
             return match.group()
 
         return None
 
-    def _extract_name(self, text: str) -> Optional[str]:
+    def _extract_name(self, text: str, sections: Optional[ResumeSections] = None) -> Optional[str]:
         """提取姓名 - 改进版"""
-        lines = text.strip().split('\n')
+        if sections is None:
+            sections = segment_resume(text)
+        lines = sections.content_lines
 
         # 黑名单词（这些词看起来像姓名但不是）
-        blacklist = {
-            # 标题类
-            '教育背景', '基本信息', '个人优势', '工作经历', '项目经验',
-            '求职意向', '教育经历', '专业技能', '自我评价', '联系方式',
-            '个人简历', '简历', '姓名', '名字', '候选人', '应聘',
-            '求职信息', '出生年月', '政治面貌', '工作年限',
-            '个人信息', '个人总结', '个人简介', '个人评价', '优势亮点',
-            '掌握技能', '资格证书',
-            '性别', '手机', '电话', '邮箱', '出生日期', '出生年月', '年龄',
-            '籍贯', '地址', '婚姻状况', '民族', '现居住地', '通讯地址',
-            '邮政编码', '最高学历', '期望薪资', '期望城市', '应聘岗位',
-            '求职信息', '工作年限', '政治面貌',
-            #第二轮：补充无效名字
-            '同学', '微信号', '手机号', '先生', '女士', '小姐',
-            #第三轮：更多字段标签
-            '出生年日', '工作时长', '联系电话', '现所在地', '相关课程',
-            '项目描述', '发件人', '实习留用', '综合绩点', '手机号码',
-            '学校住址', '工作地点', '居住地址', '户籍地址', '电子邮箱',
-            '主修专业', '所学专业', '专业名称',
-            '应用化学', '计算机', '财务管理', '市场营销', '工商管理',
-            '信息管理', '软件技术', '网络工程', '电子信息', '机械设计',
-            '土木工程', '材料科学', '生物工程', '环境工程', '化学工程',
-            #第四轮：更多无效提取结果
-            '意向城市', '户籍', '现居城市', '毕业院校', '英语水平',
-            '英语', '产品运营', '费用报销', '发送时间', '发送日期', '后端开发',
-            '前端开发', '测试开发', '运营管理', '项目管理', '系统架构',
-            '数据分析', '数据管理', '技术支持', '软件开发', '系统设计',
-            #第五轮：更多字段标签
-            '收件人', '客户成功', '求职类型', '业务支持', '客户服务',
-            '售后服务', '销售支持', '市场支持', '运营支持', '技术总监',
-            '产品总监', '运营总监', '销售经理', '市场经理', '项目经理',
-            # 信息字段（原有）
-            '男', '女', '年龄', '电话', '邮箱', '邮箱', '地址', '籍贯',
-            '学历', '学位', '专业', '学校', '毕业', '院校',
-            # 学历
-            '本科', '硕士', '博士', '大专', '专科', '高中', '中专',
-            '专升本', '研究生', '本科生', '硕士生', '博士生',
-            '本科学位', '硕士学位', '博士学位', '双一流',
-            # 学科/专业
-            '会计', '会计学', '审计', '统计学', '软件工程', '电子信息',
-            '计算机科学', '通信工程', '机械工程', '数据科学',
-            '人工智能', '自动化', '电气工程', '财务管理',
-            # 职位/岗位相关
-            '总账会计', '财务专员', '销售总监', '软件工程师', '产品经理',
-            '项目经历', '实习经历', '工作内容', '主要职责',
-            # 城市/地点
-            '上海', '北京', '深圳', '广州', '杭州', '成都', '武汉',
-            '西安', '南京', '重庆', '天津', '苏州', '长沙', '青岛', '长春',
-            # 公司名（常见误识别）
-            '明源云', '用友', '金蝶', '卫泰集团',
-            # 其他常见非姓名词汇
-            '个人介绍', '基本信息', '专业技能', '主修课程', '获奖情况',
-            '证书情况', '语言能力', '计算机能力', '工作内容',
-            # 技术术语（防止误识别为姓名）
-            '软考', '编程语言', '编程', '数据库', '算法', '前端', '后端',
-            '全栈', '运维', '架构', '开发', '设计', '分析', '数据结构',
-            '计算机网络', '操作系统', '计算机科学', '软件工程', '人工智能',
-            '机器学习', '深度学习', '大数据', '云计算', '区块链',
-            '移动开发', 'Web开发', '嵌入式', '网络安全', '游戏开发',
-        }
+        blacklist = rp.NAME_BLACKLIST
 
         #模式：支持带空格的姓名（如"李 晓 斌"）
         for line in lines[:20]:
@@ -422,7 +553,7 @@ class ResumeParser:
 
             # 匹配 "李 晓 斌" 或 "李 晓" 格式（姓和名之间有空格）
             # 支持二到三个字之间有空格
-            match = re.search(r'^([\u4e00-\u9fa5])\s+([\u4e00-\u9fa5])(?:\s+([\u4e00-\u9fa5]))?', line)
+            match = rp.NAME_SPACED.search(line)
             if match:
                 # 提取姓名（去除空格）
                 parts = [g for g in match.groups() if g]
@@ -440,7 +571,7 @@ class ResumeParser:
                 continue
             # 匹配行首的2-4个汉字（后面可能跟空格、"求职意向"、"应聘"等）
             # 例如："刘泽钰 求职意向:项目经理" 或 "张三 应聘Java开发"
-            match = re.search(r'^([一-龥]{2,4})\s+(求职意向|应聘|意向|岗位)', line)
+            match = rp.NAME_BEFORE_INTENT.search(line)
             if match:
                 name = match.group(1).strip()
                 if self._is_valid_name(name, blacklist):
@@ -448,7 +579,7 @@ class ResumeParser:
             
             # 匹配行首的2-4个汉字加冒号（可能是姓名但后面是其他信息）
             # 例如："刘泽钰: 男" 或 "张三：1990年"
-            match = re.search(r'^([一-龥]{2,4})\s*[:：]', line)
+            match = rp.NAME_BEFORE_COLON.search(line)
             if match:
                 name = match.group(1).strip()
                 if self._is_valid_name(name, blacklist):
@@ -458,14 +589,14 @@ class ResumeParser:
         for line in lines[:20]:
             line = line.strip()
             # 匹配 "姓名：张三" 或 "名字：张三" 或 "候选人：张三"
-            match = re.search(r'姓\s*名\s*[:：]\s*([^\s|]{2,4})', line)
+            match = rp.NAME_LABEL.search(line)
             if match:
                 name = match.group(1).strip()
                 if self._is_valid_name(name, blacklist):
                     return name
 
             # 匹配 "Name: 张三"
-            match = re.search(r'[Nn]ame\s*[:：]\s*([^\s|]{2,4})', line)
+            match = rp.NAME_LABEL_EN.search(line)
             if match:
                 name = match.group(1).strip()
                 if self._is_valid_name(name, blacklist):
@@ -478,10 +609,10 @@ class ResumeParser:
             if len(line) > 15:
                 continue
             # 跳过包含特殊字符的行（但不包括空格、冒号、竖线）
-            if re.search(r'[0-9@\.]', line):
+            if rp.NAME_LINE_NOISE.search(line):
                 continue
             # 匹配纯中文姓名（2-4个汉字）
-            match = re.search(r'^([\u4e00-\u9fa5]{2,4})$', line)
+            match = rp.NAME_STANDALONE.search(line)
             if match:
                 name = match.group(1).strip()
                 if self._is_valid_name(name, blacklist):
@@ -491,27 +622,27 @@ class ResumeParser:
         for line in lines[:20]:
             line = line.strip()
             # 匹配 "张三|男|25" 或 "张三 | 男 | 25"
-            parts = re.split(r'\s*[|｜]\s*', line)
+            parts = rp.PIPE_SPLIT.split(line)
             for part in parts:
                 part = part.strip()
                 # 第一个部分通常是姓名
-                if re.match(r'^[\u4e00-\u9fa5]{2,4}$', part):
+                if rp.CHINESE_2_4.match(part):
                     name = part
                     if self._is_valid_name(name, blacklist):
                         return name
                     break  # 只检查第一个部分
 
         # 模式4: 在联系方式附近查找姓名（邮箱/电话前后）
-        common_surname_chars = set('赵钱孙李周吴郑王冯陈褚卫蒋沈韩杨朱秦尤许何吕施张孔曹严华金魏陶姜戚谢邹喻柏水窦章云苏潘葛奚范彭郎鲁韦昌马苗凤花方俞任袁柳酆鲍史唐费廉薛雷贺倪汤滕殷罗毕郝邬安常乐于时傅皮卞齐康伍余元卜顾孟平黄和穆萧尹姚邵湛汪祁毛禹狄米贝明臧计伏成戴谈宋茅庞熊纪舒屈项祝董粱杜阮蓝闵席季麻强贾路娄危江童颜郭梅盛林刁钟徐邱骆高夏蔡田樊胡凌霍万柯卢莫房裘缪干解应宗丁宣邓郁单杭洪包诸左石崔吉钮龚虞乔童游迟湛闻鲍庞逄党蓝牟裘牛农曲刘付白范郝邵叶勤肖詹陶翟邝佟仲景覃')
+        common_surname_chars = rp.CONTACT_SURNAME_CHARS
         for i, line in enumerate(lines):
             line = line.strip()
             # 查找包含邮箱或电话号码的行
-            if '@' in line or re.search(r'1[3-9]\d{9}', line):
+            if '@' in line or rp.MOBILE.search(line):
                 # 检查前1-3行是否有独立成行的2-4个汉字
                 for j in range(max(0, i-3), i):
                     check_line = lines[j].strip()
                     # 匹配独立的2-4个汉字（可能前后有空格）
-                    match = re.search(r'^[\s]*([\u4e00-\u9fa5]{2,4})[\s]*$', check_line)
+                    match = rp.NAME_STANDALONE_PADDED.search(check_line)
                     if match:
                         name = match.group(1).strip()
                         # 严格检查：不能是黑名单词，第一个字必须是常见姓氏
@@ -523,7 +654,7 @@ class ResumeParser:
                 for j in range(i+1, min(len(lines), i+6)):
                     check_line = lines[j].strip()
                     # 匹配 "姓名:xxx" 或 "姓名：xxx" 格式
-                    match = re.search(r'姓\s*名\s*[:：]\s*([^\s:：|]{2,4})', check_line)
+                    match = rp.NAME_LABEL_STRICT.search(check_line)
                     if match:
                         name = match.group(1).strip()
                         if self._is_valid_name(name, blacklist):
@@ -541,23 +672,15 @@ class ResumeParser:
             return False
 
         # 检查是否包含非中文字符
-        if not re.match(r'^[\u4e00-\u9fa5]+$', name):
+        if not rp.CHINESE_ONLY.match(name):
             return False
 
         # 检查长度（姓名通常是2-4个字）
         if len(name) < 2 or len(name) > 4:
             return False
 
-        # 检查首字是否为常见姓��（百家姓 + 常见复姓 + 更多常见姓氏）
-        common_surnames = set('赵钱孙李周吴郑王冯陈褚卫蒋沈韩杨朱秦尤许何吕施张孔曹严华金魏陶姜戚谢邹喻柏水窦章云苏潘葛奚范彭郎鲁韦昌马苗凤花方俞任袁柳酆鲍史唐费廉薛雷贺倪汤滕殷罗毕郝邬安常乐于时傅皮卞齐康伍余元卜顾孟平黄和穆萧尹姚邵湛汪祁毛禹狄米贝明臧计伏成戴谈宋茅庞熊纪舒屈项祝董粱杜阮蓝闵席季麻强贾路娄危江童颜郭梅盛林刁钟徐邱骆高夏蔡田樊胡凌霍万柯卢莫房裘缪干解应宗丁宣邓郁单杭洪包诸左石崔吉钮程虞乔童游迟湛闻鲍庞逄党蓝牟裘牛农曲刘付白范郝邵叶勤易晏柯仝蔡贺崔廖江关霍邢程阎余潘游戴欧阳司马上官诸葛夏侯东方皇甫尉迟公羊穆可司徒端木')
-        # 添加更多现代常见姓氏
-        more_surnames = set('易蔡尹于袁邵葛汪田莫雷黎崔盖郝卢安戴严杜季萧饶贾童侯孟邹廖谭熊金陆郝孔白崔康毛邱秦江史顾石郝贾薛林魏吕梁唐马冯许吴何谢曹彭郑潘邢谭姚冯魏董于蒋蔡余杜叶程苏魏吕丁任沈姚卢姜崔钟谭陆汪范金石贾顾韦付彭夏韦傅莫方汤姜黎常武乔贺赖龚文庞樊兰殷陶施洪洪崔岳苗秦江池范苑耿覃阿卜')
-        # 添加简化姓氏和其他常见姓氏
-        extra_surnames = set('肖詹陶翟邝佟仲景詹覃桂卜仇全但郇麦嵇荀邴查党隋巢茆莒邴揭雒冼幸邴胥宓蓬荪訾能隗靳郇蓟蔺鄢邴蒯宿邴邴辛奚柏洪穆傅燕段')  # 萧->肖, 詹陶翟邝佟仲景覃等少见姓氏 + 辛奚柏洪段等
-
-        common_surnames.update(more_surnames)
-        common_surnames.update(extra_surnames)
-        if name[0] not in common_surnames:
+        # 检查首字是否为常见姓氏（百家姓 + 常见复姓 + 更多常见姓氏）
+        if name[0] not in rp.COMMON_SURNAMES:
             return False
 
         # 检查是否包含明显的非姓名词汇（这些词通常不会单独出现作为姓名）
@@ -603,15 +726,12 @@ class ResumeParser:
             return None
 
         # 黑名单词
-        blacklist = {
-            '同学', '先生', '女士', '求职者', '候选人', '应届生',
-            '开发', '工程师', '设计师', '实施', '顾问',
-        }
+        blacklist = rp.SUBJECT_NAME_BLACKLIST
 
         # ========== 模式1: "职位-姓名-其他"��最常见，80%的情况）==========
         # 匹配：职位 - 姓名 - 其他
         # 例如："产品经理助理-郭子义-西交利物浦大学"
-        match = re.search(r'-([\u4e00-\u9fa5]{2,4})(?:-|$)', subject)
+        match = rp.SUBJECT_NAME_DASH.search(subject)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -620,7 +740,7 @@ class ResumeParser:
         # ========== 模式1b: "职位-姓名（备注）-其他" 或 "职位-姓名（备注）"（新增）==========
         # 匹配：职位 - 姓名(备注) - 其他 或 职位 - 姓名(备注)
         # 例如："财务信息化顾问-李景昱（中）.pdf"、"产品经理-张三（男）"
-        match = re.search(r'-([\u4e00-\u9fa5]{2,4})(?:（[^）]*）)?(?:-|$|\.|\s)', subject)
+        match = rp.SUBJECT_NAME_DASH_NOTE.search(subject)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -628,7 +748,7 @@ class ResumeParser:
 
         # ========== 模式2: "姓名 | 其他信息"（姓名在最前面）==========
         # 例如："张三 | 10年以上，应聘 销售总监 | 上海40-70K"
-        match = re.search(r'^([\u4e00-\u9fa5]{2,4})\s*\|', subject)
+        match = rp.SUBJECT_NAME_PIPE_SPACED.search(subject)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -636,7 +756,7 @@ class ResumeParser:
 
         # ========== 模式3: "姓名|其他信息"（没有空格的竖线分隔）==========
         # 例如："张三|应聘销售总监"
-        match = re.search(r'^([\u4e00-\u9fa5]{2,4})\|', subject)
+        match = rp.SUBJECT_NAME_PIPE.search(subject)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -644,7 +764,7 @@ class ResumeParser:
 
         # ========== 模式4: "【岗位】姓名_其他信息" ==========
         # 例如："【销售总监】张三_简历"
-        match = re.search(r'【[^】]*】\s*([\u4e00-\u9fa5]{2,4})_', subject)
+        match = rp.SUBJECT_NAME_BRACKET.search(subject)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -652,11 +772,11 @@ class ResumeParser:
 
         # ========== 模式5: 尝试从竖线分隔的第一部分提取 ==========
         # 例如："张三 | 10年以上 | 应聘岗位"
-        parts = re.split(r'\s*[|｜]\s*', subject)
+        parts = rp.PIPE_SPLIT.split(subject)
         if len(parts) > 0:
             first_part = parts[0].strip()
             # 第一个部分是纯2-4个汉字
-            if re.match(r'^[\u4e00-\u9fa5]{2,4}$', first_part):
+            if rp.CHINESE_2_4.match(first_part):
                 name = first_part
                 if self._is_valid_name(name, blacklist):
                     return name
@@ -678,19 +798,16 @@ class ResumeParser:
         basename = Path(filename).stem
 
         # 黑名单词
-        blacklist = {
-            '简历', 'resume', 'cv', '附件', '文档', '同学', '先生', '女士',
-            '求职者', '候选人',
-        }
+        blacklist = rp.FILENAME_NAME_BLACKLIST
 
         # ========== 模式1: 去除时间戳前缀 ==========
         # "20250130_123456_职位-姓名（备注）" -> "职位-姓名（备注）"
         # 匹配开头的时间戳模式：数字_数字_
-        basename = re.sub(r'^\d{8}_\d{6}_', '', basename)
+        basename = rp.FILENAME_TIMESTAMP_PREFIX.sub('', basename)
 
         # ========== 模式2: "【职位_地点_薪资】姓名_年限"（BOSS直聘格式）==========
         # 例如："【财务咨询顾问（深圳）_深圳_10-15K】邹喆_2年.pdf"
-        match = re.search(r'】([\u4e00-\u9fa5]{2,4})_', basename)
+        match = rp.FILENAME_NAME_BOSS.search(basename)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -699,7 +816,7 @@ class ResumeParser:
         # ========== 职位-姓名-其他（支持复杂分隔符）==========
         # 例如："张先寿-销售管理&IT项目管理 案例-简历25-12.pdf"
         # 例如："市场运营助理-Yoana Li 李珮瑶（中）.pdf"
-        match = re.search(r'^([\u4e00-\u9fa5]{2,4})[-—]', basename)
+        match = rp.FILENAME_NAME_LEADING.search(basename)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -709,7 +826,7 @@ class ResumeParser:
         # ========== 姓名（备注）格式 ==========
         # 例如："李珮瑶（中）" 或 "李珮瑶(中)"
         # 例如："张三（男）" 或 "张三(男)"
-        match = re.search(r'^([\u4e00-\u9fa5]{2,4})[（\(][^）\)]*[）\)]', basename)
+        match = rp.FILENAME_NAME_NOTE.search(basename)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -719,7 +836,7 @@ class ResumeParser:
         # ========== 模式3: "职位-姓名（备注）-其他" 或 "职位-姓名（备注）"（最常见）==========
         # 例如："财务信息化顾问-李景昱（中）"
         # 例如："市场运营助理-刘悦（中）.pdf"
-        match = re.search(r'-([\u4e00-\u9fa5]{2,4})(?:（[^）]*）)?(?:-|$|\.)', basename)
+        match = rp.FILENAME_NAME_DASH_NOTE.search(basename)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -727,7 +844,7 @@ class ResumeParser:
 
         # ========== 模式4: "职位-姓名"（无括号）==========
         # 例如："产品经理-张三"
-        match = re.search(r'-([\u4e00-\u9fa5]{2,4})$', basename)
+        match = rp.FILENAME_NAME_TRAILING.search(basename)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -735,7 +852,7 @@ class ResumeParser:
 
         # ========== 模式4: "姓名-简历" 或 "姓名-resume" ==========
         # 例如："李四-简历"
-        match = re.search(r'^([\u4e00-\u9fa5]{2,4})-(?:简历|resume|cv|附件)$', basename, re.IGNORECASE)
+        match = rp.FILENAME_NAME_RESUME.search(basename)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -743,7 +860,7 @@ class ResumeParser:
 
         # ========== 模式5: "姓名_其他信息"格式 ==========
         # 例如："彭坤_本科_Java开发工程师.pdf"
-        match = re.search(r'^([\u4e00-\u9fa5]{2,4})_', basename)
+        match = rp.FILENAME_NAME_UNDERSCORE.search(basename)
         if match:
             name = match.group(1).strip()
             if self._is_valid_name(name, blacklist):
@@ -752,7 +869,7 @@ class ResumeParser:
 
         # ========== 模式6: 纯姓名（只有2-4个汉字）==========
         # 例如："王五.pdf"
-        if re.match(r'^[\u4e00-\u9fa5]{2,4}$', basename):
+        if rp.CHINESE_2_4.match(basename):
             name = basename.strip()
             if self._is_valid_name(name, blacklist):
                 return name
@@ -782,20 +899,20 @@ class ResumeParser:
 
         # 优先级2: 检查"XX年毕业"格式（应届生）
         # 例如: "24年毕业"、"2024年毕业"、"26年毕业"
-        match = re.search(r'(\d{2}|\d{4})\s*年\s*毕业', subject)
+        match = rp.SUBJECT_GRADUATION_YEAR.search(subject)
         if match:
             logger.info(f"从邮件主题识别为应届生（XX年毕业格式）")
             return 0
 
         # 模式1: "X年以上"
-        match = re.search(r'(\d+)\s*年\s*以上', subject)
+        match = rp.SUBJECT_YEARS_PLUS.search(subject)
         if match:
             years = int(match.group(1))
             logger.info(f"从邮件主题提取工作年限: {years}年以上")
             return years
 
         # 模式2: "X年经验"
-        match = re.search(r'(\d+)\s*年\s*经验', subject)
+        match = rp.SUBJECT_YEARS_EXPERIENCE.search(subject)
         if match:
             years = int(match.group(1))
             logger.info(f"从邮件主题提取工作年限: {years}年经验")
@@ -803,7 +920,7 @@ class ResumeParser:
 
         # 模式3: "X年" (单独的数字+年，排除年份如2024年)
         # 但排除"毕业"关键词
-        match = re.search(r'(\d+)\s*年(?![以经])', subject)
+        match = rp.SUBJECT_YEARS_BARE.search(subject)
         if match:
             # 检查这个"X年"是否与"毕业"相关
             # 先看看上下文是否有"毕业"
@@ -822,7 +939,7 @@ class ResumeParser:
 
         return None
 
-    def _extract_education(self, text: str) -> List[Dict]:
+    def _extract_education(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict]:
         """提取教育背景 - 增强版 V2
 
         支持格式：
@@ -844,37 +961,22 @@ class ResumeParser:
         """
         education_list = []
 
+        if sections is None:
+            sections = segment_resume(text)
+
         # 教育背景关键词（用于定位教育背景段落，不包含"学历"因为"学历"可能出现在数据行中）
-        keywords = ['教育背景', '学习经历', '教育经历', '学历背景', '专业背景', 'EDUCATIONAL BACKGROUND', 'EDUCATION', 'EDUCATION HISTORY']
+        keywords = SECTION_KEYWORDS['education']
 
         # 学历关键词（用于提取学历）- 按优先级排序（中英文双语）
-        degree_keywords = ["博士研究生", "博士", "硕士研究生", "硕士", "学士", "本科", "大专", "专科", "高中", "中专",
-                          "Ph.D", "PhD", "Doctor", "Doctorate",  # 英文博士
-                          "Master", "Masters", "M.B.A", "MBA",  # 英文硕士
-                          "Bachelor", "Bachelors", "B.S", "B.A", "B.Sc", "BBA",  # 英文本科
-                          "Associate", "College"]  # 英文大专
+        degree_keywords = rp.DEGREE_KEYWORDS
 
         # 学历正则模式（支持括号格式，包括带前缀的如"(工学硕士)"，以及英文格式）
-        degree_patterns = [
-            # 中文模式
-            r'\((?:[^\)]*?)?(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)\)',  # (本科)或(工学硕士)
-            r'（(?:[^）]*?)?(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)）',  # （本科）或（工学硕士）
-            r'\s(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)\s',  # 空格包围
-            r'/(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)',  # /本科
-            r'\|(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)',  # |本科
-            # 英文模式
-            r'\b(Ph\.D|PhD|Doctor|Doctorate|Masters?|Master|M\.B\.A|MBA|Bachelors?|Bachelor|B\.S|B\.A|B\.Sc|BBA|Associate|College)\b',  # 英文学历
-            r'/(Masters?|Master|Bachelors?|Bachelor|Ph\.D|PhD)',  # /Master or /Bachelor
-        ]
+        degree_patterns = rp.DEGREE_PATTERNS
 
-        lines = text.split('\n')
-        start_idx = None
+        lines = sections.lines
 
         # 查找教育背景段落
-        for i, line in enumerate(lines):
-            if any(keyword in line for keyword in keywords):
-                start_idx = i
-                break
+        start_idx = sections.first_mention['education']
 
         if start_idx is None:
             # 如果没找到明确的标题，尝试通过学历关键词定位
@@ -920,12 +1022,12 @@ class ResumeParser:
                     # 优先处理：当前行包含括号格式的学历（如"华东理工大学 工业催化(工学硕士)"）
                     has_bracket_degree = False
                     for pattern in degree_patterns:
-                        match = re.search(pattern, line)
+                        match = pattern.search(line)
                         if match:
                             has_bracket_degree = True
                             education['degree'] = match.group(1)
                             # 提取括号前的部分（学校 + 专业）
-                            before_paren = re.sub(r'[()（）][^()（）]*', '', line).strip()
+                            before_paren = rp.PAREN_SEGMENT.sub('', line).strip()
                             # 分离学校名和专业
                             for uni_kw in ['大学', '学院', 'University', 'College']:
                                 if uni_kw in before_paren:
@@ -942,7 +1044,7 @@ class ResumeParser:
                     if not has_bracket_degree:
                         # 检查"学校 • 内设学院 • 专业"格式
                         if ' • ' in line or ' · ' in line:
-                            parts = re.split(r' [•·|] ', line)
+                            parts = rp.BULLET_SPLIT.split(line)
                             if len(parts) >= 1:
                                 education['school'] = parts[0].strip()
                                 # 查找专业
@@ -953,7 +1055,7 @@ class ResumeParser:
                                         continue
                                     # 检查是否看起来像专业名（2-10个汉字，不含"学院"等）
                                     if '学院' not in part and len(part) >= 2 and len(part) <= 15:
-                                        if re.match(r'^[\u4e00-\u9fa5（）()]+$|^[A-Za-z\s&/]+$', part):
+                                        if rp.MAJOR_PART.match(part):
                                             education['major'] = part
                                             break
                         else:
@@ -965,14 +1067,14 @@ class ResumeParser:
                             if not prev_line:
                                 continue
                             # 检查是否包含时间格式
-                            time_match = re.search(r'(\d{4})\s*[-.年—]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)', prev_line)
+                            time_match = rp.EDU_DURATION_DASH.search(prev_line)
                             if time_match:
                                 education['duration'] = time_match.group(0)
                                 break
 
                         # 如果找到了duration，尝试推断degree
                         if education['duration'] and not education['degree']:
-                            year_match = re.findall(r'(\d{4})', education['duration'])
+                            year_match = rp.YEAR.findall(education['duration'])
                             if len(year_match) == 2:
                                 start_year, end_year = int(year_match[0]), int(year_match[1])
                                 duration_years = end_year - start_year
@@ -999,7 +1101,7 @@ class ResumeParser:
                                     # 检查这行是否包含括号格式学历
                                     has_degree = False
                                     for pattern in degree_patterns:
-                                        if re.search(pattern, next_line):
+                                        if pattern.search(next_line):
                                             has_degree = True
                                             break
                                     # 如果没有括号格式学历，可能是另一个独立的学校行，停止
@@ -1021,11 +1123,11 @@ class ResumeParser:
 
                                 # 检查括号格式的学历
                                 for pattern in degree_patterns:
-                                    match = re.search(pattern, next_line)
+                                    match = pattern.search(next_line)
                                     if match:
                                         education['degree'] = match.group(1)
                                         # 提取专业（括号前的部分）
-                                        before_paren = re.sub(r'[()（）][^()（）]*', '', next_line).strip()
+                                        before_paren = rp.PAREN_SEGMENT.sub('', next_line).strip()
                                         # 如果括号前有内容且不是学校名，作为专业
                                         if before_paren and before_paren != education['school']:
                                             education['major'] = before_paren
@@ -1033,7 +1135,7 @@ class ResumeParser:
 
                                 # 提取时间
                                 if not education['duration']:
-                                    time_match = re.search(r'(\d{4})\s*[-.年]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)', next_line)
+                                    time_match = rp.EDU_DURATION.search(next_line)
                                     if time_match:
                                         education['duration'] = time_match.group(0)
 
@@ -1104,7 +1206,7 @@ class ResumeParser:
                         if not education['duration']:
                             for j in range(max(0, i - 5), i):
                                 prev_line = lines[j].strip()
-                                time_match = re.search(r'(\d{4})\s*[-.年]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)', prev_line)
+                                time_match = rp.EDU_DURATION.search(prev_line)
                                 if time_match:
                                     education['duration'] = time_match.group(0)
                                     break
@@ -1119,8 +1221,8 @@ class ResumeParser:
                         # 第一部分是学校（可能包含"学历:"前缀）
                         school_part = parts[0].strip()
                         # 去掉"学历:"前缀
-                        school_part = re.sub(r'^学历\s*[:：]\s*', '', school_part)
-                        school_part = re.sub(r'^学校\s*[:：]\s*', '', school_part)
+                        school_part = rp.DEGREE_LABEL_PREFIX.sub('', school_part)
+                        school_part = rp.SCHOOL_LABEL_PREFIX.sub('', school_part)
 
                         education = {
                             'school': school_part,
@@ -1138,7 +1240,7 @@ class ResumeParser:
             # ========== 新增模式: 处理"学校:xxx"格式（如乔亭志简历） ==========
             if '学校:' in line or 'school:' in line.lower():
                 # 提取学校名
-                school_match = re.search(r'学校[:：]\s*([^\s]+(?:[\u4e00-\u9fa5a-zA-Z\s]*大学|学院)?[\u4e00-\u9fa5a-zA-Z]*)', line)
+                school_match = rp.SCHOOL_FIELD.search(line)
                 if school_match:
                     school_name = school_match.group(1).strip()
                     # 检查学校名是否有效（包含"大学"或"学院"）
@@ -1156,7 +1258,7 @@ class ResumeParser:
                                 continue
                             # 检查是否是专业行
                             if '专业:' in next_line or 'major:' in next_line.lower():
-                                major_match = re.search(r'专业[:：]\s*([^\s]+.*)', next_line)
+                                major_match = rp.MAJOR_FIELD.search(next_line)
                                 if major_match:
                                     education['major'] = major_match.group(1).strip()
                             # 如果遇到新的section，停止
@@ -1211,19 +1313,19 @@ class ResumeParser:
                     # 例如：湖州师范学院 • 信息工程学院 • 计算机科学与技术 • GPA: 3.43
                     if ' • ' in line or ' · ' in line or ' | ' in line:
                         # 使用分隔符拆分
-                        parts = re.split(r' [•·|] ', line)
+                        parts = rp.BULLET_SPLIT.split(line)
                         if len(parts) >= 1:
                             # 第一部分通常是学校名
                             education['school'] = parts[0].strip()
                             # 查找专业（通常在第3部分或之后）
-                            for i, part in enumerate(parts[1:], 1):
+                            for part in parts[1:]:
                                 part = part.strip()
                                 # 跳过GPA、Rank等非专业信息
                                 if part.startswith('GPA') or part.startswith('Rank') or ':' in part:
                                     continue
                                 # 检查是否看起来像专业名（2-10个汉字，不含"学院"等）
                                 if '学院' not in part and len(part) >= 2 and len(part) <= 15:
-                                    if re.match(r'^[\u4e00-\u9fa5（）()]+$|^[A-Za-z\s&/]+$', part):
+                                    if rp.MAJOR_PART.match(part):
                                         education['major'] = part
                                         break
 
@@ -1234,14 +1336,14 @@ class ResumeParser:
                                 if not prev_line:
                                     continue
                                 # 检查是否包含时间格式
-                                time_match = re.search(r'(\d{4})\s*[-.年—]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)', prev_line)
+                                time_match = rp.EDU_DURATION_DASH.search(prev_line)
                                 if time_match:
                                     education['duration'] = time_match.group(0)
                                     break
 
                         # 如果找到了duration，尝试推断degree
                         if education['duration'] and not education['degree']:
-                            year_match = re.findall(r'(\d{4})', education['duration'])
+                            year_match = rp.YEAR.findall(education['duration'])
                             if len(year_match) == 2:
                                 start_year, end_year = int(year_match[0]), int(year_match[1])
                                 duration_years = end_year - start_year
@@ -1255,12 +1357,12 @@ class ResumeParser:
                     # ========== 优先级1: 检查"专业(学历)"括号格式（如"华东理工大学 专业催化(工学硕士)"）==========
                     # 使用正则提取括号中的学历（优先级最高，因为更精确）
                     for pattern in degree_patterns:
-                        match = re.search(pattern, line)
+                        match = pattern.search(line)
                         if match:
                             education['degree'] = match.group(1)
                             # 提取括号前的部分（学校 + 专业）
                             # 使用正确的正则：匹配从左括号到右括号之间的内容
-                            before_paren = re.sub(r'[()（）][^()（）]*', '', line).strip()
+                            before_paren = rp.PAREN_SEGMENT.sub('', line).strip()
                             # 分离学校名和专业：找大学/学院关键字的位置
                             for uni_kw in ['大学', '学院', 'University', 'College']:
                                 if uni_kw in before_paren:
@@ -1328,7 +1430,7 @@ class ResumeParser:
                                 # 提取学校（去掉学位后的部分）
                                 school_part = line.replace(degree, '').strip()
                                 # 尝试提取时间（末尾的时间格式）
-                                time_match = re.search(r'(\d{4})\s*[.-年]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)(?:\s*[.-年]\s*\d{1,2})?', school_part)
+                                time_match = rp.EDU_DURATION_IN_SCHOOL.search(school_part)
                                 if time_match:
                                     education['duration'] = time_match.group(0)
                                     # 去掉时间后的部分作为学校
@@ -1340,7 +1442,7 @@ class ResumeParser:
                                     if last_paren_pos > 0:
                                         potential_major = school_part[last_paren_pos + 1:].strip()
                                         # 如果括号后的内容看起来像专业名（2-6个汉字）
-                                        if potential_major and re.match(r'^[\u4e00-\u9fa5]{2,6}$', potential_major):
+                                        if potential_major and rp.MAJOR_CHINESE_2_6.match(potential_major):
                                             education['major'] = potential_major
                                             # 学校名是括号前的部分
                                             school_part = school_part[:last_paren_pos + 1].strip()
@@ -1359,7 +1461,7 @@ class ResumeParser:
                             continue  # 跳过联系方式行
 
                         # 跳过年龄、性别、CET等非专业信息行
-                        if re.search(r'\d+\s*岁|^\d+\s*\||男|女|cet|CET|四级|六级|托福|雅思|GRE', prev_line):
+                        if rp.PERSONAL_INFO_LINE.search(prev_line):
                             continue  # 跳过年龄/性别/英语等级行
 
                         # 跳过明显不是专业的行（用continue继续向前搜索）
@@ -1367,7 +1469,7 @@ class ResumeParser:
                         if any(prev_line.startswith(p) for p in skip_prefixes):
                             continue  # 跳过标题行，继续向前搜索
                         # 跳过看起来像姓名的短行（2-4个汉字，不包含常见专业关键词）
-                        if re.match(r'^[\u4e00-\u9fa5]{2,4}$', prev_line):
+                        if rp.CHINESE_2_4.match(prev_line):
                             # 常见专业关键词（如果包含这些词，可能是专业名而非姓名）
                             major_keywords = ['计算机', '软件', '电子', '机械', '会计', '金融', '经济', '管理', '化学', '物理', '数学', '生物', '医学', '文学', '历史', '哲学', '法学', '新闻', '艺术', '建筑', '土木', '电气', '自动化', '通信', '材料', '环境', '交通', '统计', '心理学']
                             if not any(kw in prev_line for kw in major_keywords):
@@ -1401,7 +1503,7 @@ class ResumeParser:
 
                         # 如果还没有major且前一行看起来像专业名（纯中文2-6字）
                         if not education['major'] and len(prev_line) < 15:
-                            if re.match(r'^[\u4e00-\u9fa5]{2,6}$', prev_line):
+                            if rp.MAJOR_CHINESE_2_6.match(prev_line):
                                 exclude_words = {'学校', '大学', '学历', '专业', '教育', '经历', '经验', '背景', '技能', '证书', '课程', '学习', '能力', '方向', '求职意向', '应聘', '项目', '实习', '科研'}
                                 # 添加学历关键词到排除列表（避免"硕士"、"博士"被当作专业）
                                 exclude_words.update(degree_keywords)
@@ -1474,11 +1576,11 @@ class ResumeParser:
                         if not education['degree']:
                             # 使用正则提取括号中的学历
                             for pattern in degree_patterns:
-                                match = re.search(pattern, next_line)
+                                match = pattern.search(next_line)
                                 if match:
                                     education['degree'] = match.group(1)
                                     # 提取专业（括号前的部分）
-                                    major_part = re.sub(r'[()（）].*?', '', next_line).strip()
+                                    major_part = rp.PAREN_CHAR.sub('', next_line).strip()
                                     if major_part:
                                         education['major'] = major_part
                                     break
@@ -1499,7 +1601,7 @@ class ResumeParser:
                             # 跳过包含"学院"的行（那是内设学院，不是专业）
                             if '学院' not in next_line:
                                 # 检查是否是纯中文专业名称（2-6个汉字，无特殊字符）
-                                if re.match(r'^[\u4e00-\u9fa5]{2,6}$', next_line):
+                                if rp.MAJOR_CHINESE_2_6.match(next_line):
                                     # 排除一些明显不是专业的词
                                     exclude_words = {'学校', '大学', '学历', '专业', '教育', '经历', '经验', '背景', '技能', '证书', '课程', '学习', '能力', '方向'}
                                     # 添加学历关键词到排除列表（避免"硕士"、"博士"被当作专业）
@@ -1510,23 +1612,23 @@ class ResumeParser:
                         # 提取时间
                         if not education['duration']:
                             # 标准格式：2019.06-2023.06 或 2019年06月-2023年06月
-                            time_match = re.search(r'(\d{4})\s*[-.年]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)', next_line)
+                            time_match = rp.EDU_DURATION.search(next_line)
                             if time_match:
                                 education['duration'] = time_match.group(0)
                                 # 如果行中包含时间，尝试提取时间前的专业（如"产业经济学 2023.09-2026.06"）
                                 if not education['major']:
                                     before_time = next_line[:time_match.start()].strip()
                                     # 移除常见的分隔符
-                                    before_time = re.sub(r'[\s、，,]+$', '', before_time).strip()
+                                    before_time = rp.TRAILING_SEPARATORS.sub('', before_time).strip()
                                     # 检查是否是有效的专业名（2-15个字符，可能是中文或含括号/斜杠）
-                                    if before_time and 2 <= len(before_time) <= 15 and re.match(r'^[\u4e00-\u9fa5()（）/\-·]+$', before_time):
+                                    if before_time and 2 <= len(before_time) <= 15 and rp.MAJOR_BEFORE_TIME.match(before_time):
                                         # 排除明显不是专业的词
                                         exclude_words = {'学校', '大学', '学历', '专业', '教育', '经历', '经验', '背景', '技能', '证书', '课程', '学习', '能力', '方向'}
                                         if not any(excluded in before_time for excluded in exclude_words):
                                             education['major'] = before_time
                             # 特殊格式：2019 年 6 月至 2023 年 6 月（带空格和"至"）
                             elif not education['duration']:
-                                time_match = re.search(r'(\d{4})\s*年\s*\d{1,2}\s*月\s*[-.年—至到]+\s*(\d{4}|\d{1,2}|至今)', next_line)
+                                time_match = rp.EDU_DURATION_CN.search(next_line)
                                 if time_match:
                                     education['duration'] = time_match.group(0)
 
@@ -1534,7 +1636,7 @@ class ResumeParser:
                     if not education['duration']:
                         for j in range(max(0, i - 2), i):
                             prev_line = lines[j].strip()
-                            time_match = re.search(r'(\d{4})\s*[-.年]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)', prev_line)
+                            time_match = rp.EDU_DURATION.search(prev_line)
                             if time_match:
                                 education['duration'] = time_match.group(0)
                                 break
@@ -1549,8 +1651,8 @@ class ResumeParser:
                         # 第一部分是学校（可能包含"学历:"前缀）
                         school_part = parts[0].strip()
                         # 去掉"学历:"前缀
-                        school_part = re.sub(r'^学历\s*[:：]\s*', '', school_part)
-                        school_part = re.sub(r'^学校\s*[:：]\s*', '', school_part)
+                        school_part = rp.DEGREE_LABEL_PREFIX.sub('', school_part)
+                        school_part = rp.SCHOOL_LABEL_PREFIX.sub('', school_part)
 
                         education = {
                             'school': school_part,
@@ -1587,7 +1689,7 @@ class ResumeParser:
             if education and education['school'] and not education['degree']:
                 # 检查时间范围推断学历
                 if education['duration']:
-                    year_match = re.findall(r'(\d{4})', education['duration'])
+                    year_match = rp.YEAR.findall(education['duration'])
                     if len(year_match) == 2:
                         start_year, end_year = int(year_match[0]), int(year_match[1])
                         duration_years = end_year - start_year
@@ -1637,7 +1739,7 @@ class ResumeParser:
                     # 向前查找时间（范围：前2行）
                     for j in range(max(0, i - 2), i):
                         prev_line = lines[j].strip()
-                        time_match = re.search(r'(\d{4})\s*[-.年]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)', prev_line)
+                        time_match = rp.EDU_DURATION.search(prev_line)
                         if time_match:
                             education['duration'] = time_match.group(0)
                             break
@@ -1653,11 +1755,11 @@ class ResumeParser:
                         # 使用正则提取括号中的学历
                         if not education['degree']:
                             for pattern in degree_patterns:
-                                match = re.search(pattern, next_line)
+                                match = pattern.search(next_line)
                                 if match:
                                     education['degree'] = match.group(1)
                                     # 提取专业（括号前的部分）
-                                    major_part = re.sub(r'[()（）].*?', '', next_line).strip()
+                                    major_part = rp.PAREN_CHAR.sub('', next_line).strip()
                                     education['major'] = major_part
                                     break
 
@@ -1671,12 +1773,12 @@ class ResumeParser:
                         # 提取时间
                         if not education['duration']:
                             # 标准格式：2019.06-2023.06 或 2019年06月-2023年06月
-                            time_match = re.search(r'(\d{4})\s*[-.年]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)', next_line)
+                            time_match = rp.EDU_DURATION.search(next_line)
                             if time_match:
                                 education['duration'] = time_match.group(0)
                             # 特殊格式：2019 年 6 月至 2023 年 6 月（带空格和"至"）
                             elif not education['duration']:
-                                time_match = re.search(r'(\d{4})\s*年\s*\d{1,2}\s*月\s*[-.年—至到]+\s*(\d{4}|\d{1,2}|至今)', next_line)
+                                time_match = rp.EDU_DURATION_CN.search(next_line)
                                 if time_match:
                                     education['duration'] = time_match.group(0)
 
@@ -1684,7 +1786,7 @@ class ResumeParser:
                     if education['school'] and not education['degree']:
                         # 检查时间范围：如果是4年制（如2018.08-2022.07），推断为本科
                         if education['duration']:
-                            year_match = re.findall(r'(\d{4})', education['duration'])
+                            year_match = rp.YEAR.findall(education['duration'])
                             if len(year_match) == 2:
                                 start_year, end_year = int(year_match[0]), int(year_match[1])
                                 duration = end_year - start_year
@@ -1732,7 +1834,7 @@ class ResumeParser:
                             # 清理可能的分隔符和多余空格
                             cleaned_school = cleaned_school.strip(' ·•-—–\t ')
                             # 清理"学历"前缀（如"学历 湖州师范学院" -> "湖州师范学院"）
-                            cleaned_school = re.sub(r'^学历\s*[:：]?\s*', '', cleaned_school)
+                            cleaned_school = rp.DEGREE_LABEL_PREFIX_OPTIONAL.sub('', cleaned_school)
                             cleaned_school = cleaned_school.strip()
                             education['school'] = cleaned_school if cleaned_school else school[:idx]
                         break
@@ -1754,7 +1856,7 @@ class ResumeParser:
 
         return education_list
 
-    def _extract_work_experience(self, text: str) -> List[Dict]:
+    def _extract_work_experience(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict]:
         """提取工作经历 - 改进版V3（全文档搜索）
 
         支持格式：
@@ -1772,36 +1874,12 @@ class ResumeParser:
         work_list = []
 
         # 时间格式正则模式（支持多种格式）
-        time_patterns = [
-            r'(\d{4})\.(\d{1,2})\s*[-.—至到]\s*(\d{4})\.(\d{1,2})',  # 2020.09-2024.06
-            r'(\d{4})年(\d{1,2})月\s*[-.—至到]\s*(\d{4})年(\d{1,2})月',  # 2020年09月-2024年06月
-            r'(\d{4})\s*[-.—至到]\s*(\d{4})',  # 2020-2024
-            r'(\d{4})\.(\d{1,2})\s*[-.—至到]\s*至今',  # 2020.09-至今
-            r'(\d{4})年\s*[-.—至到]\s*至今',  # 2020年-至今
-            r'(\d{4})年(\d{1,2})月\s*[-.—至到]\s*至今',  # 2023年7月-至今
-        ]
+        time_patterns = rp.WORK_TIME_PATTERNS
 
         # 公司名识别模式
-        company_patterns = [
-            r'.*公司.*',  # 包含"公司"
-            r'.*科技.*',  # 包含"科技"
-            r'.*有限.*',  # 包含"有限"
-            r'.*集团.*',  # 包含"集团"
-            r'.*银行.*',  # 包含"银行"
-            r'.*医院.*',  # 包含"医院"
-            #".*学校.*"，避免把学校误识别为公司
-        ]
+        company_patterns = rp.COMPANY_PATTERNS
 
-        non_work_patterns = [
-            r'.*学院.*',  # 包含"学院"
-            r'.*大学.*',  # 包含"大学"
-            r'.*专业.*',  # 包含"专业"
-            r'.*课程.*',  # 包含"课程"
-            r'.*学习.*',  # 包含"学习"
-            r'.*教学.*',  # 包含"教学"
-            r'.*教育.*',  # 包含"教育"
-            r'.*培训.*',  # 包含"培训"
-        ]
+        non_work_patterns = rp.NON_WORK_PATTERNS
 
         non_work_majors = [
             '应用化学', '供应链管理', '工商管理', '计算机科学', '软件工程',
@@ -1820,32 +1898,15 @@ class ResumeParser:
         internship_keywords = ['实习', '兼职', '见习', '实训', '校园']
 
         # 查找工作经历段落（用于确定搜索范围）
-        keywords = ['工作经历', '工作经验', '职业经历', '工作']
-        internship_section_keywords = ['实习经历', '实习工作', '实习经验', '见习经历']
-        lines = text.split('\n')
-        start_idx = None
-        end_idx = len(lines)
-
-        def is_section_header(line_text, keyword):
-            """检查是否为section标题（独立成行，或只跟冒号）"""
-            if line_text == keyword:
-                return True
-            for colon in ['：', ':']:
-                if line_text.startswith(keyword + colon):
-                    after_colon = line_text[len(keyword) + len(colon):].strip()
-                    if not after_colon:
-                        return True
-            return False
-
-        # 优先检查是否是实习section，如果是则直接返回空列表
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            if any(is_section_header(line_stripped, kw) for kw in internship_section_keywords):
-                return []  # 实习section不提取工作经历
-            if any(is_section_header(line_stripped, kw) for kw in keywords):
-                start_idx = i
-                break
+        if sections is None:
+            sections = segment_resume(text)
+        lines = sections.lines
+        start_idx = sections.first_header('work')
 
+        # 优先检查是否是实习section（出现在工作经历标题之前），如果是则直接返回空列表
+        internship_idx = sections.first_header('internship')
+        if internship_idx is not None and (start_idx is None or internship_idx <= start_idx):
+            return []  # 实习section不提取工作经历
 
         # 定义搜索范围：如果有"工作经历"标题，从标题前搜索到标题后
         # 如果没有标题，全文档搜索
@@ -1872,7 +1933,7 @@ class ResumeParser:
 
             # 检查是否包含时间
             for pattern in time_patterns:
-                match = re.search(pattern, line)
+                match = pattern.search(line)
                 if match:
                     time_lines[i] = match.group(0)
                     break
@@ -1899,7 +1960,7 @@ class ResumeParser:
             # 先尝试从时间行提取
             time_line_clean = time_line
             for pattern in time_patterns:
-                time_line_clean = re.sub(pattern, '', time_line_clean).strip()
+                time_line_clean = pattern.sub('', time_line_clean).strip()
 
             if time_line_clean and len(time_line_clean) > 3:
                 # 分析时间行剩余内容，提取公司和职位
@@ -1917,7 +1978,7 @@ class ResumeParser:
                             # 验证：如果后面紧跟时间格式，那这不是职位
                             has_time_after = False
                             for pattern in time_patterns:
-                                if re.search(pattern, ' '.join(parts[i:])):
+                                if pattern.search(' '.join(parts[i:])):
                                     has_time_after = True
                                     break
                             if not has_time_after:
@@ -1933,7 +1994,7 @@ class ResumeParser:
                 # 如果没找到职位，尝试其他方式
                 if not company and not position:
                     # 检查是否包含公司关键词
-                    if any(re.search(p, time_line_clean) for p in company_patterns):
+                    if any(p.search(time_line_clean) for p in company_patterns):
                         # 有公司关键词，整个内容可能是公司名
                         company = time_line_clean
                     elif 3 < len(time_line_clean) < 60:
@@ -1972,7 +2033,7 @@ class ResumeParser:
                 # 检查是否是公司名（放宽条件）
                 if not company:
                     # 优先匹配包含明确公司关键词的
-                    if any(re.search(p, line) for p in company_patterns):
+                    if any(p.search(line) for p in company_patterns):
                         company = line
                         continue
                     # 优先级2：包含"|"的行通常是"职位 | 公司"格式
@@ -1988,7 +2049,7 @@ class ResumeParser:
                         continue
 
                 # 检查是否包含职位关键词（但不是公司名）
-                if not position and not any(re.search(p, line) for p in company_patterns):
+                if not position and not any(p.search(line) for p in company_patterns):
                     for keyword in position_keywords:
                         if keyword in line:
                             position = keyword
@@ -1999,7 +2060,7 @@ class ResumeParser:
             if company:
                 # 检查是否匹配非工作模式
                 for p in non_work_patterns:
-                    if re.search(p, company):
+                    if p.search(company):
                         is_education_related = True
                         break
                 if company in non_work_majors:
@@ -2071,7 +2132,7 @@ class ResumeParser:
             return 1900 <= year <= 2100
 
         # 模式1: 2020.09-2024.06 或 2020年09月-2024年06月
-        match = re.search(r'(\d{4})[\.年]\d{1,2}[月]?\s*[-.—至到]\s*(\d{4})[\.年]\d{1,2}[月]?', duration)
+        match = rp.DURATION_YEAR_MONTH.search(duration)
         if match:
             start_year = int(match.group(1))
             end_year = int(match.group(2))
@@ -2080,7 +2141,7 @@ class ResumeParser:
                 return end_year - start_year
 
         # 模式2: 2020-2024（需要更严格的验证，避免匹配薪资）
-        match = re.search(r'(\d{4})\s*[-.—至到]\s*(\d{4})(?![0-9])', duration)
+        match = rp.DURATION_YEARS.search(duration)
         if match:
             start_year = int(match.group(1))
             end_year = int(match.group(2))
@@ -2092,7 +2153,7 @@ class ResumeParser:
                     return years
 
         # 模式3: 2020.09-至今 或 2020年-至今
-        match = re.search(r'(\d{4})[\.年]?\d{0,2}[月]?\s*[-.—至到]\s*至今', duration)
+        match = rp.DURATION_TO_PRESENT.search(duration)
         if match:
             start_year = int(match.group(1))
             # 验证年份合理性
@@ -2105,21 +2166,15 @@ class ResumeParser:
         # 如果无法解析，返回0
         return 0
 
-    def _extract_project_experience(self, text: str) -> List[Dict]:
+    def _extract_project_experience(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict]:
         """提取项目经历"""
         project_list = []
 
-        # 项目经历关键词
-        keywords = ['项目经历', '项目经验', '项目']
-
         # 查找项目经历段落
-        lines = text.split('\n')
-        start_idx = None
-
-        for i, line in enumerate(lines):
-            if any(keyword in line for keyword in keywords):
-                start_idx = i
-                break
+        if sections is None:
+            sections = segment_resume(text)
+        lines = sections.lines
+        start_idx = sections.first_mention['project']
 
         if start_idx is None:
             return project_list
@@ -2149,41 +2204,18 @@ class ResumeParser:
 
     def _extract_skills(self, text: str) -> List[str]:
         """提取技能关键词 - 改进版"""
-        from app.data.skills_database import SKILLS_DATABASE, SKILL_SYNONYMS
-
-        skills_found = set()
-        text_lower = text.lower()
-
-        # 1. 遍历所有技能分类
-        for category, skills in SKILLS_DATABASE.items():
-            for skill in skills:
-                # 2. 精确匹配（支持中英文混合环境的边界检测）
-                # 使用负向环视替代 \b，因为 \b 对中文字符无效
-                # 只排除ASCII字母数字，允许中文和其他字符
-                # (?<![a-zA-Z0-9]) - 前面不是ASCII字母/数字
-                # (?![a-zA-Z0-9]) - 后面不是ASCII字母/数字
-                pattern = r'(?<![a-zA-Z0-9])' + re.escape(skill.lower()) + r'(?![a-zA-Z0-9])'
-                if re.search(pattern, text_lower):
-                    # 3. 如果是同义词，映射到标准名称
-                    standardized_skill = SKILL_SYNONYMS.get(skill.lower(), skill)
-                    skills_found.add(standardized_skill)
-
-        # 4. 按优先级排序（编程语言 > 框架 > 工具）
-        skill_priority = {
-            'Python': 10, 'Java': 10, 'JavaScript': 10, 'TypeScript': 10, 'Go': 10, 'C++': 10,
-            'React': 9, 'Vue': 9, 'Angular': 9, 'Django': 9, 'Flask': 9, 'FastAPI': 9, 'Node.js': 9,
-            'MySQL': 8, 'PostgreSQL': 8, 'MongoDB': 8, 'Redis': 8, 'Oracle': 8,
-            'Docker': 8, 'Kubernetes': 8, 'Linux': 8, 'Git': 8, 'Jenkins': 8,
-            'Excel': 7, 'SAP': 7, 'Word': 7, 'PowerPoint': 7,
-            '财务': 6, '会计': 6, '审计': 6, '税务': 6,
-            '招聘': 5, '培训': 5, '绩效管理': 5, '项目管理': 5,
-        }
-
-        # 5. 转为列表并排序
-        skills_list = list(skills_found)
+        # 单次扫描提取所有技能（边界检测：前后不是ASCII字母/数字，兼容中英文混合）
+        matcher = get_skill_matcher()
+        hits = matcher.find_all(text)
+        return self._rank_skills((hit.canonical for hit in hits), matcher.priority)
+
+    @staticmethod
+    def _rank_skills(skills, skill_priority: Dict[str, int]) -> List[str]:
+        """技能去重并按优先级排序（编程语言 > 框架 > 工具），最多返回20个"""
+        skills_list = list(set(skills))
         skills_list.sort(key=lambda x: skill_priority.get(x, 0), reverse=True)
 
-        # 6. 限制最多返回20个技能
+        # 限制最多返回20个技能
         return skills_list[:20]
 
     def _extract_skills_with_proficiency(self, text: str) -> Dict[str, List[str]]:
@@ -2197,27 +2229,6 @@ class ResumeParser:
             'mentioned': ['Excel'],            # 仅提及
         }
         """
-        from app.data.skills_database import SKILLS_DATABASE, SKILL_SYNONYMS
-        import re
-        from typing import Dict, List
-
-        # 熟练度关键词模式
-        PROFICIENCY_PATTERNS = {
-            'expert': [
-                r'精通[，、,\s]*([^，,。\s]{2,15})',
-                r'熟练掌握[，、,\s]*([^，,。\s]{2,15})',
-                r'擅长[，、,\s]*([^，,。\s]{2,15})',
-            ],
-            'proficient': [
-                r'熟悉[，、,\s]*([^，,。\s]{2,15})',
-                r'掌握[，、,\s]*([^，,。\s]{2,15})',
-            ],
-            'familiar': [
-                r'了解[，、,\s]*([^，,。\s]{2,15})',
-                r'接触过[，、,\s]*([^，,。\s]{2,15})',
-            ]
-        }
-
         skills_by_level = {
             'expert': [],
             'proficient': [],
@@ -2226,23 +2237,32 @@ class ResumeParser:
         }
         skills_with_proficiency = set()
 
+        # 全文只扫描一次技能，熟练度片段直接复用命中位置（同义词、排序使用同一版本的词库）
+        matcher = get_skill_matcher()
+        hits = matcher.find_all(text)
+        synonyms = matcher.synonyms
+
         # 提取带熟练度标记的技能
-        for level, patterns in PROFICIENCY_PATTERNS.items():
+        for level, patterns in rp.PROFICIENCY_PATTERNS.items():
             for pattern in patterns:
-                for match in re.finditer(pattern, text):
-                    skill_text = match.group(1).strip()
-                    # 从文本中提取技能名称（处理"熟悉Python、Java"情况）
-                    extracted = self._extract_skill_names(skill_text)
+                for match in pattern.finditer(text):
+                    # 片段内的技能名称（处理"熟悉Python、Java"情况）
+                    end = match.end(1)
+                    if end < len(text) and text[end].isascii() and text[end].isalnum():
+                        # 片段在单词中间被截断，片段末尾按边界处理，需单独匹配
+                        extracted = matcher.extract(match.group(1).strip())
+                    else:
+                        extracted = matcher.skill_names(hits, match.start(1), end)
                     for skill in extracted:
                         # 标准化技能名称
-                        standardized = SKILL_SYNONYMS.get(skill.lower(), skill)
+                        standardized = synonyms.get(skill.lower(), skill)
                         skills_by_level[level].append(standardized)
                         skills_with_proficiency.add(standardized)
 
         # 提取所有技能（用于无熟练度标记的）
-        all_skills = self._extract_skills(text)
+        all_skills = self._rank_skills((hit.canonical for hit in hits), matcher.priority)
         for skill in all_skills:
-            standardized = SKILL_SYNONYMS.get(skill.lower(), skill)
+            standardized = synonyms.get(skill.lower(), skill)
             if standardized not in skills_with_proficiency:
                 skills_by_level['mentioned'].append(standardized)
 
@@ -2257,16 +2277,4 @@ class ResumeParser:
 
         e.g., "Python、Java、Go" -> ['Python', 'Java', 'Go']
         """
-        from app.data.skills_database import SKILLS_DATABASE
-        import re
-
-        found_skills = []
-
-        # 尝试直接匹配已知技能
-        for category, skills in SKILLS_DATABASE.items():
-            for skill in skills:
-                pattern = r'(?<![a-zA-Z0-9])' + re.escape(skill.lower()) + r'(?![a-zA-Z0-9])'
-                if re.search(pattern, text.lower()):
-                    found_skills.append(skill)
-
-        return found_skills
+        return get_skill_matcher().extract(text)
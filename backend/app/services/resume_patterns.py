@@ -0,0 +1,370 @@
+"""简历解析正则注册表 - 模块加载时一次性编译
+
+ResumeParser 用到的正则和词表都集中在这里，导入时编译一次，
+解析过程中不再在方法体内重复构建列表、按字符串查找正则缓存。
+
+每个正则都有一个名称并记录调用/命中次数，可通过 list_patterns()
+（或 /api/v1/diagnostics/parser-patterns）查看哪些规则在生产数据上从未命中，
+作为清理依据。计数按进程统计，不加锁，只作近似参考。
+"""
+import re
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+
+
+class CountedPattern:
+    """带调用/命中计数的预编译正则
+
+    只代理解析器用到的方法（search/match/findall/finditer/sub/split），
+    返回值与 re.Pattern 完全一致。
+    """
+
+    __slots__ = ('name', 'regex', 'calls', 'hits')
+
+    def __init__(self, name: str, regex: 're.Pattern'):
+        self.name = name
+        self.regex = regex
+        self.calls = 0
+        self.hits = 0
+
+    @property
+    def pattern(self) -> str:
+        return self.regex.pattern
+
+    def search(self, string: str, *args):
+        match = self.regex.search(string, *args)
+        self.calls += 1
+        if match is not None:
+            self.hits += 1
+        return match
+
+    def match(self, string: str, *args):
+        match = self.regex.match(string, *args)
+        self.calls += 1
+        if match is not None:
+            self.hits += 1
+        return match
+
+    def findall(self, string: str, *args) -> list:
+        result = self.regex.findall(string, *args)
+        self.calls += 1
+        if result:
+            self.hits += 1
+        return result
+
+    def finditer(self, string: str, *args):
+        self.calls += 1
+        matched = False
+        for match in self.regex.finditer(string, *args):
+            if not matched:
+                self.hits += 1
+                matched = True
+            yield match
+
+    def sub(self, repl, string: str, count: int = 0) -> str:
+        result, replaced = self.regex.subn(repl, string, count)
+        self.calls += 1
+        if replaced:
+            self.hits += 1
+        return result
+
+    def split(self, string: str, maxsplit: int = 0) -> List[str]:
+        parts = self.regex.split(string, maxsplit)
+        self.calls += 1
+        if len(parts) > 1:
+            self.hits += 1
+        return parts
+
+    def __repr__(self) -> str:
+        return f"CountedPattern({self.name!r}, {self.pattern!r})"
+
+
+_registry: Dict[str, CountedPattern] = {}
+_frozen = False
+
+
+def _register(name: str, pattern: str, flags: int = 0) -> CountedPattern:
+    """编译并登记一个正则（只允许在模块加载时调用）"""
+    if _frozen:
+        raise RuntimeError(f"正则注册表已冻结，无法登记: {name}")
+    if name in _registry:
+        raise ValueError(f"正则名称重复: {name}")
+    counted = CountedPattern(name, re.compile(pattern, flags))
+    _registry[name] = counted
+    return counted
+
+
+# ==================== 联系方式 ====================
+
+MOBILE = _register('phone.mobile', r'1[3-9]\d{9}')
+MOBILE_WITH_COUNTRY_CODE = _register('phone.mobile_country_code', r'[\(（]\+86[\)）]\s*-?\s*1[3-9]\d{9}')
+MOBILE_SEPARATED = _register('phone.mobile_separated', r'1[3-9]\d[-\s]?\d{4}[-\s]?\d{4}')
+LANDLINE = _register('phone.landline', r'\d{3,4}-\d{7,8}')
+EMAIL = _register('email.address', r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# ==================== 姓名（正文） ====================
+
+NAME_SPACED = _register('name.spaced', r'^([\u4e00-\u9fa5])\s+([\u4e00-\u9fa5])(?:\s+([\u4e00-\u9fa5]))?')
+NAME_BEFORE_INTENT = _register('name.before_intent', r'^([一-龥]{2,4})\s+(求职意向|应聘|意向|岗位)')
+NAME_BEFORE_COLON = _register('name.before_colon', r'^([一-龥]{2,4})\s*[:：]')
+NAME_LABEL = _register('name.label', r'姓\s*名\s*[:：]\s*([^\s|]{2,4})')
+NAME_LABEL_STRICT = _register('name.label_strict', r'姓\s*名\s*[:：]\s*([^\s:：|]{2,4})')
+NAME_LABEL_EN = _register('name.label_en', r'[Nn]ame\s*[:：]\s*([^\s|]{2,4})')
+NAME_LINE_NOISE = _register('name.line_noise', r'[0-9@\.]')
+NAME_STANDALONE = _register('name.standalone', r'^([\u4e00-\u9fa5]{2,4})$')
+NAME_STANDALONE_PADDED = _register('name.standalone_padded', r'^[\s]*([\u4e00-\u9fa5]{2,4})[\s]*$')
+CHINESE_2_4 = _register('name.chinese_2_4', r'^[\u4e00-\u9fa5]{2,4}$')
+CHINESE_ONLY = _register('name.chinese_only', r'^[\u4e00-\u9fa5]+$')
+PIPE_SPLIT = _register('split.pipe', r'\s*[|｜]\s*')
+
+# ==================== 姓名（邮件主题 / 文件名） ====================
+
+SUBJECT_NAME_DASH = _register('subject.name_dash', r'-([\u4e00-\u9fa5]{2,4})(?:-|$)')
+SUBJECT_NAME_DASH_NOTE = _register('subject.name_dash_note', r'-([\u4e00-\u9fa5]{2,4})(?:（[^）]*）)?(?:-|$|\.|\s)')
+SUBJECT_NAME_PIPE_SPACED = _register('subject.name_pipe_spaced', r'^([\u4e00-\u9fa5]{2,4})\s*\|')
+SUBJECT_NAME_PIPE = _register('subject.name_pipe', r'^([\u4e00-\u9fa5]{2,4})\|')
+SUBJECT_NAME_BRACKET = _register('subject.name_bracket', r'【[^】]*】\s*([\u4e00-\u9fa5]{2,4})_')
+
+FILENAME_TIMESTAMP_PREFIX = _register('filename.timestamp_prefix', r'^\d{8}_\d{6}_')
+FILENAME_NAME_BOSS = _register('filename.name_boss', r'】([\u4e00-\u9fa5]{2,4})_')
+FILENAME_NAME_LEADING = _register('filename.name_leading', r'^([\u4e00-\u9fa5]{2,4})[-—]')
+FILENAME_NAME_NOTE = _register('filename.name_note', r'^([\u4e00-\u9fa5]{2,4})[（\(][^）\)]*[）\)]')
+FILENAME_NAME_DASH_NOTE = _register('filename.name_dash_note', r'-([\u4e00-\u9fa5]{2,4})(?:（[^）]*）)?(?:-|$|\.)')
+FILENAME_NAME_TRAILING = _register('filename.name_trailing', r'-([\u4e00-\u9fa5]{2,4})$')
+FILENAME_NAME_RESUME = _register('filename.name_resume', r'^([\u4e00-\u9fa5]{2,4})-(?:简历|resume|cv|附件)$', re.IGNORECASE)
+FILENAME_NAME_UNDERSCORE = _register('filename.name_underscore', r'^([\u4e00-\u9fa5]{2,4})_')
+
+# ==================== 工作年限（邮件主题） ====================
+
+SUBJECT_GRADUATION_YEAR = _register('work_years.graduation_year', r'(\d{2}|\d{4})\s*年\s*毕业')
+SUBJECT_YEARS_PLUS = _register('work_years.years_plus', r'(\d+)\s*年\s*以上')
+SUBJECT_YEARS_EXPERIENCE = _register('work_years.years_experience', r'(\d+)\s*年\s*经验')
+SUBJECT_YEARS_BARE = _register('work_years.years_bare', r'(\d+)\s*年(?![以经])')
+
+# ==================== 教育背景 ====================
+
+BASIC_INFO_DEGREE = _register('education.basic_info_degree', r'[:：]\s*([本科大专高中中专博士硕士学士]+)(?:\(([211985双非QS前\d]+)\))?')
+
+# 学历正则模式（支持括号格式，包括带前缀的如"(工学硕士)"，以及英文格式）
+DEGREE_PATTERNS = (
+    # 中文模式
+    _register('education.degree_paren', r'\((?:[^\)]*?)?(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)\)'),  # (本科)或(工学硕士)
+    _register('education.degree_paren_fullwidth', r'（(?:[^）]*?)?(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)）'),  # （本科）或（工学硕士）
+    _register('education.degree_spaced', r'\s(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)\s'),  # 空格包围
+    _register('education.degree_slash', r'/(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)'),  # /本科
+    _register('education.degree_pipe', r'\|(博士研究生|博士|硕士研究生|硕士|学士|本科|大专|专科|高中|中专)'),  # |本科
+    # 英文模式
+    _register('education.degree_en', r'\b(Ph\.D|PhD|Doctor|Doctorate|Masters?|Master|M\.B\.A|MBA|Bachelors?|Bachelor|B\.S|B\.A|B\.Sc|BBA|Associate|College)\b'),  # 英文学历
+    _register('education.degree_en_slash', r'/(Masters?|Master|Bachelors?|Bachelor|Ph\.D|PhD)'),  # /Master or /Bachelor
+)
+
+# 学历关键词（用于提取学历）- 按优先级排序（中英文双语）
+DEGREE_KEYWORDS = ("博士研究生", "博士", "硕士研究生", "硕士", "学士", "本科", "大专", "专科", "高中", "中专",
+                   "Ph.D", "PhD", "Doctor", "Doctorate",  # 英文博士
+                   "Master", "Masters", "M.B.A", "MBA",  # 英文硕士
+                   "Bachelor", "Bachelors", "B.S", "B.A", "B.Sc", "BBA",  # 英文本科
+                   "Associate", "College")  # 英文大专
+
+EDU_DURATION = _register('education.duration', r'(\d{4})\s*[-.年]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)')
+EDU_DURATION_DASH = _register('education.duration_dash', r'(\d{4})\s*[-.年—]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)')
+EDU_DURATION_CN = _register('education.duration_cn', r'(\d{4})\s*年\s*\d{1,2}\s*月\s*[-.年—至到]+\s*(\d{4}|\d{1,2}|至今)')
+EDU_DURATION_IN_SCHOOL = _register('education.duration_in_school', r'(\d{4})\s*[.-年]\s*\d{1,2}\s*[-.年—至到]\s*(\d{4}|\d{1,2}|至今)(?:\s*[.-年]\s*\d{1,2})?')
+YEAR = _register('education.year', r'(\d{4})')
+
+PAREN_SEGMENT = _register('education.paren_segment', r'[()（）][^()（）]*')
+PAREN_CHAR = _register('education.paren_char', r'[()（）].*?')
+BULLET_SPLIT = _register('split.bullet', r' [•·|] ')
+MAJOR_PART = _register('education.major_part', r'^[\u4e00-\u9fa5（）()]+$|^[A-Za-z\s&/]+$')
+MAJOR_CHINESE_2_6 = _register('education.major_chinese_2_6', r'^[\u4e00-\u9fa5]{2,6}$')
+MAJOR_BEFORE_TIME = _register('education.major_before_time', r'^[\u4e00-\u9fa5()（）/\-·]+$')
+TRAILING_SEPARATORS = _register('education.trailing_separators', r'[\s、，,]+$')
+DEGREE_LABEL_PREFIX = _register('education.degree_label_prefix', r'^学历\s*[:：]\s*')
+DEGREE_LABEL_PREFIX_OPTIONAL = _register('education.degree_label_prefix_optional', r'^学历\s*[:：]?\s*')
+SCHOOL_LABEL_PREFIX = _register('education.school_label_prefix', r'^学校\s*[:：]\s*')
+SCHOOL_FIELD = _register('education.school_field', r'学校[:：]\s*([^\s]+(?:[\u4e00-\u9fa5a-zA-Z\s]*大学|学院)?[\u4e00-\u9fa5a-zA-Z]*)')
+MAJOR_FIELD = _register('education.major_field', r'专业[:：]\s*([^\s]+.*)')
+PERSONAL_INFO_LINE = _register('education.personal_info_line', r'\d+\s*岁|^\d+\s*\||男|女|cet|CET|四级|六级|托福|雅思|GRE')
+
+# ==================== 工作经历 ====================
+
+# 时间格式正则模式（支持多种格式）
+WORK_TIME_PATTERNS = (
+    _register('work.time_dot', r'(\d{4})\.(\d{1,2})\s*[-.—至到]\s*(\d{4})\.(\d{1,2})'),  # 2020.09-2024.06
+    _register('work.time_cn', r'(\d{4})年(\d{1,2})月\s*[-.—至到]\s*(\d{4})年(\d{1,2})月'),  # 2020年09月-2024年06月
+    _register('work.time_years', r'(\d{4})\s*[-.—至到]\s*(\d{4})'),  # 2020-2024
+    _register('work.time_dot_present', r'(\d{4})\.(\d{1,2})\s*[-.—至到]\s*至今'),  # 2020.09-至今
+    _register('work.time_year_present', r'(\d{4})年\s*[-.—至到]\s*至今'),  # 2020年-至今
+    _register('work.time_cn_present', r'(\d{4})年(\d{1,2})月\s*[-.—至到]\s*至今'),  # 2023年7月-至今
+)
+
+# 公司名识别模式（不含".*学校.*"，避免把学校误识别为公司）
+COMPANY_PATTERNS = (
+    _register('work.company_gongsi', r'.*公司.*'),  # 包含"公司"
+    _register('work.company_keji', r'.*科技.*'),  # 包含"科技"
+    _register('work.company_youxian', r'.*有限.*'),  # 包含"有限"
+    _register('work.company_jituan', r'.*集团.*'),  # 包含"集团"
+    _register('work.company_yinhang', r'.*银行.*'),  # 包含"银行"
+    _register('work.company_yiyuan', r'.*医院.*'),  # 包含"医院"
+)
+
+NON_WORK_PATTERNS = (
+    _register('work.non_work_xueyuan', r'.*学院.*'),  # 包含"学院"
+    _register('work.non_work_daxue', r'.*大学.*'),  # 包含"大学"
+    _register('work.non_work_zhuanye', r'.*专业.*'),  # 包含"专业"
+    _register('work.non_work_kecheng', r'.*课程.*'),  # 包含"课程"
+    _register('work.non_work_xuexi', r'.*学习.*'),  # 包含"学习"
+    _register('work.non_work_jiaoxue', r'.*教学.*'),  # 包含"教学"
+    _register('work.non_work_jiaoyu', r'.*教育.*'),  # 包含"教育"
+    _register('work.non_work_peixun', r'.*培训.*'),  # 包含"培训"
+)
+
+# 工作年限计算（_parse_duration_to_years）
+DURATION_YEAR_MONTH = _register('duration.year_month', r'(\d{4})[\.年]\d{1,2}[月]?\s*[-.—至到]\s*(\d{4})[\.年]\d{1,2}[月]?')
+DURATION_YEARS = _register('duration.years', r'(\d{4})\s*[-.—至到]\s*(\d{4})(?![0-9])')
+DURATION_TO_PRESENT = _register('duration.to_present', r'(\d{4})[\.年]?\d{0,2}[月]?\s*[-.—至到]\s*至今')
+
+# ==================== 技能熟练度 ====================
+
+# 熟练度关键词模式
+PROFICIENCY_PATTERNS = MappingProxyType({
+    'expert': (
+        _register('skills.expert_jingtong', r'精通[，、,\s]*([^，,。\s]{2,15})'),
+        _register('skills.expert_shulian', r'熟练掌握[，、,\s]*([^，,。\s]{2,15})'),
+        _register('skills.expert_shanchang', r'擅长[，、,\s]*([^，,。\s]{2,15})'),
+    ),
+    'proficient': (
+        _register('skills.proficient_shuxi', r'熟悉[，、,\s]*([^，,。\s]{2,15})'),
+        _register('skills.proficient_zhangwo', r'掌握[，、,\s]*([^，,。\s]{2,15})'),
+    ),
+    'familiar': (
+        _register('skills.familiar_liaojie', r'了解[，、,\s]*([^，,。\s]{2,15})'),
+        _register('skills.familiar_jiechu', r'接触过[，、,\s]*([^，,。\s]{2,15})'),
+    ),
+})
+
+# ==================== 词表 ====================
+
+# 正文姓名黑名单（这些词看起来像姓名但不是）
+NAME_BLACKLIST = frozenset({
+    # 标题类
+    '教育背景', '基本信息', '个人优势', '工作经历', '项目经验',
+    '求职意向', '教育经历', '专业技能', '自我评价', '联系方式',
+    '个人简历', '简历', '姓名', '名字', '候选人', '应聘',
+    '求职信息', '出生年月', '政治面貌', '工作年限',
+    '个人信息', '个人总结', '个人简介', '个人评价', '优势亮点',
+    '掌握技能', '资格证书',
+    '性别', '手机', '电话', '邮箱', '出生日期', '出生年月', '年龄',
+    '籍贯', '地址', '婚姻状况', '民族', '现居住地', '通讯地址',
+    '邮政编码', '最高学历', '期望薪资', '期望城市', '应聘岗位',
+    '求职信息', '工作年限', '政治面貌',
+    #第二轮：补充无效名字
+    '同学', '微信号', '手机号', '先生', '女士', '小姐',
+    #第三轮：更多字段标签
+    '出生年日', '工作时长', '联系电话', '现所在地', '相关课程',
+    '项目描述', '发件人', '实习留用', '综合绩点', '手机号码',
+    '学校住址', '工作地点', '居住地址', '户籍地址', '电子邮箱',
+    '主修专业', '所学专业', '专业名称',
+    '应用化学', '计算机', '财务管理', '市场营销', '工商管理',
+    '信息管理', '软件技术', '网络工程', '电子信息', '机械设计',
+    '土木工程', '材料科学', '生物工程', '环境工程', '化学工程',
+    #第四轮：更多无效提取结果
+    '意向城市', '户籍', '现居城市', '毕业院校', '英语水平',
+    '英语', '产品运营', '费用报销', '发送时间', '发送日期', '后端开发',
+    '前端开发', '测试开发', '运营管理', '项目管理', '系统架构',
+    '数据分析', '数据管理', '技术支持', '软件开发', '系统设计',
+    #第五轮：更多字段标签
+    '收件人', '客户成功', '求职类型', '业务支持', '客户服务',
+    '售后服务', '销售支持', '市场支持', '运营支持', '技术总监',
+    '产品总监', '运营总监', '销售经理', '市场经理', '项目经理',
+    # 信息字段（原有）
+    '男', '女', '年龄', '电话', '邮箱', '邮箱', '地址', '籍贯',
+    '学历', '学位', '专业', '学校', '毕业', '院校',
+    # 学历
+    '本科', '硕士', '博士', '大专', '专科', '高中', '中专',
+    '专升本', '研究生', '本科生', '硕士生', '博士生',
+    '本科学位', '硕士学位', '博士学位', '双一流',
+    # 学科/专业
+    '会计', '会计学', '审计', '统计学', '软件工程', '电子信息',
+    '计算机科学', '通信工程', '机械工程', '数据科学',
+    '人工智能', '自动化', '电气工程', '财务管理',
+    # 职位/岗位相关
+    '总账会计', '财务专员', '销售总监', '软件工程师', '产品经理',
+    '项目经历', '实习经历', '工作内容', '主要职责',
+    # 城市/地点
+    '上海', '北京', '深圳', '广州', '杭州', '成都', '武汉',
+    '西安', '南京', '重庆', '天津', '苏州', '长沙', '青岛', '长春',
+    # 公司名（常见误识别）
+    '明源云', '用友', '金蝶', '卫泰集团',
+    # 其他常见非姓名词汇
+    '个人介绍', '基本信息', '专业技能', '主修课程', '获奖情况',
+    '证书情况', '语言能力', '计算机能力', '工作内容',
+    # 技术术语（防止误识别为姓名）
+    '软考', '编程语言', '编程', '数据库', '算法', '前端', '后端',
+    '全栈', '运维', '架构', '开发', '设计', '分析', '数据结构',
+    '计算机网络', '操作系统', '计算机科学', '软件工程', '人工智能',
+    '机器学习', '深度学习', '大数据', '云计算', '区块链',
+    '移动开发', 'Web开发', '嵌入式', '网络安全', '游戏开发',
+})
+
+# 邮件主题姓名黑名单
+SUBJECT_NAME_BLACKLIST = frozenset({
+    '同学', '先生', '女士', '求职者', '候选人', '应届生',
+    '开发', '工程师', '设计师', '实施', '顾问',
+})
+
+# 文件名姓名黑名单
+FILENAME_NAME_BLACKLIST = frozenset({
+    '简历', 'resume', 'cv', '附件', '文档', '同学', '先生', '女士',
+    '求职者', '候选人',
+})
+
+# 联系方式附近查找姓名时要求的常见姓氏
+CONTACT_SURNAME_CHARS = frozenset('赵钱孙李周吴郑王冯陈褚卫蒋沈韩杨朱秦尤许何吕施张孔曹严华金魏陶姜戚谢邹喻柏水窦章云苏潘葛奚范彭郎鲁韦昌马苗凤花方俞任袁柳酆鲍史唐费廉薛雷贺倪汤滕殷罗毕郝邬安常乐于时傅皮卞齐康伍余元卜顾孟平黄和穆萧尹姚邵湛汪祁毛禹狄米贝明臧计伏成戴谈宋茅庞熊纪舒屈项祝董粱杜阮蓝闵席季麻强贾路娄危江童颜郭梅盛林刁钟徐邱骆高夏蔡田樊胡凌霍万柯卢莫房裘缪干解应宗丁宣邓郁单杭洪包诸左石崔吉钮龚虞乔童游迟湛闻鲍庞逄党蓝牟裘牛农曲刘付白范郝邵叶勤肖詹陶翟邝佟仲景覃')
+
+# 姓名校验用的姓氏表（百家姓 + 常见复姓 + 更多常见姓氏）
+COMMON_SURNAMES = frozenset(
+    '赵钱孙李周吴郑王冯陈褚卫蒋沈韩杨朱秦尤许何吕施张孔曹严华金魏陶姜戚谢邹喻柏水窦章云苏潘葛奚范彭郎鲁韦昌马苗凤花方俞任袁柳酆鲍史唐费廉薛雷贺倪汤滕殷罗毕郝邬安常乐于时傅皮卞齐康伍余元卜顾孟平黄和穆萧尹姚邵湛汪祁毛禹狄米贝明臧计伏成戴谈宋茅庞熊纪舒屈项祝董粱杜阮蓝闵席季麻强贾路娄危江童颜郭梅盛林刁钟徐邱骆高夏蔡田樊胡凌霍万柯卢莫房裘缪干解应宗丁宣邓郁单杭洪包诸左石崔吉钮程虞乔童游迟湛闻鲍庞逄党蓝牟裘牛农曲刘付白范郝邵叶勤易晏柯仝蔡贺崔廖江关霍邢程阎余潘游戴欧阳司马上官诸葛夏侯东方皇甫尉迟公羊穆可司徒端木'
+    # 更多现代常见姓氏
+    '易蔡尹于袁邵葛汪田莫雷黎崔盖郝卢安戴严杜季萧饶贾童侯孟邹廖谭熊金陆郝孔白崔康毛邱秦江史顾石郝贾薛林魏吕梁唐马冯许吴何谢曹彭郑潘邢谭姚冯魏董于蒋蔡余杜叶程苏魏吕丁任沈姚卢姜崔钟谭陆汪范金石贾顾韦付彭夏韦傅莫方汤姜黎常武乔贺赖龚文庞樊兰殷陶施洪洪崔岳苗秦江池范苑耿覃阿卜'
+    # 简化姓氏和其他常见姓氏（萧->肖, 詹陶翟邝佟仲景覃等少见姓氏 + 辛奚柏洪段等）
+    '肖詹陶翟邝佟仲景詹覃桂卜仇全但郇麦嵇荀邴查党隋巢茆莒邴揭雒冼幸邴胥宓蓬荪訾能隗靳郇蓟蔺鄢邴蒯宿邴邴辛奚柏洪穆傅燕段'
+)
+
+PATTERNS: Mapping[str, CountedPattern] = MappingProxyType(_registry)
+_frozen = True
+
+
+def get_pattern(name: str) -> CountedPattern:
+    """按名称获取已登记的正则"""
+    return PATTERNS[name]
+
+
+def list_patterns(sort_by: Optional[str] = None) -> List[Dict]:
+    """列出所有正则及其调用/命中次数
+
+    Args:
+        sort_by: 排序字段（'hits' 或 'calls'，降序），None 保持登记顺序
+
+    Returns:
+        [{'name', 'pattern', 'calls', 'hits', 'hit_rate'}]
+    """
+    rows = [
+        {
+            'name': counted.name,
+            'pattern': counted.pattern,
+            'calls': counted.calls,
+            'hits': counted.hits,
+            'hit_rate': round(counted.hits / counted.calls, 4) if counted.calls else 0.0,
+        }
+        for counted in PATTERNS.values()
+    ]
+    if sort_by in ('hits', 'calls'):
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+    return rows
+
+
+def reset_pattern_stats() -> None:
+    """清零所有正则的调用/命中计数"""
+    for counted in PATTERNS.values():
+        counted.calls = 0
+        counted.hits = 0
@@ -0,0 +1,105 @@
+"""简历段落切分 - 一次扫描建立行数组和段落标题位置
+
+各提取器（教育、工作、项目、基本信息、姓名）共用同一份切分结果，
+不再各自 split('\\n') 并重复扫描全文查找标题。
+各提取器从标题位置出发的搜索范围保持原有规则（例如工作经历会从标题前50行开始搜索），
+不按标题之间的区间截断。调整标题识别规则只需修改本文件的 SECTION_KEYWORDS。
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# 段落标题关键词（按段落分组）
+SECTION_KEYWORDS: Dict[str, List[str]] = {
+    'basic_info': ['基本信息'],
+    # 不包含"学历"，因为"学历"可能出现在数据行中
+    'education': ['教育背景', '学习经历', '教育经历', '学历背景', '专业背景',
+                  'EDUCATIONAL BACKGROUND', 'EDUCATION', 'EDUCATION HISTORY'],
+    'work': ['工作经历', '工作经验', '职业经历', '工作'],
+    'internship': ['实习经历', '实习工作', '实习经验', '见习经历'],
+    'project': ['项目经历', '项目经验', '项目'],
+}
+
+
+def is_section_header(line_text: str, keyword: str) -> bool:
+    """检查是否为section标题（独立成行，或只跟冒号）"""
+    if line_text == keyword:
+        return True
+    for colon in ['：', ':']:
+        if line_text.startswith(keyword + colon):
+            after_colon = line_text[len(keyword) + len(colon):].strip()
+            if not after_colon:
+                return True
+    return False
+
+
+@dataclass
+class ResumeSections:
+    """简历切分结果
+
+    Attributes:
+        text: 切分所用的文本
+        lines: text.split('\\n') 的原始行
+        stripped: 每行 strip() 后的内容
+        first_mention: {段落: 首个包含该段落关键词的行号}
+        headers: {段落: 独立成行的标题行号列表}
+    """
+    text: str
+    lines: List[str]
+    stripped: List[str]
+    first_mention: Dict[str, Optional[int]] = field(default_factory=dict)
+    headers: Dict[str, List[int]] = field(default_factory=dict)
+
+    def first_header(self, section: str) -> Optional[int]:
+        """段落第一个独立标题的行号，没有返回None"""
+        positions = self.headers.get(section)
+        return positions[0] if positions else None
+
+    @property
+    def content_lines(self) -> List[str]:
+        """去掉首尾空白行后的行（等价于 text.strip().split('\\n')）"""
+        start = 0
+        end = len(self.lines)
+        while start < end and not self.stripped[start]:
+            start += 1
+        while end > start and not self.stripped[end - 1]:
+            end -= 1
+        if start == end:
+            return ['']
+        lines = self.lines[start:end]
+        lines[0] = lines[0].lstrip()
+        lines[-1] = lines[-1].rstrip()
+        return lines
+
+
+def segment_resume(text: str) -> ResumeSections:
+    """一次扫描切分简历文本
+
+    Args:
+        text: 简历文本（通常已经过TextCleaner清理）
+
+    Returns:
+        ResumeSections
+    """
+    lines = text.split('\n')
+    stripped = [line.strip() for line in lines]
+
+    first_mention: Dict[str, Optional[int]] = {name: None for name in SECTION_KEYWORDS}
+    headers: Dict[str, List[int]] = {name: [] for name in SECTION_KEYWORDS}
+
+    for i, line in enumerate(lines):
+        line_stripped = stripped[i]
+        if not line_stripped:
+            continue
+        for name, keywords in SECTION_KEYWORDS.items():
+            if first_mention[name] is None and any(keyword in line for keyword in keywords):
+                first_mention[name] = i
+            if any(is_section_header(line_stripped, keyword) for keyword in keywords):
+                headers[name].append(i)
+
+    return ResumeSections(
+        text=text,
+        lines=lines,
+        stripped=stripped,
+        first_mention=first_mention,
+        headers=headers,
+    )
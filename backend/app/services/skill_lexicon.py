@@ -0,0 +1,230 @@
+"""技能词库 - 版本化加载、编译快照、不重启热更新
+
+词库包含三部分：技能（按分类）、同义词、排序优先级。来源：
+- SKILLS_LEXICON_PATH 指向的JSON文件：{"skills": {分类: [技能]}, "synonyms": {别名: 标准名}, "priority": {技能: 优先级}}
+- 未配置时使用内置词库 app/data/skills_database.py
+
+词库版本是内容的SHA-256前8位，内容不变版本就不变。
+
+发布（python -m app.services.skill_lexicon publish）在一个进程里编译一次，把编译好的快照
+（前缀树正则、技能表、包含关系、同义词、优先级）写入Redis，再切换当前版本号：
+
+    skills_lexicon:snapshot:<版本>   快照JSON
+    skills_lexicon:version           当前版本
+
+各worker每隔 SKILLS_LEXICON_CHECK_INTERVAL 秒读一次版本号，变化时读取快照、恢复匹配器并整体替换引用
+（正在进行的提取继续使用旧对象），不需要重启。Redis中没有发布过的版本时，各进程从本地词库自行编译。
+
+词库版本变化时：解析缓存中的结构化结果失效（正文缓存仍可用，见 parse_cache.context_digest）；
+简历的解析版本标记随之过期，增量重新解析（reparse_stale_resumes）只重跑技能提取（见 parse_versions）。
+"""
+import argparse
+import hashlib
+import json
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.core.redis import get_redis, redis_failed
+from app.services.skill_matcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
+
+_VERSION_KEY = 'skills_lexicon:version'
+_SNAPSHOT_KEY = 'skills_lexicon:snapshot:{version}'
+# 被替换的旧快照保留多久（秒），给正在切换的worker留出读取时间
+_OLD_SNAPSHOT_TTL = 24 * 3600
+
+Lexicon = Tuple[Dict[str, List[str]], Dict[str, str], Dict[str, int]]
+
+
+def load_source(path: Optional[str] = None) -> Lexicon:
+    """读取词库来源（JSON文件，未指定时为内置词库）
+
+    Returns:
+        (技能, 同义词, 优先级)
+
+    Raises:
+        OSError / ValueError: 词库文件无法读取或格式错误
+    """
+    if not path:
+        from app.data.skills_database import SKILL_PRIORITY, SKILL_SYNONYMS, SKILLS_DATABASE
+        return SKILLS_DATABASE, SKILL_SYNONYMS, SKILL_PRIORITY
+
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    skills = data.get('skills')
+    if not isinstance(skills, dict) or not all(isinstance(items, list) for items in skills.values()):
+        raise ValueError(f"技能词库格式错误（skills 应为 {{分类: [技能]}}）: {path}")
+    # 同义词按小写别名查找
+    synonyms = {alias.lower(): name for alias, name in (data.get('synonyms') or {}).items()}
+    priority = {name: int(value) for name, value in (data.get('priority') or {}).items()}
+    return skills, synonyms, priority
+
+
+def lexicon_version(skills: Dict[str, List[str]], synonyms: Dict[str, str], priority: Dict[str, int]) -> str:
+    """词库内容的版本号（SHA-256前8位）"""
+    canonical = json.dumps([skills, synonyms, priority], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:8]
+
+
+def compile_lexicon(path: Optional[str] = None) -> SkillMatcher:
+    """读取并编译词库"""
+    skills, synonyms, priority = load_source(path)
+    return SkillMatcher(skills, synonyms, priority, version=lexicon_version(skills, synonyms, priority))
+
+
+class SkillLexicon:
+    """进程内当前版本的技能匹配器（按版本号从Redis热更新）"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        check_interval: Optional[float] = None,
+        redis_url: Optional[str] = None,
+    ):
+        from app.core.config import settings
+
+        self.path = settings.SKILLS_LEXICON_PATH if path is None else path
+        self.check_interval = settings.SKILLS_LEXICON_CHECK_INTERVAL if check_interval is None else check_interval
+        self.redis_url = redis_url or settings.REDIS_URL
+        self._matcher: Optional[SkillMatcher] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    # ==================== Redis ====================
+
+    def _redis_error(self, e: Exception) -> None:
+        logger.warning(f"技能词库Redis操作失败: {e}")
+        redis_failed(self.redis_url)
+
+    def _published_version(self) -> Optional[str]:
+        client = get_redis(self.redis_url)
+        if client is None:
+            return None
+        try:
+            version = client.get(_VERSION_KEY)
+        except Exception as e:
+            self._redis_error(e)
+            return None
+        return version.decode() if version else None
+
+    def _load_snapshot(self, version: str) -> Optional[SkillMatcher]:
+        client = get_redis(self.redis_url)
+        if client is None:
+            return None
+        try:
+            raw = client.get(_SNAPSHOT_KEY.format(version=version))
+        except Exception as e:
+            self._redis_error(e)
+            return None
+        if not raw:
+            logger.warning(f"技能词库快照不存在: {version}")
+            return None
+        try:
+            return SkillMatcher.from_snapshot(json.loads(raw))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"技能词库快照无法加载: {version}, {e}")
+            return None
+
+    # ==================== 当前版本 ====================
+
+    def matcher(self) -> SkillMatcher:
+        """当前版本的匹配器（距上次检查超过 check_interval 时先检查版本号）"""
+        matcher = self._matcher
+        if matcher is not None and time.monotonic() < self._next_check:
+            return matcher
+        with self._lock:
+            if self._matcher is None or time.monotonic() >= self._next_check:
+                self._refresh()
+            return self._matcher
+
+    def _refresh(self) -> None:
+        self._next_check = time.monotonic() + self.check_interval
+        version = self._published_version()
+        current = self._matcher
+        if version and (current is None or current.version != version):
+            loaded = self._load_snapshot(version)
+            if loaded is not None:
+                logger.info(f"技能词库切换到版本 {version}（{len(loaded)} 个技能）")
+                self._matcher = loaded
+                return
+        if current is None:
+            self._matcher = compile_lexicon(self.path)
+
+    def publish(self, path: Optional[str] = None) -> str:
+        """编译词库并发布为当前版本（各worker在下次检查时切换）
+
+        Args:
+            path: 词库JSON文件，默认 SKILLS_LEXICON_PATH（未配置时为内置词库）
+
+        Returns:
+            发布的版本号
+
+        Raises:
+            RuntimeError: Redis不可用
+        """
+        matcher = compile_lexicon(self.path if path is None else path)
+        client = get_redis(self.redis_url)
+        if client is None:
+            raise RuntimeError("Redis不可用，无法发布技能词库")
+
+        previous = self._published_version()
+        snapshot = json.dumps(matcher.to_snapshot(), ensure_ascii=False)
+        # 先写快照再切换版本号，worker读到新版本号时快照一定已存在
+        client.set(_SNAPSHOT_KEY.format(version=matcher.version), snapshot)
+        client.set(_VERSION_KEY, matcher.version)
+        if previous and previous != matcher.version:
+            client.expire(_SNAPSHOT_KEY.format(version=previous), _OLD_SNAPSHOT_TTL)
+
+        with self._lock:
+            self._matcher = matcher
+            self._next_check = time.monotonic() + self.check_interval
+        logger.info(f"技能词库已发布: 版本 {matcher.version}，{len(matcher)} 个技能，快照 {len(snapshot)} 字节")
+        return matcher.version
+
+
+_skill_lexicon: Optional[SkillLexicon] = None
+
+
+def get_skill_lexicon() -> SkillLexicon:
+    """获取进程内共享的技能词库"""
+    global _skill_lexicon
+    if _skill_lexicon is None:
+        _skill_lexicon = SkillLexicon()
+    return _skill_lexicon
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='技能词库管理')
+    sub = parser.add_subparsers(dest='command', required=True)
+    publish = sub.add_parser('publish', help='编译词库并发布为当前版本')
+    publish.add_argument('path', nargs='?', help='词库JSON文件（默认 SKILLS_LEXICON_PATH，未配置时为内置词库）')
+    sub.add_parser('status', help='显示本地词库版本和已发布版本')
+    export = sub.add_parser('export', help='把内置词库导出为JSON文件（作为词库文件的起点）')
+    export.add_argument('path', help='输出文件')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    lexicon = get_skill_lexicon()
+    if args.command == 'publish':
+        print(lexicon.publish(args.path))
+    elif args.command == 'status':
+        local = compile_lexicon(lexicon.path)
+        print(f"本地词库: {lexicon.path or '内置'}  版本 {local.version}  技能 {len(local)} 个")
+        print(f"已发布版本: {lexicon._published_version() or '无'}")
+    else:
+        skills, synonyms, priority = load_source()
+        Path(args.path).write_text(
+            json.dumps({'skills': skills, 'synonyms': synonyms, 'priority': priority}, ensure_ascii=False, indent=2),
+            encoding='utf-8',
+        )
+        print(f"已导出内置词库（版本 {lexicon_version(skills, synonyms, priority)}）: {args.path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
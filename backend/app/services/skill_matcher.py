@@ -0,0 +1,206 @@
+"""技能匹配器 - 单次扫描提取所有技能关键词
+
+将技能词库中的全部技能编译为一个前缀树形式的正则（每个词库版本只编译一次），
+一次线性扫描即可返回所有技能命中及其位置，替代"每个技能一次 re.search"的做法。
+
+编译结果可以导出为快照（to_snapshot），其他进程直接从快照恢复（from_snapshot），
+不必重新构建前缀树和包含关系；词库的加载、发布和热更新见 app/services/skill_lexicon.py。
+
+边界语义与原实现一致：技能前后不能是ASCII字母/数字（中文字符视为边界）。
+"""
+import re
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.utils.regex_trie import build_trie_pattern
+
+logger = logging.getLogger(__name__)
+
+# ASCII边界（\b 对中文无效，只排除ASCII字母数字）
+_BOUNDARY_BEFORE = r'(?<![a-zA-Z0-9])'
+_BOUNDARY_AFTER = r'(?![a-zA-Z0-9])'
+_PATTERN_FLAGS = re.IGNORECASE | re.ASCII
+
+# 快照格式版本（字段变化时递增，旧格式的快照不再使用）
+SNAPSHOT_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class SkillHit:
+    """技能命中
+
+    Attributes:
+        skill: 技能库中的原始名称（如 "Spring Boot"）
+        canonical: 经同义词映射后的标准名称
+        category: 技能分类（programming/frameworks/...）
+        start: 命中在文本中的起始位置
+        end: 命中在文本中的结束位置（不含）
+    """
+    skill: str
+    canonical: str
+    category: str
+    start: int
+    end: int
+
+
+def _is_ascii_alnum(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+class SkillMatcher:
+    """多模式技能匹配器（编译一次，单次扫描）
+
+    Attributes:
+        version: 词库版本
+        synonyms: {小写别名: 标准名称}
+        priority: {技能名称: 排序优先级}，未列出的为0
+    """
+
+    def __init__(
+        self,
+        skills_database: Dict[str, List[str]],
+        skill_synonyms: Dict[str, str],
+        skill_priority: Optional[Dict[str, int]] = None,
+        version: str = '',
+    ):
+        """编译技能库
+
+        Args:
+            skills_database: {分类: [技能名称]}
+            skill_synonyms: {小写别名: 标准名称}
+            skill_priority: {技能名称: 排序优先级}
+            version: 词库版本
+        """
+        # 小写键 -> (原始名称, 标准名称, 分类)；同名技能以首次出现为准（与原遍历顺序一致）
+        entries: Dict[str, Tuple[str, str, str]] = {}
+        for category, skills in skills_database.items():
+            for skill in skills:
+                key = skill.lower()
+                if key in entries:
+                    continue
+                canonical = skill_synonyms.get(key, skill)
+                entries[key] = (skill, canonical, category)
+
+        # 在同一起点上，较长技能命中时隐含成立的较短技能
+        # 例如 "spring boot" 命中 → "spring" 同样满足边界（其后是空格）
+        implied: Dict[str, List[str]] = {}
+        for key in entries:
+            shorter = [
+                other for other in entries
+                if other != key and key.startswith(other)
+                and not _is_ascii_alnum(key[len(other)])
+            ]
+            if shorter:
+                implied[key] = sorted(shorter, key=len, reverse=True)
+
+        # 零宽前瞻：每个起点都尝试一次，不会因为上一个命中而跳过重叠的技能
+        trie = build_trie_pattern(list(entries.keys()))
+        pattern = _BOUNDARY_BEFORE + r'(?=(' + trie + r')' + _BOUNDARY_AFTER + r')'
+
+        self._setup(entries, implied, pattern, skill_synonyms, skill_priority or {}, version)
+        logger.info(f"技能匹配器初始化完成，共 {len(self._entries)} 个技能（词库版本 {version or '-'}）")
+
+    def _setup(self, entries: Dict[str, Tuple[str, str, str]], implied: Dict[str, List[str]], pattern: str,
+               synonyms: Dict[str, str], priority: Dict[str, int], version: str) -> None:
+        self._entries = entries
+        self._order: Dict[str, int] = {key: index for index, key in enumerate(entries)}
+        self._implied = implied
+        self._pattern_source = pattern
+        self._pattern = re.compile(pattern, _PATTERN_FLAGS)
+        self.synonyms = synonyms
+        self.priority = priority
+        self.version = version
+
+    # ==================== 快照 ====================
+
+    def to_snapshot(self) -> Dict:
+        """导出编译结果（可JSON序列化）"""
+        return {
+            'format': SNAPSHOT_FORMAT,
+            'version': self.version,
+            'pattern': self._pattern_source,
+            'entries': [[key, skill, canonical, category]
+                        for key, (skill, canonical, category) in self._entries.items()],
+            'implied': self._implied,
+            'synonyms': self.synonyms,
+            'priority': self.priority,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict) -> 'SkillMatcher':
+        """从快照恢复（只编译一次正则，不重新构建前缀树）
+
+        Raises:
+            ValueError: 快照格式不兼容
+        """
+        if snapshot.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError(f"不支持的技能词库快照格式: {snapshot.get('format')}")
+        matcher = cls.__new__(cls)
+        matcher._setup(
+            entries={key: (skill, canonical, category) for key, skill, canonical, category in snapshot['entries']},
+            implied=snapshot['implied'],
+            pattern=snapshot['pattern'],
+            synonyms=snapshot['synonyms'],
+            priority=snapshot['priority'],
+            version=snapshot['version'],
+        )
+        return matcher
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ==================== 匹配 ====================
+
+    def find_all(self, text: str) -> List[SkillHit]:
+        """单次扫描，返回全部技能命中（按位置排序）
+
+        Args:
+            text: 任意文本（无需预先转小写）
+
+        Returns:
+            技能命中列表，同一位置可能有多个命中（如 "Spring Boot" 与 "Spring"）
+        """
+        hits: List[SkillHit] = []
+        if not text:
+            return hits
+
+        for match in self._pattern.finditer(text):
+            start = match.start(1)
+            key = match.group(1).lower()
+            for hit_key in [key] + self._implied.get(key, []):
+                skill, canonical, category = self._entries[hit_key]
+                hits.append(SkillHit(skill, canonical, category, start, start + len(hit_key)))
+
+        return hits
+
+    def skill_names(self, hits: List[SkillHit], start: int = 0, end: Optional[int] = None) -> List[str]:
+        """取出区间内命中的技能原始名称（去重，按技能库顺序）
+
+        Args:
+            hits: find_all 的返回结果
+            start: 区间起点
+            end: 区间终点（不含），None 表示到文本末尾
+
+        Returns:
+            技能原始名称列表
+        """
+        found = {}
+        for hit in hits:
+            if hit.start >= start and (end is None or hit.end <= end):
+                found[hit.skill.lower()] = hit.skill
+        return [found[key] for key in sorted(found, key=self._order.__getitem__)]
+
+    def extract(self, text: str) -> List[str]:
+        """提取文本中出现的技能原始名称（按技能库顺序）"""
+        return self.skill_names(self.find_all(text))
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """获取当前版本的技能匹配器
+
+    首次调用时加载词库；之后每隔 SKILLS_LEXICON_CHECK_INTERVAL 秒检查一次是否发布了新版本，
+    有新版本时整体替换。同一次技能提取中应复用同一个返回值，保证命中、同义词和排序来自同一个版本。
+    """
+    from app.services.skill_lexicon import get_skill_lexicon
+    return get_skill_lexicon().matcher()
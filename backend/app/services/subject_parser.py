@@ -0,0 +1,86 @@
+"""邮件主题解析服务 - 一次提取主题中的姓名、工作年限、城市和职位
+
+招聘平台的邮件主题来自少数几个模板（【职位_城市_薪资】姓名_年限、"城市8-13K【BOSS直聘】"、
+"应聘XX-姓名" 等），同一主题经常重复出现（转发的重复邮件、批量重新提取）。
+这里把四个字段的提取合并为一次调用，结果按主题原文缓存：
+
+- 姓名、工作年限：ResumeParser._extract_name_from_email_subject / _extract_work_years_from_subject
+- 城市：CityExtractor._extract_from_subject（确认城市）
+- 职位：JobTitleClassifier 的主题解析（不含从简历正文推断）
+
+各字段的提取规则不变，缓存只是避免对同一主题重复计算。
+"""
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 缓存的主题条数
+SUBJECT_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class SubjectFields:
+    """从邮件主题提取的字段（未提取到为 None）
+
+    Attributes:
+        candidate_name: 候选人姓名
+        work_years: 工作年限（应届生为0）
+        city: 确认城市（标准名称）
+        job_title: 职位名称
+    """
+    candidate_name: Optional[str] = None
+    work_years: Optional[int] = None
+    city: Optional[str] = None
+    job_title: Optional[str] = None
+
+
+_EMPTY = SubjectFields()
+_resume_parser = None
+
+
+def _get_resume_parser():
+    # 延迟导入：resume_parser -> parsed_resume -> subject_parser
+    global _resume_parser
+    if _resume_parser is None:
+        from app.services.resume_parser import ResumeParser
+        _resume_parser = ResumeParser()
+    return _resume_parser
+
+
+def parse_subject(subject: Optional[str]) -> SubjectFields:
+    """提取邮件主题中的姓名、工作年限、城市和职位（按主题原文缓存）
+
+    Args:
+        subject: 邮件主题
+
+    Returns:
+        SubjectFields
+    """
+    if not subject:
+        return _EMPTY
+    return _parse_subject(subject)
+
+
+@lru_cache(maxsize=SUBJECT_CACHE_SIZE)
+def _parse_subject(subject: str) -> SubjectFields:
+    from app.services.city_extractor import get_city_extractor
+    from app.services.job_title_classifier import get_job_title_classifier
+
+    parser = _get_resume_parser()
+    fields = SubjectFields(
+        candidate_name=parser._extract_name_from_email_subject(subject),
+        work_years=parser._extract_work_years_from_subject(subject),
+        city=get_city_extractor()._extract_from_subject(subject).confirmed_city,
+        # 本模块已按主题缓存，直接调用未缓存的主题解析
+        job_title=get_job_title_classifier()._classify_subject_uncached(subject.strip()),
+    )
+    logger.debug(f"邮件主题解析: {subject} -> {fields}")
+    return fields
+
+
+def subject_cache_info():
+    """主题解析缓存的命中统计（functools 的 CacheInfo）"""
+    return _parse_subject.cache_info()
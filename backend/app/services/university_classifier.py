@@ -1,10 +1,13 @@
 """大学分类服务
 
 从简历文本中提取学校名称并分类为985/211/QS前50/100/200/双非
+
+学校名称优先用已知校名扫描（university_database.find_universities，一次扫描覆盖全部校名和别名），
+没有已知学校时再用通用的"XX大学/学院"模式提取（这类学校不在名单中，等级为双非）。
 """
 import re
-from typing import Optional, List
-from app.data.university_database import classify_university
+from typing import Dict, Iterable, List, Optional
+from app.data.university_database import classify_university, find_universities
 
 # 常见大学名称模式
 UNIVERSITY_PATTERNS = [
@@ -16,6 +19,13 @@ UNIVERSITY_PATTERNS = [
     r'(University|Institute|College|School)\s+of\s+([^，。,\.\s]{2,20})',
     r'([^，。,\.\s]{2,20})(University|Institute|College|School)',
 ]
+# (触发子串, 正则)：文本中不含任何触发子串时跳过该模式（没有"大学/学院"时逐位置回溯代价很高）
+_UNIVERSITY_RULES = [
+    (('大学', '学院'), re.compile(UNIVERSITY_PATTERNS[0])),
+    (('大学', '學院'), re.compile(UNIVERSITY_PATTERNS[1])),
+    (('University', 'Institute', 'College', 'School'), re.compile(UNIVERSITY_PATTERNS[2])),
+    (('University', 'Institute', 'College', 'School'), re.compile(UNIVERSITY_PATTERNS[3])),
+]
 
 # 学历背景关键词
 EDUCATION_KEYWORDS = [
@@ -24,55 +34,57 @@ EDUCATION_KEYWORDS = [
     '毕业院校', '毕业于', '就读于',
 ]
 
+# Resume.education_level：已分类但没有识别出学校等级（NULL 表示尚未分类，会排队后台分类）
+EDUCATION_LEVEL_UNKNOWN = ''
 
-def extract_school_from_text(text: str) -> Optional[str]:
-    """从简历文本中提取最高学历的学校名称
-
-    Args:
-        text: 简历原始文本
-
-    Returns:
-        学校名称或None
-    """
-    if not text:
-        return None
 
-    # 1. 定位教育背景部分（通常在简历前半部分）
-    education_section = None
+def _education_section(text: str) -> str:
+    """定位教育背景部分（通常在简历前半部分）"""
     for keyword in EDUCATION_KEYWORDS:
         # 查找关键词位置
         idx = text.find(keyword)
         if idx != -1:
             # 从关键词开始，取接下来的2000字符（教育背景通常不会太长）
-            section_start = idx
-            section_end = min(idx + 2000, len(text))
-            education_section = text[section_start:section_end]
-            break
+            return text[idx:idx + 2000]
 
     # 如果没找到教育背景部分，使用前3000字符
-    if not education_section:
-        education_section = text[:3000]
+    return text[:3000]
 
-    # 2. 在教育背景部分提取学校名称
-    schools_found = []
 
-    # 使用正则模式匹配
-    for pattern in UNIVERSITY_PATTERNS:
-        matches = re.finditer(pattern, education_section)
-        for match in matches:
+def _extract_unlisted_school(section: str) -> Optional[str]:
+    """用通用模式提取学校名称（名单外的学校），返回第一个找到的学校"""
+    for triggers, pattern in _UNIVERSITY_RULES:
+        if not any(trigger in section for trigger in triggers):
+            continue
+        for match in pattern.finditer(section):
             if match.group(1):
                 school_name = match.group(1).strip()
                 # 过滤掉明显不是学校的词
                 if not is_invalid_school_name(school_name):
-                    schools_found.append(school_name)
+                    return school_name
+    return None
 
-    # 3. 去重并返回第一个找到的学校
-    if schools_found:
-        # 使用第一个找到的学校（通常是最高学历）
-        unique_schools = list(dict.fromkeys(schools_found))  # 保持顺序的去重
-        return unique_schools[0]
 
-    return None
+def extract_school_from_text(text: str) -> Optional[str]:
+    """从简历文本中提取最高学历的学校名称
+
+    Args:
+        text: 简历原始文本
+
+    Returns:
+        学校名称或None（已知学校返回标准名称）
+    """
+    if not text:
+        return None
+
+    section = _education_section(text)
+
+    # 使用第一个提到的已知学校（通常是最高学历）
+    mentions = find_universities(section)
+    if mentions:
+        return mentions[0].name
+
+    return _extract_unlisted_school(section)
 
 
 def is_invalid_school_name(name: str) -> bool:
@@ -108,6 +120,27 @@ def is_invalid_school_name(name: str) -> bool:
     return False
 
 
+def _classify_text(text: Optional[str], unlisted_levels: Dict[str, str]) -> Optional[str]:
+    if not text:
+        return None
+
+    section = _education_section(text)
+
+    # 已知学校：扫描结果已带等级
+    mentions = find_universities(section)
+    if mentions:
+        return mentions[0].level
+
+    # 名单外的学校（同一批中常有重复的学校名称，分类结果复用）
+    school_name = _extract_unlisted_school(section)
+    if not school_name:
+        return None
+    level = unlisted_levels.get(school_name)
+    if level is None:
+        level = unlisted_levels[school_name] = classify_university(school_name)
+    return level
+
+
 def classify_education_level(text: str) -> Optional[str]:
     """从简历文本中分类学历等级
 
@@ -117,29 +150,33 @@ def classify_education_level(text: str) -> Optional[str]:
     Returns:
         学历等级：'985', '211', 'QS前50', 'QS前100', 'QS前200', '双非' 或 None
     """
-    # 提取学校名称
-    school_name = extract_school_from_text(text)
+    return _classify_text(text, {})
 
-    if not school_name:
-        return None
 
-    # 分类学校等级
-    level = classify_university(school_name)
+def batch_classify_education_levels(raw_texts: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """批量分类学历等级（用于回填，每份简历只扫描一次教育背景部分）
+
+    Args:
+        raw_texts: 简历原始文本（可以是生成器，None 或空文本的结果为 None）
+
+    Returns:
+        学历等级列表，与输入一一对应
+    """
+    unlisted_levels: Dict[str, str] = {}
+    return [_classify_text(text, unlisted_levels) for text in raw_texts]
 
-    return level
 
+def resolve_education_level(parsed_level: Optional[str], raw_text: Optional[str]) -> str:
+    """入库时确定要保存的学历等级
 
-def batch_classify_education_levels(raw_texts: List[str]) -> List[Optional[str]]:
-    """批量分类学历等级
+    解析结果中没有学校等级时，从简历全文中分类；仍未识别出时返回 EDUCATION_LEVEL_UNKNOWN，
+    保证入库的简历都已分类（筛选结果列表只读取该字段）。
 
     Args:
-        raw_texts: 简历原始文本列表
+        parsed_level: 解析结果中的 education_level
+        raw_text: 简历原始文本
 
     Returns:
-        学历等级列表
+        学历等级或 EDUCATION_LEVEL_UNKNOWN
     """
-    results = []
-    for text in raw_texts:
-        level = classify_education_level(text)
-        results.append(level)
-    return results
+    return parsed_level or classify_education_level(raw_text) or EDUCATION_LEVEL_UNKNOWN
@@ -11,6 +11,7 @@ celery_app = Celery(
 
 # 显式导入任务模块以注册任务
 from app.tasks import email_tasks  # noqa
+from app.tasks import education_tasks  # noqa
 
 # Celery配置
 celery_app.conf.update(
@@ -21,10 +22,11 @@ celery_app.conf.update(
     enable_utc=True,
     # 定时任务配置
     beat_schedule={
-        # 每5分钟检查一次新邮件（自动抓取新简历）
-        'check-new-emails-every-5-minutes': {
+        # 新邮件由监听服务（app/tasks/mail_listener.py，IMAP IDLE）实时处理，
+        # 这里每30分钟检查一次，作为监听服务中断时的兜底
+        'check-new-emails-every-30-minutes': {
             'task': 'app.tasks.email_tasks.check_new_emails',
-            'schedule': 300.0,  # 5分钟
+            'schedule': 1800.0,  # 30分钟
         },
     },
 )
@@ -0,0 +1,220 @@
+"""学历等级回填与后台分类
+
+Resume.education_level 在入库时确定（university_classifier.resolve_education_level），
+筛选结果列表只读取该字段，不在请求中扫描简历正文：
+
+- NULL：尚未分类（该字段加入之前的历史简历等）
+- EDUCATION_LEVEL_UNKNOWN（空字符串）：已分类，没有识别出学校等级
+
+历史简历用回填一次补齐；列表中遇到 NULL 时调用 queue_education_levels 排队后台分类。
+
+使用方法：
+    docker-compose exec backend python3 -m app.tasks.education_tasks --dry-run
+    docker-compose exec backend python3 -m app.tasks.education_tasks --batch-size 1000
+"""
+import argparse
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from app.core.redis import get_redis, redis_failed
+from app.tasks.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+_QUEUED_KEY = 'education_level:queued:{resume_id}'
+# 排队标记的有效期（秒）：期间同一简历不重复排队，任务失败时过期后可再次排队
+_QUEUED_TTL = 600
+# 每个后台任务分类的简历数
+_TASK_CHUNK = 500
+
+
+def _fill(db, rows) -> Counter:
+    """分类并写入一批简历的学历等级（只更新仍为 NULL 的行，不覆盖期间入库写入的值）
+
+    Args:
+        db: 数据库会话
+        rows: (id, raw_text)
+
+    Returns:
+        各等级的简历数（未识别出学校等级的计为 EDUCATION_LEVEL_UNKNOWN）
+    """
+    from app.models.resume import Resume
+    from app.services.university_classifier import EDUCATION_LEVEL_UNKNOWN, batch_classify_education_levels
+
+    levels = batch_classify_education_levels(raw_text for _, raw_text in rows)
+    ids_by_level: Dict[str, List] = defaultdict(list)
+    for (resume_id, _), level in zip(rows, levels):
+        ids_by_level[level or EDUCATION_LEVEL_UNKNOWN].append(resume_id)
+
+    # 按等级分组更新，每批最多几条UPDATE
+    filled = Counter()
+    for level, ids in ids_by_level.items():
+        filled[level] = db.query(Resume).filter(
+            Resume.id.in_(ids),
+            Resume.education_level.is_(None)
+        ).update({Resume.education_level: level}, synchronize_session=False)
+    return filled
+
+
+def backfill_education_levels(
+    limit: Optional[int] = None,
+    batch_size: int = 500,
+    dry_run: bool = False
+) -> Dict:
+    """回填尚未分类（education_level 为 NULL）的简历的学历等级
+
+    按 id 分批查询（只加载 id 和正文），每批提交一次。
+
+    Args:
+        limit: 最多处理的简历数，默认全部
+        batch_size: 每批查询、分类和提交的简历数
+        dry_run: 只统计需要回填的简历数，不修改
+
+    Returns:
+        统计结果
+    """
+    from app.core.database import SessionLocal
+    from app.models.resume import Resume
+
+    db = SessionLocal()
+    stats = Counter()
+    levels = Counter()
+    last_id = None
+    started = time.perf_counter()
+
+    try:
+        while limit is None or stats['checked'] < limit:
+            size = batch_size if limit is None else min(batch_size, limit - stats['checked'])
+            query = db.query(Resume.id, Resume.raw_text).filter(Resume.education_level.is_(None))
+            if last_id is not None:
+                query = query.filter(Resume.id > last_id)
+            rows = query.order_by(Resume.id).limit(size).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            stats['checked'] += len(rows)
+            if dry_run:
+                continue
+
+            try:
+                filled = _fill(db, rows)
+                db.commit()
+            except Exception as e:
+                logger.error(f"学历等级回填提交失败: {e}")
+                db.rollback()
+                stats['errors'] += len(rows)
+                continue
+            levels.update(filled)
+            stats['updated'] += sum(filled.values())
+            logger.info(f"进度: 已检查 {stats['checked']} | 已回填: {stats['updated']} | 错误: {stats['errors']}")
+    finally:
+        db.close()
+
+    result = {
+        'dry_run': dry_run,
+        **{key: stats[key] for key in ('checked', 'updated', 'errors')},
+        'levels': {level or '未识别': count for level, count in levels.most_common()},
+    }
+    logger.info("\n" + "=" * 80)
+    logger.info(f"学历等级回填{'（预演）' if dry_run else ''}完成，耗时 {time.perf_counter() - started:.1f}s")
+    logger.info("=" * 80)
+    logger.info(f"尚未分类的简历: {stats['checked']}")
+    if not dry_run:
+        logger.info(f"已回填: {stats['updated']}（{result['levels']}）")
+        logger.info(f"错误: {stats['errors']}")
+    logger.info("=" * 80)
+    return result
+
+
+@celery_app.task(name='app.tasks.education_tasks.classify_education_levels')
+def classify_education_levels(resume_ids: List[str]) -> Dict:
+    """后台分类这些简历的学历等级（已分类的跳过）"""
+    from app.core.database import SessionLocal
+    from app.models.resume import Resume
+
+    db = SessionLocal()
+    try:
+        rows = db.query(Resume.id, Resume.raw_text).filter(
+            Resume.id.in_(resume_ids),
+            Resume.education_level.is_(None)
+        ).all()
+        filled = _fill(db, rows) if rows else Counter()
+        db.commit()
+    except Exception as e:
+        logger.error(f"学历等级后台分类失败: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    logger.info(f"学历等级后台分类: {len(resume_ids)} 份简历，写入 {sum(filled.values())} 份")
+    return dict(filled)
+
+
+class EducationLevelQueue:
+    """排队后台分类学历等级，用Redis标记已排队的简历（SET NX EX），避免每次打开列表都重复排队"""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        from app.core.config import settings
+
+        self.redis_url = redis_url or settings.REDIS_URL
+
+    def _redis_error(self, e: Exception) -> None:
+        logger.warning(f"学历等级排队Redis操作失败: {e}")
+        redis_failed(self.redis_url)
+
+    def _claim(self, resume_ids: List[str]) -> List[str]:
+        """标记为已排队，返回之前没有排队的简历（Redis不可用时全部返回）"""
+        client = get_redis(self.redis_url)
+        if client is None:
+            return resume_ids
+        try:
+            pipe = client.pipeline(transaction=False)
+            for resume_id in resume_ids:
+                pipe.set(_QUEUED_KEY.format(resume_id=resume_id), 1, nx=True, ex=_QUEUED_TTL)
+            claimed = pipe.execute()
+        except Exception as e:
+            self._redis_error(e)
+            return resume_ids
+        return [resume_id for resume_id, ok in zip(resume_ids, claimed) if ok]
+
+    def enqueue(self, resume_ids: Iterable) -> int:
+        """排队后台分类，返回新排队的简历数（排队失败不抛出异常）"""
+        ids = self._claim([str(resume_id) for resume_id in resume_ids])
+        queued = 0
+        for start in range(0, len(ids), _TASK_CHUNK):
+            chunk = ids[start:start + _TASK_CHUNK]
+            try:
+                classify_education_levels.delay(chunk)
+            except Exception as e:
+                logger.warning(f"学历等级后台分类排队失败: {e}")
+                break
+            queued += len(chunk)
+        if queued:
+            logger.info(f"学历等级排队后台分类: {queued} 份简历")
+        return queued
+
+
+_education_level_queue: Optional[EducationLevelQueue] = None
+
+
+def queue_education_levels(resume_ids: Iterable) -> int:
+    """排队后台分类这些简历的学历等级（已在排队中的跳过），返回新排队的简历数"""
+    global _education_level_queue
+    if _education_level_queue is None:
+        _education_level_queue = EducationLevelQueue()
+    return _education_level_queue.enqueue(resume_ids)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    logging.getLogger('sqlalchemy').setLevel(logging.WARNING)
+    logger.setLevel(logging.INFO)
+    arg_parser = argparse.ArgumentParser(description='回填尚未分类的简历的学历等级')
+    arg_parser.add_argument('--limit', type=int, help='最多处理的简历数（默认全部）')
+    arg_parser.add_argument('--batch-size', type=int, default=500, help='每批处理的简历数')
+    arg_parser.add_argument('--dry-run', action='store_true', help='只统计需要回填的简历数，不修改数据')
+    args = arg_parser.parse_args()
+    backfill_education_levels(args.limit, args.batch_size, args.dry_run)
@@ -1,10 +1,13 @@
 """邮箱任务 - Celery异步任务"""
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from celery import shared_task
 from app.tasks.celery_app import celery_app
-from app.services.email_service import EmailService
+from app.services.email_service import EmailService, FolderStatus
 from app.services.resume_parser import ResumeParser
 import logging
 
@@ -85,6 +88,11 @@ def process_email(email_info: dict, email_config: dict):
         return
 
     try:
+        # 按UID同步的邮件：切换到来源文件夹，附件按UID重新下载
+        by_uid = 'uid' in email_info
+        if by_uid and email_info.get('folder'):
+            email_service.select_folder(email_info['folder'])
+
         # 检查是否有附件
         has_attachments = False
         for attachment in email_info['attachments']:
@@ -104,7 +112,8 @@ def process_email(email_info: dict, email_config: dict):
                 file_path = email_service.download_attachment(
                     email_info['id'],
                     file_name,
-                    RESUME_SAVE_PATH
+                    RESUME_SAVE_PATH,
+                    by_uid=by_uid
                 )
 
             if file_path:
@@ -141,28 +150,91 @@ def parse_resume(file_path: str, email_info: dict):
     - 不使用本地JobMatcher进行匹配
     - 不使用本地ScreeningClassifier进行分类
     """
+    logger.info(f"解析简历: {file_path}")
+
+    # 1. 解析简历（先解析才能获取姓名和手机号用于去重）
+    parser = ResumeParser()
+    resume_data = parser.parse_resume(file_path, email_subject=email_info.get('subject'))
+    save_parsed_resume(file_path, email_info, resume_data)
+
+
+@celery_app.task(name='app.tasks.email_tasks.parse_resume_batch')
+def parse_resume_batch(items: list):
+    """批量解析简历并逐个保存（批量上传/ZIP导入）
+
+    多个分组由 Celery worker 并行执行，每个任务默认在进程内串行解析（PARSE_BATCH_TASK_WORKERS），
+    避免 Celery并发数 × 解析子进程数 × PDF提取子进程数 的进程膨胀；每解析完一份立即保存，不等整批结束。
+    单个文件解析失败（超时/子进程崩溃）时按无正文简历保存，标记为需要人工审核。
+
+    Args:
+        items: [{'file_path': 文件路径, 'email_info': {'subject': ..., 'source': ...}}, ...]
+
+    Returns:
+        总数、成功数、扫描件数（已保存，需人工审核）、失败数
+    """
+    from app.core.config import settings
+    from app.services.batch_parser import BatchItem
+    from app.services.pdf_layout import TIER_IMAGE_ONLY
+
+    logger.info(f"批量解析简历: {len(items)} 份")
+
+    parser = ResumeParser()
+    jobs = (
+        BatchItem(path=item['file_path'], email_subject=item['email_info'].get('subject'), key=item)
+        for item in items
+    )
+    success = 0
+    image_only = 0
+    failed = 0
+    for outcome in parser.parse_many(jobs, workers=settings.PARSE_BATCH_TASK_WORKERS):
+        item = outcome.key
+        resume_data = outcome.result or {}
+        if not outcome.ok:
+            logger.error(f"批量解析失败（{outcome.reason}）: {outcome.source}, {outcome.error}")
+            resume_data = {'review_reason': outcome.reason}
+        try:
+            save_parsed_resume(item['file_path'], item['email_info'], resume_data)
+            if resume_data.get('extraction_tier') == TIER_IMAGE_ONLY:
+                image_only += 1
+            else:
+                success += 1
+        except Exception as e:
+            failed += 1
+            logger.error(f"保存简历失败: {outcome.source}, {e}")
+
+    logger.info(
+        f"批量解析完成: 总计 {len(items)} 份, 成功 {success} 份, 扫描件 {image_only} 份（需人工审核）, 失败 {failed} 份"
+    )
+    return {'total': len(items), 'success': success, 'image_only': image_only, 'failed': failed}
+
+
+def save_parsed_resume(file_path: str, email_info: dict, resume_data: dict):
+    """解析结果的后续处理：判断城市/职位、调用外部Agent评估、去重后保存到数据库
+
+    Args:
+        file_path: 简历文件路径
+        email_info: 邮件信息（subject/body/id/sender）
+        resume_data: ResumeParser 的解析结果
+    """
     from app.core.database import SessionLocal
     from app.models.resume import Resume
-    from app.services.city_extractor import CityExtractor
-    from app.services.job_title_classifier import JobTitleClassifier
+    from app.services.job_title_classifier import get_job_title_classifier
     from app.services.agent_client import AgentClient
-
-    logger.info(f"解析简历: {file_path}")
+    from app.services.parse_versions import stamp as stamp_parse_versions, stampable
+    from app.services.subject_parser import parse_subject
+    from app.services.university_classifier import resolve_education_level
 
     db = SessionLocal()
     try:
-
-        # 1. 解析简历（先解析才能获取姓名和手机号用于去重）
-        parser = ResumeParser()
         email_subject = email_info.get('subject')
-        email_body = email_info.get('body', '')
-        resume_data = parser.parse_resume(file_path, email_subject=email_subject)
 
         # 🔴 新增：处理无正文内容的简历（保存为需要人工审核）
         needs_manual_review = False
         if not resume_data.get('raw_text'):
             logger.warning(f"简历无正文内容��将标记为需要人工审核: {file_path}")
             needs_manual_review = True
+            if resume_data.get('review_reason'):
+                logger.warning(f"人工审核原因: {resume_data['review_reason']}")
             # 尝试从文件名或邮件主题提取候选人姓名
             candidate_name = resume_data.get('candidate_name')
             if not candidate_name:
@@ -186,24 +258,21 @@ def parse_resume(file_path: str, email_info: dict):
             resume_data['email'] = None
 
         logger.info(f"简历解析完成: {resume_data.get('candidate_name')}")
+        # 学历等级在入库时确定（解析结果没有时从全文分类），筛选列表只读取该字段
+        education_level = resolve_education_level(resume_data.get('education_level'), resume_data.get('raw_text'))
 
         # 3. 判断具体职位（使用字符串匹配，不评分）
-        # 提取城市（统一处理，后续可用）
-        city_extractor = CityExtractor()
-        city_result = city_extractor.extract_city(
-            email_subject=email_subject,
-            email_body=email_body,
-            resume_text=resume_data.get('raw_text', '')
-        )
-        city = city_result.confirmed_city
-        candidate_cities = city_result.candidate_cities
+        # 邮件主题中的城市、职位一次提取（同一主题的解析结果有缓存）
+        subject_fields = parse_subject(email_subject)
+        # 只从邮件主题提取确认城市，不收集候选城市
+        city = subject_fields.city
+        candidate_cities = []
         logger.info(f"提取城市 - 确认: {city or '无'}, 候选: {candidate_cities or '无'}")
 
         job_title = None
         if not needs_manual_review:
-            job_classifier = JobTitleClassifier()
-            job_title = job_classifier.classify_job_title(
-                email_subject=email_subject,
+            # 主题中没有职位时从简历内容提取，仍无法判断为"待分类"
+            job_title = subject_fields.job_title or get_job_title_classifier().classify_job_title(
                 resume_text=resume_data.get('raw_text', ''),
                 skills=resume_data.get('skills', []),
                 skills_by_level=resume_data.get('skills_by_level', {})
@@ -220,16 +289,7 @@ def parse_resume(file_path: str, email_info: dict):
             job_title = None
             logger.info(f"简历无正文，跳过Agent评估，标记为需要人工审核")
         else:
-            # 有正文内容，正常调用Agent评估
-            job_classifier = JobTitleClassifier()
-            job_title = job_classifier.classify_job_title(
-                email_subject=email_subject,
-                resume_text=resume_data.get('raw_text', ''),
-                skills=resume_data.get('skills', []),
-                skills_by_level=resume_data.get('skills_by_level', {})
-            )
-            logger.info(f"判断职位: {job_title}")
-
+            # 有正文内容，正常调用Agent评估（职位已在上面判断）
             agent_client = AgentClient()
             agent_result = agent_client.evaluate_resume(
                 job_title=job_title,
@@ -275,7 +335,7 @@ def parse_resume(file_path: str, email_info: dict):
             existing_resume.phone = resume_data.get('phone') or existing_resume.phone
             existing_resume.email = resume_data.get('email') or existing_resume.email
             existing_resume.education = resume_data.get('education')
-            existing_resume.education_level = resume_data.get('education_level')
+            existing_resume.education_level = education_level
             existing_resume.work_years = resume_data.get('work_years', 0)
             existing_resume.skills = resume_data.get('skills', [])
             existing_resume.skills_by_level = resume_data.get('skills_by_level', {})
@@ -285,6 +345,8 @@ def parse_resume(file_path: str, email_info: dict):
             existing_resume.raw_text = resume_data.get('raw_text')
             existing_resume.file_path = file_path  # 更新为最新文件路径
             existing_resume.file_type = file_path.split('.')[-1] if '.' in file_path else None
+            existing_resume.extraction_tier = resume_data.get('extraction_tier')
+            existing_resume.review_reason = resume_data.get('review_reason')
             existing_resume.source_email_id = email_info.get('id')
             existing_resume.source_email_subject = email_info.get('subject')
             existing_resume.source_sender = email_info.get('sender')
@@ -297,6 +359,8 @@ def parse_resume(file_path: str, email_info: dict):
             existing_resume.agent_evaluated_at = agent_evaluated_at
             existing_resume.screening_status = screening_status
             existing_resume.status = 'processed'
+            if stampable(resume_data):
+                stamp_parse_versions(existing_resume)
 
             db.commit()
             db.refresh(existing_resume)
@@ -308,7 +372,7 @@ def parse_resume(file_path: str, email_info: dict):
                 phone=resume_data.get('phone'),
                 email=resume_data.get('email'),
                 education=resume_data.get('education'),
-                education_level=resume_data.get('education_level'),
+                education_level=education_level,
                 work_years=resume_data.get('work_years', 0),
                 skills=resume_data.get('skills', []),
                 skills_by_level=resume_data.get('skills_by_level', {}),
@@ -318,6 +382,8 @@ def parse_resume(file_path: str, email_info: dict):
                 raw_text=resume_data.get('raw_text'),
                 file_path=file_path,
                 file_type=file_path.split('.')[-1] if '.' in file_path else None,
+                extraction_tier=resume_data.get('extraction_tier'),
+                review_reason=resume_data.get('review_reason'),
                 source_email_id=email_info.get('id'),
                 source_email_subject=email_info.get('subject'),
                 source_sender=email_info.get('sender'),
@@ -331,6 +397,8 @@ def parse_resume(file_path: str, email_info: dict):
                 screening_status=screening_status,
                 status='processed'
             )
+            if stampable(resume_data):
+                stamp_parse_versions(resume)
             db.add(resume)
             db.commit()
             db.refresh(resume)
@@ -358,6 +426,92 @@ def parse_resume(file_path: str, email_info: dict):
         db.close()
 
 
+def demo_email_config() -> dict:
+    """自动抓取使用的邮箱配置（DEMO_EMAIL / DEMO_AUTH_CODE）"""
+    return {
+        'email_address': os.getenv('DEMO_EMAIL', 'es1@cloudpense.com'),
+        'auth_code': os.getenv('DEMO_AUTH_CODE', ''),
+        'imap_server': 'imap.exmail.qq.com',
+        'imap_port': 993,
+        'folder': 'INBOX'
+    }
+
+
+@dataclass
+class _FolderScan:
+    """一个文件夹的扫描结果
+
+    Attributes:
+        folder: 文件夹名（解码后）
+        service: 扫描使用的邮箱服务
+        status: 文件夹状态（无法选择文件夹时为 None）
+        uids: 最近邮件的UID（从近到远）
+        emails: 获取到的邮件
+        complete: 全部获取成功（没有出错或跳过的邮件）
+    """
+    folder: str
+    service: Optional[EmailService] = None
+    status: Optional[FolderStatus] = None
+    uids: List[int] = field(default_factory=list)
+    emails: List[Dict] = field(default_factory=list)
+    complete: bool = False
+
+
+def _scan_folder(pool, folder_decoded: str, folder_encoded: str, fetch_limit: int) -> _FolderScan:
+    """在连接池的一个连接上获取文件夹中最近的邮件（从近到远），出错时返回已获取的部分"""
+    from app.services.mail_sync import recent_uids
+
+    scan = _FolderScan(folder=folder_decoded)
+    logger.info(f"扫描文件夹: {folder_decoded}")
+    try:
+        with pool.connection() as email_service:
+            scan.service = email_service
+            # 切换到目标文件夹（只读，使用 IMAP UTF-7 编码的文件夹名）
+            scan.status = email_service.select_folder(folder_encoded)
+            if scan.status is None:
+                logger.warning(f"无法切换到文件夹 {folder_decoded} (encoded: {folder_encoded})")
+                return scan
+
+            # 获取该文件夹最近的邮件（按UID，从近到远）
+            scan.uids = recent_uids(email_service, scan.status, fetch_limit)
+            logger.info(f"文件夹 {folder_decoded}: 找到 {len(scan.uids)} 封最近的邮件（从近到远，限制: {fetch_limit}封）")
+            complete = True
+            for uid, email_info in email_service.fetch_by_uids(scan.uids, save_path=RESUME_SAVE_PATH):
+                if email_info is None:
+                    complete = False
+                    continue
+                scan.emails.append(email_info)
+            scan.complete = complete
+    except Exception as e:
+        logger.error(f"获取文件夹 {folder_decoded} 的邮件失败: {e}")
+
+    logger.info(f"文件夹 {folder_decoded} 中找到 {len(scan.emails)} 封邮件")
+    return scan
+
+
+def _scanned_in_order(
+    folders: List[str],
+    scans: Dict[str, _FolderScan],
+    limit: Optional[int]
+) -> Tuple[List[_FolderScan], List[Dict]]:
+    """按扫描顺序合并已扫描完的文件夹，到第一个还没扫描完的文件夹或邮件数达到 limit 为止
+
+    Returns:
+        (计入的文件夹, 它们的邮件)
+    """
+    included = []
+    emails = []
+    for folder in folders:
+        scan = scans.get(folder)
+        if scan is None:
+            break
+        included.append(scan)
+        emails.extend(scan.emails)
+        if limit is not None and len(emails) >= limit:
+            break
+    return included, emails
+
+
 @celery_app.task(name='app.tasks.email_tasks.fetch_recent_resumes')
 def fetch_recent_resumes(limit: int = 20):
     """抓取最近N封邮件中的简历附件（从近到远，扫描所有文件夹）
@@ -366,6 +520,10 @@ def fetch_recent_resumes(limit: int = 20):
         limit: 抓取邮件数量（默认20封）
     """
     from app.api.v1.email_monitoring import update_import_status
+    from app.core.config import settings
+    from app.core.database import SessionLocal
+    from app.services.imap_pool import IMAPConnectionPool
+    from app.services.mail_sync import mark_scanned
 
     logger.info(f"开始抓取最近 {limit} 封邮件中的简历...")
 
@@ -378,36 +536,37 @@ def fetch_recent_resumes(limit: int = 20):
         message="正在扫描邮箱文件夹"
     )
 
-    email_config = {
-        'email_address': os.getenv('DEMO_EMAIL', 'es1@cloudpense.com'),
-        'auth_code': os.getenv('DEMO_AUTH_CODE', ''),
-        'imap_server': 'imap.exmail.qq.com',
-        'imap_port': 993,
-        'folder': 'INBOX'
-    }
+    email_config = demo_email_config()
 
     if not email_config['auth_code']:
         logger.warning("未配置邮箱授权码，跳过")
         return {'status': 'error', 'message': '未配置邮箱授权码'}
 
-    # 创建邮箱服务
-    email_service = EmailService(
-        email_address=email_config['email_address'],
-        auth_code=email_config['auth_code'],
-        imap_server=email_config['imap_server'],
-        imap_port=email_config['imap_port'],
-        folder=email_config['folder']
-    )
+    # 创建邮箱服务（每个IMAP连接一个；各文件夹在连接池中的连接上并行扫描）
+    def new_email_service():
+        return EmailService(
+            email_address=email_config['email_address'],
+            auth_code=email_config['auth_code'],
+            imap_server=email_config['imap_server'],
+            imap_port=email_config['imap_port'],
+            folder=email_config['folder']
+        )
+
+    pool = IMAPConnectionPool(new_email_service, settings.EMAIL_SCAN_CONCURRENCY)
 
     try:
-        # 连接邮箱
-        if not email_service.connect():
+        # 连接邮箱（连接归还给连接池，之后扫描文件夹时复用）
+        try:
+            with pool.connection():
+                pass
+        except ConnectionError:
             logger.error("连接邮箱失败")
             return {'status': 'error', 'message': '连接邮箱失败'}
 
         # 获取所有文件夹列表
         try:
-            status, folders = email_service.client.list()
+            with pool.connection() as email_service:
+                status, folders = email_service.client.list()
             logger.info(f"IMAP list() status: {status}, 返回数据类型: {type(folders)}, 数量: {len(folders) if folders else 0}")
 
             # 导入 IMAP UTF-7 解码器
@@ -471,61 +630,57 @@ def fetch_recent_resumes(limit: int = 20):
             folder_map = {'INBOX': 'INBOX'}  # Fallback mapping
             folders_to_scan = ['INBOX']
 
-        all_emails = []
-        total_found = 0
-
-        for folder_decoded in folders_to_scan:
-            logger.info(f"扫描文件夹: {folder_decoded}")
-
-            # 更新状��：正在扫描文件夹
-            update_import_status(
-                current_folder=f"正在扫描: {folder_decoded}",
-                message=f"扫描文件夹 {len(folders_to_scan)}/{folders_to_scan.index(folder_decoded) + 1}"
-            )
-
-            # 获取编码后的文件夹名（用于 IMAP 操作）
-            folder_encoded = folder_map.get(folder_decoded, folder_decoded)
-
-            # 切换到目标文件夹
-            try:
-                # 使用 IMAP UTF-7 编码的文件夹名
-                email_service.client.select(folder_encoded)
-            except Exception as e:
-                # 如果失败，尝试引用的方式
-                try:
-                    email_service.client.select('"{}"'.format(folder_encoded))
-                except Exception as e2:
-                    logger.warning(f"无法切换到文件夹 {folder_decoded} (encoded: {folder_encoded}): {e2}")
-                    continue
-
-            # 获取该文件夹的邮件
-            fetch_limit = limit if limit < 1000 else 9999  # 如果limit>=1000，表示获取全部
-            emails = email_service.fetch_recent_emails(
-                limit=fetch_limit,
-                save_path=RESUME_SAVE_PATH  # 直接保存附件
-            )
+        # 并行扫描各文件夹（每个文件夹占用连接池中的一个连接），结果仍按扫描顺序（INBOX优先）合并
+        fetch_limit = limit if limit < 1000 else 9999  # 如果limit>=1000，表示获取全部
+        update_import_status(
+            current_folder=f"正在扫描 {len(folders_to_scan)} 个文件夹",
+            message=f"同时扫描 {min(pool.size, len(folders_to_scan))} 个文件夹"
+        )
 
-            logger.info(f"文件夹 {folder_decoded} 中找到 {len(emails)} 封邮件")
-            all_emails.extend(emails)
-            total_found += len(emails)
+        scans = {}
+        scanned_count = 0
+        with ThreadPoolExecutor(max_workers=pool.size, thread_name_prefix='imap-scan') as executor:
+            futures = [
+                executor.submit(
+                    _scan_folder, pool, folder_decoded,
+                    folder_map.get(folder_decoded, folder_decoded),  # 编码后的文件夹名（用于 IMAP 操作）
+                    fetch_limit
+                )
+                for folder_decoded in folders_to_scan
+            ]
+            for future in as_completed(futures):
+                scan = future.result()
+                scans[scan.folder] = scan
+                scanned_count += 1
+
+                # 更新状态：该文件夹扫描完成
+                update_import_status(
+                    total=sum(len(s.emails) for s in scans.values()),
+                    current_folder=f"已扫描: {scan.folder}",
+                    message=f"扫描文件夹 {scanned_count}/{len(folders_to_scan)}，在 {scan.folder} 中找到 {len(scan.emails)} 封邮件"
+                )
 
-            # 更新状态：找到邮件
-            update_import_status(
-                total=total_found,
-                message=f"在 {folder_decoded} 中找到 {len(emails)} 封邮件"
-            )
+                # 不是获取全部模式时，按扫描顺序靠前的文件夹已找到足够的邮件：不再扫描后面的文件夹
+                if fetch_limit < 1000 and len(_scanned_in_order(folders_to_scan, scans, fetch_limit)[1]) >= fetch_limit:
+                    for pending in futures:
+                        pending.cancel()
+                    break
 
-            # 如果已经找到足够的邮件且不是获取全部模式，停止扫描
-            if fetch_limit < 1000 and len(all_emails) >= fetch_limit:
-                logger.info(f"已找到 {len(all_emails)} 封邮件，达到目标数量")
-                break
+        # 按扫描顺序合并（达到目标数量之后扫描完成的文件夹不计入）
+        included, all_emails = _scanned_in_order(
+            folders_to_scan, scans, fetch_limit if fetch_limit < 1000 else None
+        )
+        total_found = len(all_emails)
+        if fetch_limit < 1000 and total_found >= fetch_limit:
+            logger.info(f"已找到 {total_found} 封邮件，达到目标数量")
 
-        # 去重：通过邮件ID
+        # 去重：通过邮件ID（UID只在所属文件夹内唯一）
         seen_ids = set()
         unique_emails = []
         for email in all_emails:
-            if email['id'] not in seen_ids:
-                seen_ids.add(email['id'])
+            email_key = (email.get('folder'), email['id'])
+            if email_key not in seen_ids:
+                seen_ids.add(email_key)
                 unique_emails.append(email)
 
         logger.info(f"总共找到 {len(unique_emails)} 封唯一邮件（去重后）")
@@ -555,8 +710,17 @@ def fetch_recent_resumes(limit: int = 20):
                     message=f"已处理 {idx + 1}/{len(unique_emails)} 封邮件"
                 )
 
-        # 断开连接
-        email_service.disconnect()
+        # 已处理完文件夹中最近的邮件（覆盖增量同步高水位之后的全部邮件）时推进高水位，之后的定时检查不再重复获取
+        queued = {(email.get('folder'), email['id']) for email in unique_emails[:limit]}
+        db = SessionLocal()
+        try:
+            for scan in included:
+                if scan.complete and all((email.get('folder'), email['id']) in queued for email in scan.emails):
+                    mark_scanned(db, scan.service, scan.status, scan.uids)
+        except Exception as e:
+            logger.error(f"记录扫描进度失败: {e}")
+        finally:
+            db.close()
 
         result = {
             'status': 'success',
@@ -588,20 +752,54 @@ def fetch_recent_resumes(limit: int = 20):
             message=f"抓取失败: {str(e)}"
         )
         return {'status': 'error', 'message': f'抓取失败: {str(e)}'}
+    finally:
+        # 断开连接
+        pool.close()
+
+
+def sync_new_emails(email_service: EmailService, email_config: dict):
+    """按UID增量同步收件箱，新邮件逐封排队处理（见 app/services/mail_sync.py）
+
+    定时检查（check_new_emails）和新邮件监听（app/tasks/mail_listener.py）共用。
+
+    Args:
+        email_service: 已登录的邮箱服务
+        email_config: 邮箱配置（传给 process_email）
+
+    Returns:
+        FolderSyncResult
+    """
+    from app.core.database import SessionLocal
+    from app.services.mail_sync import sync_folder
+
+    # 只获取上次同步之后到达的邮件（不论是否已读）
+    def handle(email_info):
+        logger.info(
+            f"准备处理新邮件 UID {email_info['uid']}: "
+            f"{email_info['subject'][:50]}... (附件数: {len(email_info['attachments'])})"
+        )
+        process_email.delay(email_info, email_config)
+
+    db = SessionLocal()
+    try:
+        return sync_folder(
+            email_service, db, email_config['folder'], handle,
+            save_path=RESUME_SAVE_PATH  # 直接保存附件
+        )
+    finally:
+        db.close()
 
 
 @celery_app.task(name='app.tasks.email_tasks.check_new_emails')
 def check_new_emails():
-    """检查新的未读邮件（用于定时自动抓取）"""
+    """检查新邮件（按UID增量同步收件箱）
+
+    新邮件由监听服务（app/tasks/mail_listener.py，IMAP IDLE）实时处理，
+    这个定时任务低频运行，作为监听服务中断时的兜底。
+    """
     logger.info("开始检查新邮件...")
 
-    email_config = {
-        'email_address': os.getenv('DEMO_EMAIL', 'es1@cloudpense.com'),
-        'auth_code': os.getenv('DEMO_AUTH_CODE', ''),
-        'imap_server': 'imap.exmail.qq.com',
-        'imap_port': 993,
-        'folder': 'INBOX'
-    }
+    email_config = demo_email_config()
 
     if not email_config['auth_code']:
         logger.warning("未配置邮箱授权码，跳过")
@@ -622,39 +820,31 @@ def check_new_emails():
             logger.error("连接邮箱失败")
             return {'status': 'error', 'message': '连接邮箱失败'}
 
-        # 只获取未读邮件（不再过滤）
-        emails = email_service.fetch_unread_emails(
-            save_path=RESUME_SAVE_PATH  # 直接保存附件
-        )
+        sync = sync_new_emails(email_service, email_config)
 
-        logger.info(f"找到 {len(emails)} 封未读邮件")
+        # 断开连接
+        email_service.disconnect()
+
+        if sync.error and not sync.fetched:
+            return {'status': 'error', 'message': f'同步失败: {sync.error}'}
 
-        if len(emails) == 0:
-            logger.info("没有新的未读邮件需要处理")
-            email_service.disconnect()
+        if sync.fetched == 0:
+            logger.info("没有新邮件需要处理")
             return {
                 'status': 'success',
                 'message': '没有新邮件',
                 'total_emails': 0,
-                'processed': 0
+                'processed': 0,
+                'last_seen_uid': sync.last_seen_uid
             }
 
-        # 处理每封邮件
-        for idx, email_info in enumerate(emails):
-            logger.info(
-                f"准备处理第 {idx+1}/{len(emails)} 封新邮件: "
-                f"{email_info['subject'][:50]}... (附件数: {len(email_info['attachments'])})"
-            )
-            process_email.delay(email_info, email_config)
-
-        # 断开连接
-        email_service.disconnect()
-
         result = {
             'status': 'success',
-            'message': f'成功处理 {len(emails)} 封新邮件',
-            'total_emails': len(emails),
-            'processed': len(emails)
+            'message': f'成功处理 {sync.fetched} 封新邮件',
+            'total_emails': sync.fetched + sync.remaining,
+            'processed': sync.fetched,
+            'remaining': sync.remaining,
+            'last_seen_uid': sync.last_seen_uid
         }
 
         logger.info(f"检查完成: {result}")
@@ -0,0 +1,138 @@
+"""新邮件监听 - 用 IMAP IDLE 实时获取收件箱的新邮件
+
+长期保持一个已登录的连接，在收件箱上 IDLE（RFC 2177），服务器推送新邮件（EXISTS）时立即
+按UID增量同步（email_tasks.sync_new_emails），新邮件排队给 Celery 处理，不再等定时检查。
+
+- 每 EMAIL_IDLE_TIMEOUT 秒结束并重新 IDLE，避免连接被服务器或网络设备当作空闲断开
+- 连接断开或出错时重连，等待时间从5秒开始每次失败加倍，最长 EMAIL_IDLE_MAX_BACKOFF 秒
+- 每次连接后先同步一次，补上断线期间到达的邮件
+- 服务器不支持 IDLE 时退化为在同一连接上每 EMAIL_IDLE_TIMEOUT 秒同步一次
+
+定时任务 check_new_emails 仍然低频运行，作为监听服务中断时的兜底；两者同时同步时按同步状态行锁依次执行。
+
+使用方法：
+    docker-compose up -d mail-listener
+    docker-compose exec backend python3 -m app.tasks.mail_listener
+"""
+import logging
+import signal
+import threading
+from typing import Dict, Optional
+
+from app.services.email_service import EmailService
+
+logger = logging.getLogger(__name__)
+
+# 断线重连的初始等待时间（秒）
+_MIN_BACKOFF = 5
+
+
+class MailListener:
+    """收件箱新邮件监听"""
+
+    def __init__(
+        self,
+        email_config: Dict,
+        idle_timeout: Optional[int] = None,
+        max_backoff: Optional[int] = None
+    ):
+        """初始化
+
+        Args:
+            email_config: 邮箱配置（见 email_tasks.demo_email_config）
+            idle_timeout: 每次 IDLE 的最长时间（秒），默认 EMAIL_IDLE_TIMEOUT
+            max_backoff: 断线重连的最长等待时间（秒），默认 EMAIL_IDLE_MAX_BACKOFF
+        """
+        from app.core.config import settings
+
+        self.email_config = email_config
+        self.idle_timeout = idle_timeout or settings.EMAIL_IDLE_TIMEOUT
+        self.max_backoff = max_backoff or settings.EMAIL_IDLE_MAX_BACKOFF
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """停止监听（当前的 IDLE 在1秒内结束）"""
+        self._stop.set()
+
+    def _new_service(self) -> EmailService:
+        return EmailService(
+            email_address=self.email_config['email_address'],
+            auth_code=self.email_config['auth_code'],
+            imap_server=self.email_config['imap_server'],
+            imap_port=self.email_config['imap_port'],
+            folder=self.email_config['folder']
+        )
+
+    def _sync(self, service: EmailService) -> None:
+        """同步新邮件（超过单次上限时继续同步，直到处理完）
+
+        Raises:
+            ConnectionError: 同步中途出错（重连后从断点继续）
+        """
+        from app.tasks.email_tasks import sync_new_emails
+
+        while True:
+            result = sync_new_emails(service, self.email_config)
+            if result.error:
+                raise ConnectionError(f"同步新邮件失败: {result.error}")
+            if result.fetched:
+                logger.info(f"已排队处理 {result.fetched} 封新邮件（UID 高水位 {result.last_seen_uid}）")
+            if not result.remaining or self._stop.is_set():
+                return
+
+    def _listen(self, service: EmailService) -> None:
+        if not service.supports_idle():
+            logger.warning(f"邮箱服务器不支持 IDLE，改为每 {self.idle_timeout} 秒检查一次")
+        while not self._stop.is_set():
+            if service.supports_idle():
+                # 同步后文件夹仍处于选中状态，直接在上面 IDLE
+                if not service.idle(self.idle_timeout, stop=self._stop.is_set):
+                    continue
+                logger.info("收到新邮件通知")
+            elif self._stop.wait(self.idle_timeout):
+                return
+            self._sync(service)
+
+    def run(self) -> None:
+        """监听直到 stop()（阻塞）"""
+        backoff = _MIN_BACKOFF
+        logger.info(f"开始监听邮箱 {self.email_config['email_address']} 的 {self.email_config['folder']}")
+        while not self._stop.is_set():
+            service = self._new_service()
+            error = None
+            try:
+                if not service.connect():
+                    raise ConnectionError("连接邮箱失败")
+                # 补上断线期间到达的邮件
+                self._sync(service)
+                backoff = _MIN_BACKOFF
+                self._listen(service)
+            except Exception as e:
+                error = e
+            service.disconnect()
+
+            if error is not None:
+                logger.error(f"邮箱监听中断: {error}，{backoff} 秒后重连")
+                if self._stop.wait(backoff):
+                    break
+                backoff = min(backoff * 2, self.max_backoff)
+        logger.info("邮箱监听已停止")
+
+
+def main() -> None:
+    from app.tasks.email_tasks import demo_email_config
+
+    email_config = demo_email_config()
+    if not email_config['auth_code']:
+        logger.warning("未配置邮箱授权码，不启动新邮件监听")
+        return
+
+    listener = MailListener(email_config)
+    signal.signal(signal.SIGTERM, lambda signum, frame: listener.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: listener.stop())
+    listener.run()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    main()
@@ -13,6 +13,8 @@
 - project_experience: 项目经历
 - education_history: 教育背景
 
+只需要处理解析版本过期的简历时，用 app.tasks.reparse_stale_resumes（只重跑有变化的提取器）。
+
 使用方法：
     docker-compose exec backend python3 -m app.tasks.reparse_all_resumes
 """
@@ -28,19 +30,25 @@ logging.getLogger('sqlalchemy').setLevel(logging.WARNING)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from datetime import datetime
+from typing import Optional
 from app.core.database import SessionLocal
 from app.models.resume import Resume
+from app.services.batch_parser import BatchItem
+from app.services.parse_versions import EXTRACTORS, TEXT_EXTRACTORS, stamp
 from app.services.resume_parser import ResumeParser
-from app.utils.text_cleaner import TextCleaner
+from app.services.university_classifier import resolve_education_level
 
 logger = logging.getLogger(__name__)
 
 
-def reparse_all_resumes(limit: int = 200):
+def reparse_all_resumes(limit: int = 200, workers: Optional[int] = None):
     """使用最新解析逻辑重新解析所有简历
 
+    解析通过 parse_many 在子进程池中并行进行，按完成顺序逐份比较和更新。
+
     Args:
         limit: 重新解析的简历数量，默认200份（最近的）
+        workers: 解析子进程数，默认 PARSE_BATCH_WORKERS（未设置时按CPU核数）；0 表示在当前进程内串行解析
     """
     db = SessionLocal()
 
@@ -59,18 +67,25 @@ def reparse_all_resumes(limit: int = 200):
         error_count = 0
 
         parser = ResumeParser()
-
-        for idx, resume in enumerate(resumes, 1):
+        resumes_by_id = {resume.id: resume for resume in resumes}
+        # 先清理文本（处理单字行等问题），再使用最新的解析逻辑重新解析
+        jobs = [
+            BatchItem(
+                text=resume.raw_text,
+                clean=True,
+                email_subject=resume.source_email_subject,
+                filename=resume.file_path,
+                key=resume.id
+            )
+            for resume in resumes
+        ]
+
+        for idx, outcome in enumerate(parser.parse_many(jobs, workers=workers), 1):
+            resume = resumes_by_id[outcome.key]
             try:
-                # 先清理文本（处理单字行等问题）
-                cleaned_text = TextCleaner.clean_text(resume.raw_text)
-
-                # 使用最新的解析逻辑重新解析
-                parsed_data = parser._parse_text(
-                    cleaned_text,
-                    email_subject=resume.source_email_subject,
-                    filename=resume.file_path
-                )
+                if not outcome.ok:
+                    raise RuntimeError(f"解析失败（{outcome.reason}）: {outcome.error}")
+                parsed_data = outcome.result
 
                 # 检查是否有变化
                 has_change = False
@@ -106,7 +121,7 @@ def reparse_all_resumes(limit: int = 200):
                     resume.education = new_edu
 
                 old_edu_level = resume.education_level
-                new_edu_level = parsed_data.get('education_level')
+                new_edu_level = resolve_education_level(parsed_data.get('education_level'), resume.raw_text)
                 if old_edu_level != new_edu_level:
                     has_change = True
                     changes.append(f"学历等级: {old_edu_level} -> {new_edu_level}")
@@ -158,6 +173,9 @@ def reparse_all_resumes(limit: int = 200):
                     changes.append(f"技能分类: 已更新")
                     resume.skills_by_level = new_skills_by_level
 
+                # 正文没有重新提取，只标记字段提取器的版本
+                stamp(resume, [name for name in EXTRACTORS if name not in TEXT_EXTRACTORS])
+
                 # 如果有变化，更新数据库
                 if has_change:
                     resume.updated_at = datetime.now()
@@ -174,6 +192,7 @@ def reparse_all_resumes(limit: int = 200):
                         if len(changes) > 3:
                             logger.info(f"  - ... 还有 {len(changes) - 3} 项变化")
                 else:
+                    db.commit()
                     no_change_count += 1
 
                 # 定期显示进度（每100份显示一次，减少输出）
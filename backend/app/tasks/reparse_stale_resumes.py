@@ -0,0 +1,232 @@
+"""增量重新解析 - 只处理解析版本过期的简历，只重跑有变化的提取器
+
+按 Resume.parser_version 选出不是当前解析版本（PARSER_VERSION + 技能词库版本）的简历，再按 Resume.extractor_versions
+找出过期的提取器（见 app/services/parse_versions.py）：
+
+- 只有字段提取器过期：在 raw_text 上按需解析，只计算并更新这些提取器产出的字段
+  （例如调整技能词库后只更新 skills / skills_by_level）
+- 正文提取器过期（pdf_text/docx_text）：从原文件重新完整解析；原文件已不存在时只重跑过期的字段提取器
+- 各提取器都是当前版本（PARSER_VERSION 因其他原因变化）：只更新版本标记
+- 发布新的技能词库后：只有 skills 过期，只重新匹配技能
+- 重新提取后确认为扫描件：保留原数据，记录版本和人工审核原因，单独计数，之后不再重试
+
+解析通过 parse_many 在子进程池中并行进行，每批提交一次。
+
+使用方法：
+    docker-compose exec backend python3 -m app.tasks.reparse_stale_resumes --dry-run
+    docker-compose exec backend python3 -m app.tasks.reparse_stale_resumes --limit 10000 --workers 4
+"""
+import sys
+import os
+import logging
+
+# 必须在所有其他导入之前配置日志
+logging.basicConfig(level=logging.WARNING, format='%(message)s')
+logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
+logging.getLogger('sqlalchemy').setLevel(logging.WARNING)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+import argparse
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import or_
+
+from app.core.database import SessionLocal
+from app.models.resume import Resume
+from app.services.batch_parser import BatchItem
+from app.services.parse_versions import (
+    TEXT_EXTRACTORS, current_parser_version, fields_of, stale_extractors, stamp, stampable
+)
+from app.services.pdf_layout import REASON_IMAGE_ONLY, TIER_IMAGE_ONLY
+from app.services.resume_parser import ResumeParser
+from app.services.university_classifier import resolve_education_level
+
+logger = logging.getLogger(__name__)
+
+
+def _plan(resume: Resume) -> Optional[BatchItem]:
+    """这份简历需要重跑的提取器，以及对应的解析输入；不需要解析时返回 None"""
+    stale = stale_extractors(resume.file_type, resume.extractor_versions)
+    if not stale:
+        return None
+
+    if any(name in TEXT_EXTRACTORS for name in stale):
+        if resume.file_path and os.path.exists(resume.file_path):
+            return BatchItem(
+                path=resume.file_path,
+                email_subject=resume.source_email_subject,
+                key=(resume, stale),
+            )
+        # 原文件不存在，无法重新提取正文：只重跑过期的字段提取器
+        stale = stale_extractors(None, resume.extractor_versions)
+        if not stale:
+            return None
+
+    if not resume.raw_text:
+        return None
+    return BatchItem(
+        text=resume.raw_text,
+        email_subject=resume.source_email_subject,
+        filename=resume.file_path,
+        fields=fields_of(stale),
+        key=(resume, stale),
+    )
+
+
+def _apply(resume: Resume, result: Dict, extractors: List[str]) -> List[str]:
+    """把重跑的提取器产出的字段写回简历，返回有变化的字段"""
+    changed = []
+    for field in fields_of(extractors):
+        new_value = result.get(field)
+        if field == 'work_years' and new_value is None:
+            new_value = 0
+        elif field == 'education_level':
+            # 与入库时一致：解析结果中没有学校等级时从全文分类（raw_text 在它之前已写回）
+            new_value = resolve_education_level(new_value, resume.raw_text)
+        if getattr(resume, field) != new_value:
+            setattr(resume, field, new_value)
+            changed.append(field)
+    return changed
+
+
+def reparse_stale_resumes(
+    limit: Optional[int] = None,
+    batch_size: int = 500,
+    workers: Optional[int] = None,
+    dry_run: bool = False
+) -> Dict:
+    """增量重新解析解析版本过期的简历
+
+    Args:
+        limit: 最多检查的简历数，默认全部
+        batch_size: 每批查询、解析和提交的简历数
+        workers: 解析子进程数，默认 PARSE_BATCH_WORKERS（未设置时按CPU核数）；0 表示在当前进程内串行解析
+        dry_run: 只统计各提取器需要重跑的简历数，不解析、不修改
+
+    Returns:
+        统计结果
+    """
+    db = SessionLocal()
+    parser = ResumeParser()
+    parser_version = current_parser_version()
+    stats = Counter()
+    planned = Counter()
+    changed_fields = Counter()
+    last_id = None
+
+    try:
+        while limit is None or stats['checked'] < limit:
+            size = batch_size if limit is None else min(batch_size, limit - stats['checked'])
+            query = db.query(Resume).filter(
+                or_(Resume.parser_version.is_(None), Resume.parser_version != parser_version)
+            )
+            if last_id is not None:
+                query = query.filter(Resume.id > last_id)
+            resumes = query.order_by(Resume.id).limit(size).all()
+            if not resumes:
+                break
+            last_id = resumes[-1].id
+            stats['checked'] += len(resumes)
+
+            jobs = []
+            for resume in resumes:
+                job = _plan(resume)
+                if job is None:
+                    if stale_extractors(resume.file_type, resume.extractor_versions):
+                        # 需要重新提取正文但原文件已不存在（字段已是最新或没有正文）
+                        stats['skipped'] += 1
+                    else:
+                        stats['restamped'] += 1
+                        if not dry_run:
+                            stamp(resume, [])
+                    continue
+                _, extractors = job.key
+                planned.update(extractors)
+                jobs.append(job)
+
+            stats['to_parse'] += len(jobs)
+            if dry_run:
+                db.rollback()
+                continue
+
+            for outcome in parser.parse_many(jobs, workers=workers):
+                resume, extractors = outcome.key
+                if not outcome.ok:
+                    stats['errors'] += 1
+                    logger.error(f"重新解析失败（{outcome.reason}）: {resume.id} {outcome.source}, {outcome.error}")
+                    continue
+                if outcome.item.path and not outcome.result.get('raw_text'):
+                    if not stampable(outcome.result):
+                        # 原文件重新提取没有得到正文（超时/崩溃等），保留原数据，下次再试
+                        stats['errors'] += 1
+                        logger.error(f"重新提取正文为空: {resume.id} {outcome.source}")
+                        continue
+                    # 扫描件：当前版本重新提取也不会有正文，记录版本并转人工审核
+                    resume.extraction_tier = TIER_IMAGE_ONLY
+                    resume.review_reason = REASON_IMAGE_ONLY
+                    stamp(resume, extractors)
+                    stats['image_only'] += 1
+                    continue
+
+                changed = _apply(resume, outcome.result, extractors)
+                stamp(resume, extractors)
+                if changed:
+                    resume.updated_at = datetime.now()
+                    changed_fields.update(changed)
+                    stats['updated'] += 1
+                else:
+                    stats['unchanged'] += 1
+
+            try:
+                db.commit()
+            except Exception as e:
+                logger.error(f"提交失败: {e}")
+                db.rollback()
+                stats['errors'] += len(jobs)
+
+            logger.info(
+                f"进度: 已检查 {stats['checked']} | 已更新: {stats['updated']} | "
+                f"无变化: {stats['unchanged']} | 仅更新版本: {stats['restamped']} | "
+                f"扫描件: {stats['image_only']} | 错误: {stats['errors']}"
+            )
+
+    finally:
+        db.close()
+
+    result = {
+        'parser_version': parser_version,
+        'dry_run': dry_run,
+        **{key: stats[key] for key in ('checked', 'to_parse', 'updated', 'unchanged', 'restamped', 'skipped', 'image_only', 'errors')},
+        'extractors': dict(planned),
+        'changed_fields': dict(changed_fields),
+    }
+    logger.info("\n" + "=" * 80)
+    logger.info(f"增量重新解析{'（预演）' if dry_run else ''}完成，当前解析版本 {parser_version}")
+    logger.info("=" * 80)
+    logger.info(f"检查简历数: {stats['checked']}")
+    logger.info(f"需要解析: {stats['to_parse']}")
+    for name, count in planned.most_common():
+        logger.info(f"  - {name}: {count}份")
+    if not dry_run:
+        logger.info(f"成功更新: {stats['updated']}（字段: {dict(changed_fields)}）")
+        logger.info(f"无变化: {stats['unchanged']}")
+        logger.info(f"仅更新版本标记: {stats['restamped']}")
+        logger.info(f"跳过（扫描件，已转人工审核）: {stats['image_only']}")
+        logger.info(f"错误: {stats['errors']}")
+    logger.info(f"跳过（正文需要重新提取但原文件不存在）: {stats['skipped']}")
+    logger.info("=" * 80)
+    return result
+
+
+if __name__ == "__main__":
+    logger.setLevel(logging.INFO)
+    arg_parser = argparse.ArgumentParser(description='增量重新解析解析版本过期的简历')
+    arg_parser.add_argument('--limit', type=int, help='最多检查的简历数（默认全部）')
+    arg_parser.add_argument('--batch-size', type=int, default=500, help='每批处理的简历数')
+    arg_parser.add_argument('--workers', type=int, help='解析子进程数，0表示串行')
+    arg_parser.add_argument('--dry-run', action='store_true', help='只统计需要重跑的提取器，不修改数据')
+    args = arg_parser.parse_args()
+    reparse_stale_resumes(args.limit, args.batch_size, args.workers, args.dry_run)
@@ -0,0 +1,31 @@
+"""前缀树正则 - 把大词表编译成公共前缀只比较一次的正则"""
+import re
+from typing import Dict, Iterable
+
+
+def build_trie_pattern(words: Iterable[str]) -> str:
+    """把词表构建成前缀树形式的正则（公共前缀只比较一次）
+
+    分支按字符排序，结尾可选分支在后，保证贪婪优先匹配最长的词，
+    边界不满足时正则回溯到更短的词。返回的正则不含捕获组。
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def to_regex(node: Dict) -> str:
+        is_end = '' in node
+        branches = [re.escape(char) + to_regex(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        inner = '|'.join(branches)
+        if is_end:
+            # 当前位置已可结束，后续字符整体可选（贪婪，优先更长的词）
+            return '(?:' + inner + ')?'
+        return inner if len(branches) == 1 else '(?:' + inner + ')'
+
+    return to_regex(trie)
@@ -1,12 +1,106 @@
 """文本清理工具类"""
 import re
+import sys
 import unicodedata
 import logging
+from functools import lru_cache
+from typing import List, Pattern, Tuple
+
 import chardet
 
 logger = logging.getLogger(__name__)
 
 
+# ==================== clean_text 用到的预编译规则 ====================
+
+# Markdown 标记：(触发子串, 正则, 替换)，文本中不含触发子串时整条规则跳过
+_MD_HEADING = re.compile(r'^(#{1,6})\s+', re.MULTILINE)
+_MD_INLINE_RULES = (
+    ('**', re.compile(r'\*\*([^*]+)\*\*'), r'\1'),  # 加粗 **text**
+    ('__', re.compile(r'__([^_]+)__'), r'\1'),  # 加粗 __text__
+    # 斜体 *text* 和 _text_：把"前面不是*"的后顾放到第一个*之后（等价），正则以字面量开头，可以快速定位候选位置
+    ('*', re.compile(r'\*(?<!\*\*)([^*]+)\*(?!\*)'), r'\1'),
+    ('_', re.compile(r'_(?<!__)([^_]+)_(?!_)'), r'\1'),
+    ('~~', re.compile(r'~~([^~]+)~~'), r'\1'),  # 删除线
+    ('`', re.compile(r'`([^`]+)`'), r'\1'),  # 行内代码
+    ('](', re.compile(r'\[([^\]]+)\]\([^\)]+\)'), r'\1'),  # 链接 [text](url) -> text
+    ('](', re.compile(r'!\[([^\]]*)\]\([^\)]+\)'), ''),  # 图片 ![alt](url)
+)
+# 行首标记：无序列表、有序列表、引用、水平线。
+# 各条规则的 \s 可以跨行，后一条作用在前一条删除之后的行首，依次执行的结果不能用一条正则等价替代
+_MD_LINE_RULES = (
+    (('-', '*', '+'), re.compile(r'^[\s]*[-*+]\s+', re.MULTILINE)),
+    (('.',), re.compile(r'^[\s]*\d+\.\s+', re.MULTILINE)),
+    (('>',), re.compile(r'^[\s]*>\s+', re.MULTILINE)),
+    (('---', '**', '*-', '-*'), re.compile(r'^[\s]*[-*]{3,}[\s]*$', re.MULTILINE)),
+)
+
+# 控制字符（保留\n\t\r）
+_CONTROL_CHARS = [c for c in range(0x20) if chr(c) not in '\n\t\r'] + [0x7F]
+# 纯ASCII文本只需要删除控制字符，str.translate一次完成
+_ASCII_CONTROL_TABLE = dict.fromkeys(_CONTROL_CHARS)
+# 替换为普通空格的空白字符
+_SPACE_CHARS = re.compile(r'[\u00A0\u2000-\u200B\u2028-\u202F\u205F\u3000]')
+_ASTRAL_CHAR = re.compile(r'[\U00010000-\U0010FFFF]')
+_MULTI_NEWLINES = re.compile(r'\n{3,}')
+# 单个空格不需要替换，只匹配制表符和连续空白
+_MULTI_SPACES = re.compile(r'\t[ \t]*| [ \t]+')
+
+# 单字行合并：不应该被合并的section headers（这些通常是独立的标题）
+_SECTION_HEADERS = frozenset({
+    '教育背景', '学习经历', '教育经历', '学历背景',
+    '工作经历', '项目经验', '项目经历', '实习经历', '科研经历',
+    '专业技能', '技能', '联系方式', '自我评价', '个人优势', '获奖情况',
+    '求职意向', '应聘', '意向', '岗位', '职位', '专业背景'
+})
+# 短行：主要是中文/数字/标点（长度另行限制为1-5个字符）
+_SHORT_LINE = re.compile(r'[\u4e00-\u9fa5()（）\-/\d.年月]+')
+# 相邻的两个短行：文本中没有时不可能发生合并，可以跳过逐行处理
+_ADJACENT_SHORT_LINES = re.compile(
+    r'^[\u4e00-\u9fa5()（）\-/\d.年月]{1,5}\n[\u4e00-\u9fa5()（）\-/\d.年月]{1,5}$',
+    re.MULTILINE
+)
+# 行首尾空白（此时制表符已合并为空格、其余空白字符已替换或删除，
+# 剩下的只有这几种 str.strip 会去掉的字符）。分成行尾、行首两条，各自都以字面量/字符集开头
+_LINE_TRAILING_SPACES = re.compile(r'[ \r\x85\u1680]+\n')
+_LINE_LEADING_SPACES = re.compile(r'\n[ \r\x85\u1680]+')
+
+
+def _char_class(codepoints: List[int]) -> str:
+    """把码位列表压缩成正则字符类"""
+    parts = []
+    codepoints = sorted(codepoints)
+    start = prev = codepoints[0]
+    for cp in codepoints[1:] + [None]:
+        if cp is not None and cp == prev + 1:
+            prev = cp
+            continue
+        if start == prev:
+            parts.append(re.escape(chr(start)))
+        else:
+            parts.append(f"{re.escape(chr(start))}-{re.escape(chr(prev))}")
+        if cp is not None:
+            start = prev = cp
+    return '[' + ''.join(parts) + ']'
+
+
+@lru_cache(maxsize=1)
+def _deleted_chars() -> Tuple[Pattern, Pattern]:
+    """需要删除的字符：组合字符（变音符号等）和控制字符
+
+    组合字符集合随 unicodedata 的Unicode版本变化，首次使用时扫描一遍码位表生成。
+    基本平面和辅助平面分成两个字符类：只含基本平面字符的字符类可以编译成位图，
+    逐字符判断是常数时间；辅助平面的组合字符很少见，只在文本含辅助平面字符时才检查。
+
+    Returns:
+        (基本平面字符类, 辅助平面字符类)
+    """
+    combining = [cp for cp in range(sys.maxunicode + 1) if unicodedata.combining(chr(cp))]
+    bmp = [cp for cp in combining if cp <= 0xFFFF] + _CONTROL_CHARS
+    astral = [cp for cp in combining if cp > 0xFFFF]
+    return re.compile(_char_class(bmp) + '+'), re.compile(_char_class(astral) + '+')
+
+
 class TextCleaner:
     """文本清理工具"""
 
@@ -24,39 +118,18 @@ class TextCleaner:
             return text
 
         # 移除标题标记 (# ## ### 等)
-        text = re.sub(r'^(#{1,6})\s+', '', text, flags=re.MULTILINE)
-
-        # 移除加粗标记 (**text** 或 __text__)
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        text = re.sub(r'__([^_]+)__', r'\1', text)
-
-        # 移除斜体标记 (*text* 或 _text_)
-        text = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'\1', text)
-        text = re.sub(r'(?<!_)_([^_]+)_(?!_)', r'\1', text)
-
-        # 移除删除线标记 (~~text~~)
-        text = re.sub(r'~~([^~]+)~~', r'\1', text)
-
-        # 移除行内代码标记 (`code`)
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-
-        # 移除链接格式 [text](url) -> text
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-
-        # 移除图片格式 ![alt](url)
-        text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', '', text)
-
-        # 移除无序列表标记
-        text = re.sub(r'^[\s]*[-*+]\s+', '', text, flags=re.MULTILINE)
-
-        # 移除有序列表标记
-        text = re.sub(r'^[\s]*\d+\.\s+', '', text, flags=re.MULTILINE)
+        if '#' in text:
+            text = _MD_HEADING.sub('', text)
 
-        # 移除引用标记 >
-        text = re.sub(r'^[\s]*>\s+', '', text, flags=re.MULTILINE)
+        # 移除加粗/斜体/删除线/行内代码/链接/图片标记
+        for trigger, pattern, replacement in _MD_INLINE_RULES:
+            if trigger in text:
+                text = pattern.sub(replacement, text)
 
-        # 移除水平线 --- 或 ***
-        text = re.sub(r'^[\s]*[-*]{3,}[\s]*$', '', text, flags=re.MULTILINE)
+        # 移除列表、引用标记和水平线
+        for triggers, pattern in _MD_LINE_RULES:
+            if any(trigger in text for trigger in triggers):
+                text = pattern.sub('', text)
 
         return text
 
@@ -82,115 +155,66 @@ class TextCleaner:
         # 1. Unicode规范化（NFKC - 兼容性分解后规范化）
         text = unicodedata.normalize('NFKC', text)
 
-        # 2. 移除组合字符（如变音符号）
-        text = ''.join(char for char in text if not unicodedata.combining(char))
-
-        # 3. 移除控制字符（保留换行符\n、制表符\t、回车符\r）
-        # 移除ASCII控制字符（0x00-0x1F）中除了\n\t\r的字符
-        text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+        # 2~3. 移除组合字符（如变音符号）和控制字符（保留换行符\n、制表符\t、回车符\r）
+        if not text.isascii():
+            bmp_deleted, astral_deleted = _deleted_chars()
+            text = bmp_deleted.sub('', text)
+            if _ASTRAL_CHAR.search(text):
+                text = astral_deleted.sub('', text)
+            # 4. 替换各种空白字符为普通空格（NFKC之后只剩零宽空格、行/段分隔符等少数几个）
+            text = _SPACE_CHARS.sub(' ', text)
+        else:
+            text = text.translate(_ASCII_CONTROL_TABLE)
 
         # 4. 规范化空白字符
-        # 替换各种空白字符为普通空格
-        text = re.sub(r'[\u00A0\u2000-\u200B\u2028-\u202F\u205F\u3000]', ' ', text)
         # 多个连续换行最多保留2个
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _MULTI_NEWLINES.sub('\n\n', text)
         # 多个空格/制表符合并为一个
-        text = re.sub(r'[ \t]+', ' ', text)
-        # 多个连续的空行合并为一个
-        text = re.sub(r'\n \n', '\n\n', text)
+        # （原先还有一步把"\n \n"替换为"\n\n"，下面合并单字行时每行都会strip，效果相同）
+        text = _MULTI_SPACES.sub(' ', text)
 
-        # 5. 去除首尾空白
-        text = text.strip()
+        # 5. 去除首尾空白（整体和每一行）
+        text = _LINE_LEADING_SPACES.sub('\n', _LINE_TRAILING_SPACES.sub('\n', text.strip()))
 
         # 6. 处理PDF解析导致的单字行问题（如"东\n北\n农\n业"合并为"东北农业"）
         # 检测连续的单字行并合并
+        if not _ADJACENT_SHORT_LINES.search(text):
+            return text
+
         lines = text.split('\n')
+        # 短行定义：1-5个字符，且主要是中文/数字/标点；section header不参与合并
+        short = [
+            0 < len(line) <= 5 and line not in _SECTION_HEADERS and _SHORT_LINE.fullmatch(line) is not None
+            for line in lines
+        ]
         merged_lines = []
         i = 0
+        n = len(lines)
 
-        # 定义不应该被合并的section headers（这些通常是独立的标题）
-        section_headers = {
-            '教育背景', '学习经历', '教育经历', '学历背景',
-            '工作经历', '项目经验', '项目经历', '实习经历', '科研经历',
-            '专业技能', '技能', '联系方式', '自我评价', '个人优势', '获奖情况',
-            '求职意向', '应聘', '意向', '岗位', '职位', '专业背景'
-        }
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
+        while i < n:
+            line = lines[i]
+            if not short[i]:
                 merged_lines.append(line)
                 i += 1
                 continue
 
-            # 如果是section header，不合并，直接添加
-            if line in section_headers:
-                merged_lines.append(line)
-                i += 1
-                continue
-
-            # 检查是否是短行（可能是被拆分的文本）
-            # 短行定义：1-5个字符，且主要是中文/数字/标点
-            is_short_line = (
-                len(line) <= 5 and
-                re.match(r'^[\u4e00-\u9fa5()（）\-/\d.年月]+$', line)
-            )
-
-            if is_short_line:
-                # 向后查看是否还有类似的短行，连续合并
-                merged_text = line
-                j = i + 1
-                # 最多合并20行
-                while j < len(lines) and j < i + 20:
-                    next_line = lines[j].strip()
-                    # 空行停止
-                    if not next_line:
-                        break
-                    # 如果下一行是section header，停止合并
-                    if next_line in section_headers:
-                        break
-                    # 如果下一行也是短行
-                    next_is_short = (
-                        len(next_line) <= 5 and
-                        re.match(r'^[\u4e00-\u9fa5()（）\-/\d.年月]+$', next_line)
-                    )
-                    if next_is_short:
-                        merged_text += next_line
-                        j += 1
-                    else:
-                        # 遇到长行，停止合并
-                        break
-
-                # 如果合并后的文本长度���理（超过6个字符），使用合并版本
-                if len(merged_text) > 6:
-                    merged_lines.append(merged_text)
-                    i = j
-                else:
-                    merged_lines.append(line)
-                    i += 1
+            # 向后查看是否还有类似的短行，连续合并（最多合并20行）
+            # 空行、section header和长行都会停止合并
+            j = i + 1
+            limit = min(n, i + 20)
+            while j < limit and short[j]:
+                j += 1
+            merged_text = ''.join(lines[i:j])
+
+            # 如果合并后的文本长度合理（超过6个字符），使用合并版本
+            if len(merged_text) > 6:
+                merged_lines.append(merged_text)
+                i = j
             else:
                 merged_lines.append(line)
                 i += 1
 
-        text = '\n'.join(merged_lines)
-
-        # 7. 移除行首的section header（如"教育背景东北..."变为"东北..."）
-        # 但保留header所在行，因为解析器需要这些来定位段落
-        # 注释掉此功能，因为移除section header会导致解析器找不到段落
-        # section_headers = ['教育背景', '学习经历', '教育经历', '学历背景', '工作经历', '项目经验', '实习经历',
-        #                   '专业技能', '技能', '联系方式', '自我评价', '个人优势', '获奖情况']
-        # lines = text.split('\n')
-        # cleaned_lines = []
-        # for line in lines:
-        #     # 移除行首的section header
-        #     for header in section_headers:
-        #         if line.startswith(header):
-        #             line = line[len(header):].strip()
-        #             break
-        #     cleaned_lines.append(line)
-        # text = '\n'.join(cleaned_lines)
-
-        return text
+        return '\n'.join(merged_lines)
 
     @staticmethod
     def detect_encoding(text_bytes: bytes) -> str:
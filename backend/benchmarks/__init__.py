@@ -0,0 +1 @@
+"""简历解析相关的基准测试和一致性检查（不随服务部署，手动运行）"""
@@ -0,0 +1,289 @@
+"""合成简历语料 - 生成并渲染成本地 PDF/DOCX 文件
+
+覆盖解析器需要处理的主要形态：
+- 教育背景的6种写法（见 ResumeParser._extract_education 的文档字符串）
+- 邮件主题：职位-姓名-学校、BOSS直聘"姓名 | 年限，应聘 职位 | 城市薪资"、【职位】姓名_简历
+- 文件名：职位-姓名.pdf、BOSS直聘附件名、带时间戳前缀的上传文件名
+- 中文/英文简历
+- 单栏PDF、双栏PDF（左侧个人信息+技能，右侧经历，同一高度并排）、DOCX（部分教育背景放在表格里）
+
+同一个 seed 生成的语料完全相同，不同提交之间的基准结果可以直接比较。
+"""
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+SURNAMES = ['张', '李', '王', '刘', '陈', '杨', '赵', '黄', '周', '吴', '欧阳', '司马']
+GIVEN_NAMES = ['伟', '芳', '娜', '敏', '静', '晓斌', '泽钰', '子义', '景昱', '一鸣', '思远', '雨桐']
+EN_NAMES = ['Zhang Wei', 'Li Na', 'Wang Fang', 'Chen Jie', 'Liu Yang', 'Zhao Min']
+CITIES = ['上海', '北京', '深圳', '杭州', '广州', '成都', '南京', '武汉']
+SCHOOLS = [
+    '上海师范大学', '上海大学', '合肥师范学院', '东北农业大学', '复旦大学', '华东理工大学',
+    '西交利物浦大学', '澳门科技大学', '南京信息工程大学', '武汉理工大学',
+]
+EN_SCHOOLS = ['Tsinghua University', 'Fudan University', 'University of Manchester', 'National University of Singapore']
+MAJORS = ['会计', '计算机科学与技术', '软件工程', '财务管理', '金融学', '市场营销', '人力资源管理']
+EN_MAJORS = ['Computer Science', 'Accounting', 'Finance', 'Software Engineering']
+DEGREES = ['本科', '硕士', '博士', '大专']
+EN_DEGREES = ['Bachelor', 'Master', 'PhD']
+COMPANIES = ['上海明源云科技有限公司', '百望股份有限公司', '腾讯科技', '阿里巴巴集团', '招商银行', '用友网络科技股份有限公司']
+EN_COMPANIES = ['ACME Corp.', 'Globex Ltd.', 'Initech Inc.', 'Umbrella Group']
+POSITIONS = ['Java开发工程师', '销售总监', '产品经理助理', '财务信息化顾问', '实施顾问', '人力资源专员', '测试工程师']
+EN_POSITIONS = ['Software Engineer', 'Product Manager', 'Financial Analyst', 'Sales Manager']
+SKILLS = [
+    '精通Java、Spring Boot', '熟悉MySQL、Redis', '熟练掌握Python', '了解Docker和Kubernetes',
+    '熟练使用Excel、SAP', '擅长需求分析与方案设计', '熟悉Vue、React', '掌握财务报表分析',
+]
+EN_SKILLS = ['Proficient in Python and SQL', 'Familiar with Docker, Kubernetes', 'Experienced with React and Node.js']
+DUTIES = [
+    '负责核心业务系统的设计与开发', '参与需求调研并输出实施方案', '带领5人团队完成项目交付',
+    '负责客户关系维护，年销售额增长30%', '负责月度结账及财务报表编制', '优化系统性能，接口响应时间降低50%',
+]
+EN_DUTIES = ['Led a team of 5 engineers', 'Designed and shipped the billing service', 'Reduced cloud cost by 20%']
+
+FORMATS = ('pdf', 'docx')
+LAYOUTS = ('single', 'two_column')
+EDUCATION_LAYOUTS = (1, 2, 3, 4, 5, 6)
+
+
+@dataclass
+class SyntheticResume:
+    """一份合成简历
+
+    Attributes:
+        name: 候选人姓名（期望解析结果）
+        email_subject: 邮件主题
+        filename: 附件文件名
+        fmt: pdf/docx
+        layout: single/two_column（DOCX始终为single）
+        language: zh/en
+        education_layout: 教育背景写法（1-6，对应 _extract_education 文档字符串中的编号）
+        sidebar: 双栏时左栏的行
+        body: 正文（单栏时为全部内容，双栏时为右栏）
+        education_table: DOCX中以表格形式写的教育背景行（每行若干单元格）
+    """
+    name: str
+    email_subject: str
+    filename: str
+    fmt: str
+    layout: str
+    language: str
+    education_layout: int
+    sidebar: List[str] = field(default_factory=list)
+    body: List[str] = field(default_factory=list)
+    education_table: List[List[str]] = field(default_factory=list)
+
+    @property
+    def variant(self) -> str:
+        return f"{self.fmt}/{self.layout}/{self.language}"
+
+
+def _duration(rng: random.Random, start_year: int, years: int) -> str:
+    fmt = rng.choice([
+        '{a}.{m:02d}-{b}.{n:02d}', '{a}年{m}月-{b}年{n}月', '{a}.{m:02d} ~ {b}.{n:02d}', '{a}/{m:02d} - {b}/{n:02d}',
+    ])
+    return fmt.format(a=start_year, m=rng.randint(1, 12), b=start_year + years, n=rng.randint(1, 12))
+
+
+def _education_lines(rng: random.Random, layout: int) -> Tuple[bool, List[str]]:
+    """教育背景行
+
+    Returns:
+        (是否带"教育背景"标题, 行列表)
+    """
+    school, major, degree = rng.choice(SCHOOLS), rng.choice(MAJORS), rng.choice(DEGREES)
+    start = rng.randint(2008, 2022)
+    span = 4 if degree == '本科' else 3
+    if layout == 1:
+        return True, [school, f"{major} / {degree}", _duration(rng, start, span)]
+    if layout == 2:
+        return True, [f"{degree} | {school} | {major}", _duration(rng, start, span)]
+    if layout == 3:
+        return True, [f"{_duration(rng, start, span)} {school} {major} {degree}"]
+    if layout == 4:
+        return True, [f"{school} {rng.choice(['211', '985', '双一流'])}", f"{major}({degree})"]
+    if layout == 5:
+        return True, [f"{start}.09 ~ {start + span}.07", school, f"{major}({degree})"]
+    # 6. 没有"教育背景"标题，只能全文搜索
+    return False, [f"毕业于{school}，{major}专业{degree}学历"]
+
+
+def _zh_resume(rng: random.Random) -> Tuple[str, dict]:
+    name = rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+    phone = f"1{rng.choice('3578')}{rng.randint(0, 9)}{rng.randint(10000000, 99999999)}"
+    city, position = rng.choice(CITIES), rng.choice(POSITIONS)
+    years = rng.randint(0, 15)
+    education_layout = rng.choice(EDUCATION_LAYOUTS)
+    has_header, education = _education_lines(rng, education_layout)
+
+    contact = [name, f"电话：{phone}", f"邮箱：{phone}@163.com", f"现居：{city}", f"求职意向：{position}"]
+    skills = ['专业技能'] + rng.sample(SKILLS, 3)
+    work = ['工作经历']
+    for k in range(rng.randint(1, 4)):
+        start = 2024 - years + k * 2
+        work += [
+            f"{_duration(rng, start, rng.randint(1, 3))} {rng.choice(COMPANIES)} {rng.choice(POSITIONS)}",
+            rng.choice(DUTIES),
+            rng.choice(DUTIES),
+        ]
+    projects = ['项目经历']
+    for _ in range(rng.randint(1, 3)):
+        projects += [f"{rng.choice(['财务共享', '费控系统', '供应链', '数据中台'])}项目", rng.choice(DUTIES)]
+    evaluation = ['自我评价', '工作认真负责，沟通能力强，具备良好的团队合作精神。']
+
+    education_block = (['教育背景'] if has_header else []) + education
+    subject = rng.choice([
+        f"{position}-{name}-{rng.choice(SCHOOLS)}",
+        f"{position}-{name}-{city}",
+        f"{name} | {years}年以上，应聘 {position} | {city}15-25K【BOSS直聘】",
+        f"{name} | {'应届生' if years == 0 else f'{years}年'}，应聘 {position} | {city}8-12K【BOSS直聘】",
+        f"【{position}】{name}_简历",
+        f"{position}-{name}（{rng.choice(DEGREES)}）",
+    ])
+    filename = rng.choice([
+        f"{position}-{name}",
+        f"【{position}_{city} 15-25K】{name}_{years}年",
+        f"20250130_{rng.randint(100000, 999999)}_{position}-{name}（{rng.choice(DEGREES)}）",
+        f"{name}-简历",
+    ])
+    return name, {
+        'contact': contact, 'skills': skills, 'work': work, 'projects': projects,
+        'evaluation': evaluation, 'education': education_block,
+        'education_layout': education_layout, 'subject': subject, 'filename': filename,
+    }
+
+
+def _en_resume(rng: random.Random) -> Tuple[str, dict]:
+    name = rng.choice(EN_NAMES)
+    phone = f"+86 1{rng.choice('3578')}{rng.randint(0, 9)}{rng.randint(10000000, 99999999)}"
+    position = rng.choice(EN_POSITIONS)
+    start = rng.randint(2008, 2020)
+    contact = [name, f"Phone: {phone}", f"Email: {name.lower().replace(' ', '.')}@gmail.com", 'Shanghai, China']
+    skills = ['SKILLS'] + rng.sample(EN_SKILLS, 2)
+    work = ['WORK EXPERIENCE']
+    for k in range(rng.randint(1, 3)):
+        work += [
+            f"{start + 4 + k * 2}.07-{start + 6 + k * 2}.06 {rng.choice(EN_COMPANIES)} {rng.choice(EN_POSITIONS)}",
+            rng.choice(EN_DUTIES),
+        ]
+    education = [
+        'EDUCATION',
+        f"{start}.09-{start + 4}.06 {rng.choice(EN_SCHOOLS)}",
+        f"{rng.choice(EN_DEGREES)} of {rng.choice(EN_MAJORS)}",
+    ]
+    return name, {
+        'contact': contact, 'skills': skills, 'work': work, 'projects': [],
+        'evaluation': [], 'education': education, 'education_layout': 3,
+        'subject': f"{position} Application - {name}",
+        'filename': f"{name.replace(' ', '_')}_Resume",
+    }
+
+
+def generate(count: int, seed: int = 42, english_ratio: float = 0.15,
+             two_column_ratio: float = 0.3, docx_ratio: float = 0.25) -> Iterator[SyntheticResume]:
+    """生成合成简历
+
+    Args:
+        count: 数量
+        seed: 随机种子
+        english_ratio: 英文简历比例
+        two_column_ratio: PDF中双栏版式的比例
+        docx_ratio: DOCX比例
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        language = 'en' if rng.random() < english_ratio else 'zh'
+        name, parts = _en_resume(rng) if language == 'en' else _zh_resume(rng)
+        fmt = 'docx' if rng.random() < docx_ratio else 'pdf'
+        layout = 'two_column' if fmt == 'pdf' and rng.random() < two_column_ratio else 'single'
+
+        resume = SyntheticResume(
+            name=name,
+            email_subject=parts['subject'],
+            filename=f"{parts['filename']}.{fmt}",
+            fmt=fmt,
+            layout=layout,
+            language=language,
+            education_layout=parts['education_layout'],
+        )
+        if layout == 'two_column':
+            resume.sidebar = parts['contact'] + [''] + parts['skills'] + [''] + parts['education']
+            resume.body = parts['work'] + [''] + parts['projects'] + [''] + parts['evaluation']
+        else:
+            resume.body = (
+                parts['contact'] + [''] + parts['education'] + [''] + parts['work'] + ['']
+                + parts['projects'] + [''] + parts['skills'] + [''] + parts['evaluation']
+            )
+            # DOCX里约一半的教育背景写成表格
+            if fmt == 'docx' and len(parts['education']) > 1 and rng.random() < 0.5:
+                header, rows = parts['education'][0], parts['education'][1:]
+                start = resume.body.index(header)
+                del resume.body[start + 1:start + 1 + len(rows)]
+                resume.education_table = [row.split(' ', 2) if ' ' in row else [row] for row in rows]
+        yield resume
+
+
+# ==================== 渲染 ====================
+
+_PAGE_WIDTH, _PAGE_HEIGHT = 595, 842
+_MARGIN = 50
+_LINE_HEIGHT = 16
+_FONT_SIZE = 10
+
+
+def _render_pdf(resume: SyntheticResume, path: Path) -> None:
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    columns = [(resume.body, _MARGIN)]
+    if resume.layout == 'two_column':
+        columns = [(resume.sidebar, _MARGIN), (resume.body, _PAGE_WIDTH // 2 - 20)]
+
+    pages = []
+    for lines, x in columns:
+        y, page_no = _MARGIN, 0
+        for line in lines:
+            if y > _PAGE_HEIGHT - _MARGIN:
+                y, page_no = _MARGIN, page_no + 1
+            while len(pages) <= page_no:
+                pages.append(doc.new_page(width=_PAGE_WIDTH, height=_PAGE_HEIGHT))
+            if line:
+                # china-s 是 PyMuPDF 内置的简体中文字体
+                pages[page_no].insert_text((x, y), line, fontname='china-s', fontsize=_FONT_SIZE)
+            y += _LINE_HEIGHT
+    doc.save(str(path))
+    doc.close()
+
+
+def _render_docx(resume: SyntheticResume, path: Path) -> None:
+    from docx import Document
+
+    doc = Document()
+    table_after = None
+    if resume.education_table:
+        table_after = next(line for line in resume.body if line in ('教育背景', 'EDUCATION'))
+    for line in resume.body:
+        doc.add_paragraph(line)
+        if line == table_after:
+            columns = max(len(row) for row in resume.education_table)
+            table = doc.add_table(rows=len(resume.education_table), cols=columns)
+            for r, row in enumerate(resume.education_table):
+                for c, cell in enumerate(row):
+                    table.cell(r, c).text = cell
+    doc.save(str(path))
+
+
+def render(resume: SyntheticResume, directory: Path, index: int) -> Path:
+    """把合成简历渲染成文件
+
+    Returns:
+        文件路径（放在以序号命名的子目录中，文件名保持邮件附件的样子）
+    """
+    path = directory / f"{index:05d}" / resume.filename
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if resume.fmt == 'pdf':
+        _render_pdf(resume, path)
+    else:
+        _render_docx(resume, path)
+    return path
@@ -0,0 +1,179 @@
+"""DOCX正文提取基准测试 - 流式 iterparse 对比 python-docx
+
+在合成语料（benchmarks.corpus 中的 DOCX，约一半把教育背景写成表格）上分别运行：
+- stream: app.services.docx_extractor.extract_docx_text（直接流式读取 word/document.xml，包含表格）
+- python-docx: 原先的实现，Document(...) 后拼接 doc.paragraphs（不含表格）
+
+先检查输出：合成简历的期望正文已知，流式提取必须与期望完全一致（包括表格行），
+python-docx 的输出必须与去掉表格行后的期望一致。再分别计时，并用 tracemalloc 记录单个文件的峰值内存。
+--scale 把每份简历的内容重复N次，模拟篇幅很长的DOCX；--dir 额外加入一个目录下的真实DOCX（只计时）。
+
+用法:
+    cd backend
+    python -m benchmarks.docx_extractor
+    python -m benchmarks.docx_extractor --docs 400 --scale 20 --dir /app/resume_files --json results/docx.json
+
+输出检查发现差异时以非0状态码退出。
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.services.docx_extractor import CELL_SEPARATOR, extract_docx_text, extract_docx_text_python_docx
+from benchmarks.corpus import SyntheticResume, generate, render
+from benchmarks.parser import summarize
+
+EXTRACTORS: Dict[str, Callable[[bytes], Optional[str]]] = {
+    'stream': extract_docx_text,
+    'python-docx': extract_docx_text_python_docx,
+}
+
+
+def expected_text(resume: SyntheticResume, include_tables: bool) -> str:
+    """合成简历的期望正文（与 corpus._render_docx 的渲染方式对应）"""
+    lines = []
+    table_after = None
+    if resume.education_table:
+        table_after = next(line for line in resume.body if line in ('教育背景', 'EDUCATION'))
+    for line in resume.body:
+        lines.append(line)
+        if line == table_after and include_tables:
+            lines.extend(CELL_SEPARATOR.join(cell for cell in row if cell) for row in resume.education_table)
+    return ''.join(line + '\n' for line in lines)
+
+
+def _synthetic_files(docs: int, seed: int, scale: int, work_dir: Path) -> List[Tuple[Path, SyntheticResume]]:
+    files = []
+    for index, resume in enumerate(generate(docs, seed=seed, docx_ratio=1.0)):
+        if scale > 1:
+            resume = replace(resume, body=resume.body * scale)
+        files.append((render(resume, work_dir, index), resume))
+    return files
+
+
+def check(files: List[Tuple[Path, SyntheticResume]]) -> List[str]:
+    """逐个比较两种提取方式的输出和期望正文"""
+    problems = []
+    for path, resume in files:
+        data = path.read_bytes()
+        if extract_docx_text(data) != expected_text(resume, include_tables=True):
+            problems.append(f"stream: {path}")
+        if extract_docx_text_python_docx(data) != expected_text(resume, include_tables=False):
+            problems.append(f"python-docx: {path}")
+    return problems
+
+
+def _time(extract: Callable[[bytes], Optional[str]], blobs: List[bytes], repeat: int) -> List[float]:
+    durations = []
+    for _ in range(repeat):
+        for data in blobs:
+            start = time.perf_counter()
+            extract(data)
+            durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _peak_kb(extract: Callable[[bytes], Optional[str]], data: bytes) -> float:
+    tracemalloc.start()
+    try:
+        extract(data)
+        return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def run(docs: int, seed: int, scale: int, repeat: int, work_dir: Path, sample_dir: Optional[str]) -> Dict:
+    files = _synthetic_files(docs, seed, scale, work_dir)
+    problems = check(files)
+
+    groups = {'synthetic': [path.read_bytes() for path, _ in files]}
+    if sample_dir:
+        groups['samples'] = [path.read_bytes() for path in sorted(Path(sample_dir).rglob('*.docx'))]
+
+    report: Dict = {
+        'meta': {
+            'docs': docs,
+            'seed': seed,
+            'scale': scale,
+            'repeat': repeat,
+            'with_tables': sum(1 for _, resume in files if resume.education_table),
+        },
+        'problems': problems,
+        'groups': {},
+    }
+    for group, blobs in groups.items():
+        if not blobs:
+            continue
+        largest = max(blobs, key=len)
+        results = {}
+        for name, extract in EXTRACTORS.items():
+            # 预热（导入、lxml/expat初始化）
+            extract(blobs[0])
+            durations = _time(extract, blobs, repeat)
+            summary = summarize(durations)
+            total = sum(durations)
+            summary['docs_per_sec'] = round(len(durations) / total, 1) if total else None
+            summary['peak_kb_largest'] = _peak_kb(extract, largest)
+            results[name] = summary
+        baseline, current = results['python-docx']['total_ms'], results['stream']['total_ms']
+        report['groups'][group] = {
+            'files': len(blobs),
+            'largest_kb': round(len(largest) / 1024, 1),
+            'extractors': results,
+            'speedup': round(baseline / current, 2) if current else None,
+        }
+    return report
+
+
+def _print_report(report: Dict) -> None:
+    meta = report['meta']
+    print(f"合成DOCX {meta['docs']} 份（{meta['with_tables']} 份含表格），内容重复 {meta['scale']} 次，每个文件运行 {meta['repeat']} 次")
+    for group, result in report['groups'].items():
+        print(f"{group}: {result['files']} 个文件，最大 {result['largest_kb']}KB，流式提取快 {result['speedup']} 倍")
+        for name, summary in result['extractors'].items():
+            print(
+                f"  {name:12s} {summary['docs_per_sec']:>8} docs/sec  p50 {summary['p50_ms']}ms  "
+                f"p95 {summary['p95_ms']}ms  最大文件峰值内存 {summary['peak_kb_largest']}KB"
+            )
+    if report['problems']:
+        print(f"输出与期望不一致: {len(report['problems'])} 个")
+        for problem in report['problems'][:20]:
+            print(f"  {problem}")
+    else:
+        print("输出检查通过")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='DOCX正文提取基准测试')
+    parser.add_argument('--docs', type=int, default=200, help='合成DOCX数量')
+    parser.add_argument('--seed', type=int, default=42, help='语料随机种子')
+    parser.add_argument('--scale', type=int, default=1, help='每份简历内容重复次数（模拟长文档）')
+    parser.add_argument('--repeat', type=int, default=3, help='每个文件的计时次数')
+    parser.add_argument('--dir', help='额外计时的真实DOCX目录（递归查找 *.docx）')
+    parser.add_argument('--work-dir', help='渲染文件的目录（默认临时目录）')
+    parser.add_argument('--json', help='结果写入的JSON文件路径')
+    args = parser.parse_args()
+
+    if args.work_dir:
+        report = run(args.docs, args.seed, args.scale, args.repeat, Path(args.work_dir), args.dir)
+    else:
+        with tempfile.TemporaryDirectory(prefix='docx_bench_') as work_dir:
+            report = run(args.docs, args.seed, args.scale, args.repeat, Path(work_dir), args.dir)
+
+    _print_report(report)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 1 if report['problems'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
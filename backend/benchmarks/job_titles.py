@@ -0,0 +1,124 @@
+"""match_job_titles 的一致性检查和基准测试
+
+把一次扫描的组合正则（match_job_titles）和逐个职位、逐个模式 search 的写法
+（get_compiled_patterns，原样保留作为参照）放在同一批文本上运行：先在固定用例（CASES，
+包括 re.IGNORECASE 下与ASCII字母等价的 "ſ"、"K"（开尔文符号）、"İ"、"ı"）上逐条断言结果一致，
+再比较由职位名称和随机字符拼接的文本，最后分别计时。
+
+用法:
+    cd backend
+    python -m benchmarks.job_titles
+    python -m benchmarks.job_titles --fuzz 100000 --json results/job_titles.json
+
+固定用例不一致时抛出 AssertionError；随机文本发现差异时以非0状态码退出。
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from app.data.job_titles_minimal import JOB_TITLES, get_compiled_patterns, match_job_titles
+
+CASES: List[str] = [
+    '',
+    'Java开发工程师',
+    'JAVA开发',
+    '产品运营经理',
+    'ſDET',
+    'ſpring Boot开发',
+    'ſpring开发工程师 / ſAP实施顾问',
+    'KA经理',
+    'İT项目经理',
+    'ıT项目经理',
+    'APı测试工程师',
+]
+
+
+def _reference(text: str) -> List[str]:
+    """逐个职位、逐个模式 search（重写前的写法）"""
+    return [job_name for job_name in JOB_TITLES
+            if any(pattern.search(text) for pattern in get_compiled_patterns(job_name))]
+
+
+def _current(text: str) -> List[str]:
+    return [job_name for job_name, _ in match_job_titles(text)]
+
+
+def check_cases() -> int:
+    """逐条断言固定用例
+
+    Returns:
+        检查的用例数
+
+    Raises:
+        AssertionError: 结果与参照不一致
+    """
+    for text in CASES:
+        expected, actual = _reference(text), _current(text)
+        assert actual == expected, f"职位匹配与参照不一致: {text!r}\n  参照: {expected}\n  实际: {actual}"
+    return len(CASES)
+
+
+def _fuzz_texts(count: int, seed: int) -> List[str]:
+    """职位名称与随机字符拼接的文本，部分整体转大写"""
+    rng = random.Random(seed)
+    names = [pattern for patterns in JOB_TITLES.values() for pattern in patterns]
+    alphabet = sorted(set(''.join(names))) + list(' -_/|ſKİı')
+    texts = []
+    for _ in range(count):
+        parts = [rng.choice(names) if rng.random() < 0.5 else ''.join(rng.choices(alphabet, k=rng.randint(0, 4)))
+                 for _ in range(rng.randint(1, 4))]
+        text = ''.join(parts)
+        texts.append(text.upper() if rng.random() < 0.3 else text)
+    return texts
+
+
+def run(fuzz: int, seed: int) -> Dict:
+    cases = check_cases()
+
+    texts = _fuzz_texts(fuzz, seed)
+    mismatches = [text for text in texts if _current(text) != _reference(text)]
+
+    timings = {}
+    for label, func in (('reference', _reference), ('current', _current)):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        timings[label] = round((time.perf_counter() - start) / max(len(texts), 1) * 1e6, 1)
+
+    return {
+        'cases': cases,
+        'fuzz': len(texts),
+        'mismatches': len(mismatches),
+        'mismatch_samples': mismatches[:5],
+        'us_per_text': timings,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='职位匹配一致性检查和基准测试')
+    parser.add_argument('--fuzz', type=int, default=20000, help='随机文本数量')
+    parser.add_argument('--seed', type=int, default=1, help='随机种子')
+    parser.add_argument('--json', help='结果写入的JSON文件路径')
+    args = parser.parse_args()
+
+    report = run(args.fuzz, args.seed)
+    print(f"固定用例: {report['cases']} 条，结果与参照一致")
+    print(f"随机文本: {report['fuzz']} 条，不一致 {report['mismatches']} 条")
+    for text in report['mismatch_samples']:
+        print(f"  {text!r}")
+    timings = report['us_per_text']
+    print(f"耗时: 参照 {timings['reference']} us/条，当前 {timings['current']} us/条")
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 1 if report['mismatches'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
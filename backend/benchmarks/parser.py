@@ -0,0 +1,262 @@
+"""简历解析基准测试 - 端到端和各提取器耗时
+
+生成合成简历（benchmarks.corpus），渲染成本地 PDF/DOCX 后逐个调用 ResumeParser.parse_resume，统计：
+- 端到端：docs/sec、p50/p95/max 延迟，按格式/版式分组
+- 各阶段：PDF/DOCX提取、TextCleaner.clean_text、_parse_text 以及各 _extract_* 的调用次数、总耗时、p50/p95
+  （_extract_years_from_duration 等在其他提取器内部调用，耗时与外层有重叠）
+- 峰值RSS：当前进程，以及已退出的子进程（pymupdf4llm 隔离进程在结束时回收后计入）
+
+结果写成JSON，带上提交号和 PARSER_VERSION，用 --compare 和之前的结果对比。
+
+用法:
+    cd backend
+    python -m benchmarks.parser --docs 200 --json results/parser.json
+    python -m benchmarks.parser --docs 200 --compare results/parser.json
+
+默认关闭解析缓存（否则重复运行测的是缓存命中）；--cache 打开。
+"""
+import argparse
+import json
+import logging
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.corpus import generate, render
+
+# 被计时的 ResumeParser 方法
+TIMED_METHODS = (
+    '_parse_pdf', '_parse_docx', '_parse_text',
+    '_extract_phone', '_extract_email', '_extract_name',
+    '_extract_name_from_email_subject', '_extract_name_from_filename', '_extract_work_years_from_subject',
+    '_extract_education', '_extract_work_experience', '_extract_project_experience',
+    '_extract_years_from_duration', '_extract_skills_with_proficiency',
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """最近秩百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(durations: List[float]) -> Dict:
+    """一组耗时（秒）的统计，单位毫秒"""
+    total = sum(durations)
+    return {
+        'count': len(durations),
+        'total_ms': round(total * 1000, 2),
+        'mean_ms': round(total / len(durations) * 1000, 3) if durations else 0.0,
+        'p50_ms': round(percentile(durations, 50) * 1000, 3),
+        'p95_ms': round(percentile(durations, 95) * 1000, 3),
+        'max_ms': round(max(durations) * 1000, 3) if durations else 0.0,
+    }
+
+
+def _timed(func: Callable, samples: List[float]) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - start)
+    return wrapper
+
+
+def _instrument(parser, stages: Dict[str, List[float]]) -> Callable[[], None]:
+    """给解析器实例的各方法和 TextCleaner.clean_text 加计时
+
+    Returns:
+        撤销 TextCleaner 补丁的函数
+    """
+    from app.utils.text_cleaner import TextCleaner
+
+    for name in TIMED_METHODS:
+        setattr(parser, name, _timed(getattr(parser, name), stages[name]))
+
+    original = TextCleaner.__dict__['clean_text']
+    TextCleaner.clean_text = staticmethod(_timed(original.__func__, stages['TextCleaner.clean_text']))
+
+    def restore():
+        TextCleaner.clean_text = original
+    return restore
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True, cwd=str(Path(__file__).parent),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _peak_rss_mb(who: int) -> float:
+    # Linux 上 ru_maxrss 单位是KB
+    return round(resource.getrusage(who).ru_maxrss / 1024, 1)
+
+
+def run(docs: int, seed: int, work_dir: Path, use_cache: bool, warmup: int) -> Dict:
+    from app.services import parse_cache
+    from app.services.resume_parser import PARSER_VERSION, ResumeParser
+
+    if not use_cache:
+        parse_cache._parse_cache = parse_cache.ParseCache(enabled=False)
+
+    resumes = list(generate(docs, seed=seed))
+    render_start = time.perf_counter()
+    files = [render(resume, work_dir, index) for index, resume in enumerate(resumes)]
+    render_seconds = time.perf_counter() - render_start
+
+    parser = ResumeParser()
+    # 预热：加载jieba词典、技能词库、子进程等一次性开销不计入
+    for index in range(min(warmup, len(files))):
+        parser.parse_resume(str(files[index]), email_subject=resumes[index].email_subject)
+
+    stages: Dict[str, List[float]] = defaultdict(list)
+    restore = _instrument(parser, stages)
+    latencies: List[float] = []
+    by_variant: Dict[str, List[float]] = defaultdict(list)
+    by_format: Dict[str, List[float]] = defaultdict(list)
+    names_matched = 0
+    empty_results = 0
+    try:
+        wall_start = time.perf_counter()
+        for resume, path in zip(resumes, files):
+            start = time.perf_counter()
+            result = parser.parse_resume(str(path), email_subject=resume.email_subject)
+            elapsed = time.perf_counter() - start
+            latencies.append(elapsed)
+            by_variant[resume.variant].append(elapsed)
+            by_format[resume.fmt].append(elapsed)
+            if not result.get('raw_text'):
+                empty_results += 1
+            if result.get('candidate_name') == resume.name:
+                names_matched += 1
+        wall_seconds = time.perf_counter() - wall_start
+    finally:
+        restore()
+
+    # 回收提取子进程，让它们的峰值内存计入 RUSAGE_CHILDREN
+    from app.services.pdf_extractor import _pool
+    if _pool is not None:
+        _pool.shutdown()
+
+    end_to_end = summarize(latencies)
+    end_to_end['docs_per_sec'] = round(len(latencies) / wall_seconds, 2) if wall_seconds else None
+    stage_report = {}
+    for name, samples in sorted(stages.items(), key=lambda item: -sum(item[1])):
+        summary = summarize(samples)
+        summary['share_of_wall'] = round(sum(samples) / wall_seconds, 3) if wall_seconds else None
+        stage_report[name] = summary
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_commit': _git_commit(),
+            'parser_version': PARSER_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'docs': docs,
+            'seed': seed,
+            'cache': use_cache,
+            'warmup': warmup,
+            'render_seconds': round(render_seconds, 2),
+        },
+        'end_to_end': end_to_end,
+        'by_format': {name: summarize(values) for name, values in sorted(by_format.items())},
+        'by_variant': {name: summarize(values) for name, values in sorted(by_variant.items())},
+        'stages': stage_report,
+        'quality': {
+            'empty_results': empty_results,
+            'names_matched': names_matched,
+        },
+        'memory': {
+            'peak_rss_mb': _peak_rss_mb(resource.RUSAGE_SELF),
+            'children_peak_rss_mb': _peak_rss_mb(resource.RUSAGE_CHILDREN),
+        },
+    }
+
+
+def _print_report(report: Dict, baseline: Optional[Dict]) -> None:
+    def delta(path: List[str], lower_is_better: bool = True) -> str:
+        if not baseline:
+            return ''
+        current, previous = report, baseline
+        for key in path:
+            current, previous = current.get(key, {}), previous.get(key, {})
+        if not isinstance(current, (int, float)) or not isinstance(previous, (int, float)) or not previous:
+            return ''
+        change = (current - previous) / previous * 100
+        better = change < 0 if lower_is_better else change > 0
+        return f" ({change:+.1f}% {'↑好' if better else '↓差'})"
+
+    meta, e2e = report['meta'], report['end_to_end']
+    print(f"提交 {meta['git_commit']}  解析器版本 {meta['parser_version']}  文档 {meta['docs']}  缓存 {meta['cache']}")
+    print(
+        f"端到端: {e2e['docs_per_sec']} docs/sec{delta(['end_to_end', 'docs_per_sec'], lower_is_better=False)}  "
+        f"p50 {e2e['p50_ms']}ms{delta(['end_to_end', 'p50_ms'])}  "
+        f"p95 {e2e['p95_ms']}ms{delta(['end_to_end', 'p95_ms'])}  max {e2e['max_ms']}ms"
+    )
+    for name, summary in report['by_variant'].items():
+        print(f"  {name:24s} n={summary['count']:<5d} p50 {summary['p50_ms']}ms  p95 {summary['p95_ms']}ms")
+    print("各阶段（按总耗时排序）:")
+    for name, summary in report['stages'].items():
+        print(
+            f"  {name:36s} 调用 {summary['count']:<6d} 总计 {summary['total_ms']:>10.1f}ms"
+            f"{delta(['stages', name, 'total_ms'])}  p50 {summary['p50_ms']}ms  p95 {summary['p95_ms']}ms"
+        )
+    memory, quality = report['memory'], report['quality']
+    print(f"峰值RSS: {memory['peak_rss_mb']}MB（子进程 {memory['children_peak_rss_mb']}MB）")
+    print(f"无正文结果: {quality['empty_results']}  姓名与期望一致: {quality['names_matched']}/{meta['docs']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='简历解析基准测试')
+    parser.add_argument('--docs', type=int, default=200, help='合成简历数量')
+    parser.add_argument('--seed', type=int, default=42, help='语料随机种子')
+    parser.add_argument('--warmup', type=int, default=5, help='预热解析次数（不计时）')
+    parser.add_argument('--work-dir', help='渲染文件的目录（默认临时目录）')
+    parser.add_argument('--cache', action='store_true', help='启用解析缓存')
+    parser.add_argument('--json', help='结果写入的JSON文件路径')
+    parser.add_argument('--compare', help='与之前的JSON结果对比')
+    parser.add_argument('--verbose', action='store_true', help='输出解析日志')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    if args.work_dir:
+        report = run(args.docs, args.seed, Path(args.work_dir), args.cache, args.warmup)
+    else:
+        with tempfile.TemporaryDirectory(prefix='resume_bench_') as work_dir:
+            report = run(args.docs, args.seed, Path(work_dir), args.cache, args.warmup)
+
+    _print_report(report, baseline)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
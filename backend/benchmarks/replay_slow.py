@@ -0,0 +1,114 @@
+"""重放耗时最长的简历解析 - 按文件SHA-256找到原文件，重新解析并输出各阶段耗时
+
+慢解析记录来自 parse_metrics（/api/v1/diagnostics/parse-metrics/slowest），
+每条记录带文件哈希和大小；在简历目录中找到同一个文件后强制采样重新解析，
+重放结果不写入解析缓存和共享统计。
+
+用法:
+    cd backend
+    python -m benchmarks.replay_slow                       # 从Redis读取最慢记录
+    python -m benchmarks.replay_slow --input slowest.json  # 从保存下来的接口响应读取
+    python -m benchmarks.replay_slow --search-dir /app/resume_files --repeat 3
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+DEFAULT_SEARCH_DIR = os.getenv('RESUME_SAVE_PATH', '/app/resume_files')
+
+
+def load_entries(input_path: str = None) -> List[Dict]:
+    if input_path:
+        with open(input_path, encoding='utf-8') as f:
+            data = json.load(f)
+        return data['parses'] if isinstance(data, dict) else data
+
+    from app.services.parse_metrics import get_parse_metrics
+    return get_parse_metrics().slowest()
+
+
+def locate(entries: List[Dict], search_dirs: List[str]) -> Dict[str, Path]:
+    """在目录中查找记录对应的文件（先按大小过滤，只对候选文件计算哈希）
+
+    Returns:
+        文件哈希 -> 文件路径
+    """
+    wanted = {entry['file_hash']: entry.get('size_bytes') for entry in entries}
+    sizes = {size for size in wanted.values() if size is not None}
+    found: Dict[str, Path] = {}
+    for directory in search_dirs:
+        for root, _, files in os.walk(directory):
+            for name in files:
+                path = Path(root) / name
+                try:
+                    if sizes and path.stat().st_size not in sizes:
+                        continue
+                    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+                except OSError:
+                    continue
+                if digest in wanted and digest not in found:
+                    found[digest] = path
+                    if len(found) == len(wanted):
+                        return found
+    return found
+
+
+def replay(path: Path, email_subject: str, repeat: int) -> List[Dict]:
+    """强制采样解析一个文件（绕过缓存），返回每次的 parse_profile"""
+    from app.services.parse_metrics import get_parse_metrics
+    from app.services.resume_parser import ResumeParser
+
+    parser = ResumeParser()
+    metrics = get_parse_metrics()
+    data = path.read_bytes()
+    profiles = []
+    for _ in range(repeat):
+        trace = metrics.begin(force=True)
+        try:
+            if path.suffix.lower() == '.pdf':
+                parser._parse_pdf(data, str(path), email_subject=email_subject)
+            else:
+                parser._parse_docx(data, str(path), email_subject=email_subject)
+        finally:
+            metrics.end(trace)
+        profiles.append(trace.profile())
+    return profiles
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='重放耗时最长的简历解析')
+    parser.add_argument('--input', help='/parse-metrics/slowest 接口响应保存的JSON文件（默认从Redis读取）')
+    parser.add_argument('--search-dir', action='append', help=f'查找原文件的目录，可重复（默认 {DEFAULT_SEARCH_DIR}）')
+    parser.add_argument('--limit', type=int, default=10, help='最多重放多少条')
+    parser.add_argument('--repeat', type=int, default=1, help='每个文件重放次数')
+    parser.add_argument('--verbose', action='store_true', help='输出解析日志')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+
+    entries = load_entries(args.input)[:args.limit]
+    if not entries:
+        print('没有慢解析记录')
+        return 0
+
+    found = locate(entries, args.search_dir or [DEFAULT_SEARCH_DIR])
+    for entry in entries:
+        path = found.get(entry['file_hash'])
+        print(f"{entry['seconds']:.3f}s  {entry['filename']}  [{entry.get('tier')}]  {entry['file_hash'][:12]}")
+        if path is None:
+            print('  未找到原文件')
+            continue
+        for run, profile in enumerate(replay(path, entry.get('email_subject'), args.repeat), 1):
+            stages = sorted(profile['stages'].items(), key=lambda item: -item[1]['ms'])
+            detail = '  '.join(f"{name} {stats['ms']:.1f}ms" for name, stats in stages)
+            print(f"  重放#{run} {profile['total_ms']:.1f}ms  {detail}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,382 @@
+"""TextCleaner.clean_text 的一致性检查和基准测试
+
+把当前实现和重写前的逐步实现（_legacy_clean_text，原样保留在这里作为参照）
+放在同一批文本上运行：先在固定语料（FIXED_CASES + benchmarks.corpus 的合成简历）上
+逐条断言输出一致，再比较随机生成的文本，最后分别计时。
+
+用法:
+    cd backend
+    python -m benchmarks.text_cleaner
+    python -m benchmarks.text_cleaner --docs 1000 --fuzz 200000 --json results/text_cleaner.json
+
+固定语料不一致时抛出 AssertionError；随机文本发现差异时以非0状态码退出。
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import time
+import unicodedata
+from typing import Callable, Dict, Iterator, List
+
+from app.utils.text_cleaner import TextCleaner
+
+
+# ==================== 重写前的实现（参照） ====================
+
+def _legacy_clean_markdown(text: str) -> str:
+    """清理Markdown格式标记
+
+    Args:
+        text: 包含Markdown格式的文本
+
+    Returns:
+        清理后的纯文本
+    """
+    if not text:
+        return text
+
+    # 移除标题标记 (# ## ### 等)
+    text = re.sub(r'^(#{1,6})\s+', '', text, flags=re.MULTILINE)
+
+    # 移除加粗标记 (**text** 或 __text__)
+    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
+    text = re.sub(r'__([^_]+)__', r'\1', text)
+
+    # 移除斜体标记 (*text* 或 _text_)
+    text = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'\1', text)
+    text = re.sub(r'(?<!_)_([^_]+)_(?!_)', r'\1', text)
+
+    # 移除删除线标记 (~~text~~)
+    text = re.sub(r'~~([^~]+)~~', r'\1', text)
+
+    # 移除行内代码标记 (`code`)
+    text = re.sub(r'`([^`]+)`', r'\1', text)
+
+    # 移除链接格式 [text](url) -> text
+    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+
+    # 移除图片格式 ![alt](url)
+    text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', '', text)
+
+    # 移除无序列表标记
+    text = re.sub(r'^[\s]*[-*+]\s+', '', text, flags=re.MULTILINE)
+
+    # 移除有序列表标记
+    text = re.sub(r'^[\s]*\d+\.\s+', '', text, flags=re.MULTILINE)
+
+    # 移除引用标记 >
+    text = re.sub(r'^[\s]*>\s+', '', text, flags=re.MULTILINE)
+
+    # 移除水平线 --- 或 ***
+    text = re.sub(r'^[\s]*[-*]{3,}[\s]*$', '', text, flags=re.MULTILINE)
+
+    return text
+
+
+def _legacy_clean_text(text: str, clean_markdown: bool = True) -> str:
+    """清理和规范化文本
+
+    Args:
+        text: 原始文本
+        clean_markdown: 是否清理Markdown格式标记
+
+    Returns:
+        清理后的文本
+    """
+    if not text:
+        return ""
+
+    # 0. 清理Markdown格式（如果启用）
+    if clean_markdown:
+        text = _legacy_clean_markdown(text)
+
+    # 1. Unicode规范化（NFKC - 兼容性分解后规范化）
+    text = unicodedata.normalize('NFKC', text)
+
+    # 2. 移除组合字符（如变音符号）
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+
+    # 3. 移除控制字符（保留换行符\n、制表符\t、回车符\r）
+    # 移除ASCII控制字符（0x00-0x1F）中除了\n\t\r的字符
+    text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+
+    # 4. 规范化空白字符
+    # 替换各种空白字符为普通空格
+    text = re.sub(r'[\u00A0\u2000-\u200B\u2028-\u202F\u205F\u3000]', ' ', text)
+    # 多个连续换行最多保留2个
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    # 多个空格/制表符合并为一个
+    text = re.sub(r'[ \t]+', ' ', text)
+    # 多个连续的空行合并为一个
+    text = re.sub(r'\n \n', '\n\n', text)
+
+    # 5. 去除首尾空白
+    text = text.strip()
+
+    # 6. 处理PDF解析导致的单字行问题（如"东\n北\n农\n业"合并为"东北农业"）
+    # 检测连续的单字行并合并
+    lines = text.split('\n')
+    merged_lines = []
+    i = 0
+
+    # 定义不应该被合并的section headers（这些通常是独立的标题）
+    section_headers = {
+        '教育背景', '学习经历', '教育经历', '学历背景',
+        '工作经历', '项目经验', '项目经历', '实习经历', '科研经历',
+        '专业技能', '技能', '联系方式', '自我评价', '个人优势', '获奖情况',
+        '求职意向', '应聘', '意向', '岗位', '职位', '专业背景'
+    }
+
+    while i < len(lines):
+        line = lines[i].strip()
+        if not line:
+            merged_lines.append(line)
+            i += 1
+            continue
+
+        # 如果是section header，不合并，直接添加
+        if line in section_headers:
+            merged_lines.append(line)
+            i += 1
+            continue
+
+        # 检查是否是短行（可能是被拆分的文本）
+        # 短行定义：1-5个字符，且主要是中文/数字/标点
+        is_short_line = (
+            len(line) <= 5 and
+            re.match(r'^[\u4e00-\u9fa5()（）\-/\d.年月]+$', line)
+        )
+
+        if is_short_line:
+            # 向后查看是否还有类似的短行，连续合并
+            merged_text = line
+            j = i + 1
+            # 最多合并20行
+            while j < len(lines) and j < i + 20:
+                next_line = lines[j].strip()
+                # 空行停止
+                if not next_line:
+                    break
+                # 如果下一行是section header，停止合并
+                if next_line in section_headers:
+                    break
+                # 如果下一行也是短行
+                next_is_short = (
+                    len(next_line) <= 5 and
+                    re.match(r'^[\u4e00-\u9fa5()（）\-/\d.年月]+$', next_line)
+                )
+                if next_is_short:
+                    merged_text += next_line
+                    j += 1
+                else:
+                    # 遇到长行，停止合并
+                    break
+
+            # 如果合并后的文本长度合理（超过6个字符），使用合并版本
+            if len(merged_text) > 6:
+                merged_lines.append(merged_text)
+                i = j
+            else:
+                merged_lines.append(line)
+                i += 1
+        else:
+            merged_lines.append(line)
+            i += 1
+
+    text = '\n'.join(merged_lines)
+
+    return text
+
+
+# ==================== 测试文本 ====================
+
+_NAMES = ['张三', '李晓斌', '王五', '刘泽钰', '欧阳娜娜', 'Zhang Wei']
+_SCHOOLS = ['上海大学', '东北农业大学（211）', '复旦大学', '华东理工大学 工业催化(工学硕士)', 'Tsinghua University']
+_COMPANIES = ['上海明源云科技有限公司', '百望股份有限公司', '腾讯', '招商银行', 'ACME Corp.']
+_POSITIONS = ['Java开发工程师', '销售经理', '产品经理', '实施顾问', '财务专员']
+_HEADERS = ['教育背景', '工作经历', '项目经验', '专业技能', '自我评价', '求职意向', 'EDUCATION']
+
+# pymupdf4llm 输出中常见的Markdown写法，以及全角字符、组合字符、控制字符、零宽空格等
+_MARKDOWN_LINES = [
+    '# 个人简历', '## 教育背景', '### 工作经历', '**{name}**', '**熟悉** Python、Java',
+    '- 负责{company}的系统实施', '* 熟练使用 `Spring Boot`', '1. 需求分析', '  2. 方案设计',
+    '> 引用说明', '---', '***', '| 时间 | 公司 | 职位 |', '|---|---|---|',
+    '| 2019.07-2023.06 | {company} | {position} |', '[作品集](https://example.com/{name})',
+    '![](image_{name}.png)', '电话：１３８００１３８０００', '邮箱：ａｂｃ＠ｅｘａｍｐｌｅ．ｃｏｍ',
+    'café naïve résumé', 'e\u0301\u0308x', '\x07控制\x0b字符\x1f', '\t\t制表符  多个   空格',
+    '\u200b零宽空格\u3000全角空格\u00a0不换行空格', 'ﬁ ligature ①② ㈱', '{school} {position}',
+    '东', '北', '农', '业', '大', '学', '2019', '年',
+]
+
+# 固定语料：逐条核对过的边界情况（Markdown规则之间的相互影响、单字行合并、各类空白和控制字符）
+FIXED_CASES = [
+    '',
+    '   ',
+    '# 张三\n## 教育背景\n**上海大学** 计算机科学与技术 本科',
+    '**熟悉** *Python*、__Java__ 和 _Go_，~~PHP~~，`Spring Boot`',
+    '***加粗斜体*** 和 **未闭合的加粗',
+    '[作品集](https://example.com) ![头像](avatar.png) ![](x.png)',
+    '- 负责系统实施\n* 需求分析\n+ 方案设计\n1. 上线\n  23. 运维\n> 引用说明',
+    '---\n***\n-*-\n  ---  \n正文',
+    '| 时间 | 公司 | 职位 |\n|---|---|---|\n| 2019.07-2023.06 | 腾讯 | 产品经理 |',
+    '东\n北\n农\n业\n大\n学',
+    '2019\n年\n7\n月\n至\n今',
+    '张\n三\n教育背景\n上\n海\n大\n学',
+    '上\n海\n\n大\n学',
+    '(\n2\n1\n1\n)\n东北农业大学',
+    '电话：１３８００１３８０００\n邮箱：ａｂｃ＠ｅｘａｍｐｌｅ．ｃｏｍ',
+    'café naïve résumé e\u0301\u0308x \U0001D165',
+    '\x07控制\x0b字符\x1f\x7f\r\n回车',
+    '\t\t制表符  多个   空格\n\n\n\n\n多个换行\n \n空白行',
+    '\u200b零宽空格\u3000全角空格\u00a0不换行空格\u2028行分隔符\u205f',
+    'ﬁ ligature ①② ㈱ ＡＢＣ \U0001D400',
+    'a_b_c snake_case __init__ 2*3*4 **',
+    '\n'.join(['短'] * 30),
+]
+
+# 随机拼接的各种标记片段，覆盖规则之间相互影响的边界情况
+_FUZZ_ATOMS = [
+    '-', '*', '+', '>', '#', '1.', '23.', '---', '***', '-*-', ' ', '  ', '\t', '\n', '\n\n', '\n \n',
+    '**', '__', '_', '~~', '`', '[a](b)', '![](c)', '![x](y)', 'a', '张', '东', '北', '年', '月', '2019',
+    '.', '(', ')', 'é', '\u0301', '\x07', '\u3000', '\u200b', '\u00a0', '\U0001D165', '\U0001D400',
+    'ﬁ', '\r', '\u2028', '教育背景',
+]
+
+
+def markdown_corpus(count: int, seed: int = 7) -> Iterator[str]:
+    """生成类似 pymupdf4llm 输出的简历Markdown文本"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        lines = []
+        for _ in range(rng.randint(5, 800)):
+            line = rng.choice(_MARKDOWN_LINES).format(
+                name=rng.choice(_NAMES),
+                school=rng.choice(_SCHOOLS),
+                company=rng.choice(_COMPANIES),
+                position=rng.choice(_POSITIONS),
+            )
+            if rng.random() < 0.1:
+                line = f"{rng.choice(_HEADERS)} {line}"
+            lines.append(line)
+        yield rng.choice(['\n', '\n', '\n\n', '\n\n\n\n']).join(lines)
+
+
+def fuzz_corpus(count: int, seed: int = 3) -> Iterator[str]:
+    """随机拼接标记片段"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(rng.choice(_FUZZ_ATOMS) for _ in range(rng.randint(1, 60)))
+
+
+# ==================== 检查和计时 ====================
+
+def fixed_corpus(resumes: int = 200) -> List[str]:
+    """固定语料：FIXED_CASES + 合成简历正文（benchmarks.corpus，固定seed）"""
+    from benchmarks.corpus import generate
+
+    texts = list(FIXED_CASES)
+    for resume in generate(resumes):
+        texts.append('\n'.join(resume.sidebar + resume.body))
+    return texts
+
+
+def assert_equivalent(texts: List[str]) -> int:
+    """逐条断言新旧实现输出一致（clean_markdown 开启和关闭两种情况）
+
+    Returns:
+        检查的文本数
+
+    Raises:
+        AssertionError: 输出不一致
+    """
+    for text in texts:
+        for clean_markdown in (True, False):
+            expected = _legacy_clean_text(text, clean_markdown=clean_markdown)
+            actual = TextCleaner.clean_text(text, clean_markdown=clean_markdown)
+            assert actual == expected, (
+                f"clean_text 与旧实现不一致 (clean_markdown={clean_markdown}): {text[:200]!r}\n"
+                f"  旧: {expected[:200]!r}\n  新: {actual[:200]!r}"
+            )
+    return len(texts)
+
+
+def check_parity(texts: List[str]) -> List[str]:
+    """返回新旧实现输出不一致的文本"""
+    return [text for text in texts if TextCleaner.clean_text(text) != _legacy_clean_text(text)]
+
+
+def time_cleaner(func: Callable[[str], str], texts: List[str], repeat: int) -> float:
+    """多次运行取最短耗时（秒）"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(docs: int, fuzz: int, repeat: int) -> Dict:
+    # 首次调用会生成组合字符表，不计入计时
+    TextCleaner.clean_text('é')
+
+    fixed = assert_equivalent(fixed_corpus())
+
+    corpora = {
+        'markdown': list(markdown_corpus(docs)),
+        'fuzz': list(fuzz_corpus(fuzz)),
+    }
+    report = {'fixed': fixed, 'parity': {}, 'timing': {}}
+    for name, texts in corpora.items():
+        mismatches = check_parity(texts)
+        report['parity'][name] = {
+            'texts': len(texts),
+            'mismatches': len(mismatches),
+            'examples': [repr(text) for text in mismatches[:3]],
+        }
+
+    texts = corpora['markdown']
+    legacy = time_cleaner(_legacy_clean_text, texts, repeat)
+    current = time_cleaner(TextCleaner.clean_text, texts, repeat)
+    report['timing'] = {
+        'texts': len(texts),
+        'avg_chars': sum(map(len, texts)) // max(len(texts), 1),
+        'legacy_ms': round(legacy * 1000, 1),
+        'current_ms': round(current * 1000, 1),
+        'speedup': round(legacy / current, 2) if current else None,
+    }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='TextCleaner.clean_text 一致性检查和基准测试')
+    parser.add_argument('--docs', type=int, default=300, help='Markdown简历文本数量')
+    parser.add_argument('--fuzz', type=int, default=50000, help='随机标记片段文本数量')
+    parser.add_argument('--repeat', type=int, default=3, help='计时重复次数（取最短）')
+    parser.add_argument('--json', help='结果写入的JSON文件路径')
+    args = parser.parse_args()
+
+    report = run(args.docs, args.fuzz, args.repeat)
+
+    print(f"固定语料: {report['fixed']} 条，新旧实现输出一致")
+    for name, parity in report['parity'].items():
+        print(f"一致性 [{name}]: {parity['texts']} 条，不一致 {parity['mismatches']} 条")
+        for example in parity['examples']:
+            print(f"  {example[:200]}")
+    timing = report['timing']
+    print(
+        f"耗时: {timing['texts']} 条（平均 {timing['avg_chars']} 字符） "
+        f"旧 {timing['legacy_ms']}ms / 新 {timing['current_ms']}ms，提速 {timing['speedup']}x"
+    )
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    return 1 if any(p['mismatches'] for p in report['parity'].values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""学校识别的一致性检查和基准测试
+
+先在固定用例（CASES）上逐条断言 extract_school_from_text / classify_education_level 的结果，
+覆盖 find_universities 的边界规则：英文缩写的单词边界、短中文别名、以及是其他已知校名结尾的校名
+（"清华大学" 是 "台湾清华大学" 的结尾，"交通大学" 是 "上海交通大学" 等的结尾）前面紧接学历/栏目名等引导词的写法。
+再在合成简历（benchmarks.corpus）上对 batch_classify_education_levels 计时。
+
+用法:
+    cd backend
+    python -m benchmarks.university
+    python -m benchmarks.university --docs 2000 --json results/university.json
+
+固定用例不一致时抛出 AssertionError。
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.services.university_classifier import (
+    batch_classify_education_levels, classify_education_level, extract_school_from_text
+)
+from benchmarks.corpus import generate
+
+# (文本, 期望学校名称, 期望等级)
+CASES: List[Tuple[str, Optional[str], Optional[str]]] = [
+    ('教育背景 硕士清华大学', '清华大学', 'QS前50'),
+    ('学校名称：清华大学', '清华大学', 'QS前50'),
+    ('学校名称清华大学 计算机科学与技术', '清华大学', 'QS前50'),
+    ('教育背景\n2015.09-2019.06 本科清华大学 软件工程', '清华大学', 'QS前50'),
+    ('博士清华大学', '清华大学', 'QS前50'),
+    ('台湾清华大学 电机工程', '台湾清华大学', 'QS前100'),
+    ('毕业于交通大学', '交通大学', 'QS前100'),
+    ('硕士上海交通大学 金融学', '上海交通大学', 'QS前50'),
+    ('教育背景 研究生西安交通大学', '西安交通大学', 'QS前100'),
+    ('华东交通大学 会计学', '华东交通', '双非'),
+    ('桂林电子科技大学 通信工程', '桂林电子科技', '双非'),
+    ('教育经历 南大 计算机', '南京大学', 'QS前50'),
+    ('河南大学 汉语言文学', '河南', '双非'),
+    ('Education: MIT, Computer Science', 'Massachusetts Institute of Technology', 'QS前50'),
+    ('I submit reports weekly', None, None),
+]
+
+
+def check_cases() -> int:
+    """逐条断言固定用例
+
+    Returns:
+        检查的用例数
+
+    Raises:
+        AssertionError: 结果与期望不一致
+    """
+    for text, school, level in CASES:
+        actual_school = extract_school_from_text(text)
+        actual_level = classify_education_level(text)
+        assert (actual_school, actual_level) == (school, level), (
+            f"学校识别与期望不一致: {text!r}\n"
+            f"  期望: {school!r} {level!r}\n  实际: {actual_school!r} {actual_level!r}"
+        )
+    return len(CASES)
+
+
+def run(docs: int, seed: int, repeat: int) -> Dict:
+    cases = check_cases()
+
+    texts = ['\n'.join(resume.sidebar + resume.body) for resume in generate(docs, seed=seed)]
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        levels = batch_classify_education_levels(texts)
+        best = min(best, time.perf_counter() - start)
+
+    counts: Dict[str, int] = {}
+    for level in levels:
+        counts[level or 'none'] = counts.get(level or 'none', 0) + 1
+    return {
+        'cases': cases,
+        'texts': len(texts),
+        'us_per_text': round(best / max(len(texts), 1) * 1e6, 1),
+        'levels': counts,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='学校识别一致性检查和基准测试')
+    parser.add_argument('--docs', type=int, default=1000, help='合成简历数量')
+    parser.add_argument('--seed', type=int, default=42, help='语料随机种子')
+    parser.add_argument('--repeat', type=int, default=3, help='计时重复次数（取最短）')
+    parser.add_argument('--json', help='结果写入的JSON文件路径')
+    args = parser.parse_args()
+
+    report = run(args.docs, args.seed, args.repeat)
+    print(f"固定用例: {report['cases']} 条，结果与期望一致")
+    print(f"耗时: {report['texts']} 条，平均 {report['us_per_text']} us/条，等级分布 {report['levels']}")
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,6 +4,7 @@ sys.path.append('/app')
 
 from app.core.database import SessionLocal
 from app.models.resume import Resume
+from app.services.parse_versions import stamp
 from app.services.resume_parser import ResumeParser
 import logging
 
@@ -29,12 +30,14 @@ def update_resume_skills():
             try:
                 # 检查是否需要更新
                 if not resume.skills or len(resume.skills) == 0:
-                    # 从raw_text提取技能
+                    # 从raw_text提取技能（只做技能匹配，与入库解析的 skills 字段一致）
                     text = resume.raw_text[:10000]  # 使用前10000字符
-                    skills = parser._extract_skills(text)
+                    parsed = parser._parse_text(text, lazy=True)
 
                     # 更新数据库
-                    resume.skills = skills
+                    resume.skills = parsed['skills']
+                    resume.skills_by_level = parsed['skills_by_level']
+                    stamp(resume, ['skills'])
                     db.commit()
 
                     updated_count += 1
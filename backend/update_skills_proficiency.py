@@ -8,6 +8,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from sqlalchemy import select
 from app.core.database import SessionLocal
 from app.models.resume import Resume
+from app.services.parse_versions import stamp
 from app.services.resume_parser import ResumeParser
 
 
@@ -44,6 +45,7 @@ def update_resume_skills():
                 # 更新数据库
                 resume.skills = all_skills
                 resume.skills_by_level = skills_with_levels
+                stamp(resume, ['skills'])
                 updated_count += 1
 
                 expert_count = len(skills_with_levels.get('expert', []))
@@ -227,6 +227,23 @@ const ManualReviewPage = () => {
         return <Tag color={color}>{length} 字符</Tag>;
       },
     },
+    {
+      title: '原因',
+      dataIndex: 'review_reason',
+      key: 'review_reason',
+      width: 120,
+      render: (reason: string) => {
+        const reasonMap: Record<string, { text: string; color: string }> = {
+          pdf_timeout: { text: '提取超时', color: 'orange' },
+          pdf_memory_limit: { text: '超出内存限制', color: 'orange' },
+          pdf_worker_crashed: { text: '提取进程崩溃', color: 'red' },
+          pdf_image_only: { text: '扫描件', color: 'purple' },
+        };
+        if (!reason) return '-';
+        const info = reasonMap[reason] || { text: reason, color: 'default' };
+        return <Tag color={info.color}>{info.text}</Tag>;
+      },
+    },
     {
       title: '联系方式',
       key: 'contact',
@@ -166,6 +166,7 @@ export const getResumes = async (params?: {
   min_score?: number;  // 最低Agent评分
   exclude_needs_review?: boolean;  // 排除需要人工审核的简历(raw_text少于100字符)
   needs_review_only?: boolean;  // 只返回需要人工审核的简历
+  review_reason?: string;  // 人工审核原因: pdf_timeout/pdf_memory_limit/pdf_worker_crashed/pdf_image_only
   time_range?: string;  // 时间范围: today/this_week/this_month
   search?: string;  // 搜索候选人姓名
 }): Promise<{ total: number; items: any[]; page?: number; page_size?: number }> => {